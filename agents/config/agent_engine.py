@@ -213,6 +213,31 @@ def get_reasoning_engine_url(
     return f"https://{loc}-aiplatform.googleapis.com/v1/{resource_path}:query"
 
 
+def get_reasoning_engine_stream_url(
+    engine_id: str,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None
+) -> str:
+    """
+    Construct Agent Engine REST API URL for the streaming query endpoint.
+
+    Args:
+        engine_id: Reasoning engine ID
+        project_id: GCP project ID (if None, reads from environment)
+        location: GCP location (if None, reads from environment)
+
+    Returns:
+        Full HTTPS URL to Agent Engine streamQuery endpoint (SSE framing)
+
+    Examples:
+        >>> get_reasoning_engine_stream_url("12345")
+        "https://us-central1-aiplatform.googleapis.com/v1/projects/my-project/locations/us-central1/reasoningEngines/12345:streamQuery?alt=sse"
+    """
+    loc = location or get_location()
+    resource_path = make_reasoning_engine_path(engine_id, project_id, loc)
+    return f"https://{loc}-aiplatform.googleapis.com/v1/{resource_path}:streamQuery?alt=sse"
+
+
 # ==============================================================================
 # AGENT CONFIG BUILDERS
 # ==============================================================================
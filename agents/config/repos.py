@@ -79,6 +79,9 @@ class RegistrySettings:
     analysis_exclude_patterns: List[str] = field(default_factory=list)
     max_file_size_bytes: int = 1048576
     max_total_size_bytes: int = 10485760
+    repo_backend: str = "github_api"  # "github_api" or "git_mirror"
+    git_mirror_dir: str = "~/.cache/bobs-brain/git-mirrors"
+    git_mirror_refresh_seconds: int = 300
 
 
 class RepoRegistry:
@@ -147,7 +150,10 @@ class RepoRegistry:
             analysis_file_patterns=settings_data.get('analysis_file_patterns', []),
             analysis_exclude_patterns=settings_data.get('analysis_exclude_patterns', []),
             max_file_size_bytes=settings_data.get('max_file_size_bytes', 1048576),
-            max_total_size_bytes=settings_data.get('max_total_size_bytes', 10485760)
+            max_total_size_bytes=settings_data.get('max_total_size_bytes', 10485760),
+            repo_backend=os.getenv('REPO_BACKEND', settings_data.get('repo_backend', 'github_api')),
+            git_mirror_dir=settings_data.get('git_mirror_dir', '~/.cache/bobs-brain/git-mirrors'),
+            git_mirror_refresh_seconds=settings_data.get('git_mirror_refresh_seconds', 300)
         )
 
     def get_repo_by_id(self, repo_id: str) -> Optional[RepoConfig]:
@@ -6,12 +6,14 @@ via GitHub REST API with safety gates:
 - DRY_RUN mode by default (logs only, no API calls)
 - Repo allowlist enforcement
 - Environment-aware behavior (dev/staging/prod)
+- Deduplication: each issue body carries a finding fingerprint, and
+  batch creation skips (or updates) findings that already have an open
+  issue (see tools/issue_index.py)
 
 Phase: LIVE3B/LIVE3C-GITHUB-ISSUES (G2)
 """
 
 import sys
-import os
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
@@ -28,6 +30,14 @@ from config.github_features import (
     load_github_feature_config,
     can_create_issues_for_repo
 )
+from tools.github_client import GitHubClient, GitHubClientError
+from tools.issue_index import (
+    IndexedIssue,
+    OpenIssueIndex,
+    content_hash,
+    finding_fingerprint,
+    stamp_fingerprint
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +51,7 @@ class IssueCreationResult:
     issue_url: Optional[str] = None
     error: Optional[str] = None
     dry_run_payload: Optional[Dict[str, Any]] = None
+    action: Optional[str] = None  # "created", "updated", or "skipped" (already filed)
 
 
 def get_severity_labels(severity: Severity) -> List[str]:
@@ -85,12 +96,48 @@ def get_issue_type_labels(issue_type: IssueType) -> List[str]:
     return type_map.get(issue_type, ["enhancement"])
 
 
-def format_issue_body(issue: IssueSpec) -> str:
+def issue_fingerprint(issue: IssueSpec, repo: str) -> str:
+    """
+    Get the dedup fingerprint of an IssueSpec.
+
+    Args:
+        issue: IssueSpec object
+        repo: Repository full name (owner/repo)
+
+    Returns:
+        Fingerprint over (repo, rule, file, normalized title)
+    """
+    rule = issue.pattern_violated or issue.type.value
+    return finding_fingerprint(repo, rule, issue.file_path, issue.title)
+
+
+def issue_content_hash(issue: IssueSpec) -> str:
+    """
+    Hash the parts of an IssueSpec that end up in the issue body.
+
+    Excludes the per-run issue ID and timestamp, so regenerating an
+    unchanged finding yields the same hash.
+    """
+    return content_hash(
+        issue.title,
+        issue.description,
+        issue.severity.value,
+        issue.file_path,
+        str(issue.line_start or ""),
+        str(issue.line_end or ""),
+        issue.pattern_violated,
+        issue.expected_pattern
+    )
+
+
+def format_issue_body(issue: IssueSpec, repo: Optional[str] = None) -> str:
     """
     Format IssueSpec into GitHub issue body with structured template.
 
     Args:
         issue: IssueSpec object
+        repo: Repository full name; when given, the body is stamped with
+            the finding fingerprint for deduplication
 
     Returns:
         Formatted markdown body
@@ -138,13 +185,17 @@ def format_issue_body(issue: IssueSpec) -> str:
     body_parts.append("*This issue was generated by the IAM SWE Pipeline*\n")
     body_parts.append(f"*Agent: {issue.detected_by}*\n")
 
-    return "\n".join(body_parts)
+    body = "\n".join(body_parts)
+    if repo:
+        body = stamp_fingerprint(body, issue_fingerprint(issue, repo), issue_content_hash(issue))
+    return body
 
 
 def issue_spec_to_github_payload(
     issue: IssueSpec,
     assignees: Optional[List[str]] = None,
-    milestone: Optional[int] = None
+    milestone: Optional[int] = None,
+    repo: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Convert IssueSpec to GitHub issue API payload.
@@ -153,6 +204,7 @@ def issue_spec_to_github_payload(
         issue: IssueSpec object
         assignees: Optional list of GitHub usernames to assign
         milestone: Optional milestone number
+        repo: Optional repository full name (stamps the dedup fingerprint)
 
     Returns:
         Dictionary matching GitHub Issues API format
@@ -172,7 +224,7 @@ def issue_spec_to_github_payload(
     # Build payload
     payload = {
         "title": issue.title,
-        "body": format_issue_body(issue),
+        "body": format_issue_body(issue, repo),
         "labels": labels
     }
 
@@ -242,7 +294,10 @@ def create_github_issue(
     github_owner: str,
     github_repo: str,
     assignees: Optional[List[str]] = None,
-    milestone: Optional[int] = None
+    milestone: Optional[int] = None,
+    index: Optional[OpenIssueIndex] = None,
+    update_existing: bool = True,
+    client: Optional[GitHubClient] = None
 ) -> IssueCreationResult:
     """
     Create a GitHub issue from IssueSpec with safety gates.
@@ -252,6 +307,9 @@ def create_github_issue(
     - DRY_RUN: Logs what would be created, no API call
     - REAL: Creates actual GitHub issue via API
 
+    With an index, findings that already have an open issue are skipped
+    (unchanged) or update that issue (content changed) instead.
+
     Args:
         issue: IssueSpec to convert to GitHub issue
         repo_id: Repository ID (for allowlist check)
@@ -259,6 +317,9 @@ def create_github_issue(
         github_repo: GitHub repository name
         assignees: Optional list of GitHub usernames
         milestone: Optional milestone number
+        index: Optional open issue index for deduplication
+        update_existing: Update changed findings (False = always skip)
+        client: GitHub client for REAL mode (default: a new GitHubClient)
 
     Returns:
         IssueCreationResult with success/failure and details
@@ -286,8 +347,9 @@ def create_github_issue(
         }
     )
 
-    # Generate GitHub payload
-    payload = issue_spec_to_github_payload(issue, assignees, milestone)
+    # Generate GitHub payload (stamped with the finding fingerprint)
+    repo_full_name = f"{github_owner}/{github_repo}"
+    payload = issue_spec_to_github_payload(issue, assignees, milestone, repo=repo_full_name)
 
     # MODE: DISABLED
     if mode == GitHubMode.DISABLED:
@@ -304,6 +366,26 @@ def create_github_issue(
             error="GitHub issue creation is disabled for this repository"
         )
 
+    # Deduplicate against issues already filed for this finding
+    fingerprint = issue_fingerprint(issue, repo_full_name)
+    existing = index.get(fingerprint) if index is not None else None
+    if existing is not None:
+        if not update_existing or existing.content_hash == issue_content_hash(issue):
+            logger.info(
+                f"⏭️ Finding already filed as #{existing.number}, skipping",
+                extra={"repo": repo_full_name, "issue_id": issue.id}
+            )
+            return IssueCreationResult(
+                success=True,
+                mode=mode.value,
+                issue_number=existing.number,
+                issue_url=existing.html_url,
+                action="skipped"
+            )
+        return _update_existing_issue(
+            issue, payload, existing, fingerprint, index, mode, github_owner, github_repo, client
+        )
+
     # MODE: DRY_RUN
     if mode == GitHubMode.DRY_RUN:
         logger.info(
@@ -325,111 +407,187 @@ def create_github_issue(
         return IssueCreationResult(
             success=True,
             mode="dry_run",
-            dry_run_payload=payload
+            dry_run_payload=payload,
+            action="created"
         )
 
     # MODE: REAL - Create actual GitHub issue
-    try:
-        import requests  # Import only when needed for real creation
-
-        # Get GitHub token
-        github_token = os.getenv("GITHUB_TOKEN")
-        if not github_token:
-            logger.error("GITHUB_TOKEN not set, cannot create real issue")
-            return IssueCreationResult(
-                success=False,
-                mode="real",
-                error="GITHUB_TOKEN environment variable not set"
-            )
-
-        # GitHub API endpoint
-        api_url = f"https://api.github.com/repos/{github_owner}/{github_repo}/issues"
+    client = client or GitHubClient()
+    if not client.token:
+        logger.error("GITHUB_TOKEN not set, cannot create real issue")
+        return IssueCreationResult(
+            success=False,
+            mode="real",
+            error="GITHUB_TOKEN environment variable not set"
+        )
 
-        # Make API request
-        headers = {
-            "Authorization": f"token {github_token}",
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28"
+    logger.warning(
+        f"🚨 Creating REAL GitHub issue",
+        extra={
+            "repo": f"{github_owner}/{github_repo}",
+            "title": issue.title
         }
+    )
 
-        logger.warning(
-            f"🚨 Creating REAL GitHub issue",
+    try:
+        created = client.create_issue(github_owner, github_repo, payload)
+
+    except GitHubClientError as e:
+        logger.error(
+            f"Failed to create GitHub issue",
             extra={
                 "repo": f"{github_owner}/{github_repo}",
-                "title": issue.title,
-                "api_url": api_url
+                "error": str(e)
             }
         )
+        return IssueCreationResult(
+            success=False,
+            mode="real",
+            error=str(e)
+        )
 
-        response = requests.post(
-            api_url,
-            headers=headers,
-            json=payload,
-            timeout=30.0
+    except Exception as e:
+        logger.error(
+            f"Exception during GitHub issue creation: {e}",
+            exc_info=True,
+            extra={"repo": f"{github_owner}/{github_repo}"}
         )
 
-        # Check response
-        if response.status_code == 201:
-            # Success!
-            issue_data = response.json()
-            issue_number = issue_data.get("number")
-            issue_url = issue_data.get("html_url")
+        return IssueCreationResult(
+            success=False,
+            mode="real",
+            error=str(e)
+        )
 
-            logger.info(
-                f"✅ Created GitHub issue #{issue_number}",
-                extra={
-                    "repo": f"{github_owner}/{github_repo}",
-                    "issue_number": issue_number,
-                    "issue_url": issue_url,
-                    "issue_id": issue.id
-                }
-            )
+    logger.info(
+        f"✅ Created GitHub issue #{created.number}",
+        extra={
+            "repo": f"{github_owner}/{github_repo}",
+            "issue_number": created.number,
+            "issue_url": created.html_url,
+            "issue_id": issue.id
+        }
+    )
 
-            return IssueCreationResult(
-                success=True,
-                mode="real",
-                issue_number=issue_number,
-                issue_url=issue_url
-            )
-        else:
-            # API error
-            error_msg = f"GitHub API returned {response.status_code}: {response.text}"
-            logger.error(
-                f"Failed to create GitHub issue",
-                extra={
-                    "repo": f"{github_owner}/{github_repo}",
-                    "status_code": response.status_code,
-                    "error": response.text
-                }
-            )
+    if index is not None:
+        index.add(fingerprint, IndexedIssue(
+            number=created.number,
+            html_url=created.html_url,
+            content_hash=issue_content_hash(issue)
+        ))
+
+    return IssueCreationResult(
+        success=True,
+        mode="real",
+        issue_number=created.number,
+        issue_url=created.html_url,
+        action="created"
+    )
 
-            return IssueCreationResult(
-                success=False,
-                mode="real",
-                error=error_msg
-            )
 
-    except ImportError:
-        logger.error("requests library not installed (required for real GitHub API calls)")
+def _update_existing_issue(
+    issue: IssueSpec,
+    payload: Dict[str, Any],
+    existing: IndexedIssue,
+    fingerprint: str,
+    index: OpenIssueIndex,
+    mode: GitHubMode,
+    github_owner: str,
+    github_repo: str,
+    client: Optional[GitHubClient] = None
+) -> IssueCreationResult:
+    """
+    Refresh an already-filed issue whose finding content changed.
+
+    Only title and body are updated; labels, assignees and milestone
+    may have been curated by humans since the issue was filed.
+    """
+    update = {"title": payload["title"], "body": payload["body"]}
+
+    if mode == GitHubMode.DRY_RUN:
+        logger.info(
+            f"📝 DRY-RUN: Would update GitHub issue #{existing.number}",
+            extra={"repo": f"{github_owner}/{github_repo}", "issue_id": issue.id}
+        )
         return IssueCreationResult(
-            success=False,
-            mode="real",
-            error="requests library not installed"
+            success=True,
+            mode="dry_run",
+            issue_number=existing.number,
+            issue_url=existing.html_url,
+            dry_run_payload=update,
+            action="updated"
         )
 
-    except Exception as e:
+    try:
+        (client or GitHubClient()).update_issue(github_owner, github_repo, existing.number, update)
+    except GitHubClientError as e:
         logger.error(
-            f"Exception during GitHub issue creation: {e}",
-            exc_info=True,
+            f"Failed to update GitHub issue #{existing.number}: {e}",
             extra={"repo": f"{github_owner}/{github_repo}"}
         )
-
         return IssueCreationResult(
             success=False,
             mode="real",
+            issue_number=existing.number,
+            issue_url=existing.html_url,
             error=str(e)
         )
 
+    index.add(fingerprint, IndexedIssue(
+        number=existing.number,
+        html_url=existing.html_url,
+        content_hash=issue_content_hash(issue)
+    ))
+    logger.info(
+        f"✏️ Updated GitHub issue #{existing.number}",
+        extra={"repo": f"{github_owner}/{github_repo}", "issue_id": issue.id}
+    )
+    return IssueCreationResult(
+        success=True,
+        mode="real",
+        issue_number=existing.number,
+        issue_url=existing.html_url,
+        action="updated"
+    )
+
+
+def load_open_issue_index(
+    github_owner: str,
+    github_repo: str,
+    cache_dir: Optional[str] = None,
+    client: Optional[GitHubClient] = None
+) -> Optional[OpenIssueIndex]:
+    """
+    Build the dedup index for a repo, or None if it cannot be listed.
+
+    Args:
+        github_owner: GitHub owner/org name
+        github_repo: GitHub repository name
+        cache_dir: Optional cache directory (default: GITHUB_ISSUE_INDEX_DIR)
+        client: GitHub client to list with (default: a new GitHubClient)
+
+    Returns:
+        OpenIssueIndex, or None on listing failure (dedup is then skipped)
+    """
+    try:
+        index = OpenIssueIndex.load(client or GitHubClient(), github_owner, github_repo, cache_dir)
+    except GitHubClientError as e:
+        logger.warning(
+            f"Could not build open issue index, dedup disabled for this batch: {e}",
+            extra={"repo": f"{github_owner}/{github_repo}"}
+        )
+        return None
+
+    logger.info(
+        f"Indexed {len(index)} open bot issues",
+        extra={
+            "repo": f"{github_owner}/{github_repo}",
+            "pages_fetched": index.pages_fetched,
+            "pages_not_modified": index.pages_not_modified
+        }
+    )
+    return index
+
 
 def batch_create_github_issues(
     issues: List[IssueSpec],
@@ -437,11 +595,18 @@ def batch_create_github_issues(
     github_owner: str,
     github_repo: str,
     assignees: Optional[List[str]] = None,
-    milestone: Optional[int] = None
+    milestone: Optional[int] = None,
+    dedup: bool = True,
+    update_existing: bool = True
 ) -> List[IssueCreationResult]:
     """
     Create multiple GitHub issues with safety gates.
 
+    With dedup on, the repo's open issues are listed once per batch and
+    findings that are already filed are skipped (or their issue updated),
+    as are repeats of the same finding within the batch. DRY_RUN makes no
+    API calls, so it only skips repeats within the batch.
+
     Args:
         issues: List of IssueSpecs to create
         repo_id: Repository ID (for allowlist check)
@@ -449,20 +614,45 @@ def batch_create_github_issues(
         github_repo: GitHub repository name
         assignees: Optional assignees for all issues
         milestone: Optional milestone for all issues
+        dedup: Skip findings that already have an open issue
+        update_existing: Update issues whose finding content changed
 
     Returns:
         List of IssueCreationResults (one per issue)
     """
     results = []
 
+    mode = get_github_mode(repo_id)
+    dedup = dedup and mode != GitHubMode.DISABLED
+
+    # One client for listing, creating and updating in REAL mode
+    client = GitHubClient() if mode == GitHubMode.REAL else None
+
+    index = None
+    if dedup and issues and client is not None:
+        index = load_open_issue_index(github_owner, github_repo, client=client)
+
+    repo_full_name = f"{github_owner}/{github_repo}"
+    seen = set()
+
     for issue in issues:
+        if dedup:
+            fingerprint = issue_fingerprint(issue, repo_full_name)
+            if fingerprint in seen:
+                results.append(IssueCreationResult(success=True, mode=mode.value, action="skipped"))
+                continue
+            seen.add(fingerprint)
+
         result = create_github_issue(
             issue=issue,
             repo_id=repo_id,
             github_owner=github_owner,
             github_repo=github_repo,
             assignees=assignees,
-            milestone=milestone
+            milestone=milestone,
+            index=index,
+            update_existing=update_existing,
+            client=client
         )
         results.append(result)
 
@@ -37,7 +37,8 @@ from shared_contracts import (
 from config.repos import get_repo_by_id, RepoConfig, get_registry
 
 # Import GitHub client (Phase GH2)
-from tools.github_client import get_client, GitHubClientError, RepoTree
+from tools.github_client import get_client, GitHubClientError, RepoTree, STRATEGY_AUTO
+from tools.git_mirror import get_repo_client
 
 # Import GitHub issue adapter (Phase GH3)
 # Import directly to avoid triggering iam_issue/__init__.py which imports ADK
@@ -440,13 +441,13 @@ def run_swe_pipeline(request: PipelineRequest) -> PipelineResult:
     repo_tree: Optional[RepoTree] = None
     if request.github_owner and request.github_repo:
         try:
-            print("🐙 Fetching repository from GitHub...")
-            gh_client = get_client()
-
-            # Get registry settings for file filtering
+            # Get registry settings for file filtering and backend selection
             registry = get_registry()
             settings = registry.settings
 
+            print(f"🐙 Fetching repository from GitHub ({settings.repo_backend})...")
+            gh_client = get_repo_client(settings)
+
             # Fetch repo tree with filtering
             repo_tree = gh_client.get_repo_tree(
                 owner=request.github_owner,
@@ -456,7 +457,8 @@ def run_swe_pipeline(request: PipelineRequest) -> PipelineResult:
                 exclude_patterns=settings.analysis_exclude_patterns,
                 max_file_size=settings.max_file_size_bytes,
                 max_total_size=settings.max_total_size_bytes,
-                fetch_content=False  # Only fetch metadata for now
+                fetch_content=False,  # Only fetch metadata for now
+                strategy=STRATEGY_AUTO  # Tarball for large trees once content is fetched
             )
 
             print(f"✓ Fetched {len(repo_tree.files)} files ({repo_tree.total_size / 1024:.1f}KB total)")
@@ -221,9 +221,16 @@ def run_portfolio_swe(
 
             # Count successes
             for result in results:
-                if result.success and result.mode == "real":
+                if result.success and result.action == "skipped":
+                    print(f"    ⏭️  Already filed: #{result.issue_number}" if result.issue_number
+                          else "    ⏭️  Duplicate finding in batch")
+                elif result.success and result.mode == "real" and result.action == "updated":
+                    print(f"    ✏️  Updated issue #{result.issue_number}: {result.issue_url}")
+                elif result.success and result.mode == "real":
                     portfolio_result.issues_created += 1
                     print(f"    ✅ Created issue #{result.issue_number}: {result.issue_url}")
+                elif result.success and result.mode == "dry_run" and result.action == "updated":
+                    print(f"    📝 DRY-RUN: Would update issue #{result.issue_number}")
                 elif result.success and result.mode == "dry_run":
                     print(f"    📝 DRY-RUN: Would create issue")
                 elif result.mode == "disabled":
@@ -3,6 +3,14 @@ Slack message sender for SWE/portfolio notifications.
 
 Handles the actual HTTP POST to Slack webhooks or Slack API.
 
+API posts are paced per channel (Slack allows roughly one message per
+second per channel) and a `ratelimited` answer is retried once after its
+Retry-After, within the call's timeout.
+
+Environment Variables:
+- SLACK_OUTBOUND_RATE: chat.postMessage calls per second per channel (default: 1)
+- SLACK_OUTBOUND_BURST: Calls allowed back to back per channel (default: 3)
+
 Usage:
     from agents.notifications.slack_sender import send_portfolio_notification
 
@@ -11,8 +19,10 @@ Usage:
 
 import os
 import logging
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List
 
 from agents.shared_contracts import PortfolioResult
 from agents.config.notifications import (
@@ -28,6 +38,90 @@ from agents.notifications.slack_formatter import (
 logger = logging.getLogger(__name__)
 
 
+class ChannelRateLimiter:
+    """
+    Per-channel token buckets for chat.postMessage (thread-safe).
+
+    Args:
+        rate: Calls per second per channel
+        burst: Calls allowed back to back per channel
+        clock: Monotonic time source (tests)
+        sleep: Sleep function (tests)
+    """
+
+    def __init__(
+        self,
+        rate: float = 1.0,
+        burst: int = 3,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        # channel -> (tokens, updated); tokens go negative for reserved calls
+        self._buckets: Dict[str, List[float]] = {}
+
+    @classmethod
+    def from_env(cls) -> "ChannelRateLimiter":
+        """Build a limiter from SLACK_OUTBOUND_RATE / SLACK_OUTBOUND_BURST."""
+        return cls(
+            rate=max(0.01, float(os.getenv("SLACK_OUTBOUND_RATE", "1"))),
+            burst=max(1, int(os.getenv("SLACK_OUTBOUND_BURST", "3")))
+        )
+
+    def acquire(self, channel: str, max_wait: float) -> bool:
+        """
+        Wait for the channel's next call slot.
+
+        Args:
+            channel: Slack channel ID
+            max_wait: Give up (without using a slot) if the wait would be longer
+
+        Returns:
+            bool: True once the call may be made, False if it would wait too long.
+        """
+        with self._lock:
+            now = self._clock()
+            tokens, updated = self._buckets.get(channel, (float(self.burst), now))
+            tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+            # A paused channel refills from the end of its pause
+            wait = max(0.0, updated - now) + max(0.0, (1 - tokens) / self.rate)
+            if wait > max_wait:
+                return False
+            self._buckets[channel] = [tokens - 1, max(now, updated)]
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def pause(self, channel: str, seconds: float) -> None:
+        """Hold the channel's calls for `seconds` (Slack's Retry-After)."""
+        with self._lock:
+            self._buckets[channel] = [1.0, self._clock() + seconds]
+
+
+_api_rate_limiter = ChannelRateLimiter.from_env()
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    """Seconds Slack asked us to wait, or None if the response is not a rate limit."""
+    if response.status_code == 429:
+        limited = True
+    elif response.status_code == 200:
+        limited = response.json().get("error") == "ratelimited"
+    else:
+        limited = False
+    if not limited:
+        return None
+    try:
+        return float(response.headers.get("Retry-After", 1))
+    except (TypeError, ValueError):
+        return 1.0
+
+
 def send_portfolio_notification(
     result: PortfolioResult,
     env: str = "dev",
@@ -170,6 +264,10 @@ def _send_via_api(
     }
 
     try:
+        if not _api_rate_limiter.acquire(channel_id, max_wait=timeout):
+            logger.warning(f"API POST skipped: channel {channel_id} rate limit wait exceeds {timeout}s")
+            return False
+
         response = requests.post(
             url,
             json=payload,
@@ -177,6 +275,20 @@ def _send_via_api(
             timeout=timeout
         )
 
+        # Rate limited: honor Retry-After and try once more if it fits the timeout
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            _api_rate_limiter.pause(channel_id, retry_after)
+            logger.warning(f"API POST rate limited: retry after {retry_after}s")
+            if not _api_rate_limiter.acquire(channel_id, max_wait=timeout):
+                return False
+            response = requests.post(
+                url,
+                json=payload,
+                headers=headers,
+                timeout=timeout
+            )
+
         if response.status_code == 200:
             data = response.json()
             if data.get("ok"):
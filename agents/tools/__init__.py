@@ -11,6 +11,9 @@ from .github_client import (
     RepoTree,
     get_client
 )
+from .async_github_client import AsyncGitHubClient, get_async_client
+from .blob_store import BlobStore, get_default_blob_store
+from .git_mirror import GitMirrorClient, GitMirrorError, get_repo_client
 
 __all__ = [
     'GitHubClient',
@@ -19,5 +22,12 @@ __all__ = [
     'GitHubRateLimitError',
     'RepoFile',
     'RepoTree',
-    'get_client'
+    'get_client',
+    'AsyncGitHubClient',
+    'get_async_client',
+    'BlobStore',
+    'get_default_blob_store',
+    'GitMirrorClient',
+    'GitMirrorError',
+    'get_repo_client'
 ]
\ No newline at end of file
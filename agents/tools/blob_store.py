@@ -0,0 +1,279 @@
+"""
+Content-Addressed Blob Store for Repository Files
+
+Local cache of file contents fetched from GitHub, keyed by git blob SHA.
+Because a blob SHA identifies content exactly, a stored blob never goes
+stale: repeat audits of mostly unchanged repos are served from disk and
+only new or modified files hit the network.
+
+Layout:
+    {root}/{sha[:2]}/{sha[2:]}        - Uncompressed blob
+    {root}/{sha[:2]}/{sha[2:]}.gz     - gzip-compressed blob
+    {root}/{sha[:2]}/{sha[2:]}.zst    - zstd-compressed blob (needs zstandard)
+
+Eviction is LRU by total on-disk bytes; file mtimes record last use so
+the order survives restarts.
+
+Environment Variables:
+    GITHUB_BLOB_STORE_DIR: Store root directory (store disabled if unset)
+    GITHUB_BLOB_STORE_MAX_BYTES: Max on-disk size (default: 512MB)
+    GITHUB_BLOB_STORE_COMPRESSION: "auto", "zstd", "gzip", or "none" (default: auto)
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # Optional dependency
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+COMPRESSION_SUFFIXES = {
+    "none": "",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+def git_blob_sha(data: bytes) -> str:
+    """
+    Compute the git blob SHA-1 for raw file bytes.
+
+    Matches the ``sha`` field GitHub returns in tree and contents
+    responses, so any copy of a file maps to the same store key.
+    """
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data).hexdigest()
+
+
+class BlobStore:
+    """
+    Sharded, optionally compressed, content-addressed blob cache.
+
+    Thread-safe; a single store can back several clients.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        compression: str = "auto"
+    ):
+        """
+        Initialize blob store, indexing any blobs already on disk.
+
+        Args:
+            root: Store root directory (created if missing)
+            max_bytes: Evict least recently used blobs above this size
+            compression: "auto" (zstd if installed, else gzip), "zstd", "gzip", or "none"
+
+        Raises:
+            ValueError: If compression is unknown or zstd is unavailable
+        """
+        if compression == "auto":
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown blob store compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            raise ValueError("zstd compression requires the 'zstandard' package")
+
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.compression = compression
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        # sha -> (path, on-disk size), least recently used first
+        self._index: "OrderedDict[str, Tuple[Path, int]]" = OrderedDict()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        """Index existing blobs in last-used (mtime) order."""
+        entries = []
+        for shard in self.root.iterdir():
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard):
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+                stat = entry.stat()
+                sha = shard.name + entry.name.split(".", 1)[0]
+                entries.append((stat.st_mtime, sha, Path(entry.path), stat.st_size))
+
+        for _, sha, path, size in sorted(entries):
+            self._index[sha] = (path, size)
+            self.total_bytes += size
+
+    def _blob_path(self, sha: str) -> Path:
+        """Get the on-disk path for a new blob using the current codec."""
+        return self.root / sha[:2] / (sha[2:] + COMPRESSION_SUFFIXES[self.compression])
+
+    def __contains__(self, sha: str) -> bool:
+        with self._lock:
+            return sha in self._index
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """
+        Get blob bytes by SHA, marking the blob as recently used.
+
+        Args:
+            sha: Git blob SHA
+
+        Returns:
+            Raw (decompressed) bytes, or None if not stored (or stored with
+            zstd by a process that had zstandard, and this one has not)
+        """
+        with self._lock:
+            entry = self._index.get(sha)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._index.move_to_end(sha)
+            self.hits += 1
+
+        path = entry[0]
+        if path.suffix == ".zst" and zstandard is None:
+            # Left in place: a process with zstandard can still use it
+            logger.warning(f"Blob {sha} is zstd-compressed but zstandard is not installed; treating as a miss")
+            self._count_as_miss()
+            return None
+
+        try:
+            raw = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            # Evicted or removed underneath us
+            with self._lock:
+                if self._index.pop(sha, None) is not None:
+                    self.total_bytes -= entry[1]
+            self._count_as_miss()
+            return None
+
+        if path.suffix == ".zst":
+            return zstandard.ZstdDecompressor().decompress(raw)
+        if path.suffix == ".gz":
+            return gzip.decompress(raw)
+        return raw
+
+    def _count_as_miss(self) -> None:
+        with self._lock:
+            self.hits -= 1
+            self.misses += 1
+
+    def put(self, sha: str, data: bytes) -> bool:
+        """
+        Store blob bytes under their SHA.
+
+        Blobs whose content does not hash to ``sha`` are rejected so a bad
+        response can never poison the store.
+
+        Args:
+            sha: Git blob SHA
+            data: Raw file bytes
+
+        Returns:
+            True if stored (or already present), False if rejected
+        """
+        if git_blob_sha(data) != sha:
+            return False
+
+        with self._lock:
+            if sha in self._index:
+                self._index.move_to_end(sha)
+                return True
+
+        if self.compression == "zstd":
+            encoded = zstandard.ZstdCompressor().compress(data)
+        elif self.compression == "gzip":
+            encoded = gzip.compress(data, compresslevel=6)
+        else:
+            encoded = data
+
+        path = self._blob_path(sha)
+        path.parent.mkdir(exist_ok=True)
+        # Atomic write: readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return False
+
+        with self._lock:
+            if sha not in self._index:
+                self._index[sha] = (path, len(encoded))
+                self.total_bytes += len(encoded)
+            self._evict_locked()
+
+        return True
+
+    def _evict_locked(self) -> None:
+        """Drop least recently used blobs until under max_bytes (lock held)."""
+        while self.total_bytes > self.max_bytes and self._index:
+            _, (path, size) = self._index.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Union[int, str]]:
+        """Get store statistics (for logging and reports)."""
+        with self._lock:
+            return {
+                "blobs": len(self._index),
+                "total_bytes": self.total_bytes,
+                "max_bytes": self.max_bytes,
+                "compression": self.compression,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# Module-level store instances (lazy loaded, one per root directory)
+_default_stores: Dict[str, BlobStore] = {}
+
+
+def get_default_blob_store() -> Optional[BlobStore]:
+    """
+    Get the blob store configured by environment variables.
+
+    The store is created once per root directory and shared by every
+    client in the process.
+
+    Returns:
+        BlobStore if GITHUB_BLOB_STORE_DIR is set, None otherwise.
+    """
+    root = os.getenv("GITHUB_BLOB_STORE_DIR")
+    if not root:
+        return None
+
+    if root not in _default_stores:
+        _default_stores[root] = BlobStore(
+            root=root,
+            max_bytes=int(os.getenv("GITHUB_BLOB_STORE_MAX_BYTES", str(DEFAULT_MAX_BYTES))),
+            compression=os.getenv("GITHUB_BLOB_STORE_COMPRESSION", "auto")
+        )
+    return _default_stores[root]
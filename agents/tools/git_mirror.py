@@ -0,0 +1,449 @@
+"""
+Local Bare-Mirror Git Backend
+
+Reads repositories from local bare mirrors instead of the GitHub REST
+API, so frequently audited repos cost zero API calls and are not subject
+to rate limits.
+
+- One bare mirror per repository: {mirror_root}/{owner}/{repo}.git
+- Created with `git clone --mirror`, refreshed with incremental
+  `git fetch --prune` (at most once per refresh_interval)
+- Tree listings come from `git ls-tree -r -l` (one call per listing)
+- Blob reads go through a persistent `git cat-file --batch` process per
+  mirror, so fetching thousands of files costs no process spawns
+
+Returns the same RepoFile / RepoTree types as GitHubClient; select it
+with the `repo_backend` registry setting (see get_repo_client).
+
+Environment Variables:
+    GIT_MIRROR_DIR: Mirror root directory (overrides the registry setting)
+    GITHUB_TOKEN: Used for HTTPS fetches of private repositories
+"""
+
+import base64
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .blob_store import BlobStore
+from .github_client import (
+    GitHubClient,
+    GitHubClientError,
+    RepoFile,
+    RepoTree,
+    _apply_total_size_budget,
+    _decode_text,
+    _parse_tree_files,
+    get_client,
+)
+
+# Registry `repo_backend` values
+BACKEND_GITHUB_API = "github_api"
+BACKEND_GIT_MIRROR = "git_mirror"
+REPO_BACKENDS = (BACKEND_GITHUB_API, BACKEND_GIT_MIRROR)
+
+DEFAULT_URL_TEMPLATE = "https://github.com/{owner}/{repo}.git"
+DEFAULT_REFRESH_INTERVAL = 300  # seconds
+
+
+class GitMirrorError(GitHubClientError):
+    """Local mirror operation failed (subclass so callers handle both backends alike)."""
+    pass
+
+
+class CatFileBatch:
+    """
+    Persistent `git cat-file --batch` reader for one repository.
+
+    Thread-safe; the subprocess is started lazily and restarted if it dies.
+    """
+
+    def __init__(self, git_dir: Union[str, Path]):
+        self.git_dir = str(git_dir)
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "--git-dir", self.git_dir, "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        return self._process
+
+    def read(self, name: str) -> Optional[Tuple[str, str, bytes]]:
+        """
+        Read an object by name (SHA or "ref:path").
+
+        Args:
+            name: Any object name git rev-parse understands
+
+        Returns:
+            (sha, type, data) tuple, or None if the object does not exist
+
+        Raises:
+            GitMirrorError: If the name is invalid or git fails
+        """
+        if "\n" in name:
+            raise GitMirrorError(f"Invalid object name: {name!r}")
+
+        with self._lock:
+            process = self._start()
+            try:
+                process.stdin.write(name.encode() + b"\n")
+                process.stdin.flush()
+                header = process.stdout.readline()
+                if not header:
+                    raise GitMirrorError(f"git cat-file exited reading {name}")
+
+                # "<name> missing" / "<name> ambiguous" echo the name, which may contain spaces
+                reply = header.decode().rstrip("\n")
+                if reply.endswith((" missing", " ambiguous")):
+                    return None
+
+                sha, obj_type, size = reply.split(" ")
+                data = process.stdout.read(int(size))
+                process.stdout.read(1)  # Trailing newline
+                return sha, obj_type, data
+
+            except (BrokenPipeError, OSError, ValueError) as e:
+                self._kill()
+                raise GitMirrorError(f"git cat-file failed reading {name}: {e}")
+
+    def _kill(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def close(self) -> None:
+        """Stop the subprocess."""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                self._process.stdin.close()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process = None
+
+
+class GitMirrorClient:
+    """
+    Read-only repository client backed by local bare mirrors.
+
+    Mirrors are created or refreshed on first use of each repository.
+    """
+
+    def __init__(
+        self,
+        mirror_root: Union[str, Path],
+        url_template: str = DEFAULT_URL_TEMPLATE,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        token: Optional[str] = None,
+        blob_store: Optional[BlobStore] = None
+    ):
+        """
+        Initialize mirror client.
+
+        Args:
+            mirror_root: Directory holding the bare mirrors (created if missing)
+            url_template: Remote URL with {owner} and {repo} placeholders
+            refresh_interval: Minimum seconds between fetches of one mirror
+                (0 = fetch on every call)
+            token: GitHub token for HTTPS fetches (from env if not provided)
+            blob_store: Optional blob store to populate with fetched contents
+        """
+        self.mirror_root = Path(mirror_root)
+        self.url_template = url_template
+        self.refresh_interval = refresh_interval
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        self.blob_store = blob_store
+
+        self._readers: Dict[str, CatFileBatch] = {}
+        self._last_refresh: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.mirror_root.mkdir(parents=True, exist_ok=True)
+
+    def __enter__(self) -> "GitMirrorClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop all cat-file subprocesses."""
+        with self._lock:
+            readers, self._readers = list(self._readers.values()), {}
+        for reader in readers:
+            reader.close()
+
+    def mirror_path(self, owner: str, repo: str) -> Path:
+        """Get the bare mirror directory for a repository."""
+        return self.mirror_root / owner / f"{repo}.git"
+
+    def _git(self, *args: str, git_dir: Optional[Path] = None, remote: bool = False) -> bytes:
+        """Run a git command and return stdout."""
+        command = ["git"]
+        env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        if remote and self.token and self.url_template.startswith("https://"):
+            # Passed through the environment, so the token is neither written to
+            # the mirror config nor visible in the process list
+            basic = base64.b64encode(f"x-access-token:{self.token}".encode()).decode()
+            index = int(env.get("GIT_CONFIG_COUNT") or 0)
+            env.update({
+                "GIT_CONFIG_COUNT": str(index + 1),
+                f"GIT_CONFIG_KEY_{index}": "http.extraHeader",
+                f"GIT_CONFIG_VALUE_{index}": f"Authorization: Basic {basic}",
+            })
+        if git_dir is not None:
+            command += ["--git-dir", str(git_dir)]
+        command += list(args)
+
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env
+        )
+        if result.returncode != 0:
+            raise GitMirrorError(
+                f"git {args[0]} failed: {result.stderr.decode(errors='replace').strip()}"
+            )
+        return result.stdout
+
+    def ensure_mirror(self, owner: str, repo: str, force: bool = False) -> Path:
+        """
+        Create the mirror if missing, otherwise fetch incrementally.
+
+        Fetches are skipped if the mirror was refreshed within
+        refresh_interval, unless force is set.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            force: Fetch even if recently refreshed
+
+        Returns:
+            Path to the bare mirror
+
+        Raises:
+            GitMirrorError: If clone or fetch fails
+        """
+        path = self.mirror_path(owner, repo)
+        key = str(path)
+
+        last = self._last_refresh.get(key)
+        if not force and last is not None and time.monotonic() - last < self.refresh_interval:
+            return path
+
+        if (path / "HEAD").exists():
+            self._git("fetch", "--prune", "--quiet", "origin", git_dir=path, remote=True)
+        else:
+            url = self.url_template.format(owner=owner, repo=repo)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._git("clone", "--mirror", "--quiet", url, str(path), remote=True)
+
+        self._last_refresh[key] = time.monotonic()
+        return path
+
+    def _reader(self, owner: str, repo: str) -> CatFileBatch:
+        """Get the cat-file reader for a repository, refreshing its mirror."""
+        path = self.ensure_mirror(owner, repo)
+        key = str(path)
+        with self._lock:
+            if key not in self._readers:
+                self._readers[key] = CatFileBatch(path)
+            return self._readers[key]
+
+    def list_repo_files(
+        self,
+        owner: str,
+        repo: str,
+        ref: str = "main",
+        path: str = "",
+        recursive: bool = True,
+        file_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        max_size_bytes: Optional[int] = None
+    ) -> List[RepoFile]:
+        """
+        List files in a repository from its mirror.
+
+        Same arguments and result as GitHubClient.list_repo_files.
+
+        Returns:
+            List of RepoFile objects
+        """
+        git_dir = self.ensure_mirror(owner, repo)
+
+        args = ["ls-tree", "-l", "-z", "--full-tree"]
+        if recursive:
+            args.append("-r")
+        args.append(ref)
+        if path:
+            args.append(path.rstrip("/") + "/")
+        output = self._git(*args, git_dir=git_dir)
+
+        items: List[Dict[str, Any]] = []
+        for record in output.split(b"\0"):
+            if not record:
+                continue
+            # "<mode> SP <type> SP <sha> SP+ <size> TAB <path>"
+            meta, file_path = record.split(b"\t", 1)
+            _mode, obj_type, sha, size = meta.split()
+            items.append({
+                "type": obj_type.decode(),
+                "path": file_path.decode("utf-8", errors="surrogateescape"),
+                "sha": sha.decode(),
+                "size": int(size) if size != b"-" else 0
+            })
+
+        return _parse_tree_files(items, file_patterns, exclude_patterns, max_size_bytes)
+
+    def get_file_content(
+        self,
+        owner: str,
+        repo: str,
+        path: str,
+        ref: str = "main",
+        sha: Optional[str] = None
+    ) -> str:
+        """
+        Get file content from the mirror (by blob SHA when known).
+
+        Returns:
+            File content as string
+
+        Raises:
+            GitMirrorError: If the file does not exist at ref
+        """
+        obj = self._reader(owner, repo).read(sha or f"{ref}:{path}")
+        if obj is None or obj[1] != "blob":
+            raise GitMirrorError(f"No content for {path} at {ref}")
+        return obj[2].decode("utf-8")
+
+    def get_blob_content(self, owner: str, repo: str, sha: str) -> str:
+        """
+        Get file content by git blob SHA.
+
+        Returns:
+            File content as string
+
+        Raises:
+            GitMirrorError: If the blob does not exist
+        """
+        obj = self._reader(owner, repo).read(sha)
+        if obj is None or obj[1] != "blob":
+            raise GitMirrorError(f"No content returned for blob {sha}")
+        return obj[2].decode("utf-8")
+
+    def get_repo_tree(
+        self,
+        owner: str,
+        repo: str,
+        ref: str = "main",
+        file_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        max_file_size: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+        fetch_content: bool = False,
+        strategy: Optional[str] = None
+    ) -> RepoTree:
+        """
+        Get complete repository tree with optional content fetching.
+
+        Same arguments and result as GitHubClient.get_repo_tree; strategy
+        is accepted for compatibility and ignored (reads are all local).
+
+        Returns:
+            RepoTree object with files (and optionally contents)
+        """
+        files = self.list_repo_files(
+            owner=owner,
+            repo=repo,
+            ref=ref,
+            recursive=True,
+            file_patterns=file_patterns,
+            exclude_patterns=exclude_patterns,
+            max_size_bytes=max_file_size
+        )
+
+        tree = _apply_total_size_budget(
+            RepoTree(owner=owner, repo=repo, ref=ref, files=[]),
+            files,
+            max_total_size
+        )
+
+        if fetch_content:
+            reader = self._reader(owner, repo)
+            for file in tree.files:
+                obj = reader.read(file.sha)
+                if obj is None:
+                    print(f"⚠️ Could not read {file.path} from mirror")
+                    continue
+                file.content = _decode_text(obj[2])
+                if self.blob_store is not None:
+                    self.blob_store.put(file.sha, obj[2])
+
+        return tree
+
+    def sync_registry(self, registry) -> Dict[str, Optional[str]]:
+        """
+        Create or refresh mirrors for every repository in a RepoRegistry.
+
+        Args:
+            registry: RepoRegistry instance
+
+        Returns:
+            Dict of repo id -> None on success or error message
+        """
+        results: Dict[str, Optional[str]] = {}
+        for repo in registry.list_repos():
+            try:
+                self.ensure_mirror(repo.github_owner, repo.github_repo, force=True)
+                results[repo.id] = None
+            except GitMirrorError as e:
+                results[repo.id] = str(e)
+        return results
+
+
+# Module-level mirror clients (lazy loaded, one per mirror root)
+_mirror_clients: Dict[str, GitMirrorClient] = {}
+
+
+def get_repo_client(settings) -> Union[GitHubClient, GitMirrorClient]:
+    """
+    Get the repository read client selected by registry settings.
+
+    Args:
+        settings: RegistrySettings (repo_backend, git_mirror_dir,
+            git_mirror_refresh_seconds)
+
+    Returns:
+        GitMirrorClient if repo_backend is "git_mirror", else GitHubClient
+
+    Raises:
+        ValueError: If repo_backend is not recognized
+    """
+    backend = settings.repo_backend
+    if backend not in REPO_BACKENDS:
+        raise ValueError(f"Unknown repo_backend '{backend}' (expected one of {', '.join(REPO_BACKENDS)})")
+
+    if backend == BACKEND_GITHUB_API:
+        return get_client()
+
+    root = os.path.expanduser(os.getenv("GIT_MIRROR_DIR") or settings.git_mirror_dir)
+    if root not in _mirror_clients:
+        _mirror_clients[root] = GitMirrorClient(
+            mirror_root=root,
+            refresh_interval=settings.git_mirror_refresh_seconds
+        )
+    return _mirror_clients[root]
@@ -11,9 +11,16 @@ feature flags for safety.
 
 import os
 import json
+import base64
+import random
+import tarfile
+import time
 import requests
+import urllib3
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import IO, List, Optional, Dict, Any, Callable, Iterator, Tuple
 from pathlib import Path
 
 # Import structured logging (Phase RC2)
@@ -21,9 +28,36 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.logging import get_logger
 
+try:
+    from .blob_store import BlobStore, get_default_blob_store, git_blob_sha
+    from .path_matcher import get_path_matcher
+except ImportError:  # Run as a script (see __main__ below)
+    from blob_store import BlobStore, get_default_blob_store, git_blob_sha
+    from path_matcher import get_path_matcher
+
 # Create logger
 logger = get_logger(__name__)
 
+# get_repo_tree() fetch strategies
+STRATEGY_PER_FILE = "per_file"  # One contents/ call per file
+STRATEGY_ARCHIVE = "archive"  # One tarball download, stream-decompressed
+STRATEGY_AUTO = "auto"  # Pick per_file or archive from the expected file count
+FETCH_STRATEGIES = (STRATEGY_PER_FILE, STRATEGY_ARCHIVE, STRATEGY_AUTO)
+
+# Above this many files to fetch, one tarball beats N contents/ calls
+ARCHIVE_AUTO_MIN_FILES = 50
+
+# Concurrent subtree fetches when walking a truncated tree
+TREE_WALK_CONCURRENCY = 4
+
+
+def _decode_text(data: bytes) -> Optional[str]:
+    """Decode file bytes as UTF-8 text, or None for binary content."""
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
 
 @dataclass
 class RepoFile:
@@ -76,6 +110,350 @@ class GitHubRateLimitError(GitHubClientError):
     pass
 
 
+# ============================================================================
+# SHARED REQUEST LAYERS (used by GitHubClient and AsyncGitHubClient)
+# ============================================================================
+
+DEFAULT_HEADERS = {
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28"
+}
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy for transient GitHub API failures.
+
+    For idempotent methods (GET, HEAD), connection errors, timeouts, 5xx
+    responses and secondary rate limits (429) are retried with full-jitter
+    exponential backoff, honoring Retry-After. Other methods (POST
+    create_issue, PATCH update_issue) may already have been applied when
+    the request fails, so they are only retried when the request provably
+    never reached GitHub: a connect-phase error, or a 429 carrying
+    Retry-After. Primary rate limits (403) and auth failures are never
+    retried.
+    """
+
+    max_retries: int = 2
+    backoff_base: float = 0.5
+    max_backoff: float = 8.0
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    idempotent_methods: Tuple[str, ...] = ("GET", "HEAD")
+
+    def is_idempotent(self, method: str) -> bool:
+        """Check if a request with this method can safely be sent twice."""
+        return method.upper() in self.idempotent_methods
+
+    def should_retry(
+        self,
+        status_code: int,
+        attempt: int,
+        method: str = "GET",
+        retry_after: Optional[str] = None
+    ) -> bool:
+        """
+        Check if a response should be retried on this attempt.
+
+        Args:
+            status_code: Response status
+            attempt: Zero-based attempt number that just failed
+            method: Request method
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            True if the request should be sent again
+        """
+        if attempt >= self.max_retries or status_code not in self.retry_statuses:
+            return False
+        if self.is_idempotent(method):
+            return True
+        return status_code == 429 and bool(retry_after)
+
+    def should_retry_error(self, attempt: int, method: str, connect_phase: bool) -> bool:
+        """
+        Check if a failed request (no response) should be retried on this attempt.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            method: Request method
+            connect_phase: Whether the connection was never established
+                (so the request was never sent)
+
+        Returns:
+            True if the request should be sent again
+        """
+        return attempt < self.max_retries and (connect_phase or self.is_idempotent(method))
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get seconds to wait before the next attempt.
+
+        Args:
+            attempt: Zero-based attempt number that just failed
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            Delay in seconds (never above max_backoff)
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.max_backoff, self.backoff_base * (2 ** attempt)))
+
+
+def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    """Check if a requests error happened before the request was sent."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.exceptions.ConnectionError):
+        return False
+    # urllib3 wraps connect failures (refused, DNS) as NewConnectionError;
+    # resets and aborted responses may follow a sent request
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+
+def _raise_for_github_error(
+    status_code: int,
+    text: str,
+    headers: Any,
+    endpoint: str
+) -> None:
+    """
+    Map GitHub rate-limit and auth responses to client exceptions.
+
+    Raises:
+        GitHubRateLimitError: Rate limit exceeded
+        GitHubAuthError: Authentication failed
+    """
+    # Check for rate limiting
+    if status_code == 403 and "rate limit" in text.lower():
+        logger.log_error(
+            "github_rate_limit_exceeded",
+            endpoint=endpoint,
+            reset_at=headers.get('X-RateLimit-Reset'),
+            remaining=headers.get('X-RateLimit-Remaining')
+        )
+        raise GitHubRateLimitError(f"GitHub API rate limit exceeded. Reset at: {headers.get('X-RateLimit-Reset')}")
+
+    # Check for auth errors
+    if status_code in (401, 403):
+        logger.log_error(
+            "github_auth_failed",
+            endpoint=endpoint,
+            status_code=status_code
+        )
+        raise GitHubAuthError(f"GitHub authentication failed: {status_code} - {text[:200]}")
+
+
+def _parse_tree_files(
+    items: List[Dict[str, Any]],
+    file_patterns: Optional[List[str]],
+    exclude_patterns: Optional[List[str]],
+    max_size_bytes: Optional[int]
+) -> List[RepoFile]:
+    """Turn git tree API items into filtered RepoFiles."""
+    # Compiled once per pattern set and shared with the other walkers
+    matcher = get_path_matcher(file_patterns, exclude_patterns)
+
+    files = []
+    for item in items:
+        # Skip directories in file list
+        if item["type"] != "blob":  # blob = file, tree = directory
+            continue
+
+        file_path = item["path"]
+
+        # Apply include/exclude pattern filters
+        if not matcher.matches(file_path):
+            continue
+
+        # Apply size filter
+        if max_size_bytes and item.get("size", 0) > max_size_bytes:
+            continue
+
+        files.append(RepoFile(
+            path=file_path,
+            type="file",
+            size=item.get("size", 0),
+            sha=item["sha"],
+            download_url=None  # Not provided in tree API
+        ))
+
+    return files
+
+
+def _split_tree_items(
+    items: List[Dict[str, Any]],
+    prefix: str,
+    matcher: Any,
+    max_size_bytes: Optional[int]
+) -> Tuple[List[RepoFile], List[Tuple[str, str]]]:
+    """
+    Split tree API items into selected files and subtrees to walk.
+
+    Args:
+        items: Tree entries (paths relative to the tree being listed)
+        prefix: Path of that tree within the repo ("" or "dir/")
+        matcher: PathMatcher for include/exclude filters
+        max_size_bytes: Skip files larger than this
+
+    Returns:
+        (files, subtrees) - subtrees are (prefix, sha) pairs, with fully
+        excluded directories pruned
+    """
+    files = []
+    subtrees = []
+    for item in items:
+        path = prefix + item["path"]
+        if item["type"] == "tree":
+            if not matcher.excludes_dir(path):
+                subtrees.append((path + "/", item["sha"]))
+        elif item["type"] == "blob":
+            size = item.get("size", 0)
+            if not matcher.matches(path):
+                continue
+            if max_size_bytes and size > max_size_bytes:
+                continue
+            files.append(RepoFile(path=path, type="file", size=size, sha=item["sha"]))
+    return files, subtrees
+
+
+class _SizeBudget:
+    """Running max_total_size check for streamed file listings."""
+
+    def __init__(self, max_total_size: Optional[int]):
+        self.max_total_size = max_total_size
+        self.total_size = 0
+        self.count = 0
+
+    def admit(self, file: RepoFile) -> bool:
+        """Count a file against the budget; False once the budget is reached."""
+        if self.max_total_size and self.total_size + file.size > self.max_total_size:
+            print(f"⚠️ Stopping at {self.count} files (total size limit reached)")
+            return False
+        self.total_size += file.size
+        self.count += 1
+        return True
+
+
+def _apply_total_size_budget(
+    tree: RepoTree,
+    files: List[RepoFile],
+    max_total_size: Optional[int]
+) -> RepoTree:
+    """Add files to tree in order until the total size budget is reached."""
+    for file in files:
+        # Check total size limit
+        if max_total_size and tree.total_size + file.size > max_total_size:
+            print(f"⚠️ Stopping at {len(tree.files)} files (total size limit reached)")
+            break
+
+        tree.files.append(file)
+        tree.total_size += file.size
+
+    return tree
+
+
+def _iter_tar_files(
+    fileobj: IO[bytes],
+    select: Callable[[str, int], bool]
+) -> Iterator[Tuple[str, int, IO[bytes]]]:
+    """
+    Stream a GitHub tarball and yield selected regular files.
+
+    Members rejected by ``select``, and members whose stream the caller
+    does not read, are skipped without being held in memory.
+
+    Yields:
+        (path, size, stream) tuples with paths relative to the repo root.
+        Each stream is only valid until the next item is requested.
+    """
+    with tarfile.open(fileobj=fileobj, mode="r|gz") as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+
+            # Strip the "{owner}-{repo}-{sha}/" prefix GitHub adds
+            _, _, path = member.name.partition("/")
+            if not path or not select(path, member.size):
+                continue
+
+            extracted = archive.extractfile(member)
+            if extracted is None:
+                continue
+            yield path, member.size, extracted
+
+
+def _fill_tree_from_archive(
+    tree: RepoTree,
+    entries: Iterator[Tuple[str, int, IO[bytes]]],
+    max_total_size: Optional[int],
+    fetch_content: bool,
+    blob_store: Optional[BlobStore]
+) -> RepoTree:
+    """Add archive entries to tree, computing blob SHAs and honoring the budget."""
+    for path, size, stream in entries:
+        # Check total size limit
+        if max_total_size and tree.total_size + size > max_total_size:
+            print(f"⚠️ Stopping at {len(tree.files)} files (total size limit reached)")
+            break
+
+        data = stream.read()
+        sha = git_blob_sha(data)
+        if blob_store is not None:
+            blob_store.put(sha, data)
+        tree.files.append(RepoFile(
+            path=path,
+            type="file",
+            size=size,
+            sha=sha,
+            download_url=None,
+            content=_decode_text(data) if fetch_content else None
+        ))
+        tree.total_size += size
+
+    return tree
+
+
+def _check_issue_payload(token: Optional[str], payload: Dict[str, Any]) -> None:
+    """
+    Validate issue creation preconditions.
+
+    Raises:
+        GitHubAuthError: If no token is configured
+        GitHubClientError: If payload has no title
+    """
+    # SAFETY: Require authentication for write operations
+    if not token:
+        raise GitHubAuthError(
+            "GitHub issue creation requires authentication. "
+            "Set GITHUB_TOKEN environment variable or provide token to client."
+        )
+
+    # Validate required fields
+    if "title" not in payload or not payload["title"]:
+        raise GitHubClientError("Issue payload must include 'title' field")
+
+
+def _parse_created_issue(issue_data: Dict[str, Any]) -> CreatedIssue:
+    """Extract issue details from a GitHub issue response."""
+    return CreatedIssue(
+        number=issue_data["number"],
+        html_url=issue_data["html_url"],
+        title=issue_data["title"],
+        state=issue_data["state"],
+        body=issue_data.get("body"),
+        labels=[label["name"] if isinstance(label, dict) else label
+               for label in issue_data.get("labels", [])],
+        assignees=[user["login"] if isinstance(user, dict) else user
+                  for user in issue_data.get("assignees", [])]
+    )
+
+
 class GitHubClient:
     """
     GitHub API client with read and guarded write operations.
@@ -87,25 +465,35 @@ class GitHubClient:
 
     Write operations (require authentication + feature flags):
     - Create issues
+
+    File contents are served from an optional BlobStore (keyed by git
+    blob SHA) before hitting the network.
     """
 
-    def __init__(self, token: Optional[str] = None, base_url: str = "https://api.github.com"):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        base_url: str = "https://api.github.com",
+        blob_store: Optional[BlobStore] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub personal access token (from env if not provided)
             base_url: GitHub API base URL (default: public GitHub)
+            blob_store: Optional content-addressed cache for file contents
+            retry_policy: Retry policy for transient failures (default: RetryPolicy())
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.base_url = base_url.rstrip("/")
+        self.blob_store = blob_store
+        self.retry_policy = retry_policy or RetryPolicy()
         self.session = requests.Session()
 
         # Set headers
-        self.session.headers.update({
-            "Accept": "application/vnd.github+json",
-            "X-GitHub-Api-Version": "2022-11-28"
-        })
+        self.session.headers.update(DEFAULT_HEADERS)
 
         if self.token:
             self.session.headers.update({
@@ -132,26 +520,26 @@ class GitHubClient:
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
 
         try:
-            response = self.session.request(method, url, **kwargs)
-
-            # Check for rate limiting
-            if response.status_code == 403 and "rate limit" in response.text.lower():
-                logger.log_error(
-                    "github_rate_limit_exceeded",
-                    endpoint=endpoint,
-                    reset_at=response.headers.get('X-RateLimit-Reset'),
-                    remaining=response.headers.get('X-RateLimit-Remaining')
-                )
-                raise GitHubRateLimitError(f"GitHub API rate limit exceeded. Reset at: {response.headers.get('X-RateLimit-Reset')}")
-
-            # Check for auth errors
-            if response.status_code in (401, 403):
-                logger.log_error(
-                    "github_auth_failed",
-                    endpoint=endpoint,
-                    status_code=response.status_code
-                )
-                raise GitHubAuthError(f"GitHub authentication failed: {response.status_code} - {response.text[:200]}")
+            attempt = 0
+            while True:
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if not self.retry_policy.should_retry_error(attempt, method, _is_connect_error(e)):
+                        raise
+                    time.sleep(self.retry_policy.delay(attempt))
+                    attempt += 1
+                    continue
+
+                retry_after = response.headers.get("Retry-After")
+                if self.retry_policy.should_retry(response.status_code, attempt, method, retry_after):
+                    response.close()
+                    time.sleep(self.retry_policy.delay(attempt, retry_after))
+                    attempt += 1
+                    continue
+                break
+
+            _raise_for_github_error(response.status_code, response.text, response.headers, endpoint)
 
             # Raise for other HTTP errors
             response.raise_for_status()
@@ -193,63 +581,148 @@ class GitHubClient:
         Returns:
             List of RepoFile objects
         """
-        endpoint = f"/repos/{owner}/{repo}/git/trees/{ref}"
+        if recursive:
+            # Walker handles truncated listings of very large repos
+            return list(self.iter_repo_files(
+                owner=owner,
+                repo=repo,
+                ref=ref,
+                file_patterns=file_patterns,
+                exclude_patterns=exclude_patterns,
+                max_size_bytes=max_size_bytes
+            ))
+
+        response = self._request("GET", f"/repos/{owner}/{repo}/git/trees/{ref}")
+        tree_data = response.json()
+
+        return _parse_tree_files(
+            tree_data.get("tree", []),
+            file_patterns,
+            exclude_patterns,
+            max_size_bytes
+        )
+
+    def _get_tree(self, owner: str, repo: str, tree: str, recursive: bool) -> Dict[str, Any]:
+        """Fetch one git tree (by ref or tree SHA)."""
+        endpoint = f"/repos/{owner}/{repo}/git/trees/{tree}"
         if recursive:
             endpoint += "?recursive=1"
+        return self._request("GET", endpoint).json()
 
-        response = self._request("GET", endpoint)
-        tree_data = response.json()
+    def _get_subtree(self, owner: str, repo: str, sha: str) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Fetch a subtree recursively, or one level if that is truncated too.
 
-        files = []
-        for item in tree_data.get("tree", []):
-            # Skip directories in file list
-            if item["type"] != "blob":  # blob = file, tree = directory
-                continue
+        Returns:
+            (items, complete) - complete is False if only direct children
+            were listed and nested subtrees still need walking
+        """
+        data = self._get_tree(owner, repo, sha, recursive=True)
+        if not data.get("truncated"):
+            return data.get("tree", []), True
+        return self._get_tree(owner, repo, sha, recursive=False).get("tree", []), False
 
-            file_path = item["path"]
+    def iter_repo_files(
+        self,
+        owner: str,
+        repo: str,
+        ref: str = "main",
+        file_patterns: Optional[List[str]] = None,
+        exclude_patterns: Optional[List[str]] = None,
+        max_size_bytes: Optional[int] = None,
+        max_total_size: Optional[int] = None,
+        concurrency: int = TREE_WALK_CONCURRENCY
+    ) -> Iterator[RepoFile]:
+        """
+        Stream all matching files in a repository, however large.
 
-            # Apply file pattern filters
-            if file_patterns:
-                import fnmatch
-                if not any(fnmatch.fnmatch(file_path, pattern) for pattern in file_patterns):
-                    continue
+        Makes one recursive tree call. If GitHub truncates it (very large
+        repos), walks the tree breadth-first instead: each subtree is
+        fetched recursively (or one level at a time if it is truncated
+        too), with up to `concurrency` requests in flight. Excluded
+        directories are never fetched.
 
-            # Apply exclude patterns
-            if exclude_patterns:
-                import fnmatch
-                if any(fnmatch.fnmatch(file_path, pattern) for pattern in exclude_patterns):
-                    continue
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag, or commit SHA
+            file_patterns: Include only matching patterns
+            exclude_patterns: Exclude matching patterns
+            max_size_bytes: Skip files larger than this
+            max_total_size: Stop once the total size would exceed this
+            concurrency: Max concurrent subtree fetches
 
-            # Apply size filter
-            if max_size_bytes and item.get("size", 0) > max_size_bytes:
-                continue
+        Yields:
+            RepoFile objects as they are discovered
+        """
+        matcher = get_path_matcher(file_patterns, exclude_patterns)
+        budget = _SizeBudget(max_total_size)
+
+        data = self._get_tree(owner, repo, ref, recursive=True)
+        if not data.get("truncated"):
+            files, _ = _split_tree_items(data.get("tree", []), "", matcher, max_size_bytes)
+            for file in files:
+                if not budget.admit(file):
+                    return
+                yield file
+            return
+
+        logger.log_warning(
+            "github_tree_truncated",
+            repo=f"{owner}/{repo}",
+            ref=ref,
+            message="Recursive listing truncated, walking subtrees"
+        )
 
-            repo_file = RepoFile(
-                path=file_path,
-                type="file",
-                size=item.get("size", 0),
-                sha=item["sha"],
-                download_url=None  # Not provided in tree API
-            )
-            files.append(repo_file)
+        root = self._get_tree(owner, repo, ref, recursive=False)
+        files, pending = _split_tree_items(root.get("tree", []), "", matcher, max_size_bytes)
+        pending = deque(pending)
+        in_flight = deque()
+        pool = ThreadPoolExecutor(max_workers=concurrency)
 
-        return files
+        try:
+            while True:
+                for file in files:
+                    if not budget.admit(file):
+                        return
+                    yield file
+
+                # Keep the window full; results are consumed in BFS order
+                while pending and len(in_flight) < concurrency:
+                    prefix, sha = pending.popleft()
+                    in_flight.append((prefix, pool.submit(self._get_subtree, owner, repo, sha)))
+                if not in_flight:
+                    return
+
+                prefix, future = in_flight.popleft()
+                items, complete = future.result()
+                files, subtrees = _split_tree_items(items, prefix, matcher, max_size_bytes)
+                if not complete:
+                    pending.extend(subtrees)
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def get_file_content(
         self,
         owner: str,
         repo: str,
         path: str,
-        ref: str = "main"
+        ref: str = "main",
+        sha: Optional[str] = None
     ) -> str:
         """
         Get raw file content from repository.
 
+        When the blob SHA is known (e.g. from a tree listing) and the blob
+        store holds it, no request is made. Fetched content is added to
+        the blob store.
+
         Args:
             owner: Repository owner
             repo: Repository name
             path: File path within repo
             ref: Branch, tag, or commit SHA
+            sha: Optional git blob SHA of the file
 
         Returns:
             File content as string
@@ -257,6 +730,11 @@ class GitHubClient:
         Raises:
             GitHubClientError: If file cannot be fetched
         """
+        if sha and self.blob_store is not None:
+            data = self.blob_store.get(sha)
+            if data is not None:
+                return data.decode("utf-8")
+
         endpoint = f"/repos/{owner}/{repo}/contents/{path}"
         params = {"ref": ref}
 
@@ -264,13 +742,48 @@ class GitHubClient:
         data = response.json()
 
         # GitHub returns content base64-encoded
-        import base64
         if "content" in data:
-            content = base64.b64decode(data["content"]).decode("utf-8")
-            return content
+            raw = base64.b64decode(data["content"])
+            if self.blob_store is not None and data.get("sha"):
+                self.blob_store.put(data["sha"], raw)
+            return raw.decode("utf-8")
         else:
             raise GitHubClientError(f"No content returned for {path}")
 
+    def get_blob_content(self, owner: str, repo: str, sha: str) -> str:
+        """
+        Get file content by git blob SHA alone.
+
+        Served from the blob store when present, otherwise fetched via the
+        git/blobs/{sha} endpoint and stored.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            sha: Git blob SHA
+
+        Returns:
+            File content as string
+
+        Raises:
+            GitHubClientError: If blob cannot be fetched
+        """
+        if self.blob_store is not None:
+            data = self.blob_store.get(sha)
+            if data is not None:
+                return data.decode("utf-8")
+
+        response = self._request("GET", f"/repos/{owner}/{repo}/git/blobs/{sha}")
+        data = response.json()
+
+        if data.get("encoding") != "base64" or "content" not in data:
+            raise GitHubClientError(f"No content returned for blob {sha}")
+
+        raw = base64.b64decode(data["content"])
+        if self.blob_store is not None:
+            self.blob_store.put(sha, raw)
+        return raw.decode("utf-8")
+
     def get_repo_tree(
         self,
         owner: str,
@@ -280,11 +793,19 @@ class GitHubClient:
         exclude_patterns: Optional[List[str]] = None,
         max_file_size: Optional[int] = None,
         max_total_size: Optional[int] = None,
-        fetch_content: bool = False
+        fetch_content: bool = False,
+        strategy: str = STRATEGY_PER_FILE
     ) -> RepoTree:
         """
         Get complete repository tree with optional content fetching.
 
+        Strategies:
+        - "per_file": List the tree, then one contents/ call per file
+        - "archive": Download /tarball/{ref} once and stream-decompress it,
+          keeping only matching files in memory
+        - "auto": List the tree, then use the archive when more than
+          ARCHIVE_AUTO_MIN_FILES files need content (per_file otherwise)
+
         Args:
             owner: Repository owner
             repo: Repository name
@@ -294,46 +815,172 @@ class GitHubClient:
             max_file_size: Max size per file in bytes
             max_total_size: Max total size in bytes (stops when exceeded)
             fetch_content: Whether to fetch actual file contents
+            strategy: Fetch strategy ("per_file", "archive", or "auto";
+                default: per_file)
 
         Returns:
             RepoTree object with files (and optionally contents)
+
+        Raises:
+            ValueError: If strategy is not recognized
         """
-        # List all matching files
-        files = self.list_repo_files(
+        if strategy not in FETCH_STRATEGIES:
+            raise ValueError(
+                f"Unknown fetch strategy '{strategy}' (expected one of {', '.join(FETCH_STRATEGIES)})"
+            )
+
+        if strategy == STRATEGY_ARCHIVE:
+            return self._get_repo_tree_from_archive(
+                owner=owner,
+                repo=repo,
+                ref=ref,
+                file_patterns=file_patterns,
+                exclude_patterns=exclude_patterns,
+                max_file_size=max_file_size,
+                max_total_size=max_total_size,
+                fetch_content=fetch_content
+            )
+
+        # Stream matching files, applying the total size budget before
+        # fetching any content
+        tree = RepoTree(owner=owner, repo=repo, ref=ref, files=[])
+        for file in self.iter_repo_files(
             owner=owner,
             repo=repo,
             ref=ref,
-            recursive=True,
             file_patterns=file_patterns,
             exclude_patterns=exclude_patterns,
-            max_size_bytes=max_file_size
-        )
+            max_size_bytes=max_file_size,
+            max_total_size=max_total_size
+        ):
+            tree.files.append(file)
+            tree.total_size += file.size
 
-        tree = RepoTree(
-            owner=owner,
-            repo=repo,
-            ref=ref,
-            files=[]
-        )
+        if not fetch_content:
+            return tree
+
+        # Serve unchanged files from the blob store
+        missing = []
+        for file in tree.files:
+            data = self.blob_store.get(file.sha) if self.blob_store is not None else None
+            if data is not None:
+                file.content = _decode_text(data)
+            else:
+                missing.append(file)
+
+        if strategy == STRATEGY_AUTO and len(missing) > ARCHIVE_AUTO_MIN_FILES:
+            wanted = {file.path: file for file in missing}
+            try:
+                for path, _size, stream in self._iter_archive_files(
+                    owner, repo, ref, lambda path, size: path in wanted
+                ):
+                    data = stream.read()
+                    wanted[path].content = _decode_text(data)
+                    self._store_blob(wanted[path].sha, data)
+                return tree
+            except GitHubClientError as e:
+                # Degrade to per-file fetches for whatever the archive did not cover
+                logger.log_warning(
+                    "github_archive_fallback",
+                    repo=f"{owner}/{repo}",
+                    ref=ref,
+                    message=f"Archive fetch failed, fetching files individually: {e}"
+                )
+                missing = [file for file in missing if file.content is None]
 
-        # Fetch content if requested
-        for file in files:
-            # Check total size limit
-            if max_total_size and tree.total_size + file.size > max_total_size:
-                print(f"⚠️ Stopping at {len(tree.files)} files (total size limit reached)")
-                break
+        # Fetch content per file
+        for file in missing:
+            try:
+                file.content = self.get_file_content(owner, repo, file.path, ref, sha=file.sha)
+            except GitHubClientError as e:
+                print(f"⚠️ Could not fetch {file.path}: {e}")
+                file.content = None
 
-            if fetch_content:
-                try:
-                    file.content = self.get_file_content(owner, repo, file.path, ref)
-                except GitHubClientError as e:
-                    print(f"⚠️ Could not fetch {file.path}: {e}")
-                    file.content = None
+        return tree
 
-            tree.files.append(file)
-            tree.total_size += file.size
+    def _store_blob(self, sha: str, data: bytes) -> None:
+        """Add blob bytes to the blob store, if one is configured."""
+        if self.blob_store is not None:
+            self.blob_store.put(sha, data)
 
-        return tree
+    def _iter_archive_files(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        select: Callable[[str, int], bool]
+    ) -> Iterator[Tuple[str, int, IO[bytes]]]:
+        """
+        Stream the repository tarball and yield selected regular files.
+
+        The archive is decompressed as it downloads. Members rejected by
+        ``select``, and members whose stream the caller does not read, are
+        skipped without being held in memory. Closing the iterator early
+        stops the download.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ref: Branch, tag, or commit SHA
+            select: Callable (path, size) -> bool deciding which files to read
+
+        Yields:
+            (path, size, stream) tuples with paths relative to the repo root.
+            Each stream is only valid until the next item is requested.
+
+        Raises:
+            GitHubClientError: If the archive cannot be downloaded or read
+        """
+        endpoint = f"/repos/{owner}/{repo}/tarball/{ref}"
+        response = self._request("GET", endpoint, stream=True)
+
+        try:
+            response.raw.decode_content = True
+            yield from _iter_tar_files(response.raw, select)
+
+        except (tarfile.TarError, OSError, requests.exceptions.RequestException) as e:
+            logger.log_error(
+                "github_archive_failed",
+                endpoint=endpoint,
+                error=str(e)
+            )
+            raise GitHubClientError(f"Failed to read archive for {owner}/{repo}@{ref}: {e}")
+
+        finally:
+            response.close()
+
+    def _get_repo_tree_from_archive(
+        self,
+        owner: str,
+        repo: str,
+        ref: str,
+        file_patterns: Optional[List[str]],
+        exclude_patterns: Optional[List[str]],
+        max_file_size: Optional[int],
+        max_total_size: Optional[int],
+        fetch_content: bool
+    ) -> RepoTree:
+        """
+        Build a RepoTree from a single tarball download.
+
+        Filters and size limits are applied while streaming, so only
+        matching files are ever held in memory. File SHAs are computed
+        locally and match the git blob SHAs of the tree API.
+        """
+        matcher = get_path_matcher(file_patterns, exclude_patterns)
+
+        def select(path: str, size: int) -> bool:
+            if max_file_size and size > max_file_size:
+                return False
+            return matcher.matches(path)
+
+        return _fill_tree_from_archive(
+            RepoTree(owner=owner, repo=repo, ref=ref, files=[]),
+            self._iter_archive_files(owner, repo, ref, select),
+            max_total_size,
+            fetch_content,
+            self.blob_store
+        )
 
     def check_auth(self) -> Dict[str, Any]:
         """
@@ -405,36 +1052,14 @@ class GitHubClient:
             GitHubAuthError: If no token or insufficient permissions
             GitHubClientError: If creation fails
         """
-        # SAFETY: Require authentication for write operations
-        if not self.token:
-            raise GitHubAuthError(
-                "GitHub issue creation requires authentication. "
-                "Set GITHUB_TOKEN environment variable or provide token to client."
-            )
-
-        # Validate required fields
-        if "title" not in payload or not payload["title"]:
-            raise GitHubClientError("Issue payload must include 'title' field")
+        _check_issue_payload(self.token, payload)
 
         # Make POST request to create issue
         endpoint = f"/repos/{owner}/{repo}/issues"
 
         try:
             response = self._request("POST", endpoint, json=payload)
-            issue_data = response.json()
-
-            # Extract issue details
-            return CreatedIssue(
-                number=issue_data["number"],
-                html_url=issue_data["html_url"],
-                title=issue_data["title"],
-                state=issue_data["state"],
-                body=issue_data.get("body"),
-                labels=[label["name"] if isinstance(label, dict) else label
-                       for label in issue_data.get("labels", [])],
-                assignees=[user["login"] if isinstance(user, dict) else user
-                          for user in issue_data.get("assignees", [])]
-            )
+            return _parse_created_issue(response.json())
 
         except GitHubAuthError:
             # Re-raise auth errors with context
@@ -446,19 +1071,109 @@ class GitHubClient:
             # Re-raise with context
             raise GitHubClientError(f"Failed to create issue in {owner}/{repo}: {e}")
 
+    def update_issue(
+        self,
+        owner: str,
+        repo: str,
+        number: int,
+        payload: Dict[str, Any]
+    ) -> CreatedIssue:
+        """
+        Update an existing issue (title, body, labels, ...).
+
+        IMPORTANT: This is a WRITE operation, guarded like create_issue.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            number: Issue number
+            payload: Fields to change (same keys as create_issue)
+
+        Returns:
+            CreatedIssue object with the updated issue details
+
+        Raises:
+            GitHubAuthError: If no token or insufficient permissions
+            GitHubClientError: If the update fails
+        """
+        _check_issue_payload(self.token, payload)
+
+        endpoint = f"/repos/{owner}/{repo}/issues/{number}"
+
+        try:
+            response = self._request("PATCH", endpoint, json=payload)
+            return _parse_created_issue(response.json())
+
+        except GitHubAuthError:
+            raise GitHubAuthError(
+                f"Failed to update issue #{number} in {owner}/{repo}: "
+                "Check that GITHUB_TOKEN has 'repo' or 'public_repo' scope"
+            )
+        except GitHubClientError as e:
+            raise GitHubClientError(f"Failed to update issue #{number} in {owner}/{repo}: {e}")
+
+    def get_issues_page(
+        self,
+        owner: str,
+        repo: str,
+        page: int = 1,
+        etag: Optional[str] = None,
+        state: str = "open",
+        per_page: int = 100
+    ) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str], bool]:
+        """
+        Fetch one page of issues, conditionally on a cached ETag.
+
+        Conditional requests answered with 304 do not count against the
+        rate limit, so re-listing an unchanged repo is free.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            page: Page number (1-based)
+            etag: ETag from a previous fetch of this page
+            state: "open", "closed", or "all"
+            per_page: Page size (max 100)
+
+        Returns:
+            (issues, etag, has_next) - issues is None if the page is
+            unchanged (has_next then comes from the 304 and may be unset)
+        """
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self._request(
+            "GET",
+            f"/repos/{owner}/{repo}/issues",
+            params={"state": state, "per_page": per_page, "page": page},
+            headers=headers
+        )
+
+        has_next = "next" in response.links
+        if response.status_code == 304:
+            return None, etag, has_next
+
+        # Pull requests are listed as issues; skip them
+        issues = [item for item in response.json() if "pull_request" not in item]
+        return issues, response.headers.get("ETag"), has_next
+
 
 # Convenience functions
-def get_client(token: Optional[str] = None) -> GitHubClient:
+def get_client(
+    token: Optional[str] = None,
+    blob_store: Optional[BlobStore] = None
+) -> GitHubClient:
     """
     Get a GitHub client instance.
 
     Args:
         token: Optional token (uses GITHUB_TOKEN env var if not provided)
+        blob_store: Optional blob store (uses GITHUB_BLOB_STORE_DIR if not provided)
 
     Returns:
         GitHubClient instance
     """
-    return GitHubClient(token=token)
+    if blob_store is None:
+        blob_store = get_default_blob_store()
+    return GitHubClient(token=token, blob_store=blob_store)
 
 
 # Example usage
@@ -0,0 +1,254 @@
+"""
+Open Issue Index for Finding Deduplication
+
+Nightly runs regenerate the same findings. Each bot-filed issue carries a
+finding fingerprint in a hidden marker in its body; this module indexes
+the open issues of a repo by that fingerprint so callers can skip (or
+update) findings that are already filed instead of opening duplicates.
+
+- Fingerprint: sha256 of (repo, rule, file, normalized title)
+- Content hash: sha256 of the stable parts of the issue body, so an
+  unchanged finding needs no write at all
+- Index: one paginated listing of open issues per run, cached on disk
+  per repo with per-page ETags. Unchanged pages come back as 304s, which
+  do not count against the GitHub rate limit.
+
+Environment Variables:
+    GITHUB_ISSUE_INDEX_DIR: Cache directory (default: ~/.cache/bobs-brain/issue-index)
+"""
+
+import hashlib
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .github_client import GitHubClient
+
+DEFAULT_INDEX_DIR = "~/.cache/bobs-brain/issue-index"
+
+# Hidden marker stamped into issue bodies (invisible in rendered markdown)
+FINGERPRINT_MARKER = "<!-- bob-fingerprint: {fingerprint} content: {content_hash} -->"
+_MARKER_RE = re.compile(r"<!-- bob-fingerprint: ([0-9a-f]{64}) content: ([0-9a-f]{64}) -->")
+
+_NON_WORD = re.compile(r"[^a-z0-9#]+")
+_DIGITS = re.compile(r"\d+")
+
+# Bump to invalidate caches written in an older format
+_CACHE_VERSION = 1
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize an issue title for fingerprinting.
+
+    Case, punctuation, whitespace and numbers (line numbers, counts) are
+    ignored, so "Missing docstring (3 functions)" and "missing docstring:
+    4 functions" collide.
+    """
+    text = _DIGITS.sub("#", title.lower())
+    return _NON_WORD.sub(" ", text).strip()
+
+
+def finding_fingerprint(
+    repo: str,
+    rule: str,
+    file_path: Optional[str],
+    title: str
+) -> str:
+    """
+    Compute the stable fingerprint of a finding.
+
+    Args:
+        repo: Repository full name (owner/repo)
+        rule: Rule or pattern that produced the finding
+        file_path: File the finding is about (None for repo-wide findings)
+        title: Issue title (normalized before hashing)
+
+    Returns:
+        64-char hex fingerprint
+    """
+    key = "\0".join([repo.lower(), rule, file_path or "", normalize_title(title)])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """Hash the stable content of an issue (excluding timestamps and run IDs)."""
+    return hashlib.sha256("\0".join(p or "" for p in parts).encode()).hexdigest()
+
+
+def stamp_fingerprint(body: str, fingerprint: str, body_hash: str) -> str:
+    """Append the fingerprint marker to an issue body."""
+    marker = FINGERPRINT_MARKER.format(fingerprint=fingerprint, content_hash=body_hash)
+    return f"{body.rstrip()}\n\n{marker}\n"
+
+
+def parse_fingerprint(body: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Extract (fingerprint, content_hash) from an issue body.
+
+    Returns:
+        Tuple if the body carries a marker, None otherwise
+    """
+    if not body:
+        return None
+    match = _MARKER_RE.search(body)
+    return (match.group(1), match.group(2)) if match else None
+
+
+@dataclass
+class IndexedIssue:
+    """An open bot issue, as recorded in the index."""
+
+    number: int
+    html_url: str
+    content_hash: str
+
+
+@dataclass
+class _CachedPage:
+    etag: Optional[str]
+    has_next: bool
+    entries: Dict[str, IndexedIssue] = field(default_factory=dict)
+
+
+class OpenIssueIndex:
+    """
+    Fingerprint -> open issue index for one repository.
+
+    Build with OpenIssueIndex.load(); record new issues with add() so
+    duplicates inside the same batch are caught too.
+    """
+
+    def __init__(self, owner: str, repo: str, entries: Optional[Dict[str, IndexedIssue]] = None):
+        self.owner = owner
+        self.repo = repo
+        self.entries: Dict[str, IndexedIssue] = dict(entries or {})
+        self.pages_fetched = 0
+        self.pages_not_modified = 0
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, fingerprint: str) -> Optional[IndexedIssue]:
+        """Get the open issue for a fingerprint, if any."""
+        return self.entries.get(fingerprint)
+
+    def add(self, fingerprint: str, issue: IndexedIssue) -> None:
+        """Record an issue filed or updated during this run."""
+        self.entries[fingerprint] = issue
+
+    @staticmethod
+    def cache_path(owner: str, repo: str, cache_dir: Optional[Union[str, Path]] = None) -> Path:
+        """Get the cache file for a repository."""
+        root = Path(os.path.expanduser(str(cache_dir or os.getenv("GITHUB_ISSUE_INDEX_DIR", DEFAULT_INDEX_DIR))))
+        return root / f"{owner}__{repo}.json"
+
+    @classmethod
+    def load(
+        cls,
+        client: GitHubClient,
+        owner: str,
+        repo: str,
+        cache_dir: Optional[Union[str, Path]] = None
+    ) -> "OpenIssueIndex":
+        """
+        Build the index with one paginated listing of open issues.
+
+        Every page is requested conditionally on its cached ETag; 304
+        pages are served from the cache. The refreshed pages are written
+        back for the next run.
+
+        Args:
+            client: GitHub client (token optional for public repos)
+            owner: Repository owner
+            repo: Repository name
+            cache_dir: Cache directory (default: GITHUB_ISSUE_INDEX_DIR)
+
+        Returns:
+            OpenIssueIndex instance
+
+        Raises:
+            GitHubClientError: If the listing fails
+        """
+        path = cls.cache_path(owner, repo, cache_dir)
+        cached = _read_cache(path)
+
+        index = cls(owner, repo)
+        pages: List[_CachedPage] = []
+        page_number = 1
+        while True:
+            previous = cached[page_number - 1] if page_number <= len(cached) else None
+            issues, etag, has_next = client.get_issues_page(
+                owner, repo, page=page_number, etag=previous.etag if previous else None
+            )
+
+            if issues is None and previous is not None:
+                page = _CachedPage(etag=previous.etag, has_next=previous.has_next, entries=previous.entries)
+                index.pages_not_modified += 1
+            else:
+                page = _CachedPage(etag=etag, has_next=has_next)
+                for issue in issues or []:
+                    marker = parse_fingerprint(issue.get("body"))
+                    if marker:
+                        page.entries[marker[0]] = IndexedIssue(
+                            number=issue["number"],
+                            html_url=issue["html_url"],
+                            content_hash=marker[1]
+                        )
+                index.pages_fetched += 1
+
+            pages.append(page)
+            index.entries.update(page.entries)
+            if not page.has_next:
+                break
+            page_number += 1
+
+        _write_cache(path, pages)
+        return index
+
+
+def _read_cache(path: Path) -> List[_CachedPage]:
+    """Read cached pages, ignoring missing or unreadable caches."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []
+    if data.get("version") != _CACHE_VERSION:
+        return []
+
+    return [
+        _CachedPage(
+            etag=page.get("etag"),
+            has_next=page.get("has_next", False),
+            entries={fp: IndexedIssue(**entry) for fp, entry in page.get("entries", {}).items()}
+        )
+        for page in data.get("pages", [])
+    ]
+
+
+def _write_cache(path: Path, pages: List[_CachedPage]) -> None:
+    """Write pages atomically; a failed write only costs a full listing next run."""
+    data = {
+        "version": _CACHE_VERSION,
+        "pages": [
+            {
+                "etag": page.etag,
+                "has_next": page.has_next,
+                "entries": {fp: asdict(entry) for fp, entry in page.entries.items()}
+            }
+            for page in pages
+        ]
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
@@ -0,0 +1,183 @@
+"""
+Precompiled Path Filter for Repository File Listings
+
+Compiles include/exclude glob patterns (fnmatch syntax, as used by
+RegistrySettings.analysis_file_patterns / analysis_exclude_patterns)
+once, so filtering a 100k+ entry tree costs a few string checks per
+path instead of one fnmatch call per pattern per path.
+
+Patterns are split into fast paths before falling back to regex:
+- "*.py"            -> str.endswith() over a tuple of suffixes
+- "node_modules/*"  -> str.startswith() over a tuple of prefixes
+- "*__pycache__*"   -> substring check
+- "README.md"       -> set membership
+- anything else     -> one combined regex for the whole pattern list
+
+Matching is exactly equivalent to fnmatch.fnmatch() on POSIX paths
+("*" also matches "/").
+"""
+
+import fnmatch
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+def _has_wildcards(text: str) -> bool:
+    """Check if text contains any fnmatch wildcard characters."""
+    return _WILDCARDS.search(text) is not None
+
+
+class _PatternSet:
+    """One compiled pattern list (includes or excludes)."""
+
+    __slots__ = ("suffixes", "prefixes", "substrings", "literals", "regex", "match_all")
+
+    def __init__(self, patterns: Sequence[str]):
+        suffixes: List[str] = []
+        prefixes: List[str] = []
+        substrings: List[str] = []
+        literals = set()
+        regex_parts: List[str] = []
+        self.match_all = False
+
+        for pattern in patterns:
+            if pattern == "*":
+                self.match_all = True
+            elif not _has_wildcards(pattern):
+                literals.add(pattern)
+            elif pattern.startswith("*") and not _has_wildcards(pattern[1:]):
+                suffixes.append(pattern[1:])
+            elif pattern.endswith("*") and not _has_wildcards(pattern[:-1]):
+                prefixes.append(pattern[:-1])
+            elif (len(pattern) > 2 and pattern.startswith("*") and pattern.endswith("*")
+                  and not _has_wildcards(pattern[1:-1])):
+                substrings.append(pattern[1:-1])
+            else:
+                regex_parts.append(fnmatch.translate(pattern))
+
+        self.suffixes: Tuple[str, ...] = tuple(suffixes)
+        self.prefixes: Tuple[str, ...] = tuple(prefixes)
+        self.substrings: Tuple[str, ...] = tuple(substrings)
+        self.literals = frozenset(literals)
+        self.regex = re.compile("|".join(regex_parts)) if regex_parts else None
+
+    def matches(self, path: str) -> bool:
+        """Check if path matches any pattern in the set."""
+        if self.match_all:
+            return True
+        if self.suffixes and path.endswith(self.suffixes):
+            return True
+        if self.prefixes and path.startswith(self.prefixes):
+            return True
+        if path in self.literals:
+            return True
+        for substring in self.substrings:
+            if substring in path:
+                return True
+        if self.regex is not None and self.regex.match(path):
+            return True
+        return False
+
+    def covers_dir(self, dir_path: str) -> bool:
+        """Check if every path under dir_path is guaranteed to match."""
+        if self.match_all:
+            return True
+        prefix = dir_path + "/"
+        if self.prefixes and prefix.startswith(self.prefixes):
+            return True
+        for substring in self.substrings:
+            if substring in prefix:
+                return True
+        return False
+
+
+class PathMatcher:
+    """
+    Compiled include/exclude path filter.
+
+    A path is selected when it matches an include pattern (or there are
+    no include patterns) and matches no exclude pattern.
+
+    Example:
+        >>> matcher = PathMatcher(["*.py", "*.md"], ["*.pyc", "venv/*"])
+        >>> matcher.matches("agents/bob/agent.py")
+        True
+        >>> matcher.matches("venv/lib/site.py")
+        False
+    """
+
+    def __init__(
+        self,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None
+    ):
+        """
+        Compile include and exclude patterns.
+
+        Args:
+            include: Include only matching paths (None or empty = include all)
+            exclude: Exclude matching paths
+        """
+        self.include_patterns = tuple(include or ())
+        self.exclude_patterns = tuple(exclude or ())
+        self._include = _PatternSet(self.include_patterns) if self.include_patterns else None
+        self._exclude = _PatternSet(self.exclude_patterns) if self.exclude_patterns else None
+
+    def matches(self, path: str) -> bool:
+        """
+        Check if a repository-relative path is selected.
+
+        Args:
+            path: POSIX-style path relative to the repo root
+
+        Returns:
+            True if the path passes include and exclude filters
+        """
+        if self._include is not None and not self._include.matches(path):
+            return False
+        if self._exclude is not None and self._exclude.matches(path):
+            return False
+        return True
+
+    __call__ = matches
+
+    def excludes_dir(self, dir_path: str) -> bool:
+        """
+        Check if a whole directory can be skipped.
+
+        Only returns True when every possible path beneath the directory
+        is excluded, so tree walkers can prune without changing results.
+
+        Args:
+            dir_path: POSIX-style directory path relative to the repo root
+
+        Returns:
+            True if the directory subtree is fully excluded
+        """
+        return self._exclude is not None and self._exclude.covers_dir(dir_path)
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(include: Tuple[str, ...], exclude: Tuple[str, ...]) -> PathMatcher:
+    return PathMatcher(include, exclude)
+
+
+def get_path_matcher(
+    include: Optional[Sequence[str]] = None,
+    exclude: Optional[Sequence[str]] = None
+) -> PathMatcher:
+    """
+    Get a compiled matcher, reusing one already built for the same patterns.
+
+    Args:
+        include: Include patterns
+        exclude: Exclude patterns
+
+    Returns:
+        PathMatcher instance
+    """
+    return _cached_matcher(tuple(include or ()), tuple(exclude or ()))
+
@@ -0,0 +1,306 @@
+"""
+Admission Control for the A2A Gateway
+
+Under bursts, fanning every /a2a/run call out to Agent Engine just gets
+them all throttled and timed out together. Upstream calls are admitted
+against:
+
+- a global concurrency limit, tuned with AIMD: +1 after a healthy window
+  in which the limit was actually used, x0.7 after a window with too many
+  429/5xx/timeouts or latency above the target
+- a per-caller_spiffe_id concurrency limit, so one noisy agent cannot take
+  every slot (calls without a caller ID only count against the global limit)
+- a bounded FIFO wait queue with a deadline
+
+When the queue is full or the deadline passes, the call is rejected fast
+with AdmissionRejected; the gateway turns that into 429 + Retry-After.
+
+Environment Variables:
+- GATEWAY_ADMISSION_ENABLED: Enable admission control (default: true)
+- GATEWAY_MAX_CONCURRENCY: Initial global upstream limit (default: 32)
+- GATEWAY_MIN_CONCURRENCY / GATEWAY_MAX_CONCURRENCY_CEILING: AIMD bounds
+  (defaults: 4 / 128)
+- GATEWAY_PER_CALLER_CONCURRENCY: Per-caller_spiffe_id limit (default: 8)
+- GATEWAY_QUEUE_SIZE: Max queued calls (default: 64)
+- GATEWAY_QUEUE_TIMEOUT: Max seconds a call waits in the queue (default: 10)
+- GATEWAY_ADAPTIVE_CONCURRENCY: Enable AIMD tuning (default: true)
+- GATEWAY_TARGET_LATENCY: Upstream latency (seconds) above which the limit
+  is decreased (default: 20)
+"""
+
+import asyncio
+import logging
+import math
+import os
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upstream outcomes that count as "overloaded" for AIMD
+OVERLOAD_STATUSES = (429, 500, 502, 503, 504)
+
+# AIMD tuning
+DECREASE_FACTOR = 0.7
+MAX_ERROR_RATE = 0.1
+LATENCY_EWMA_ALPHA = 0.2
+MAX_RETRY_AFTER = 60
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class AdmissionRejected(Exception):
+    """Call was not admitted (queue full or queue deadline passed)."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(f"Gateway overloaded ({reason}), retry after {retry_after}s")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class AdmissionConfig:
+    """Admission control settings."""
+
+    enabled: bool = True
+    initial_limit: int = 32
+    min_limit: int = 4
+    max_limit: int = 128
+    per_caller_limit: int = 8
+    max_queue: int = 64
+    queue_timeout: float = 10.0
+    adaptive: bool = True
+    target_latency: float = 20.0
+
+    @classmethod
+    def from_env(cls) -> "AdmissionConfig":
+        """Load settings from GATEWAY_* environment variables."""
+        return cls(
+            enabled=_env_bool("GATEWAY_ADMISSION_ENABLED", True),
+            initial_limit=int(os.getenv("GATEWAY_MAX_CONCURRENCY", "32")),
+            min_limit=int(os.getenv("GATEWAY_MIN_CONCURRENCY", "4")),
+            max_limit=int(os.getenv("GATEWAY_MAX_CONCURRENCY_CEILING", "128")),
+            per_caller_limit=int(os.getenv("GATEWAY_PER_CALLER_CONCURRENCY", "8")),
+            max_queue=int(os.getenv("GATEWAY_QUEUE_SIZE", "64")),
+            queue_timeout=float(os.getenv("GATEWAY_QUEUE_TIMEOUT", "10")),
+            adaptive=_env_bool("GATEWAY_ADAPTIVE_CONCURRENCY", True),
+            target_latency=float(os.getenv("GATEWAY_TARGET_LATENCY", "20")),
+        )
+
+
+class AdmissionController:
+    """
+    Concurrency limiter with a bounded deadline queue and AIMD tuning.
+
+    Usage:
+        async with controller.admit(caller_spiffe_id):
+            result = await call_upstream()
+        controller.record(latency_seconds, status_code)
+
+    Args:
+        config: Admission settings (default: AdmissionConfig.from_env())
+    """
+
+    def __init__(self, config: Optional[AdmissionConfig] = None):
+        self.config = config or AdmissionConfig.from_env()
+        self.limit = max(
+            self.config.min_limit, min(self.config.initial_limit, self.config.max_limit)
+        )
+        self.in_flight = 0
+        self._per_caller: Dict[str, int] = {}
+        self._waiters: Deque[Tuple[asyncio.Future, Optional[str]]] = deque()
+
+        # AIMD window
+        self._window_calls = 0
+        self._window_overloads = 0
+        self._window_peak = 0
+        self.latency_ewma: Optional[float] = None
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected: Dict[str, int] = {"queue_full": 0, "queue_timeout": 0}
+        self.increases = 0
+        self.decreases = 0
+
+    def _can_start(self, caller: Optional[str]) -> bool:
+        if self.in_flight >= self.limit:
+            return False
+        return (
+            caller is None
+            or self._per_caller.get(caller, 0) < self.config.per_caller_limit
+        )
+
+    def _start(self, caller: Optional[str]) -> None:
+        self.in_flight += 1
+        self._window_peak = max(self._window_peak, self.in_flight)
+        if caller is not None:
+            self._per_caller[caller] = self._per_caller.get(caller, 0) + 1
+        self.admitted += 1
+
+    def _release(self, caller: Optional[str]) -> None:
+        self.in_flight -= 1
+        if caller is not None:
+            remaining = self._per_caller.get(caller, 1) - 1
+            if remaining:
+                self._per_caller[caller] = remaining
+            else:
+                self._per_caller.pop(caller, None)
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        """Grant free slots to queued calls in FIFO order, skipping callers at their limit."""
+        for waiter in list(self._waiters):
+            if self.in_flight >= self.limit:
+                break
+            future, caller = waiter
+            if future.done():
+                self._waiters.remove(waiter)
+                continue
+            if self._can_start(caller):
+                self._waiters.remove(waiter)
+                self._start(caller)
+                future.set_result(None)
+
+    def retry_after(self) -> int:
+        """Estimate seconds until a slot frees up (for Retry-After)."""
+        latency = self.latency_ewma or 1.0
+        backlog = len(self._waiters) + 1
+        return max(
+            1, min(MAX_RETRY_AFTER, math.ceil(latency * backlog / max(self.limit, 1)))
+        )
+
+    def _reject(self, reason: str, caller: Optional[str]) -> AdmissionRejected:
+        self.rejected[reason] += 1
+        rejection = AdmissionRejected(reason, self.retry_after())
+        logger.warning(
+            "Gateway call rejected by admission control",
+            extra={
+                "reason": reason,
+                "caller_spiffe_id": caller,
+                "in_flight": self.in_flight,
+                "queued": len(self._waiters),
+                "limit": self.limit,
+            },
+        )
+        return rejection
+
+    @asynccontextmanager
+    async def admit(self, caller: Optional[str] = None) -> AsyncIterator[None]:
+        """
+        Hold an upstream slot for the duration of the block.
+
+        Args:
+            caller: caller_spiffe_id for the per-caller limit (None: global only)
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait exceeds the deadline
+        """
+        if not self.config.enabled:
+            yield
+            return
+
+        if self._can_start(caller) and not self._waiters:
+            self._start(caller)
+        elif len(self._waiters) >= self.config.max_queue:
+            raise self._reject("queue_full", caller)
+        else:
+            future = asyncio.get_running_loop().create_future()
+            waiter = (future, caller)
+            self._waiters.append(waiter)
+            # Queued callers may all be at their per-caller limit
+            self._wake_waiters()
+            if not future.done():
+                self.queued += 1
+            try:
+                await asyncio.wait_for(future, self.config.queue_timeout)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+                if future.done() and not future.cancelled():
+                    # Slot was granted as the wait ended: hand it back
+                    self._release(caller)
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+                raise self._reject("queue_timeout", caller)
+
+        try:
+            yield
+        finally:
+            self._release(caller)
+
+    def record(self, latency: float, status_code: int) -> None:
+        """
+        Record an upstream outcome and adjust the limit at window end.
+
+        Args:
+            latency: Upstream call duration in seconds
+            status_code: Upstream HTTP status (timeouts as 504)
+        """
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma += LATENCY_EWMA_ALPHA * (latency - self.latency_ewma)
+
+        self._window_calls += 1
+        if status_code in OVERLOAD_STATUSES:
+            self._window_overloads += 1
+
+        if not self.config.adaptive or self._window_calls < self.limit:
+            return
+
+        overloaded = (
+            self._window_overloads / self._window_calls > MAX_ERROR_RATE
+            or self.latency_ewma > self.config.target_latency
+        )
+        previous = self.limit
+        if overloaded:
+            self.limit = max(self.config.min_limit, int(self.limit * DECREASE_FACTOR))
+            if self.limit < previous:
+                self.decreases += 1
+        elif self._window_peak >= self.limit:
+            # Only grow a limit that was actually the bottleneck
+            self.limit = min(self.config.max_limit, self.limit + 1)
+            if self.limit > previous:
+                self.increases += 1
+                self._wake_waiters()
+
+        if self.limit != previous:
+            logger.info(
+                "Gateway concurrency limit adjusted",
+                extra={
+                    "previous_limit": previous,
+                    "limit": self.limit,
+                    "latency_ewma": round(self.latency_ewma, 3),
+                    "overloads": self._window_overloads,
+                    "window_calls": self._window_calls,
+                },
+            )
+
+        self._window_calls = 0
+        self._window_overloads = 0
+        self._window_peak = self.in_flight
+
+    def stats(self) -> Dict[str, Any]:
+        """Get current limit, usage and rejection counters."""
+        return {
+            "enabled": self.config.enabled,
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queue_depth": len(self._waiters),
+            "callers_in_flight": len(self._per_caller),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": dict(self.rejected),
+            "limit_increases": self.increases,
+            "limit_decreases": self.decreases,
+            "latency_ewma": (
+                round(self.latency_ewma, 3) if self.latency_ewma is not None else None
+            ),
+        }
@@ -0,0 +1,161 @@
+"""
+Precomputed AgentCard Responses for the A2A Gateway
+
+Discovery crawlers and the A2A inspector poll AgentCards far more often
+than they change. Cards are serialized once, at startup, into bytes with
+a strong ETag; requests are answered from those bytes with Cache-Control,
+and with 304 Not Modified when the client already has the current ETag.
+
+The gateway's own card is served at /.well-known/agent.json. Specialist
+cards (agents/*/.well-known/agent-card.json) are loaded into a
+SpecialistCards store and served from one route,
+/agents/{name}/.well-known/agent-card.json, plus an index at /agents/cards.
+
+Environment Variables:
+- GATEWAY_AGENT_CARDS_DIR: Directory holding <agent>/.well-known/agent-card.json
+  (default: the repository's agents/ directory)
+- GATEWAY_CARD_MAX_AGE: Cache-Control max-age in seconds (default: 300)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CARDS_DIR = Path(__file__).resolve().parents[2] / "agents"
+
+
+@dataclass(frozen=True)
+class PrecomputedJSON:
+    """A JSON document encoded once, with its strong ETag."""
+
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_obj(cls, obj: Any) -> "PrecomputedJSON":
+        """Encode obj as compact UTF-8 JSON and hash it into an ETag."""
+        body = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        return cls(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def cache_control() -> str:
+    """Cache-Control header value for AgentCards."""
+    return f"public, max-age={int(os.getenv('GATEWAY_CARD_MAX_AGE', '300'))}"
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison: W/"x" matches "x"
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def serve_precomputed(document: PrecomputedJSON, request: Request) -> Response:
+    """
+    Answer a request from precomputed bytes.
+
+    Returns:
+        304 with no body if If-None-Match matches the ETag, otherwise 200
+        with the JSON body; both carry ETag and Cache-Control
+    """
+    headers = {"ETag": document.etag, "Cache-Control": cache_control()}
+    if _etag_matches(request.headers.get("if-none-match"), document.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(
+        content=document.body, media_type="application/json", headers=headers
+    )
+
+
+def _version_key(card: Dict[str, Any]) -> tuple:
+    parts = []
+    for part in str(card.get("version", "0")).split("."):
+        parts.append(int(part) if part.isdigit() else 0)
+    return tuple(parts)
+
+
+class SpecialistCards:
+    """
+    Specialist AgentCards keyed by card name, each precomputed.
+
+    Args:
+        cards: Card dicts keyed by name
+    """
+
+    def __init__(self, cards: Dict[str, Dict[str, Any]]):
+        self._cards = {
+            name: PrecomputedJSON.from_obj(card) for name, card in sorted(cards.items())
+        }
+        self.index = PrecomputedJSON.from_obj(
+            {
+                "agents": [
+                    {
+                        "name": name,
+                        "version": card.get("version"),
+                        "description": card.get("description"),
+                        "card_url": f"/agents/{name}/.well-known/agent-card.json",
+                        "etag": self._cards[name].etag,
+                    }
+                    for name, card in sorted(cards.items())
+                ]
+            }
+        )
+
+    @classmethod
+    def from_directory(cls, cards_dir: Optional[str] = None) -> "SpecialistCards":
+        """
+        Load every <agent>/.well-known/agent-card.json under cards_dir.
+
+        Cards are keyed by their "name" field (directory name if missing).
+        When two directories publish the same name, the higher version wins.
+        Unreadable cards are logged and skipped.
+
+        Args:
+            cards_dir: Directory to scan (default: GATEWAY_AGENT_CARDS_DIR or agents/)
+
+        Returns:
+            SpecialistCards (empty if the directory does not exist)
+        """
+        root = Path(
+            cards_dir or os.getenv("GATEWAY_AGENT_CARDS_DIR") or DEFAULT_CARDS_DIR
+        )
+        cards: Dict[str, Dict[str, Any]] = {}
+        for path in sorted(root.glob("*/.well-known/agent-card.json")):
+            try:
+                card = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as e:
+                logger.error(f"Skipping unreadable AgentCard {path}: {e}")
+                continue
+            name = str(card.get("name") or path.parent.parent.name)
+            if name in cards and _version_key(cards[name]) >= _version_key(card):
+                continue
+            cards[name] = card
+
+        logger.info(
+            "Specialist AgentCards loaded",
+            extra={"cards_dir": str(root), "cards": len(cards)},
+        )
+        return cls(cards)
+
+    def get(self, name: str) -> Optional[PrecomputedJSON]:
+        """Get a card by name; "iam_adk" and "iam-adk" both resolve."""
+        return self._cards.get(name) or self._cards.get(name.replace("_", "-"))
+
+    def names(self) -> list:
+        """Names of all loaded cards."""
+        return list(self._cards)
+
+    def __len__(self) -> int:
+        return len(self._cards)
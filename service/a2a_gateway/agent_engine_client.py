@@ -6,11 +6,18 @@ It uses the centralized agent_engine.py config module and handles authentication
 request formatting, and error handling.
 
 Key Features:
-- Uses Application Default Credentials (ADC) for authentication
-- Reads Agent Engine IDs from environment via agent_engine.py
+- Uses Application Default Credentials (ADC) for authentication, with the
+  access token cached and refreshed in the background (token_manager.py)
+- Routes by (env, agent_role) through a startup snapshot of the
+  agent_engine.py config (routing.py)
 - Formats requests for Agent Engine REST API
-- Handles timeouts, retries, and error responses
+- Handles timeouts, retries, and error responses; retries connect errors
+  and 429/503 with jittered backoff and hedges slow sessionless calls
+  (resilience.py)
 - Correlates requests with trace/correlation IDs
+- Reuses the gateway's shared upstream connection pool (http_pool.py)
+- Streams responses chunk by chunk (stream_agent_engine) for SSE proxying
+- Reports upstream time-to-first-byte in response metadata
 
 Usage:
     from agent_engine_client import call_agent_engine
@@ -25,20 +32,25 @@ Usage:
 
 import os
 import sys
+import json
 import logging
 import httpx
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, Tuple
 from dataclasses import dataclass
 
 # Add project root to path for imports
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
 sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from agents.config.agent_engine import (
-    build_agent_config,
-    get_reasoning_engine_url,
-    get_current_environment,
-)
+import gateway_metrics
+from common.metrics import classify_error  # On sys.path via gateway_metrics
+from http_pool import UpstreamTimings, route_timeout, upstream_client
+from resilience import get_resilience
+from routing import get_routing_table
+from token_manager import get_token_manager
 
 logger = logging.getLogger(__name__)
 
@@ -46,16 +58,36 @@ logger = logging.getLogger(__name__)
 @dataclass
 class AgentEngineResponse:
     """Response from Agent Engine."""
+
     response: str
     session_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 
+@dataclass
+class AgentEngineChunk:
+    """One chunk of a streamed Agent Engine response."""
+
+    text: str
+    session_id: Optional[str] = None
+    raw: Optional[Dict[str, Any]] = None
+
+
+class AgentEngineStreamError(RuntimeError):
+    """Streaming call failed before or during the response."""
+
+    def __init__(self, message: str, metadata: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.metadata = metadata or {}
+
+
 def get_gcp_token() -> str:
     """
     Get GCP OAuth token using Application Default Credentials.
 
+    Uncached and blocking; async request paths use get_access_token().
+
     Returns:
         str: Bearer token for API calls
 
@@ -66,7 +98,9 @@ def get_gcp_token() -> str:
         from google.auth import default
         from google.auth.transport.requests import Request
 
-        credentials, _ = default(scopes=["https://www.googleapis.com/auth/cloud-platform"])
+        credentials, _ = default(
+            scopes=["https://www.googleapis.com/auth/cloud-platform"]
+        )
 
         # Refresh token if needed
         if not credentials.valid:
@@ -78,13 +112,57 @@ def get_gcp_token() -> str:
         raise RuntimeError(f"Authentication failed: {e}")
 
 
+async def get_access_token() -> str:
+    """
+    Get a cached GCP OAuth token for the request path.
+
+    Unlike get_gcp_token(), credentials are loaded once per process and
+    the token is only refreshed near expiry, off the event loop.
+
+    Returns:
+        str: Bearer token for API calls
+
+    Raises:
+        RuntimeError: If token cannot be obtained
+    """
+    return await get_token_manager().get_token()
+
+
+def _build_request(
+    agent_config: Any,
+    token: str,
+    prompt: str,
+    session_id: Optional[str],
+    correlation_id: Optional[str],
+    context: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Build the Agent Engine payload and headers for a query."""
+    payload = {"query": prompt}
+    if session_id:
+        payload["session_id"] = session_id
+    if context:
+        payload["context"] = context
+
+    # Add correlation headers
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {token}",
+    }
+    if correlation_id:
+        headers["X-Correlation-ID"] = correlation_id
+    if agent_config.spiffe_id:
+        headers["X-SPIFFE-ID"] = agent_config.spiffe_id
+
+    return payload, headers
+
+
 async def call_agent_engine(
     agent_role: str,
     prompt: str,
     session_id: Optional[str] = None,
     correlation_id: Optional[str] = None,
     context: Optional[Dict[str, Any]] = None,
-    timeout: float = 30.0,
+    timeout: Optional[float] = None,
     env: Optional[str] = None,
 ) -> AgentEngineResponse:
     """
@@ -96,7 +174,7 @@ async def call_agent_engine(
         session_id: Optional session ID for conversation continuity
         correlation_id: Optional correlation ID for request tracking
         context: Optional additional context to pass to agent
-        timeout: Request timeout in seconds (default: 30.0)
+        timeout: Request timeout in seconds (default: GATEWAY_TIMEOUT_A2A_RUN or 30.0)
         env: Environment override (defaults to current environment)
 
     Returns:
@@ -115,13 +193,15 @@ async def call_agent_engine(
         >>> print(result.response)
         "ADK stands for Agent Development Kit..."
     """
-    # Determine environment
-    if env is None:
-        env = get_current_environment()
+    # Resolve environment and route from the routing table snapshot
+    routing_table = get_routing_table()
+    env = routing_table.resolve_env(env)
+    route = routing_table.lookup(agent_role, env)
 
-    # Get Agent Engine config for this agent
-    agent_config = build_agent_config(agent_role, env)
-    if not agent_config:
+    request_timeout = route_timeout("a2a_run", timeout)
+    timeout = request_timeout.read
+
+    if not route:
         error_msg = f"Agent '{agent_role}' not configured for {env} environment"
         logger.error(
             error_msg,
@@ -131,6 +211,7 @@ async def call_agent_engine(
                 "correlation_id": correlation_id,
             },
         )
+        gateway_metrics.record_error("query", agent_role, "config")
         return AgentEngineResponse(
             response="",
             error=error_msg,
@@ -143,35 +224,24 @@ async def call_agent_engine(
 
     # Get OAuth token
     try:
-        token = get_gcp_token()
+        token = await get_access_token()
     except RuntimeError as e:
         error_msg = f"Authentication failed: {e}"
         logger.error(error_msg, extra={"correlation_id": correlation_id})
+        gateway_metrics.record_error("query", agent_role, "auth")
         return AgentEngineResponse(
             response="",
             error=error_msg,
             metadata={"reason": "Authentication failure"},
         )
 
-    # Build Agent Engine URL
-    engine_url = get_reasoning_engine_url(agent_config.reasoning_engine_id)
-
-    # Build request payload
-    payload = {"query": prompt}
-    if session_id:
-        payload["session_id"] = session_id
-    if context:
-        payload["context"] = context
+    agent_config = route.config
+    engine_url = route.url
 
-    # Add correlation headers
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {token}",
-    }
-    if correlation_id:
-        headers["X-Correlation-ID"] = correlation_id
-    if agent_config.spiffe_id:
-        headers["X-SPIFFE-ID"] = agent_config.spiffe_id
+    # Build request payload and correlation headers
+    payload, headers = _build_request(
+        agent_config, token, prompt, session_id, correlation_id, context
+    )
 
     # Log request
     logger.info(
@@ -186,16 +256,36 @@ async def call_agent_engine(
         },
     )
 
-    # Make request to Agent Engine
+    # Make request to Agent Engine (retried / hedged within the route deadline)
+    resilience = get_resilience()
+    timings = UpstreamTimings()
+    attempts = 0
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                engine_url,
-                json=payload,
-                headers=headers,
+        async with upstream_client(timeout) as client:
+
+            async def send(remaining: float):
+                nonlocal attempts
+                attempts += 1
+                attempt_timings = UpstreamTimings()
+                response = await client.post(
+                    engine_url,
+                    json=payload,
+                    headers=headers,
+                    timeout=httpx.Timeout(
+                        remaining, connect=min(request_timeout.connect, remaining)
+                    ),
+                    extensions={"trace": attempt_timings.trace},
+                )
+                attempt_timings.finish()
+                return response, attempt_timings
+
+            response, timings = await resilience.execute(
+                agent_role, send, timeout, hedge=session_id is None
             )
             response.raise_for_status()
             result = response.json()
+        gateway_metrics.record_upstream("query", agent_role, timings)
+        resilience.record_latency(agent_role, timings.total_ms / 1000)
 
         # Extract response
         response_text = result.get("response", result.get("output", ""))
@@ -203,13 +293,17 @@ async def call_agent_engine(
         response_metadata = result.get("metadata", {})
 
         # Add our tracking metadata
-        response_metadata.update({
-            "agent_role": agent_role,
-            "env": env,
-            "engine_id": agent_config.reasoning_engine_id,
-            "spiffe_id": agent_config.spiffe_id,
-            "correlation_id": correlation_id,
-        })
+        response_metadata.update(
+            {
+                "agent_role": agent_role,
+                "env": env,
+                "engine_id": agent_config.reasoning_engine_id,
+                "spiffe_id": agent_config.spiffe_id,
+                "correlation_id": correlation_id,
+                "upstream_attempts": attempts,
+                **timings.as_metadata(),
+            }
+        )
 
         logger.info(
             f"✅ Agent Engine response received from {agent_role}",
@@ -218,6 +312,7 @@ async def call_agent_engine(
                 "correlation_id": correlation_id,
                 "response_length": len(response_text),
                 "session_id": response_session_id,
+                "ttfb_ms": timings.ttfb_ms,
             },
         )
 
@@ -229,7 +324,15 @@ async def call_agent_engine(
         )
 
     except httpx.HTTPStatusError as e:
-        error_msg = f"Agent Engine HTTP error: {e.response.status_code} - {e.response.text}"
+        gateway_metrics.record_upstream(
+            "query",
+            agent_role,
+            timings,
+            classify_error(status_code=e.response.status_code),
+        )
+        error_msg = (
+            f"Agent Engine HTTP error: {e.response.status_code} - {e.response.text}"
+        )
         logger.error(
             error_msg,
             extra={
@@ -249,7 +352,9 @@ async def call_agent_engine(
             },
         )
 
-    except httpx.TimeoutException:
+    except httpx.TimeoutException as e:
+        timings.finish()
+        gateway_metrics.record_upstream("query", agent_role, timings, classify_error(e))
         error_msg = f"Agent Engine timeout after {timeout}s"
         logger.error(
             error_msg,
@@ -270,6 +375,8 @@ async def call_agent_engine(
         )
 
     except Exception as e:
+        timings.finish()
+        gateway_metrics.record_upstream("query", agent_role, timings, classify_error(e))
         error_msg = f"Agent Engine call failed: {str(e)}"
         logger.error(
             error_msg,
@@ -291,6 +398,165 @@ async def call_agent_engine(
         )
 
 
+def _parse_stream_line(line: str) -> Optional[AgentEngineChunk]:
+    """
+    Parse one line of an Agent Engine stream into a chunk.
+
+    Accepts SSE framing ("data: {...}") and newline-delimited JSON. Text
+    is taken from ADK event content parts, or from a "response"/"output"/
+    "text" field; events without text (tool calls, etc.) are skipped.
+    """
+    line = line.strip()
+    if line.startswith("data:"):
+        line = line[len("data:") :].strip()
+    elif line.startswith(("event:", "id:", "retry:", ":")):
+        return None
+    if not line or line == "[DONE]":
+        return None
+
+    try:
+        event = json.loads(line)
+    except ValueError:
+        return AgentEngineChunk(text=line)
+    if not isinstance(event, dict):
+        return AgentEngineChunk(text=str(event))
+
+    parts = (event.get("content") or {}).get("parts") or []
+    text = "".join(part.get("text", "") for part in parts if isinstance(part, dict))
+    if not text:
+        for key in ("response", "output", "text"):
+            if isinstance(event.get(key), str):
+                text = event[key]
+                break
+    if not text:
+        return None
+
+    return AgentEngineChunk(text=text, session_id=event.get("session_id"), raw=event)
+
+
+async def stream_agent_engine(
+    agent_role: str,
+    prompt: str,
+    session_id: Optional[str] = None,
+    correlation_id: Optional[str] = None,
+    context: Optional[Dict[str, Any]] = None,
+    timeout: Optional[float] = None,
+    env: Optional[str] = None,
+    timings: Optional[UpstreamTimings] = None,
+) -> AsyncIterator[AgentEngineChunk]:
+    """
+    Stream a query to Vertex AI Agent Engine, yielding chunks as they arrive.
+
+    The next upstream chunk is only read once the caller has consumed the
+    previous one, so a slow consumer slows the upstream read (backpressure)
+    instead of buffering the whole answer in the gateway.
+
+    Args:
+        agent_role: Agent role (e.g., "bob", "foreman", "iam-adk")
+        prompt: User query/message to send to agent
+        session_id: Optional session ID for conversation continuity
+        correlation_id: Optional correlation ID for request tracking
+        context: Optional additional context to pass to agent
+        timeout: Max seconds between chunks (default: GATEWAY_TIMEOUT_A2A_STREAM or 30.0)
+        env: Environment override (defaults to current environment)
+        timings: Optional UpstreamTimings to fill in (TTFB, first chunk, total)
+
+    Yields:
+        AgentEngineChunk: Response text chunks
+
+    Raises:
+        AgentEngineStreamError: If the agent is not configured, auth fails,
+            or Agent Engine returns an error or times out
+    """
+    routing_table = get_routing_table()
+    env = routing_table.resolve_env(env)
+    route = routing_table.lookup(agent_role, env)
+
+    request_timeout = route_timeout("a2a_stream", timeout)
+    timings = timings or UpstreamTimings()
+
+    if not route:
+        gateway_metrics.record_error("stream_query", agent_role, "config")
+        raise AgentEngineStreamError(
+            f"Agent '{agent_role}' not configured for {env} environment",
+            {
+                "agent_role": agent_role,
+                "env": env,
+                "reason": "Agent not configured - set environment variable",
+            },
+        )
+
+    try:
+        token = await get_access_token()
+    except RuntimeError as e:
+        gateway_metrics.record_error("stream_query", agent_role, "auth")
+        raise AgentEngineStreamError(
+            f"Authentication failed: {e}", {"reason": "Authentication failure"}
+        )
+
+    agent_config = route.config
+    engine_url = route.stream_url
+    payload, headers = _build_request(
+        agent_config, token, prompt, session_id, correlation_id, context
+    )
+    headers["Accept"] = "text/event-stream"
+
+    logger.info(
+        f"Streaming from Agent Engine for {agent_role}",
+        extra={
+            "agent_role": agent_role,
+            "env": env,
+            "engine_id": agent_config.reasoning_engine_id,
+            "session_id": session_id,
+            "correlation_id": correlation_id,
+        },
+    )
+
+    error_class = None
+    try:
+        async with upstream_client(request_timeout.read) as client:
+            async with client.stream(
+                "POST",
+                engine_url,
+                json=payload,
+                headers=headers,
+                timeout=request_timeout,
+                extensions={"trace": timings.trace},
+            ) as response:
+                if response.status_code >= 400:
+                    error_class = classify_error(status_code=response.status_code)
+                    body = (await response.aread()).decode("utf-8", errors="replace")
+                    raise AgentEngineStreamError(
+                        f"Agent Engine HTTP error: {response.status_code} - {body[:200]}",
+                        {"agent_role": agent_role, "status_code": response.status_code},
+                    )
+
+                async for line in response.aiter_lines():
+                    chunk = _parse_stream_line(line)
+                    if chunk is None:
+                        continue
+                    timings.mark_first_chunk()
+                    yield chunk
+
+    except httpx.TimeoutException as e:
+        error_class = classify_error(e)
+        raise AgentEngineStreamError(
+            f"Agent Engine stream timeout after {request_timeout.read}s",
+            {"agent_role": agent_role, "timeout": request_timeout.read},
+        )
+    except httpx.HTTPError as e:
+        error_class = classify_error(e)
+        raise AgentEngineStreamError(
+            f"Agent Engine stream failed: {e}",
+            {"agent_role": agent_role, "exception_type": type(e).__name__},
+        )
+    finally:
+        timings.finish()
+        gateway_metrics.record_upstream(
+            "stream_query", agent_role, timings, error_class
+        )
+
+
 # For testing
 if __name__ == "__main__":
     import asyncio
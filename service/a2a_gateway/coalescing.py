@@ -0,0 +1,108 @@
+"""
+Request Coalescing (Single-Flight) for the A2A Gateway
+
+Slack retries, dashboards and duplicate triggers often send identical
+sessionless /a2a/run calls within seconds. With coalescing enabled, the
+first call for a key goes upstream and concurrent duplicates await its
+result instead of invoking Agent Engine again. Nothing is cached: once
+the call completes, the next request for the key goes upstream.
+
+Only sessionless calls are coalesced - a session carries conversation
+state, so two calls in the same session are not interchangeable.
+
+Environment Variables:
+- GATEWAY_COALESCE: Enable single-flight for sessionless /a2a/run (default: false)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def canonical_request_key(**fields: Any) -> str:
+    """
+    Hash request fields into a canonical key.
+
+    Dict key order and JSON whitespace do not affect the key, so
+    equivalent contexts collide.
+
+    Returns:
+        64-char hex key
+    """
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Share one in-flight call among concurrent callers with the same key.
+
+    Args:
+        enabled: Coalesce calls (default: GATEWAY_COALESCE)
+    """
+
+    def __init__(self, enabled: Optional[bool] = None):
+        if enabled is None:
+            enabled = os.getenv("GATEWAY_COALESCE", "false").strip().lower() in (
+                "1",
+                "true",
+                "yes",
+                "on",
+            )
+        self.enabled = enabled
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run call() for key, or join the call already in flight.
+
+        The upstream call runs as its own task, so a cancelled caller
+        (client disconnect) does not cancel it for the others.
+
+        Args:
+            key: Coalescing key (see canonical_request_key)
+            call: Zero-argument coroutine factory for the upstream call
+
+        Returns:
+            Tuple of (result, shared) where shared is True for callers
+            that joined another caller's call
+
+        Raises:
+            Whatever call() raised, for every caller of the flight
+        """
+        task = self._in_flight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self.coalesced += 1
+            logger.info("Coalesced duplicate request", extra={"coalesce_key": key[:16]})
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(call())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        self.leaders += 1
+        return await asyncio.shield(task), False
+
+    def _forget(self, key: str, task: asyncio.Future) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get coalescing counters; coalesced is the number of upstream calls saved."""
+        return {
+            "enabled": self.enabled,
+            "in_flight": len(self._in_flight),
+            "upstream_calls": self.leaders,
+            "coalesced": self.coalesced,
+        }
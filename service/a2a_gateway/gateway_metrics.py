@@ -0,0 +1,151 @@
+"""
+Prometheus Metrics for the A2A Gateway
+
+Metric definitions shared by main.py (routes) and agent_engine_client.py
+(upstream calls), exported by GET /metrics. Built on the dependency-free
+registry in service/common/metrics.py.
+
+- gateway_http_*: request count, latency and in-flight per route
+- gateway_a2a_*: agent calls by route, agent_role and outcome
+- gateway_upstream_*: Agent Engine connect / TTFB / total latency, error
+  classes, retries and hedges (see resilience.py)
+- Scrape-time gauges for the upstream pool, admission queue, token cache,
+  coalescing and response cache (registered by main.py)
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Set
+
+# service/common is shared with slack_webhook (copied next to main.py in the image)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.metrics import HTTPMetrics, MetricsRegistry  # noqa: E402
+
+# agent_role comes from callers; cap distinct label values
+MAX_ROLE_LABELS = 50
+
+registry = MetricsRegistry(namespace="gateway")
+http = HTTPMetrics(registry)
+
+a2a_calls = registry.counter(
+    "a2a_calls_total",
+    "Agent calls by route, agent role and outcome (ok, error, cache_hit, coalesced, rejected)",
+    ["route", "agent_role", "outcome"],
+)
+a2a_latency = registry.histogram(
+    "a2a_call_duration_seconds",
+    "Agent call latency seen by the caller",
+    ["route", "agent_role"],
+)
+a2a_in_flight = registry.gauge(
+    "a2a_calls_in_flight", "Agent calls in progress", ["route", "agent_role"]
+)
+
+upstream_connect = registry.histogram(
+    "upstream_connect_seconds",
+    "Agent Engine TCP connect time (new connections only)",
+    ["operation", "agent_role"],
+)
+upstream_ttfb = registry.histogram(
+    "upstream_ttfb_seconds",
+    "Agent Engine time to response headers",
+    ["operation", "agent_role"],
+)
+upstream_latency = registry.histogram(
+    "upstream_duration_seconds",
+    "Agent Engine total call time",
+    ["operation", "agent_role"],
+)
+upstream_errors = registry.counter(
+    "upstream_errors_total",
+    "Agent Engine call failures by error class",
+    ["operation", "agent_role", "error_class"],
+)
+upstream_retries = registry.counter(
+    "upstream_retries_total",
+    "Agent Engine call retries by reason",
+    ["agent_role", "reason"],
+)
+upstream_hedges = registry.counter(
+    "upstream_hedges_total",
+    "Hedged Agent Engine calls by whether the hedge won",
+    ["agent_role", "outcome"],
+)
+
+
+_seen_roles: Set[str] = set()
+
+
+def role_label(agent_role: str) -> str:
+    """Bound agent_role label cardinality (roles past the cap become "other")."""
+    if agent_role in _seen_roles:
+        return agent_role
+    if len(_seen_roles) < MAX_ROLE_LABELS:
+        _seen_roles.add(agent_role)
+        return agent_role
+    return "other"
+
+
+class CallTracker:
+    """Outcome holder for track_call(); set .outcome before the block ends."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self) -> None:
+        self.outcome = "ok"
+
+
+@contextmanager
+def track_call(route: str, agent_role: str) -> Iterator[CallTracker]:
+    """
+    Count and time one agent call by route, agent role and outcome.
+
+    Exceptions escaping the block are counted as "error".
+    """
+    role = role_label(agent_role)
+    in_flight = a2a_in_flight.labels(route, role)
+    in_flight.inc()
+    tracker = CallTracker()
+    started = time.perf_counter()
+    try:
+        yield tracker
+    except BaseException:
+        tracker.outcome = "error"
+        raise
+    finally:
+        in_flight.dec()
+        a2a_calls.labels(route, role, tracker.outcome).inc()
+        a2a_latency.labels(route, role).observe(time.perf_counter() - started)
+
+
+def record_upstream(
+    operation: str, agent_role: str, timings, error_class: Optional[str] = None
+) -> None:
+    """
+    Record one Agent Engine call.
+
+    Args:
+        operation: "query" or "stream_query"
+        agent_role: Target agent role
+        timings: http_pool.UpstreamTimings (finished)
+        error_class: classify_error() result if the call failed
+    """
+    agent_role = role_label(agent_role)
+    if timings.connect_ms is not None:
+        upstream_connect.labels(operation, agent_role).observe(
+            timings.connect_ms / 1000
+        )
+    if timings.ttfb_ms is not None:
+        upstream_ttfb.labels(operation, agent_role).observe(timings.ttfb_ms / 1000)
+    if timings.total_ms is not None:
+        upstream_latency.labels(operation, agent_role).observe(timings.total_ms / 1000)
+    if error_class:
+        upstream_errors.labels(operation, agent_role, error_class).inc()
+
+
+def record_error(operation: str, agent_role: str, error_class: str) -> None:
+    """Count an upstream failure that happened before any request was sent."""
+    upstream_errors.labels(operation, role_label(agent_role), error_class).inc()
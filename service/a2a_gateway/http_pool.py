@@ -0,0 +1,257 @@
+"""
+Shared Upstream HTTP Pool for the A2A Gateway
+
+One pooled httpx.AsyncClient per process, opened and closed by the
+FastAPI lifespan, so every proxied call reuses warm (HTTP/2 when
+available) connections to Agent Engine instead of paying a fresh
+TCP+TLS handshake.
+
+Outside a running app (scripts, unit tests), upstream_client() falls back
+to a per-call client, so callers work the same either way.
+
+Environment Variables:
+- GATEWAY_HTTP2: Enable HTTP/2 if the h2 package is installed (default: true)
+- GATEWAY_POOL_MAX_CONNECTIONS: Max upstream connections (default: 100)
+- GATEWAY_POOL_MAX_KEEPALIVE: Max idle keepalive connections (default: 20)
+- GATEWAY_POOL_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds (default: 30)
+- GATEWAY_CONNECT_TIMEOUT: Connect timeout in seconds (default: 5)
+- GATEWAY_TIMEOUT_<ROUTE>: Total timeout per route in seconds, e.g.
+  GATEWAY_TIMEOUT_QUERY, GATEWAY_TIMEOUT_A2A_RUN (default: 30)
+"""
+
+import logging
+import os
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, ClassVar, Dict, Optional
+
+import httpx
+
+# service/common is shared with slack_webhook (copied next to main.py in the image)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common import http_pool as common_pool  # noqa: E402
+from common.http_pool import connection_stats, http2_available  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTE_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class PoolConfig(common_pool.PoolConfig):
+    """Upstream connection pool settings."""
+
+    env_names: ClassVar[Dict[str, str]] = {
+        "http2": "GATEWAY_HTTP2",
+        "max_connections": "GATEWAY_POOL_MAX_CONNECTIONS",
+        "max_keepalive_connections": "GATEWAY_POOL_MAX_KEEPALIVE",
+        "keepalive_expiry": "GATEWAY_POOL_KEEPALIVE_EXPIRY",
+        "connect_timeout": "GATEWAY_CONNECT_TIMEOUT",
+    }
+
+
+# Module-level shared client (set by the app lifespan)
+_client: Optional[httpx.AsyncClient] = None
+_config: Optional[PoolConfig] = None
+
+
+def route_timeout(route: str, default: Optional[float] = None) -> httpx.Timeout:
+    """
+    Get the upstream timeout for a gateway route.
+
+    Args:
+        route: Route name ("query", "a2a_run", ...)
+        default: Total timeout if GATEWAY_TIMEOUT_<ROUTE> is unset
+
+    Returns:
+        httpx.Timeout with the route's total and the pool connect timeout
+    """
+    env_name = f"GATEWAY_TIMEOUT_{route.upper()}"
+    total = float(
+        os.getenv(env_name, default if default is not None else DEFAULT_ROUTE_TIMEOUT)
+    )
+    config = _config or PoolConfig.from_env()
+    return httpx.Timeout(total, connect=min(config.connect_timeout, total))
+
+
+@dataclass
+class UpstreamTimings:
+    """
+    Per-request upstream timings, filled in from httpcore trace events.
+
+    Pass `extensions={"trace": timings.trace}` to the request. Times are
+    milliseconds since the timings object was created; connect_ms stays
+    None when a pooled connection was reused.
+    """
+
+    started: float = field(default_factory=time.perf_counter)
+    connect_ms: Optional[float] = None
+    ttfb_ms: Optional[float] = None
+    first_chunk_ms: Optional[float] = None
+    total_ms: Optional[float] = None
+
+    def _elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 1)
+
+    async def trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        """httpcore trace callback."""
+        if event_name == "connection.connect_tcp.complete":
+            self.connect_ms = self._elapsed_ms()
+        elif (
+            event_name.endswith("receive_response_headers.complete")
+            and self.ttfb_ms is None
+        ):
+            self.ttfb_ms = self._elapsed_ms()
+
+    def mark_first_chunk(self) -> None:
+        """Record the first body chunk of a streamed response."""
+        if self.first_chunk_ms is None:
+            self.first_chunk_ms = self._elapsed_ms()
+
+    def finish(self) -> None:
+        """Record the end of the request (headers time defaults to it if untraced)."""
+        self.total_ms = self._elapsed_ms()
+        if self.ttfb_ms is None:
+            self.ttfb_ms = (
+                self.first_chunk_ms
+                if self.first_chunk_ms is not None
+                else self.total_ms
+            )
+
+    def as_metadata(self) -> Dict[str, float]:
+        """Timings for response metadata (unset timings are omitted)."""
+        timings = {
+            "upstream_connect_ms": self.connect_ms,
+            "ttfb_ms": self.ttfb_ms,
+            "first_chunk_ms": self.first_chunk_ms,
+            "total_ms": self.total_ms,
+        }
+        return {name: value for name, value in timings.items() if value is not None}
+
+
+async def start_shared_client(
+    config: Optional[PoolConfig] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> httpx.AsyncClient:
+    """
+    Open the shared upstream client (call from the app lifespan).
+
+    Args:
+        config: Pool settings (default: PoolConfig.from_env())
+        transport: Optional transport override (tests)
+
+    Returns:
+        The shared client
+    """
+    global _client, _config
+
+    if _client is not None:
+        return _client
+
+    config = config or PoolConfig.from_env()
+    http2 = config.http2 and http2_available()
+    if config.http2 and not http2:
+        logger.warning(
+            "GATEWAY_HTTP2 requested but h2 is not installed; using HTTP/1.1"
+        )
+
+    kwargs: Dict[str, Any] = {}
+    if transport is not None:
+        kwargs["transport"] = transport
+
+    _client = httpx.AsyncClient(
+        http2=http2,
+        limits=config.limits(),
+        timeout=httpx.Timeout(DEFAULT_ROUTE_TIMEOUT, connect=config.connect_timeout),
+        **kwargs,
+    )
+    _config = config
+
+    logger.info(
+        "Shared upstream HTTP client started",
+        extra={
+            "http2": http2,
+            "max_connections": config.max_connections,
+            "max_keepalive_connections": config.max_keepalive_connections,
+        },
+    )
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the shared upstream client (call from the app lifespan)."""
+    global _client, _config
+
+    client, _client, _config = _client, None, None
+    if client is not None:
+        await client.aclose()
+        logger.info("Shared upstream HTTP client closed")
+
+
+def get_shared_client() -> Optional[httpx.AsyncClient]:
+    """Get the shared client, or None outside the app lifespan."""
+    return _client
+
+
+@asynccontextmanager
+async def upstream_client(
+    timeout: Optional[float] = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Get a client for one upstream call.
+
+    Yields the shared pooled client when the app is running, otherwise a
+    short-lived client that is closed on exit.
+
+    Args:
+        timeout: Timeout for the short-lived fallback client
+    """
+    if _client is not None:
+        yield _client
+        return
+
+    async with httpx.AsyncClient(timeout=timeout or DEFAULT_ROUTE_TIMEOUT) as client:
+        yield client
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Get upstream pool utilization (for /health).
+
+    Connection counts come from the underlying httpcore pool; if its
+    internals are unavailable only the configuration is reported.
+
+    Returns:
+        Dict with configuration and current connection usage
+    """
+    if _client is None or _config is None:
+        return {"status": "not_started"}
+
+    stats: Dict[str, Any] = {
+        "status": "ok",
+        "http2": _config.http2 and http2_available(),
+        "max_connections": _config.max_connections,
+        "max_keepalive_connections": _config.max_keepalive_connections,
+        "keepalive_expiry": _config.keepalive_expiry,
+    }
+
+    connections = connection_stats(_client)
+    if not connections:
+        return stats
+
+    stats.update(
+        {
+            "connections": connections["connections"],
+            "active_connections": connections["active_connections"],
+            "idle_connections": connections["idle_connections"],
+            "http2_connections": connections["http2_connections"],
+            "requests_in_flight": connections["requests"],
+            "utilization": round(
+                connections["active_connections"] / _config.max_connections, 3
+            ),
+        }
+    )
+    return stats
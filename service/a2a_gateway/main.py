@@ -15,17 +15,58 @@ Environment Variables:
 - LOCATION: GCP region
 - AGENT_ENGINE_ID: Agent Engine instance ID
 - PORT: Service port (default 8080)
+- GATEWAY_*: Upstream connection pool and timeouts (see http_pool.py),
+  token refresh margin (see token_manager.py), request coalescing
+  (see coalescing.py), sessionless response cache (see response_cache.py),
+  admission control (see admission.py), routing roles (see routing.py),
+  upstream retries and hedging (see resilience.py)
+- GATEWAY_ADMIN_TOKEN: Bearer token for /admin/* endpoints (unset: disabled)
+- GATEWAY_BATCH_MAX_CALLS: Max calls per /a2a/batch request (default 50)
+- GATEWAY_BATCH_CONCURRENCY: Max concurrent calls per batch (default 8)
+
+Metrics:
+- GET /metrics serves Prometheus text metrics (see gateway_metrics.py)
 """
 
 import os
+import sys
+import json
+import copy
+import hmac
+import asyncio
 import logging
+import signal
+import time
 import uuid
-from typing import Dict, Any, Optional
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
 from pydantic import BaseModel
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.background import BackgroundTask
 import httpx
 
+# Gateway modules are imported by file name (as deployed alongside main.py)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from http_pool import (
+    UpstreamTimings,
+    close_shared_client,
+    pool_stats,
+    route_timeout,
+    start_shared_client,
+    upstream_client,
+)
+import gateway_metrics
+from admission import AdmissionController, AdmissionRejected
+from agent_cards import PrecomputedJSON, SpecialistCards, serve_precomputed
+from coalescing import SingleFlight, canonical_request_key
+from resilience import get_resilience
+from response_cache import CACHE_HIT, ResponseCache
+from routing import get_routing_table, reload_routing_table
+from token_manager import get_token_manager
+from common.metrics import CONTENT_TYPE, MetricsMiddleware
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -38,6 +79,10 @@ LOCATION = os.getenv("LOCATION")
 AGENT_ENGINE_ID = os.getenv("AGENT_ENGINE_ID")
 PORT = int(os.getenv("PORT", "8080"))
 
+# /a2a/batch limits
+BATCH_MAX_CALLS = int(os.getenv("GATEWAY_BATCH_MAX_CALLS", "50"))
+BATCH_CONCURRENCY = int(os.getenv("GATEWAY_BATCH_CONCURRENCY", "8"))
+
 # Agent Engine REST API endpoint
 # Format: https://{LOCATION}-aiplatform.googleapis.com/v1/projects/{PROJECT_ID}/locations/{LOCATION}/reasoningEngines/{AGENT_ENGINE_ID}:query
 AGENT_ENGINE_URL = os.getenv(
@@ -51,11 +96,118 @@ if not all([PROJECT_ID, LOCATION, AGENT_ENGINE_ID]):
         "Missing required environment variables: PROJECT_ID, LOCATION, AGENT_ENGINE_ID"
     )
 
+
+def _reload_routing_on_signal() -> None:
+    try:
+        reload_routing_table()
+    except Exception as e:
+        # Keep serving with the previous table
+        logger.error(f"Routing table reload failed: {e}", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the shared upstream connection pool for the app's lifetime.
+
+    Also builds the agent routing table up front and reloads it on SIGHUP.
+    """
+    get_routing_table()
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGHUP, _reload_routing_on_signal)
+    except (NotImplementedError, RuntimeError, AttributeError):
+        logger.info("SIGHUP routing reload unavailable on this platform")
+    await start_shared_client()
+    try:
+        yield
+    finally:
+        await close_shared_client()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Bob's Brain A2A Gateway",
     description="A2A Protocol gateway proxying to Vertex AI Agent Engine",
     version="0.6.0",
+    lifespan=lifespan,
+)
+
+# Single-flight for identical sessionless /a2a/run calls (opt-in)
+coalescer = SingleFlight()
+
+# Cache for sessionless /a2a/run results (per-role opt-in)
+response_cache = ResponseCache.from_env()
+
+# Upstream concurrency limits, wait queue and AIMD tuning
+admission = AdmissionController()
+
+# Per-route request metrics (GET /metrics)
+app.add_middleware(MetricsMiddleware, metrics=gateway_metrics.http)
+
+
+def _pool_samples():
+    stats = pool_stats()
+    for state in ("active", "idle"):
+        yield {"state": state}, stats.get(f"{state}_connections")
+
+
+def _admission_samples():
+    stats = admission.stats()
+    for name in ("limit", "in_flight", "queue_depth"):
+        yield {"value": name}, stats[name]
+
+
+def _token_samples():
+    stats = get_token_manager().stats()
+    yield {"result": "success"}, stats["refresh_count"]
+    yield {"result": "failure"}, stats["refresh_failures"]
+
+
+def _cache_samples():
+    stats = response_cache.stats()
+    for result in ("hits", "misses", "bypassed"):
+        yield {"result": result}, stats[result]
+
+
+gateway_metrics.registry.register_callback(
+    "upstream_pool_connections", "Upstream pool connections by state", _pool_samples
+)
+gateway_metrics.registry.register_callback(
+    "admission",
+    "Admission control limit, in-flight calls and queue depth",
+    _admission_samples,
+)
+gateway_metrics.registry.register_callback(
+    "admission_rejected_total",
+    "Calls rejected by admission control by reason",
+    lambda: (
+        ({"reason": reason}, count) for reason, count in admission.rejected.items()
+    ),
+    kind="counter",
+)
+gateway_metrics.registry.register_callback(
+    "token_refreshes_total",
+    "GCP access token refreshes by result",
+    _token_samples,
+    kind="counter",
+)
+gateway_metrics.registry.register_callback(
+    "token_expires_in_seconds",
+    "Seconds until the cached access token expires",
+    lambda: [({}, get_token_manager().stats()["expires_in"])],
+)
+gateway_metrics.registry.register_callback(
+    "coalesced_total",
+    "Calls that joined another caller's upstream call",
+    lambda: [({}, coalescer.coalesced)],
+    kind="counter",
+)
+gateway_metrics.registry.register_callback(
+    "response_cache_requests_total",
+    "Response cache lookups by result",
+    _cache_samples,
+    kind="counter",
 )
 
 # R3 Compliance: No agent code imports
@@ -123,6 +275,35 @@ class A2AAgentResult(BaseModel):
     """SPIFFE ID of the target agent that handled the request"""
 
 
+class A2ABatchRequest(BaseModel):
+    """Request payload for /a2a/batch: independent A2A calls run concurrently."""
+
+    calls: List[A2AAgentCall]
+    """Calls to run; results come back in the same order"""
+
+    max_concurrency: Optional[int] = None
+    """Per-batch concurrency cap (default and upper bound: GATEWAY_BATCH_CONCURRENCY)"""
+
+    correlation_id: Optional[str] = None
+    """Batch correlation ID; calls without one get {correlation_id}-{index}"""
+
+    stream: bool = False
+    """Stream results as NDJSON lines in completion order instead of one JSON body"""
+
+
+class A2ABatchResult(BaseModel):
+    """Response payload for /a2a/batch (non-streaming)."""
+
+    results: List[A2AAgentResult]
+    """One result per call, in request order"""
+
+    correlation_id: str
+    """Batch correlation ID"""
+
+    metadata: Dict[str, Any]
+    """Batch summary (calls, succeeded, failed, max_concurrency, duration_ms)"""
+
+
 # Additional environment variables for AgentCard
 APP_NAME = os.getenv("APP_NAME", "bobs-brain")
 APP_VERSION = os.getenv("APP_VERSION", "0.6.0")
@@ -173,8 +354,13 @@ Agent-to-Agent protocol for multi-agent orchestration.
     }
 
 
+# Cards only change on deploy: encode them once and serve the bytes
+AGENT_CARD = PrecomputedJSON.from_obj(get_agent_card_dict())
+SPECIALIST_CARDS = SpecialistCards.from_directory()
+
+
 @app.get("/.well-known/agent.json")
-async def agent_card() -> Dict[str, Any]:
+async def agent_card(request: Request) -> Response:
     """
     A2A Protocol: Return AgentCard for agent discovery.
 
@@ -183,16 +369,44 @@ async def agent_card() -> Dict[str, Any]:
 
     R3 Compliance: AgentCard logic is inlined here, no agent imports.
 
+    The card is serialized once at import; responses carry a strong ETag
+    and Cache-Control, and a matching If-None-Match gets 304.
+
     Returns:
-        dict: AgentCard with agent metadata and capabilities
+        Response: AgentCard JSON (or 304 Not Modified)
     """
-    try:
-        card_dict = get_agent_card_dict()
-        logger.info("AgentCard served", extra={"spiffe_id": card_dict.get("spiffe_id")})
-        return card_dict
-    except Exception as e:
-        logger.error(f"Failed to generate AgentCard: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="Failed to generate AgentCard")
+    return serve_precomputed(AGENT_CARD, request)
+
+
+@app.get("/agents/cards")
+async def specialist_card_index(request: Request) -> Response:
+    """
+    List the specialist AgentCards served by this gateway.
+
+    Returns:
+        Response: {"agents": [{name, version, description, card_url, etag}]}
+    """
+    return serve_precomputed(SPECIALIST_CARDS.index, request)
+
+
+@app.get("/agents/{name}/.well-known/agent-card.json")
+async def specialist_card(name: str, request: Request) -> Response:
+    """
+    Serve a specialist's AgentCard (agents/<name>/.well-known/agent-card.json).
+
+    Args:
+        name: Card name, e.g. "iam-adk" ("iam_adk" also resolves)
+
+    Returns:
+        Response: AgentCard JSON (or 304 Not Modified)
+
+    Raises:
+        HTTPException: 404 if no card with that name is loaded
+    """
+    card = SPECIALIST_CARDS.get(name)
+    if card is None:
+        raise HTTPException(status_code=404, detail=f"Unknown agent: {name}")
+    return serve_precomputed(card, request)
 
 
 @app.post("/query")
@@ -211,6 +425,9 @@ async def query(request: Request) -> Dict[str, Any]:
 
     Returns:
         dict: Agent response from Agent Engine
+
+    The upstream call goes through admission control (global limit only,
+    there is no caller ID); rejected queries get a 429 with Retry-After.
     """
     try:
         # Parse request body
@@ -236,16 +453,28 @@ async def query(request: Request) -> Dict[str, Any]:
         if session_id:
             payload["session_id"] = session_id
 
-        # Call Agent Engine via REST API (R3: no local Runner)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                AGENT_ENGINE_URL,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-
-            response.raise_for_status()
-            result = response.json()
+        # Call Agent Engine via REST API (R3: no local Runner), admission-controlled
+        timeout = route_timeout("query")
+        async with admission.admit():
+            started = time.perf_counter()
+            status_code = 500
+            try:
+                async with upstream_client(timeout.read) as client:
+                    response = await client.post(
+                        AGENT_ENGINE_URL,
+                        json=payload,
+                        headers={"Content-Type": "application/json"},
+                        timeout=timeout,
+                    )
+                    status_code = response.status_code
+
+                    response.raise_for_status()
+                    result = response.json()
+            except httpx.TimeoutException:
+                status_code = 504
+                raise
+            finally:
+                admission.record(time.perf_counter() - started, status_code)
 
         logger.info(
             "Agent Engine response received",
@@ -267,13 +496,17 @@ async def query(request: Request) -> Dict[str, Any]:
     except httpx.RequestError as e:
         logger.error(f"Failed to connect to Agent Engine: {e}", exc_info=True)
         raise HTTPException(status_code=503, detail="Agent Engine unavailable")
+    except AdmissionRejected as e:
+        raise HTTPException(
+            status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)}
+        )
     except Exception as e:
         logger.error(f"Query processing failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
 @app.post("/a2a/run")
-async def a2a_run(call: A2AAgentCall) -> A2AAgentResult:
+async def a2a_run(call: A2AAgentCall, response: Response) -> A2AAgentResult:
     """
     A2A Protocol: Agent-to-Agent call endpoint (AE2).
 
@@ -293,104 +526,592 @@ async def a2a_run(call: A2AAgentCall) -> A2AAgentResult:
     Returns:
         A2AAgentResult: Agent response from Agent Engine
 
+    With GATEWAY_COALESCE on, concurrent identical sessionless calls share
+    one upstream call (metadata.coalesced_with names the leader's ID).
+
+    Sessionless calls to roles listed in GATEWAY_CACHE_ROLES are served
+    from the response cache when possible; X-Cache reports HIT, MISS or
+    BYPASS, and hits carry an Age header.
+
+    Upstream calls go through admission control; when the wait queue is
+    full or the queue deadline passes, the call gets a 429 with
+    Retry-After.
+
     Phase AE2: Real Agent Engine integration implemented.
     """
-    try:
-        # Import agent_engine_client (local import to avoid issues)
-        from agent_engine_client import call_agent_engine
+    headers: Dict[str, str] = {}
+    result, status_code = await _execute_call(call, "/a2a/run", headers)
+    if status_code != 200:
+        return JSONResponse(
+            status_code=status_code, content=result.model_dump(), headers=headers
+        )
+    response.headers.update(headers)
+    return result
 
-        # Generate correlation ID if not provided
-        correlation_id = call.correlation_id or str(uuid.uuid4())
 
-        logger.info(
-            "A2A call received",
-            extra={
-                "agent_role": call.agent_role,
-                "caller_spiffe_id": call.caller_spiffe_id,
-                "correlation_id": correlation_id,
-                "prompt_length": len(call.prompt),
-                "env": call.env or "current",
-                "session_id": call.session_id,
-            },
-        )
+async def _execute_call(
+    call: A2AAgentCall, route: str, headers: Dict[str, str]
+) -> Tuple[A2AAgentResult, int]:
+    """
+    Run one A2A call: cache lookup, coalescing, admission, Agent Engine.
 
-        # Call Agent Engine
-        result = await call_agent_engine(
-            agent_role=call.agent_role,
-            prompt=call.prompt,
-            session_id=call.session_id,
-            correlation_id=correlation_id,
-            context=call.context,
-            env=call.env,
-        )
+    Shared by /a2a/run and /a2a/batch. Failures are returned as results
+    with error set, never raised.
 
-        # Convert to A2A result format
-        a2a_result = A2AAgentResult(
-            response=result.response,
-            session_id=result.session_id,
-            correlation_id=correlation_id,
-            target_spiffe_id=result.metadata.get("spiffe_id") if result.metadata else None,
-            metadata=result.metadata,
-            error=result.error,
-        )
+    Args:
+        call: The A2A call
+        route: Route label for metrics
+        headers: Filled with X-Cache, Age and Retry-After as applicable
 
-        if result.error:
-            logger.error(
-                "A2A call completed with error",
+    Returns:
+        Tuple of (result, HTTP status) - 429 if admission rejected the call
+    """
+    with gateway_metrics.track_call(route, call.agent_role) as tracker:
+        try:
+            # Import agent_engine_client (local import to avoid issues)
+            from agent_engine_client import call_agent_engine
+
+            # Generate correlation ID if not provided
+            correlation_id = call.correlation_id or str(uuid.uuid4())
+
+            logger.info(
+                "A2A call received",
                 extra={
-                    "correlation_id": correlation_id,
                     "agent_role": call.agent_role,
-                    "error": result.error,
+                    "caller_spiffe_id": call.caller_spiffe_id,
+                    "correlation_id": correlation_id,
+                    "prompt_length": len(call.prompt),
+                    "env": call.env or "current",
+                    "session_id": call.session_id,
                 },
             )
-        else:
-            logger.info(
-                "A2A call completed successfully",
+
+            # Serve repeated sessionless questions from the cache
+            cache_status, cache_key, cached = await response_cache.lookup(
+                call.agent_role, call.prompt, call.context, call.env, call.session_id
+            )
+            headers["X-Cache"] = cache_status
+            if cache_status == CACHE_HIT:
+                headers["Age"] = str(int(cached.age))
+                metadata = dict(cached.result.get("metadata") or {})
+                metadata.update(
+                    {
+                        "correlation_id": correlation_id,
+                        "cache": "hit",
+                        "cache_age_s": round(cached.age, 1),
+                    }
+                )
+                logger.info(
+                    "A2A call served from cache",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "agent_role": call.agent_role,
+                    },
+                )
+                tracker.outcome = "cache_hit"
+                return (
+                    A2AAgentResult(
+                        response=cached.result["response"],
+                        session_id=cached.result.get("session_id"),
+                        correlation_id=correlation_id,
+                        target_spiffe_id=metadata.get("spiffe_id"),
+                        metadata=metadata,
+                    ),
+                    200,
+                )
+
+            # Call Agent Engine (admission-controlled; feeds AIMD tuning)
+            async def upstream_call():
+                async with admission.admit(call.caller_spiffe_id):
+                    started = time.perf_counter()
+                    result = await call_agent_engine(
+                        agent_role=call.agent_role,
+                        prompt=call.prompt,
+                        session_id=call.session_id,
+                        correlation_id=correlation_id,
+                        context=call.context,
+                        env=call.env,
+                    )
+                    admission.record(
+                        time.perf_counter() - started, _upstream_status(result)
+                    )
+                return result
+
+            if coalescer.enabled and not call.session_id:
+                coalesce_key = canonical_request_key(
+                    agent_role=call.agent_role,
+                    prompt=call.prompt,
+                    context=call.context,
+                    env=call.env,
+                )
+                result, shared = await coalescer.run(coalesce_key, upstream_call)
+                if shared:
+                    # Joined another caller's upstream call: keep our own IDs
+                    tracker.outcome = "coalesced"
+                    result = copy.deepcopy(result)
+                    result.metadata = result.metadata or {}
+                    result.metadata["coalesced_with"] = result.metadata.get(
+                        "correlation_id"
+                    )
+                    result.metadata["correlation_id"] = correlation_id
+            else:
+                result = await upstream_call()
+
+            if cache_key and not result.error:
+                await response_cache.put(
+                    cache_key,
+                    call.agent_role,
+                    {
+                        "response": result.response,
+                        "session_id": result.session_id,
+                        "metadata": result.metadata,
+                    },
+                )
+
+            # Convert to A2A result format
+            a2a_result = A2AAgentResult(
+                response=result.response,
+                session_id=result.session_id,
+                correlation_id=correlation_id,
+                target_spiffe_id=(
+                    result.metadata.get("spiffe_id") if result.metadata else None
+                ),
+                metadata=result.metadata,
+                error=result.error,
+            )
+
+            if result.error:
+                tracker.outcome = "error"
+                logger.error(
+                    "A2A call completed with error",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "agent_role": call.agent_role,
+                        "error": result.error,
+                    },
+                )
+            else:
+                logger.info(
+                    "A2A call completed successfully",
+                    extra={
+                        "correlation_id": correlation_id,
+                        "agent_role": call.agent_role,
+                        "response_length": len(result.response),
+                        "session_id": result.session_id,
+                    },
+                )
+
+            return a2a_result, 200
+
+        except AdmissionRejected as e:
+            tracker.outcome = "rejected"
+            headers["Retry-After"] = str(e.retry_after)
+            return (
+                A2AAgentResult(
+                    response="",
+                    error=str(e),
+                    correlation_id=correlation_id,
+                    metadata={
+                        "agent_role": call.agent_role,
+                        "reason": e.reason,
+                        "retry_after": e.retry_after,
+                    },
+                ),
+                429,
+            )
+
+        except Exception as e:
+            tracker.outcome = "error"
+            logger.error(
+                f"A2A call failed with exception: {e}",
+                exc_info=True,
                 extra={
-                    "correlation_id": correlation_id,
                     "agent_role": call.agent_role,
-                    "response_length": len(result.response),
-                    "session_id": result.session_id,
+                    "correlation_id": call.correlation_id or "unknown",
                 },
             )
+            return (
+                A2AAgentResult(
+                    response="",
+                    error=f"A2A call failed: {str(e)}",
+                    correlation_id=call.correlation_id or str(uuid.uuid4()),
+                    metadata={
+                        "phase": "AE2",
+                        "error": True,
+                        "exception_type": type(e).__name__,
+                        "agent_role": call.agent_role,
+                    },
+                ),
+                200,
+            )
 
-        return a2a_result
 
-    except Exception as e:
-        logger.error(
-            f"A2A call failed with exception: {e}",
-            exc_info=True,
-            extra={
-                "agent_role": call.agent_role,
-                "correlation_id": call.correlation_id or "unknown",
-            },
+@app.post("/a2a/batch")
+async def a2a_batch(batch: A2ABatchRequest):
+    """
+    A2A Protocol: run several independent A2A calls in one request.
+
+    Calls run concurrently (at most max_concurrency at a time) over the
+    shared upstream pool and go through the same cache, coalescing and
+    admission control as /a2a/run. A failed or rejected call becomes an
+    error result for that item; it never fails the batch.
+
+    Body:
+        A2ABatchRequest with calls, optional max_concurrency,
+        correlation_id and stream
+
+    Returns:
+        A2ABatchResult with results in request order, or with stream=true
+        an application/x-ndjson stream: one {"index", "status_code",
+        "result"} line per call as it completes, then a {"summary"} line
+
+    Raises:
+        HTTPException: 400 if the batch is empty or exceeds GATEWAY_BATCH_MAX_CALLS
+    """
+    if not batch.calls:
+        raise HTTPException(status_code=400, detail="Batch has no calls")
+    if len(batch.calls) > BATCH_MAX_CALLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch has {len(batch.calls)} calls; the limit is {BATCH_MAX_CALLS}",
+        )
+
+    batch_id = batch.correlation_id or str(uuid.uuid4())
+    max_concurrency = max(
+        1, min(batch.max_concurrency or BATCH_CONCURRENCY, BATCH_CONCURRENCY)
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    started = time.perf_counter()
+
+    logger.info(
+        "A2A batch received",
+        extra={
+            "correlation_id": batch_id,
+            "calls": len(batch.calls),
+            "max_concurrency": max_concurrency,
+        },
+    )
+
+    async def run_item(
+        index: int, call: A2AAgentCall
+    ) -> Tuple[int, A2AAgentResult, int]:
+        if not call.correlation_id:
+            call = call.model_copy(update={"correlation_id": f"{batch_id}-{index}"})
+        async with semaphore:
+            result, status_code = await _execute_call(call, "/a2a/batch", {})
+        return index, result, status_code
+
+    def summary(results: List[A2AAgentResult]) -> Dict[str, Any]:
+        failed = sum(1 for result in results if result.error)
+        return {
+            "calls": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "max_concurrency": max_concurrency,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    tasks = [
+        asyncio.ensure_future(run_item(i, call)) for i, call in enumerate(batch.calls)
+    ]
+
+    if not batch.stream:
+        try:
+            completed = await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        results = [result for _, result, _ in completed]
+        metadata = summary(results)
+        logger.info(
+            "A2A batch completed", extra={"correlation_id": batch_id, **metadata}
+        )
+        return A2ABatchResult(
+            results=results, correlation_id=batch_id, metadata=metadata
         )
-        return A2AAgentResult(
+
+    async def lines():
+        results = []
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                index, result, status_code = await next_done
+                results.append(result)
+                line = {
+                    "index": index,
+                    "status_code": status_code,
+                    "result": result.model_dump(),
+                }
+                yield (json.dumps(line) + "\n").encode("utf-8")
+            metadata = summary(results)
+            logger.info(
+                "A2A batch completed", extra={"correlation_id": batch_id, **metadata}
+            )
+            yield (
+                json.dumps({"summary": {"correlation_id": batch_id, **metadata}}) + "\n"
+            ).encode("utf-8")
+        finally:
+            # Client went away: stop the calls still running
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"X-Correlation-ID": batch_id, "X-Accel-Buffering": "no"},
+    )
+
+
+def _upstream_status(result: Any) -> int:
+    """Map an AgentEngineResponse to an HTTP status for admission tuning."""
+    if not result.error:
+        return 200
+    return _error_status(result.metadata or {})
+
+
+def _error_status(metadata: Dict[str, Any]) -> int:
+    """Map Agent Engine error metadata to an HTTP status for admission tuning."""
+    if "status_code" in metadata:
+        return metadata["status_code"]
+    if "timeout" in metadata:
+        return 504
+    if "exception_type" in metadata:
+        return 500
+    # Config/auth failures never reached Agent Engine
+    return 401 if metadata.get("reason") == "Authentication failure" else 400
+
+
+def _sse_event(
+    event: str, data: Dict[str, Any], event_id: Optional[str] = None
+) -> bytes:
+    """Encode one server-sent event."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data)}")
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
+
+
+@app.post("/a2a/stream")
+async def a2a_stream(call: A2AAgentCall, request: Request) -> Response:
+    """
+    A2A Protocol: streaming Agent-to-Agent call endpoint.
+
+    Same request body as /a2a/run. Agent Engine's streaming query is
+    proxied as server-sent events, one upstream chunk at a time; the next
+    chunk is only read after the previous one was sent, so slow clients
+    apply backpressure instead of the gateway buffering the answer.
+
+    Events:
+        - start: {correlation_id, agent_role}
+        - chunk: {seq, text} (SSE id = seq)
+        - error: {error, correlation_id, ...} if the call fails
+        - summary: {correlation_id, agent_role, session_id, chunks,
+          response_length, error, ttfb_ms, first_chunk_ms, total_ms}
+          (always last unless the client disconnected)
+
+    The stream holds an admission slot until it ends; when the wait
+    queue is full or the queue deadline passes, the call gets a 429 with
+    Retry-After (as /a2a/run) instead of a stream.
+
+    Returns:
+        StreamingResponse: text/event-stream (JSONResponse if rejected)
+    """
+    from agent_engine_client import AgentEngineStreamError, stream_agent_engine
+
+    correlation_id = call.correlation_id or str(uuid.uuid4())
+
+    logger.info(
+        "A2A stream received",
+        extra={
+            "agent_role": call.agent_role,
+            "caller_spiffe_id": call.caller_spiffe_id,
+            "correlation_id": correlation_id,
+            "prompt_length": len(call.prompt),
+            "env": call.env or "current",
+            "session_id": call.session_id,
+        },
+    )
+
+    # Admit before the response starts, so a rejection can still be a 429
+    slot = AsyncExitStack()
+    try:
+        await slot.enter_async_context(admission.admit(call.caller_spiffe_id))
+    except AdmissionRejected as e:
+        with gateway_metrics.track_call("/a2a/stream", call.agent_role) as tracker:
+            tracker.outcome = "rejected"
+        rejected = A2AAgentResult(
             response="",
-            error=f"A2A call failed: {str(e)}",
-            correlation_id=call.correlation_id or str(uuid.uuid4()),
+            error=str(e),
+            correlation_id=correlation_id,
             metadata={
-                "phase": "AE2",
-                "error": True,
-                "exception_type": type(e).__name__,
                 "agent_role": call.agent_role,
+                "reason": e.reason,
+                "retry_after": e.retry_after,
             },
         )
+        return JSONResponse(
+            status_code=429,
+            content=rejected.model_dump(),
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+    async def events():
+        with gateway_metrics.track_call("/a2a/stream", call.agent_role) as tracker:
+            timings = UpstreamTimings()
+            summary: Dict[str, Any] = {
+                "correlation_id": correlation_id,
+                "agent_role": call.agent_role,
+                "session_id": call.session_id,
+                "chunks": 0,
+                "response_length": 0,
+                "error": None,
+            }
+            yield _sse_event(
+                "start",
+                {"correlation_id": correlation_id, "agent_role": call.agent_role},
+            )
+
+            stream = stream_agent_engine(
+                agent_role=call.agent_role,
+                prompt=call.prompt,
+                session_id=call.session_id,
+                correlation_id=correlation_id,
+                context=call.context,
+                env=call.env,
+                timings=timings,
+            )
+            disconnected = False
+            started = time.perf_counter()
+            status_code = 200
+            try:
+                async for chunk in stream:
+                    if await request.is_disconnected():
+                        tracker.outcome = "disconnected"
+                        disconnected = True
+                        break
+                    summary["chunks"] += 1
+                    summary["response_length"] += len(chunk.text)
+                    if chunk.session_id:
+                        summary["session_id"] = chunk.session_id
+                    seq = summary["chunks"]
+                    yield _sse_event(
+                        "chunk", {"seq": seq, "text": chunk.text}, event_id=str(seq)
+                    )
+            except AgentEngineStreamError as e:
+                tracker.outcome = "error"
+                status_code = _error_status(e.metadata)
+                summary["error"] = str(e)
+                yield _sse_event(
+                    "error",
+                    {**e.metadata, "error": str(e), "correlation_id": correlation_id},
+                )
+            except Exception as e:
+                tracker.outcome = "error"
+                logger.error(f"A2A stream failed with exception: {e}", exc_info=True)
+                status_code = 500
+                summary["error"] = f"A2A stream failed: {str(e)}"
+                yield _sse_event(
+                    "error",
+                    {
+                        "error": summary["error"],
+                        "correlation_id": correlation_id,
+                        "exception_type": type(e).__name__,
+                    },
+                )
+            finally:
+                # Release the upstream connection and admission slot even if
+                # the client went away (a cut-short stream says nothing about
+                # upstream latency, so it is not recorded)
+                await stream.aclose()
+                if not disconnected:
+                    admission.record(time.perf_counter() - started, status_code)
+                await slot.aclose()
+
+            summary.update(timings.as_metadata())
+            logger.info(
+                "A2A stream completed",
+                extra={**summary, "disconnected": disconnected},
+            )
+            if not disconnected:
+                yield _sse_event("summary", summary)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # Disable proxy buffering
+            "X-Correlation-ID": correlation_id,
+        },
+        # Releases the slot if the stream never started (no-op otherwise)
+        background=BackgroundTask(slot.aclose),
+    )
+
+
+@app.post("/admin/routing/reload")
+async def reload_routing(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+    """
+    Rebuild the agent routing table from the current environment.
+
+    Requires "Authorization: Bearer <GATEWAY_ADMIN_TOKEN>"; the endpoint is
+    disabled while GATEWAY_ADMIN_TOKEN is unset. SIGHUP does the same.
+
+    Returns:
+        dict: Previous and new table version plus the new routes
+
+    Raises:
+        HTTPException: 403 if admin endpoints are disabled or the token is wrong
+    """
+    admin_token = os.getenv("GATEWAY_ADMIN_TOKEN")
+    if not admin_token:
+        raise HTTPException(
+            status_code=403,
+            detail="Admin endpoints disabled (GATEWAY_ADMIN_TOKEN not set)",
+        )
+    if not hmac.compare_digest(authorization or "", f"Bearer {admin_token}"):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+    previous = get_routing_table().version
+    try:
+        table = reload_routing_table()
+    except Exception as e:
+        logger.error(f"Routing table reload failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Routing table reload failed: {e}")
+    return {"previous_version": previous, **table.stats()}
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """
+    Prometheus metrics endpoint.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format
+    """
+    return Response(gateway_metrics.registry.render(), media_type=CONTENT_TYPE)
 
 
 @app.get("/health")
-async def health() -> Dict[str, str]:
+async def health() -> Dict[str, Any]:
     """
     Health check endpoint.
 
     Returns:
-        dict: Service health status
+        dict: Service health status, upstream pool utilization, token cache
+            state, coalescing, response cache and admission counters,
+            routing table version, hedge and retry rates
     """
     return {
         "status": "healthy",
         "service": "a2a-gateway",
         "version": "0.6.0",
         "agent_engine_url": AGENT_ENGINE_URL,
+        "upstream_pool": pool_stats(),
+        "auth_token": get_token_manager().stats(),
+        "coalescing": coalescer.stats(),
+        "response_cache": response_cache.stats(),
+        "admission": admission.stats(),
+        "routing": get_routing_table().stats(),
+        "resilience": get_resilience().stats(),
     }
 
 
@@ -408,9 +1129,13 @@ async def root() -> Dict[str, str]:
         "description": "A2A Protocol gateway to Vertex AI Agent Engine",
         "endpoints": {
             "agent_card": "/.well-known/agent.json",
+            "specialist_cards": "/agents/cards",  # Index of /agents/{name}/.well-known/agent-card.json
             "query": "/query",
             "a2a_run": "/a2a/run",  # Phase AE2: A2A protocol endpoint (implemented)
+            "a2a_stream": "/a2a/stream",  # SSE streaming variant of /a2a/run
+            "a2a_batch": "/a2a/batch",  # Concurrent multi-call variant of /a2a/run
             "health": "/health",
+            "metrics": "/metrics",
         },
         "phase": "AE2-complete",
         "features": {
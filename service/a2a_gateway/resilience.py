@@ -0,0 +1,349 @@
+"""
+Hedged Requests and Jittered Retries for Agent Engine Calls
+
+A few slow or failed upstream calls dominate /a2a/run's tail latency.
+call_agent_engine runs each call through UpstreamResilience:
+
+- Retries: connect errors and 429/503 responses are retried with full
+  jitter exponential backoff (honoring Retry-After), up to a bounded
+  number of attempts
+- Hedging: for roles opted in via GATEWAY_HEDGE_ROLES, a sessionless call
+  still running after the role's recent p95 latency gets a second
+  identical request; the first response wins and the other is cancelled.
+  Hedges are capped at a fraction of calls so a slow Agent Engine is not
+  hit with double load
+- Deadline: attempts, hedges and backoff sleeps all share the route
+  timeout; nothing is started that cannot finish before it
+
+Only sessionless calls are hedged - a session carries conversation state,
+so sending the same turn twice is not safe. Roles whose agents take
+actions (opening PRs, filing issues) should not be listed.
+
+Environment Variables:
+- GATEWAY_RETRY_MAX_ATTEMPTS: Max attempts per call, including the first
+  (default: 3; 1 disables retries)
+- GATEWAY_RETRY_BASE_DELAY / GATEWAY_RETRY_MAX_DELAY: Backoff bounds in
+  seconds (defaults: 0.2 / 2.0)
+- GATEWAY_HEDGE_ROLES: Roles whose sessionless calls may be hedged,
+  comma-separated, or "*" for all (default: none)
+- GATEWAY_HEDGE_QUANTILE: Latency quantile used as the hedge delay
+  (default: 0.95)
+- GATEWAY_HEDGE_MIN_DELAY: Lower bound on the hedge delay in seconds
+  (default: 0.5)
+- GATEWAY_HEDGE_MIN_SAMPLES: Latency samples a role needs before it is
+  hedged (default: 20)
+- GATEWAY_HEDGE_BUDGET: Max fraction of calls that may be hedged
+  (default: 0.1)
+"""
+
+import asyncio
+import logging
+import math
+import os
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+)
+
+import httpx
+
+import gateway_metrics
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 503)
+LATENCY_WINDOW = 200
+
+# send(remaining_seconds) -> (response, per-attempt timings)
+Send = Callable[[float], Awaitable[Tuple[httpx.Response, Any]]]
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    """Retry and hedging settings."""
+
+    max_attempts: int = 3
+    retry_base_delay: float = 0.2
+    retry_max_delay: float = 2.0
+    hedge_roles: FrozenSet[str] = frozenset()
+    hedge_quantile: float = 0.95
+    hedge_min_delay: float = 0.5
+    hedge_min_samples: int = 20
+    hedge_budget: float = 0.1
+
+    @classmethod
+    def from_env(cls) -> "ResiliencePolicy":
+        """Load settings from GATEWAY_RETRY_* / GATEWAY_HEDGE_* environment variables."""
+        roles = os.getenv("GATEWAY_HEDGE_ROLES", "")
+        return cls(
+            max_attempts=max(1, int(os.getenv("GATEWAY_RETRY_MAX_ATTEMPTS", "3"))),
+            retry_base_delay=float(os.getenv("GATEWAY_RETRY_BASE_DELAY", "0.2")),
+            retry_max_delay=float(os.getenv("GATEWAY_RETRY_MAX_DELAY", "2.0")),
+            hedge_roles=frozenset(
+                role.strip() for role in roles.split(",") if role.strip()
+            ),
+            hedge_quantile=float(os.getenv("GATEWAY_HEDGE_QUANTILE", "0.95")),
+            hedge_min_delay=float(os.getenv("GATEWAY_HEDGE_MIN_DELAY", "0.5")),
+            hedge_min_samples=int(os.getenv("GATEWAY_HEDGE_MIN_SAMPLES", "20")),
+            hedge_budget=float(os.getenv("GATEWAY_HEDGE_BUDGET", "0.1")),
+        )
+
+    def hedges(self, agent_role: str) -> bool:
+        """Check if calls to this role may be hedged."""
+        return "*" in self.hedge_roles or agent_role in self.hedge_roles
+
+
+def retry_reason(
+    response: Optional[httpx.Response] = None, error: Optional[BaseException] = None
+) -> Optional[str]:
+    """
+    Classify an attempt outcome as retryable.
+
+    Returns:
+        "connect", "http_429" or "http_503" if the attempt should be
+        retried, None otherwise
+    """
+    if error is not None:
+        if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+            return "connect"
+        return None
+    if response is not None and response.status_code in RETRY_STATUSES:
+        return f"http_{response.status_code}"
+    return None
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    if response is None:
+        return None
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None  # HTTP-date form is not used by Google APIs
+
+
+def _discard(task: asyncio.Future) -> None:
+    # Retrieve the outcome of a cancelled/lost attempt so it is not logged as unhandled
+    if not task.cancelled():
+        task.exception()
+
+
+class UpstreamResilience:
+    """
+    Runs upstream attempts with retries, hedging and a shared deadline.
+
+    Args:
+        policy: Settings (default: ResiliencePolicy.from_env())
+        rng: Jitter source returning [0, 1) (tests)
+        clock: Monotonic time source for the deadline (tests)
+        sleep: Backoff sleep (tests)
+    """
+
+    def __init__(
+        self,
+        policy: Optional[ResiliencePolicy] = None,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.policy = policy or ResiliencePolicy.from_env()
+        self._rng = rng
+        self._clock = clock
+        self._sleep = sleep
+        self._latencies: Dict[str, Deque[float]] = {}
+
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.retries: Dict[str, int] = {}
+        self.deadline_exceeded = 0
+
+    def record_latency(self, agent_role: str, seconds: float) -> None:
+        """Record a successful upstream call's duration for hedge delays."""
+        window = self._latencies.get(agent_role)
+        if window is None:
+            window = self._latencies[agent_role] = deque(maxlen=LATENCY_WINDOW)
+        window.append(seconds)
+
+    def hedge_delay(self, agent_role: str) -> Optional[float]:
+        """
+        Get how long to wait before hedging a call to this role.
+
+        Returns:
+            The role's recent latency quantile (at least hedge_min_delay),
+            or None until enough samples were recorded
+        """
+        window = self._latencies.get(agent_role)
+        if window is None or len(window) < self.policy.hedge_min_samples:
+            return None
+        ordered = sorted(window)
+        index = min(
+            len(ordered) - 1, math.ceil(self.policy.hedge_quantile * len(ordered)) - 1
+        )
+        return max(self.policy.hedge_min_delay, ordered[index])
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Full-jitter exponential backoff before retry number `attempt` (1-based)."""
+        cap = min(
+            self.policy.retry_max_delay,
+            self.policy.retry_base_delay * 2 ** (attempt - 1),
+        )
+        delay = self._rng() * cap
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def _hedge_allowed(self) -> bool:
+        # Budget: hedges stay below hedge_budget of calls (one allowed up front)
+        return self.hedged < self.policy.hedge_budget * self.calls + 1
+
+    async def execute(
+        self, agent_role: str, send: Send, timeout: float, hedge: bool = False
+    ) -> Tuple[httpx.Response, Any]:
+        """
+        Run send() until it succeeds, fails permanently or the deadline passes.
+
+        Args:
+            agent_role: Target role (latency window, hedging opt-in, metrics)
+            send: Makes one attempt with the remaining seconds as its timeout
+            timeout: Total deadline in seconds for all attempts
+            hedge: Allow hedging (caller checked the call is idempotent)
+
+        Returns:
+            (response, timings) of the winning attempt; the last 429/503
+            response if retries ran out
+
+        Raises:
+            httpx.TimeoutException: If the deadline passed
+            Whatever the last attempt raised for non-retryable errors
+        """
+        deadline = self._clock() + timeout
+        hedge = hedge and self.policy.hedges(agent_role)
+        role = gateway_metrics.role_label(agent_role)
+        self.calls += 1
+
+        attempt = 1
+        while True:
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                self.deadline_exceeded += 1
+                raise httpx.TimeoutException(
+                    f"Agent Engine deadline of {timeout}s exceeded"
+                )
+
+            error: Optional[BaseException] = None
+            outcome: Optional[Tuple[httpx.Response, Any]] = None
+            try:
+                outcome = await self._attempt(agent_role, role, send, remaining, hedge)
+            except Exception as e:
+                error = e
+
+            reason = retry_reason(outcome[0] if outcome else None, error)
+            if reason is None or attempt >= self.policy.max_attempts:
+                if error is not None:
+                    raise error
+                return outcome
+
+            delay = self.backoff(attempt, _retry_after(outcome[0] if outcome else None))
+            if self._clock() + delay >= deadline:
+                # No time left for another attempt: surface this one
+                if error is not None:
+                    raise error
+                return outcome
+
+            self.retries[reason] = self.retries.get(reason, 0) + 1
+            gateway_metrics.upstream_retries.labels(role, reason).inc()
+            logger.warning(
+                "Retrying Agent Engine call",
+                extra={
+                    "agent_role": agent_role,
+                    "attempt": attempt,
+                    "reason": reason,
+                    "delay": round(delay, 3),
+                },
+            )
+            await self._sleep(delay)
+            attempt += 1
+
+    async def _attempt(
+        self, agent_role: str, role: str, send: Send, remaining: float, hedge: bool
+    ) -> Tuple[httpx.Response, Any]:
+        """One attempt, hedged after the role's hedge delay when allowed."""
+        deadline = self._clock() + remaining
+        delay = self.hedge_delay(agent_role) if hedge else None
+
+        tasks: List[asyncio.Future] = [asyncio.ensure_future(send(remaining))]
+        try:
+            if delay is not None and delay < remaining:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self._hedge_allowed():
+                    self.hedged += 1
+                    logger.info(
+                        "Hedging slow Agent Engine call",
+                        extra={"agent_role": agent_role, "delay": delay},
+                    )
+                    tasks.append(asyncio.ensure_future(send(deadline - self._clock())))
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, deadline - self._clock()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    self.deadline_exceeded += 1
+                    raise httpx.TimeoutException(
+                        f"Agent Engine call exceeded {remaining:.1f}s"
+                    )
+                # First response wins; a failed attempt waits for its twin
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is None and pending:
+                    continue
+                winner = winner or next(iter(done))
+                if len(tasks) > 1:
+                    hedge_won = winner is tasks[1]
+                    self.hedge_wins += int(hedge_won)
+                    gateway_metrics.upstream_hedges.labels(
+                        role, "won" if hedge_won else "lost"
+                    ).inc()
+                return winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                task.add_done_callback(_discard)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hedge and retry counters and rates."""
+        retries = sum(self.retries.values())
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": round(self.hedged / self.calls, 4) if self.calls else 0.0,
+            "retries": dict(self.retries),
+            "retry_rate": round(retries / self.calls, 4) if self.calls else 0.0,
+            "deadline_exceeded": self.deadline_exceeded,
+            "hedge_roles": sorted(self.policy.hedge_roles),
+        }
+
+
+_resilience: Optional[UpstreamResilience] = None
+
+
+def get_resilience() -> UpstreamResilience:
+    """Get the process-wide UpstreamResilience (created on first use)."""
+    global _resilience
+    if _resilience is None:
+        _resilience = UpstreamResilience()
+    return _resilience
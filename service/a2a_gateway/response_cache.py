@@ -0,0 +1,404 @@
+"""
+Sessionless Response Cache for the A2A Gateway
+
+Stateless questions (ADK doc lookups, "what is ...") repeat verbatim
+across users. For agent roles that opt in, successful /a2a/run results of
+calls without a session_id are cached for a per-role TTL.
+
+- Key: agent_role + normalized prompt (case/whitespace-insensitive) +
+  context hash + env
+- Stores are pluggable:
+  - "memory": in-process LRU bounded by total bytes
+  - "sqlite": a local SQLite file shared by every worker process on the
+    host; stands in for a shared cache (e.g. Memorystore) across Cloud
+    Run instances, behind the same interface
+- Only successful results are cached; calls with a session are never
+  cached (conversation state makes them non-repeatable)
+
+Environment Variables:
+- GATEWAY_CACHE_ROLES: Per-role TTLs in seconds, e.g. "bob=300,iam-adk=900".
+  Roles not listed (or with TTL 0) are not cached. Empty disables the cache.
+- GATEWAY_CACHE_BACKEND: "memory" or "sqlite" (default: memory)
+- GATEWAY_CACHE_MAX_BYTES: Max total cached bytes (default: 67108864)
+- GATEWAY_CACHE_PATH: SQLite file for the sqlite backend
+  (default: /tmp/bobs-brain-gateway-cache.sqlite3)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from coalescing import canonical_request_key
+
+logger = logging.getLogger(__name__)
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_SQLITE_PATH = "/tmp/bobs-brain-gateway-cache.sqlite3"
+
+# X-Cache header values
+CACHE_HIT = "HIT"
+CACHE_MISS = "MISS"
+CACHE_BYPASS = "BYPASS"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt for cache keys (case and whitespace-insensitive)."""
+    return _WHITESPACE.sub(" ", prompt).strip().casefold()
+
+
+def response_cache_key(
+    agent_role: str,
+    prompt: str,
+    context: Optional[Dict[str, Any]] = None,
+    env: Optional[str] = None,
+) -> str:
+    """
+    Compute the cache key for a sessionless call.
+
+    Returns:
+        64-char hex key
+    """
+    return canonical_request_key(
+        agent_role=agent_role,
+        prompt=normalize_prompt(prompt),
+        context_hash=canonical_request_key(context=context) if context else None,
+        env=env,
+    )
+
+
+def parse_role_ttls(spec: str) -> Dict[str, float]:
+    """
+    Parse GATEWAY_CACHE_ROLES ("bob=300,iam-adk=900") into role TTLs.
+
+    Raises:
+        ValueError: If an entry is not role=seconds
+    """
+    ttls: Dict[str, float] = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        role, sep, ttl = entry.partition("=")
+        if not sep or not role.strip():
+            raise ValueError(
+                f"Invalid GATEWAY_CACHE_ROLES entry: {entry!r} (expected role=seconds)"
+            )
+        ttls[role.strip()] = float(ttl)
+    return ttls
+
+
+class CacheStore(ABC):
+    """
+    Byte-value store with per-entry TTL.
+
+    Stores with blocking I/O set `blocking = True`; ResponseCache then
+    calls them from a worker thread.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        """Get (value, stored_at) for a live entry, or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get entry count, total bytes and evictions."""
+
+
+class InProcessStore(CacheStore):
+    """
+    In-process LRU bounded by total value bytes.
+
+    Args:
+        max_bytes: Evict least recently used entries above this size
+        clock: Time source (tests)
+    """
+
+    def __init__(
+        self, max_bytes: int = DEFAULT_MAX_BYTES, clock: Callable[[], float] = time.time
+    ):
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[bytes, float, float]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at, expires_at = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value, stored_at
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        now = self._clock()
+        self._entries[key] = (value, now, now + ttl)
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        value, _, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": BACKEND_MEMORY,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class SQLiteStore(CacheStore):
+    """
+    Cache shared by every process that opens the same SQLite file.
+
+    LRU by last access, bounded by total value bytes. Each call opens its
+    own connection, so the store is safe across threads and processes.
+
+    Args:
+        path: SQLite database file
+        max_bytes: Evict least recently used entries above this size
+        clock: Time source (tests)
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        path: str = DEFAULT_SQLITE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.evictions = 0
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection; commit on success and always close."""
+        db = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, float]]:
+        now = self._clock()
+        with self._lock, self._connect() as db:
+            row = db.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        return bytes(row[0]), row[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+        now = self._clock()
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+            db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                (key, value, len(value), now, now + ttl, now),
+            )
+            total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[
+                0
+            ]
+            while total > self.max_bytes:
+                oldest, size = db.execute(
+                    "SELECT key, size FROM entries ORDER BY last_access LIMIT 1"
+                ).fetchone()
+                db.execute("DELETE FROM entries WHERE key = ?", (oldest,))
+                total -= size
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as db:
+            entries, size = db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        return {
+            "backend": BACKEND_SQLITE,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+@dataclass
+class CachedResponse:
+    """A cache hit: the stored result and its age in seconds."""
+
+    result: Dict[str, Any]
+    age: float
+
+
+class ResponseCache:
+    """
+    Per-role TTL cache for sessionless agent results.
+
+    Args:
+        store: Backing store
+        role_ttls: Agent role -> TTL seconds; unlisted roles are not cached
+        clock: Time source for entry age (tests)
+    """
+
+    def __init__(
+        self,
+        store: CacheStore,
+        role_ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.store = store
+        self.role_ttls = {
+            role: ttl for role, ttl in (role_ttls or {}).items() if ttl > 0
+        }
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """Build the cache from GATEWAY_CACHE_* environment variables."""
+        role_ttls = parse_role_ttls(os.getenv("GATEWAY_CACHE_ROLES", ""))
+        max_bytes = int(os.getenv("GATEWAY_CACHE_MAX_BYTES", str(DEFAULT_MAX_BYTES)))
+        backend = os.getenv("GATEWAY_CACHE_BACKEND", BACKEND_MEMORY)
+
+        if backend == BACKEND_MEMORY:
+            store: CacheStore = InProcessStore(max_bytes=max_bytes)
+        elif backend == BACKEND_SQLITE:
+            store = SQLiteStore(
+                os.getenv("GATEWAY_CACHE_PATH", DEFAULT_SQLITE_PATH),
+                max_bytes=max_bytes,
+            )
+        else:
+            raise ValueError(
+                f"Invalid GATEWAY_CACHE_BACKEND: {backend!r} (expected {BACKEND_MEMORY} or {BACKEND_SQLITE})"
+            )
+        return cls(store, role_ttls)
+
+    def cacheable(self, agent_role: str, session_id: Optional[str]) -> bool:
+        """Check if a call may be served from / stored in the cache."""
+        return not session_id and agent_role in self.role_ttls
+
+    async def _call_store(self, method: Callable, *args: Any) -> Any:
+        if self.store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def lookup(
+        self,
+        agent_role: str,
+        prompt: str,
+        context: Optional[Dict[str, Any]],
+        env: Optional[str],
+        session_id: Optional[str],
+    ) -> Tuple[str, Optional[str], Optional[CachedResponse]]:
+        """
+        Look up a call.
+
+        Returns:
+            Tuple of (cache status for X-Cache, key to store the result
+            under or None if the call is not cacheable, hit or None)
+        """
+        if not self.cacheable(agent_role, session_id):
+            self.bypassed += 1
+            return CACHE_BYPASS, None, None
+
+        key = response_cache_key(agent_role, prompt, context, env)
+        cached = await self.get(key)
+        return (CACHE_HIT if cached else CACHE_MISS), key, cached
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached result.
+
+        Store failures are logged and treated as misses.
+        """
+        try:
+            entry = await self._call_store(self.store.get, key)
+        except Exception as e:
+            logger.warning(f"Response cache read failed: {e}")
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, stored_at = entry
+        self.hits += 1
+        return CachedResponse(
+            result=json.loads(value), age=max(0.0, self._clock() - stored_at)
+        )
+
+    async def put(self, key: str, agent_role: str, result: Dict[str, Any]) -> None:
+        """Store a successful result for the role's TTL (store failures are logged)."""
+        ttl = self.role_ttls.get(agent_role)
+        if not ttl:
+            return
+        try:
+            value = json.dumps(result, default=str).encode("utf-8")
+            await self._call_store(self.store.set, key, value, ttl)
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss/bypass counters and store usage."""
+        try:
+            store_stats = self.store.stats()
+        except Exception as e:
+            store_stats = {"error": str(e)}
+        return {
+            "enabled": bool(self.role_ttls),
+            "roles": self.role_ttls,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            **store_stats,
+        }
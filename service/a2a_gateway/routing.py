@@ -0,0 +1,264 @@
+"""
+Agent Routing Table for the A2A Gateway
+
+build_agent_config() re-reads several environment variables and rebuilds
+the SPIFFE ID and engine URLs on every call. The gateway instead builds an
+immutable snapshot once - (env, agent_role) -> Route with the config and
+both engine URLs precomputed - so per-request routing is a dict lookup.
+
+The snapshot is replaced atomically by reload_routing_table(), triggered
+by POST /admin/routing/reload or SIGHUP (see main.py). Requests already in
+flight keep the table they started with.
+
+Roles outside the snapshot (e.g. iam-doc with AGENT_ENGINE_IAM_DOC_DEV
+set) still route: a lookup miss falls back to build_agent_config() and
+caches the result in the table until the next reload.
+
+Environment Variables:
+- GATEWAY_ROUTING_ROLES: Extra agent roles to route, comma-separated, on
+  top of the known roles (bob, foreman, iam-*, ...)
+- AGENT_ENGINE_{AGENT}_{ENV}, PROJECT_ID, LOCATION, DEPLOYMENT_ENV: read
+  at build time via agents/config/agent_engine.py
+"""
+
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+# Add project root to path for imports
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from agents.config.agent_engine import (  # noqa: E402
+    AgentEngineConfig,
+    build_agent_config,
+    get_current_environment,
+    get_reasoning_engine_stream_url,
+    get_reasoning_engine_url,
+)
+
+logger = logging.getLogger(__name__)
+
+ENVIRONMENTS = ("dev", "staging", "prod")
+
+# Same roles list_configured_agents() scans
+KNOWN_AGENT_ROLES = (
+    "bob",
+    "bob_current",
+    "bob_next_gen",
+    "foreman",
+    "iam-adk",
+    "iam-issue",
+    "iam-fix",
+    "iam-qa",
+)
+
+RouteKey = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Route:
+    """Precomputed routing entry for one agent role in one environment."""
+
+    env: str
+    agent_role: str
+    config: AgentEngineConfig
+    url: str
+    """Agent Engine :query URL"""
+    stream_url: str
+    """Agent Engine :streamQuery?alt=sse URL"""
+
+    @property
+    def spiffe_id(self) -> str:
+        """SPIFFE ID of the target agent."""
+        return self.config.spiffe_id
+
+    @classmethod
+    def from_config(
+        cls, env: str, agent_role: str, config: AgentEngineConfig
+    ) -> "Route":
+        """Precompute engine URLs for a config."""
+        engine_id, project_id, location = (
+            config.reasoning_engine_id,
+            config.project_id,
+            config.location,
+        )
+        return cls(
+            env=env,
+            agent_role=agent_role,
+            config=config,
+            url=get_reasoning_engine_url(engine_id, project_id, location),
+            stream_url=get_reasoning_engine_stream_url(engine_id, project_id, location),
+        )
+
+
+class RoutingTable:
+    """
+    Immutable (env, agent_role) -> Route mapping.
+
+    Args:
+        routes: Route per (env, agent_role)
+        default_env: Environment used when a call does not name one
+        version: Reload generation (1 for the first table)
+        builder: Config builder for roles missing from routes (None: no fallback)
+    """
+
+    def __init__(
+        self,
+        routes: Mapping[RouteKey, Route],
+        default_env: str,
+        version: int = 1,
+        builder: Optional[Callable[[str, str], Optional[AgentEngineConfig]]] = None,
+    ):
+        self._routes = MappingProxyType(dict(routes))
+        self.default_env = default_env
+        self.version = version
+        self.built_at = time.time()
+        self._builder = builder
+        # Routes resolved on lookup miss (single dict writes, safe on the loop)
+        self._fallback: Dict[RouteKey, Route] = {}
+
+    @classmethod
+    def build(
+        cls,
+        roles: Optional[Iterable[str]] = None,
+        envs: Iterable[str] = ENVIRONMENTS,
+        builder: Callable[[str, str], Optional[AgentEngineConfig]] = build_agent_config,
+        version: int = 1,
+    ) -> "RoutingTable":
+        """
+        Snapshot agent configs from the environment.
+
+        Args:
+            roles: Agent roles to route (default: known roles + GATEWAY_ROUTING_ROLES)
+            envs: Environments to route
+            builder: Config builder (default: build_agent_config)
+            version: Reload generation
+
+        Returns:
+            RoutingTable with an entry for every configured (env, role)
+        """
+        if roles is None:
+            extra = [
+                r.strip()
+                for r in os.getenv("GATEWAY_ROUTING_ROLES", "").split(",")
+                if r.strip()
+            ]
+            roles = list(dict.fromkeys([*KNOWN_AGENT_ROLES, *extra]))
+
+        routes: Dict[RouteKey, Route] = {}
+        for env in envs:
+            for role in roles:
+                try:
+                    config = builder(role, env)
+                except ValueError as e:
+                    logger.error(f"Skipping route {env}/{role}: {e}")
+                    continue
+                if config:
+                    routes[(env, role)] = Route.from_config(env, role, config)
+
+        return cls(
+            routes,
+            default_env=get_current_environment(),
+            version=version,
+            builder=builder,
+        )
+
+    @classmethod
+    def from_configs(
+        cls, configs: Mapping[RouteKey, AgentEngineConfig], default_env: str = "dev"
+    ) -> "RoutingTable":
+        """Build a table from explicit configs (tests, scripts)."""
+        routes = {
+            key: Route.from_config(key[0], key[1], config)
+            for key, config in configs.items()
+        }
+        return cls(routes, default_env=default_env)
+
+    def resolve_env(self, env: Optional[str]) -> str:
+        """Resolve an optional per-call environment override."""
+        return env or self.default_env
+
+    def lookup(self, agent_role: str, env: Optional[str] = None) -> Optional[Route]:
+        """
+        Get the route for an agent role.
+
+        Args:
+            agent_role: Target agent role
+            env: Environment override (default: the table's default_env)
+
+        Returns:
+            Route, or None if the role is not configured in that environment
+        """
+        key = (env or self.default_env, agent_role)
+        route = self._routes.get(key) or self._fallback.get(key)
+        if route is None and self._builder is not None:
+            route = self._build_fallback(*key)
+        return route
+
+    def _build_fallback(self, env: str, agent_role: str) -> Optional[Route]:
+        """Resolve a role outside the snapshot and cache it."""
+        try:
+            config = self._builder(agent_role, env)
+        except ValueError as e:
+            logger.error(f"Invalid route {env}/{agent_role}: {e}")
+            return None
+        if not config:
+            return None
+
+        route = self._fallback[(env, agent_role)] = Route.from_config(
+            env, agent_role, config
+        )
+        logger.warning(
+            f"Routing {env}/{agent_role} outside the routing table; "
+            "add it to GATEWAY_ROUTING_ROLES to snapshot it",
+            extra={"env": env, "agent_role": agent_role},
+        )
+        return route
+
+    def __len__(self) -> int:
+        return len(self._routes) + len(self._fallback)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get table version, age and routed roles per environment."""
+        roles: Dict[str, list] = {}
+        for env, role in [*self._routes, *self._fallback]:
+            roles.setdefault(env, []).append(role)
+        return {
+            "version": self.version,
+            "default_env": self.default_env,
+            "routes": len(self),
+            "age_s": round(time.time() - self.built_at, 1),
+            "roles": roles,
+        }
+
+
+_table: Optional[RoutingTable] = None
+
+
+def get_routing_table() -> RoutingTable:
+    """Get the current routing table (built on first use)."""
+    global _table
+    if _table is None:
+        _table = RoutingTable.build()
+        logger.info("Routing table built", extra=_table.stats())
+    return _table
+
+
+def reload_routing_table() -> RoutingTable:
+    """
+    Rebuild the routing table from the environment and swap it in.
+
+    Returns:
+        The new RoutingTable
+    """
+    global _table
+    version = _table.version + 1 if _table is not None else 1
+    _table = RoutingTable.build(version=version)
+    logger.info("Routing table reloaded", extra=_table.stats())
+    return _table
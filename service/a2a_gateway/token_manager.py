@@ -0,0 +1,199 @@
+"""
+Cached GCP Access Token for the A2A Gateway
+
+Application Default Credentials are loaded once per process and the
+access token is reused until shortly before it expires, so the request
+path normally just reads a cached string.
+
+- Credentials load and token refresh run in a worker thread, never on
+  the event loop (both can block on the metadata server / OAuth endpoint)
+- Inside the refresh margin the current token is still served while a
+  refresh runs in the background
+- Refreshes are single-flight: concurrent requests share one refresh
+
+Environment Variables:
+- GATEWAY_TOKEN_REFRESH_MARGIN: Seconds before expiry to start a background
+  refresh (default: 300)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCOPES = ["https://www.googleapis.com/auth/cloud-platform"]
+DEFAULT_REFRESH_MARGIN = 300.0
+
+# Below this remaining lifetime a token is not handed out at all
+MIN_TOKEN_TTL = 10.0
+
+
+def load_default_credentials(scopes: List[str]) -> Any:
+    """Load Application Default Credentials (blocking)."""
+    from google.auth import default
+
+    credentials, _ = default(scopes=scopes)
+    return credentials
+
+
+def refresh_credentials(credentials: Any) -> None:
+    """Refresh credentials in place (blocking)."""
+    from google.auth.transport.requests import Request
+
+    credentials.refresh(Request())
+
+
+def _utcnow() -> datetime:
+    # google-auth stores expiry as a naive UTC datetime
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class TokenManager:
+    """
+    Process-wide cache for a GCP access token.
+
+    Args:
+        scopes: OAuth scopes for the credentials
+        refresh_margin: Seconds before expiry to refresh in the background
+        credentials_loader: Callable(scopes) -> credentials (tests)
+        refresher: Callable(credentials) that refreshes in place (tests)
+    """
+
+    def __init__(
+        self,
+        scopes: Optional[List[str]] = None,
+        refresh_margin: Optional[float] = None,
+        credentials_loader: Callable[[List[str]], Any] = load_default_credentials,
+        refresher: Callable[[Any], None] = refresh_credentials,
+    ):
+        self.scopes = scopes or DEFAULT_SCOPES
+        if refresh_margin is None:
+            refresh_margin = float(
+                os.getenv("GATEWAY_TOKEN_REFRESH_MARGIN", DEFAULT_REFRESH_MARGIN)
+            )
+        self.refresh_margin = refresh_margin
+        self._credentials_loader = credentials_loader
+        self._refresher = refresher
+
+        self._credentials: Optional[Any] = None
+        self._load_lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Future] = None
+
+        self.refresh_count = 0
+        self.refresh_failures = 0
+        self.last_error: Optional[str] = None
+
+    def _remaining(self) -> Optional[float]:
+        """Seconds until the cached token expires (None: no expiry known)."""
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is None:
+            return None
+        return (expiry - _utcnow()).total_seconds()
+
+    def _usable(self) -> bool:
+        if self._credentials is None or not getattr(self._credentials, "token", None):
+            return False
+        remaining = self._remaining()
+        return remaining is None or remaining > MIN_TOKEN_TTL
+
+    def _expiring_soon(self) -> bool:
+        remaining = self._remaining()
+        return remaining is not None and remaining <= self.refresh_margin
+
+    def _load_credentials(self) -> Any:
+        """Load credentials once (runs in a worker thread)."""
+        with self._load_lock:
+            if self._credentials is None:
+                self._credentials = self._credentials_loader(self.scopes)
+            return self._credentials
+
+    async def _refresh(self) -> None:
+        try:
+            await asyncio.to_thread(self._refresher, self._credentials)
+        except Exception as e:
+            self.refresh_failures += 1
+            self.last_error = str(e)
+            raise
+        self.refresh_count += 1
+        self.last_error = None
+        logger.info(
+            "GCP access token refreshed", extra={"expires_in": self._remaining()}
+        )
+
+    def _start_refresh(self) -> asyncio.Future:
+        """Start a refresh, or join the one already running on this loop."""
+        task = self._refresh_task
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.ensure_future(self._refresh())
+            task.add_done_callback(_log_background_failure)
+            self._refresh_task = task
+        return task
+
+    async def get_token(self) -> str:
+        """
+        Get a valid access token.
+
+        Returns:
+            str: Bearer token for API calls
+
+        Raises:
+            RuntimeError: If credentials cannot be loaded or refreshed
+        """
+        try:
+            if self._credentials is None:
+                await asyncio.to_thread(self._load_credentials)
+
+            if self._usable():
+                if self._expiring_soon():
+                    self._start_refresh()
+                return self._credentials.token
+
+            # Shielded so a cancelled request does not cancel the shared refresh
+            await asyncio.shield(self._start_refresh())
+        except Exception as e:
+            logger.error(f"Failed to get GCP token: {e}")
+            raise RuntimeError(f"Authentication failed: {e}")
+
+        if not getattr(self._credentials, "token", None):
+            raise RuntimeError("Authentication failed: refresh returned no token")
+        return self._credentials.token
+
+    def stats(self) -> Dict[str, Any]:
+        """Get token cache stats (refresh counts, remaining lifetime)."""
+        remaining = self._remaining() if self._credentials is not None else None
+        return {
+            "loaded": self._credentials is not None,
+            "expires_in": round(remaining, 1) if remaining is not None else None,
+            "refresh_count": self.refresh_count,
+            "refresh_failures": self.refresh_failures,
+            "refreshing": self._refresh_task is not None
+            and not self._refresh_task.done(),
+            "last_error": self.last_error,
+        }
+
+
+def _log_background_failure(task: asyncio.Future) -> None:
+    # Retrieve the exception so background failures are logged, not "never retrieved"
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Background GCP token refresh failed: {task.exception()}")
+
+
+# Module-level manager (credentials are loaded on first use)
+_manager: Optional[TokenManager] = None
+
+
+def get_token_manager() -> TokenManager:
+    """Get the process-wide token manager."""
+    global _manager
+
+    if _manager is None:
+        _manager = TokenManager()
+    return _manager
@@ -0,0 +1,6 @@
+"""
+Shared helpers for the Cloud Run gateway services (a2a_gateway, slack_webhook).
+
+Only needs packages every service already installs; services copy this
+package next to their main.py.
+"""
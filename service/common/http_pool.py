@@ -0,0 +1,99 @@
+"""
+Shared httpx Connection Pool Helpers
+
+Pool settings, the HTTP/2 availability check and connection usage
+introspection used by each service's pooled upstream clients
+(a2a_gateway/http_pool.py, slack_webhook/http_clients.py).
+
+Each service subclasses PoolConfig to set its own defaults and
+environment variable names:
+
+    @dataclass(frozen=True)
+    class PoolConfig(common.http_pool.PoolConfig):
+        max_connections: int = 50
+
+        env_names: ClassVar[Dict[str, str]] = {"http2": "MY_SERVICE_HTTP2"}
+"""
+
+import importlib.util
+import os
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict
+
+import httpx
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable ("1", "true", "yes", "on")."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings."""
+
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    connect_timeout: float = 5.0
+
+    # Field name -> environment variable name (set by each service)
+    env_names: ClassVar[Dict[str, str]] = {}
+
+    @classmethod
+    def from_env(cls) -> "PoolConfig":
+        """Load pool settings from the environment variables in env_names."""
+        values: Dict[str, Any] = {}
+        for f in fields(cls):
+            name = cls.env_names.get(f.name)
+            if name is None or os.getenv(name) is None:
+                continue
+            if isinstance(f.default, bool):
+                values[f.name] = env_bool(name, f.default)
+            else:
+                values[f.name] = type(f.default)(os.environ[name])
+        return cls(**values)
+
+    def limits(self) -> httpx.Limits:
+        """httpx pool limits for these settings."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+def http2_available() -> bool:
+    """Check if the h2 package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def connection_stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    """
+    Get connection usage from a client's httpcore pool.
+
+    Reads httpx/httpcore internals (client._transport._pool), so an empty
+    dict is returned if they are unavailable (custom transports, or a
+    future httpx release).
+
+    Returns:
+        Dict with connection counts and the number of requests using or
+        waiting for a connection, or {} if unavailable
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return {}
+
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {
+        "connections": len(connections),
+        "active_connections": len(connections) - idle,
+        "idle_connections": idle,
+        "http2_connections": sum(1 for c in connections if "HTTP/2" in c.info()),
+        "requests": len(getattr(pool, "_requests", [])),
+    }
@@ -0,0 +1,408 @@
+"""
+Minimal Prometheus Metrics for the Gateway Services
+
+A small subset of the Prometheus client: counters, gauges and
+histograms with labels, rendered in the text exposition format (0.0.4)
+by a /metrics endpoint. No collector or client library is needed to run
+or test it - the output is plain text. The only import beyond the
+standard library is httpx (for classify_error), which every service
+already depends on.
+
+Recording is a dict lookup plus a few float ops (a bisect for
+histograms), a few microseconds per request. Values that already live
+elsewhere (pool stats, queue depth, token refreshes) are exported with
+register_callback() and only computed at scrape time.
+
+Metrics are updated from the event loop thread; no locking is done.
+
+Usage:
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ["route"])
+    requests.labels("/a2a/run").inc()
+
+    app.add_middleware(MetricsMiddleware, metrics=HTTPMetrics(registry))
+
+    @app.get("/metrics")
+    async def metrics():
+        return Response(registry.render(), media_type=CONTENT_TYPE)
+"""
+
+import math
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import httpx
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; covers fast cache hits up to slow multi-tool agent runs
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base for labelled metrics; children are cached per label tuple."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, Any] = {}
+
+    def labels(self, *values: Any) -> Any:
+        """Get the child for these label values (positional, in labelnames order)."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {values}"
+                )
+            child = self._children[values] = self._new_child()
+        return child
+
+    def _new_child(self) -> Any:
+        raise NotImplementedError
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Counter(_Metric):
+    """Monotonic counter."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _render_samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+            for values, child in self._children.items()
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down (in-flight requests, queue depth)."""
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(_Metric):
+    """Bucketed distribution (latencies in seconds)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe into the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), child.counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class _Callback(_Metric):
+    """Metric whose samples are produced at scrape time."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], Iterable[Sample]],
+    ):
+        super().__init__(name, documentation)
+        self.kind = kind
+        self._collect = collect
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        for labels, value in self._collect():
+            if value is None:
+                continue
+            lines.append(
+                f"{self.name}{_format_labels(list(labels), list(labels.values()))} {_format_value(value)}"
+            )
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of metrics rendered together by /metrics."""
+
+    def __init__(self, namespace: str = ""):
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _name(self, name: str) -> str:
+        return f"{self.namespace}_{name}" if self.namespace else name
+
+    def _register(self, metric: _Metric) -> Any:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Create and register a counter."""
+        return self._register(Counter(self._name(name), documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Create and register a gauge."""
+        return self._register(Gauge(self._name(name), documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Create and register a histogram."""
+        return self._register(
+            Histogram(self._name(name), documentation, labelnames, buckets)
+        )
+
+    def register_callback(
+        self,
+        name: str,
+        documentation: str,
+        collect: Callable[[], Iterable[Sample]],
+        kind: str = "gauge",
+    ) -> None:
+        """
+        Export values computed at scrape time.
+
+        Args:
+            name: Metric name (namespace is prepended)
+            documentation: HELP text
+            collect: Returns (labels dict, value) samples; None values are skipped
+            kind: "gauge" or "counter"
+        """
+        self._register(_Callback(self._name(name), documentation, kind, collect))
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # A failing callback must not break the whole scrape
+                lines.append(f"# {metric.name} unavailable: {_escape(str(e))}")
+        return "\n".join(lines) + "\n"
+
+
+def classify_error(
+    error: Optional[BaseException] = None, status_code: Optional[int] = None
+) -> str:
+    """
+    Map an upstream failure to a low-cardinality error class.
+
+    Returns:
+        One of http_429, http_4xx, http_5xx, timeout, connect, other
+    """
+    if status_code is not None:
+        if status_code == 429:
+            return "http_429"
+        return "http_5xx" if status_code >= 500 else "http_4xx"
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, (httpx.ConnectError, httpx.RemoteProtocolError)):
+        return "connect"
+    return "other"
+
+
+def parse_metrics(text: str) -> Dict[str, float]:
+    """
+    Parse rendered metrics into {sample with labels: value} (tests, scripts).
+
+    Example key: 'gateway_http_requests_total{route="/health",method="GET",status="200"}'
+    """
+    samples = {}
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        sample, _, value = line.rpartition(" ")
+        samples[sample] = math.inf if value == "+Inf" else float(value)
+    return samples
+
+
+class HTTPMetrics:
+    """Per-route request count, latency and in-flight metrics for an ASGI app."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.requests = registry.counter(
+            "http_requests_total",
+            "HTTP requests by route, method and status",
+            ["route", "method", "status"],
+        )
+        self.latency = registry.histogram(
+            "http_request_duration_seconds",
+            "HTTP request latency by route",
+            ["route", "method"],
+        )
+        # Unlabelled: the route is only known once routing has run
+        self.in_flight = registry.gauge(
+            "http_requests_in_flight", "HTTP requests in progress"
+        )
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording HTTPMetrics.
+
+    The route label is the matched route template ("/a2a/run"), not the
+    raw path, so unknown paths collapse into "unmatched" and label
+    cardinality stays bounded. Streaming responses are timed until the
+    last body chunk is sent.
+    """
+
+    def __init__(
+        self, app: Any, metrics: HTTPMetrics, exclude: Sequence[str] = ("/metrics",)
+    ):
+        self.app = app
+        self.metrics = metrics
+        self.exclude = frozenset(exclude)
+
+    async def __call__(
+        self, scope: Dict[str, Any], receive: Callable, send: Callable
+    ) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+            await send(message)
+
+        in_flight = self.metrics.in_flight.labels()
+        in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope.get("method", "")
+            self.metrics.requests.labels(route, method, str(status[0])).inc()
+            self.metrics.latency.labels(route, method).observe(
+                time.perf_counter() - started
+            )
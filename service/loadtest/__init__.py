@@ -0,0 +1,13 @@
+"""
+Offline load-test harness for the gateway services (a2a_gateway, slack_webhook).
+
+Runs a fake Agent Engine (and Slack Web API) on loopback, starts the real
+gateway and webhook apps against it, and drives /query, /a2a/run and
+/slack/events at a target request rate. No GCP or Slack access is needed.
+
+Usage (from service/):
+    python -m loadtest run --rps 50 --duration 20 --output results.json
+    python -m loadtest compare baseline.json results.json
+
+See README.md in this directory.
+"""
@@ -0,0 +1,168 @@
+"""
+Load-test CLI.
+
+Commands:
+    run      Start fake engine + services, load targets, print/write results
+    compare  Diff two results files; exit 1 on regressions
+    serve    Run one service (used by `run` for its subprocesses)
+"""
+
+import argparse
+import json
+import sys
+
+from .fake_engine import FakeEngineConfig, LatencyModel
+from .harness import (
+    compare_results,
+    format_comparison,
+    format_summary,
+    load_results,
+    run,
+    write_results,
+)
+from .loadgen import TARGETS
+
+
+def _engine_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--latency",
+        default="lognormal:0.2,1.5",
+        help="Engine latency: fixed:S | uniform:LO,HI | exponential:MEAN | lognormal:MEDIAN,P99",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        help="Fraction of engine calls that fail",
+    )
+    parser.add_argument(
+        "--error-statuses", default="500,503,429", help="Injected error statuses"
+    )
+    parser.add_argument(
+        "--stream-chunks", type=int, default=4, help="Chunks per streamed response"
+    )
+    parser.add_argument(
+        "--response-bytes", type=int, default=512, help="Approximate response size"
+    )
+    parser.add_argument(
+        "--slack-latency", default="fixed:0.02", help="Fake chat.postMessage latency"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Seed for latency/error sampling"
+    )
+
+
+def _engine_config(args: argparse.Namespace) -> FakeEngineConfig:
+    return FakeEngineConfig(
+        latency=LatencyModel.parse(args.latency),
+        error_rate=args.error_rate,
+        error_statuses=tuple(
+            int(s) for s in args.error_statuses.split(",") if s.strip()
+        ),
+        stream_chunks=args.stream_chunks,
+        response_bytes=args.response_bytes,
+        slack_latency=LatencyModel.parse(args.slack_latency),
+        seed=args.seed,
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest", description="Offline gateway load tests"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run a load test")
+    run_parser.add_argument(
+        "--targets",
+        default=",".join(TARGETS),
+        help=f"Comma-separated targets (default: {','.join(TARGETS)})",
+    )
+    run_parser.add_argument(
+        "--rps", type=float, default=20.0, help="Requests per second per target"
+    )
+    run_parser.add_argument(
+        "--duration", type=float, default=10.0, help="Measured seconds per target"
+    )
+    run_parser.add_argument(
+        "--warmup", type=float, default=2.0, help="Unmeasured seconds per target"
+    )
+    run_parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=1000,
+        help="Drop requests beyond this many in flight",
+    )
+    run_parser.add_argument(
+        "--distinct-prompts",
+        type=int,
+        default=0,
+        help="Cycle through N prompts (exercises coalescing/cache; 0: all unique)",
+    )
+    run_parser.add_argument("--output", help="Write JSON results here")
+    run_parser.add_argument("--log-level", default="warning", help="Service log level")
+    _engine_options(run_parser)
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Relative change counted as a regression (default: 0.1)",
+    )
+    compare_parser.add_argument(
+        "--json", action="store_true", help="Print the report as JSON"
+    )
+
+    serve_parser = commands.add_parser("serve", help="Run one service (internal)")
+    serve_parser.add_argument("kind", choices=("engine", "gateway", "webhook"))
+    serve_parser.add_argument("--port", type=int, required=True)
+    serve_parser.add_argument("--engine-url")
+    serve_parser.add_argument("--gateway-url")
+    serve_parser.add_argument("--log-level", default="warning")
+    _engine_options(serve_parser)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(
+            targets=[t.strip() for t in args.targets.split(",") if t.strip()],
+            rps=args.rps,
+            duration=args.duration,
+            engine=_engine_config(args),
+            warmup=args.warmup,
+            max_in_flight=args.max_in_flight,
+            distinct_prompts=args.distinct_prompts,
+            log_level=args.log_level,
+        )
+        print(format_summary(results))
+        if args.output:
+            write_results(results, args.output)
+            print(f"Results written to {args.output}")
+        return 0
+
+    if args.command == "compare":
+        report = compare_results(
+            load_results(args.baseline), load_results(args.current), args.threshold
+        )
+        print(json.dumps(report, indent=2) if args.json else format_comparison(report))
+        return 1 if report["regressions"] else 0
+
+    # Imported here: uvicorn is only needed by the service subprocesses
+    from . import servers
+
+    if args.kind == "engine":
+        servers.serve_engine(args.port, _engine_config(args), args.log_level)
+    elif args.kind == "gateway":
+        servers.serve_gateway(args.port, args.engine_url, args.log_level)
+    else:
+        servers.serve_webhook(
+            args.port, args.engine_url, args.gateway_url, args.log_level
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+"""
+Fake Vertex AI Agent Engine (and Slack Web API) for Load Tests
+
+Answers the REST calls the gateway and webhook make, with latency drawn
+from a configurable distribution and errors injected at a configurable
+rate:
+
+- POST /v1/{resource}:query - JSON response
+- POST /v1/{resource}:streamQuery?alt=sse - SSE chunks spread over the
+  sampled latency
+- POST /api/chat.postMessage, /api/chat.update - Slack reply sink
+- GET /fake/stats - Request, error and reply counts
+
+Latency specs (seconds):
+- fixed:0.1
+- uniform:0.05,0.3 (low, high)
+- exponential:0.2 (mean)
+- lognormal:0.2,1.5 (median, p99)
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# z-score of the 99th percentile of a standard normal
+Z_P99 = 2.3263
+
+DISTRIBUTIONS = ("fixed", "uniform", "exponential", "lognormal")
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """A latency distribution in seconds."""
+
+    distribution: str = "fixed"
+    params: Tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """
+        Parse a spec like "lognormal:0.2,1.5".
+
+        Raises:
+            ValueError: If the distribution is unknown or params are missing
+        """
+        name, _, raw = spec.partition(":")
+        name = name.strip().lower()
+        if name not in DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution {name!r} (expected one of {', '.join(DISTRIBUTIONS)})"
+            )
+        params = tuple(float(p) for p in raw.split(",") if p.strip())
+        needed = 2 if name in ("uniform", "lognormal") else 1
+        if len(params) != needed:
+            raise ValueError(
+                f"{name} latency takes {needed} parameter(s), got {spec!r}"
+            )
+        if name == "lognormal" and not 0 < params[0] <= params[1]:
+            raise ValueError(f"lognormal latency needs 0 < median <= p99, got {spec!r}")
+        return cls(name, params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.distribution == "fixed":
+            return self.params[0]
+        if self.distribution == "uniform":
+            return rng.uniform(*self.params)
+        if self.distribution == "exponential":
+            return rng.expovariate(1.0 / self.params[0]) if self.params[0] > 0 else 0.0
+        median, p99 = self.params
+        sigma = math.log(p99 / median) / Z_P99
+        return rng.lognormvariate(math.log(median), sigma)
+
+    def __str__(self) -> str:
+        return f"{self.distribution}:{','.join(f'{p:g}' for p in self.params)}"
+
+
+@dataclass(frozen=True)
+class FakeEngineConfig:
+    """Behavior of the fake Agent Engine."""
+
+    latency: LatencyModel = LatencyModel("lognormal", (0.2, 1.5))
+    error_rate: float = 0.0
+    """Fraction of engine calls answered with an error status"""
+    error_statuses: Tuple[int, ...] = (500, 503, 429)
+    """Error statuses, picked uniformly"""
+    stream_chunks: int = 4
+    response_bytes: int = 512
+    slack_latency: LatencyModel = LatencyModel("fixed", (0.02,))
+    seed: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form for results files."""
+        return {
+            "latency": str(self.latency),
+            "error_rate": self.error_rate,
+            "error_statuses": list(self.error_statuses),
+            "stream_chunks": self.stream_chunks,
+            "response_bytes": self.response_bytes,
+            "slack_latency": str(self.slack_latency),
+            "seed": self.seed,
+        }
+
+
+@dataclass
+class FakeEngineStats:
+    """Counters served at /fake/stats."""
+
+    queries: int = 0
+    streams: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    slack_posts: int = 0
+    slack_updates: int = 0
+    slack_error_replies: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "queries": self.queries,
+            "streams": self.streams,
+            "errors": dict(self.errors),
+            "slack_posts": self.slack_posts,
+            "slack_updates": self.slack_updates,
+            "slack_error_replies": self.slack_error_replies,
+            "peak_in_flight": self.peak_in_flight,
+        }
+
+
+def create_app(
+    config: Optional[FakeEngineConfig] = None,
+    sleep: Callable[[float], Any] = asyncio.sleep,
+) -> FastAPI:
+    """
+    Build the fake Agent Engine app.
+
+    Args:
+        config: Behavior (default: FakeEngineConfig())
+        sleep: Awaitable sleep (tests)
+
+    Returns:
+        FastAPI app; app.state.stats holds the FakeEngineStats
+    """
+    config = config or FakeEngineConfig()
+    rng = random.Random(config.seed)
+    stats = FakeEngineStats()
+    filler = "x" * config.response_bytes
+
+    app = FastAPI(title="Fake Agent Engine")
+    app.state.stats = stats
+    app.state.config = config
+
+    def injected_error() -> Optional[JSONResponse]:
+        if config.error_rate <= 0 or rng.random() >= config.error_rate:
+            return None
+        status = rng.choice(config.error_statuses)
+        stats.errors[str(status)] = stats.errors.get(str(status), 0) + 1
+        headers = {"Retry-After": "1"} if status in (429, 503) else None
+        return JSONResponse(
+            {"error": {"code": status, "message": "injected by fake engine"}},
+            status,
+            headers,
+        )
+
+    async def engine_query(body: Dict[str, Any]) -> JSONResponse:
+        stats.queries += 1
+        stats.in_flight += 1
+        stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+        try:
+            await sleep(config.latency.sample(rng))
+            error = injected_error()
+            if error is not None:
+                return error
+            # Agent Engine answers with "output"; the webhook's legacy path reads "response"
+            text = f"echo: {body.get('query', '')[:64]} {filler}"
+            return JSONResponse(
+                {"output": text, "response": text, "session_id": body.get("session_id")}
+            )
+        finally:
+            stats.in_flight -= 1
+
+    async def engine_stream(body: Dict[str, Any]):
+        stats.streams += 1
+        error = injected_error()
+        if error is not None:
+            return error
+        chunks = max(1, config.stream_chunks)
+        total = config.latency.sample(rng)
+        piece = filler[: max(1, config.response_bytes // chunks)]
+
+        async def events():
+            stats.in_flight += 1
+            stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+            try:
+                for i in range(chunks):
+                    await sleep(total / chunks)
+                    event = {
+                        "content": {"parts": [{"text": f"[{i}] {piece}"}]},
+                        "session_id": body.get("session_id"),
+                    }
+                    yield f"data: {json.dumps(event)}\n\n"
+            finally:
+                stats.in_flight -= 1
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.post("/v1/{resource:path}")
+    async def reasoning_engine(resource: str, request: Request):
+        body = await request.json()
+        if resource.endswith(":query"):
+            return await engine_query(body)
+        if resource.endswith(":streamQuery"):
+            return await engine_stream(body)
+        raise HTTPException(status_code=404, detail=f"Unknown method: {resource}")
+
+    @app.post("/api/chat.postMessage")
+    async def chat_post_message(request: Request) -> Dict[str, Any]:
+        body = await request.json()
+        await sleep(config.slack_latency.sample(rng))
+        stats.slack_posts += 1
+        if str(body.get("text", "")).startswith("Sorry"):
+            # The webhook posts an apology when its agent call failed
+            stats.slack_error_replies += 1
+        return {"ok": True, "channel": body.get("channel"), "ts": f"{time.time():.6f}"}
+
+    @app.post("/api/chat.update")
+    async def chat_update(request: Request) -> Dict[str, Any]:
+        body = await request.json()
+        await sleep(config.slack_latency.sample(rng))
+        stats.slack_updates += 1
+        if str(body.get("text", "")).startswith("Sorry"):
+            stats.slack_error_replies += 1
+        return {"ok": True, "channel": body.get("channel"), "ts": body.get("ts")}
+
+    @app.get("/fake/stats")
+    async def fake_stats() -> Dict[str, Any]:
+        return stats.to_dict()
+
+    return app
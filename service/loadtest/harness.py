@@ -0,0 +1,326 @@
+"""
+Load-Test Orchestration and Results
+
+Starts the fake engine, gateway and (when needed) webhook as local
+subprocesses on free ports, runs each target in turn and writes a JSON
+results file. compare_results() diffs two results files so runs can be
+compared across commits.
+"""
+
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import httpx
+
+from .fake_engine import FakeEngineConfig
+from .loadgen import TARGETS, run_load
+
+RESULTS_VERSION = 1
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def free_port() -> int:
+    """Pick an unused loopback port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def git_commit() -> Optional[str]:
+    """Current commit of the repo, if git is available."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def wait_ready(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    """
+    Poll url until it answers.
+
+    Raises:
+        RuntimeError: If the process exits or the timeout passes first
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} server exited with code {process.returncode}")
+        try:
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"{url} not ready after {timeout}s")
+
+
+@contextmanager
+def service(
+    kind: str, args: Sequence[str], ready_path: str, log_level: str
+) -> Iterator[str]:
+    """
+    Run `python -m loadtest serve <kind>` and yield its base URL.
+
+    The subprocess is terminated on exit.
+    """
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        __package__,
+        "serve",
+        kind,
+        "--port",
+        str(port),
+        "--log-level",
+        log_level,
+        *args,
+    ]
+    process = subprocess.Popen(command, cwd=os.getcwd())
+    url = f"http://127.0.0.1:{port}"
+    try:
+        wait_ready(url + ready_path, process)
+        yield url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def engine_args(config: FakeEngineConfig) -> List[str]:
+    """CLI arguments reproducing config for `serve engine`."""
+    args = [
+        "--latency",
+        str(config.latency),
+        "--error-rate",
+        str(config.error_rate),
+        "--error-statuses",
+        ",".join(str(s) for s in config.error_statuses),
+        "--stream-chunks",
+        str(config.stream_chunks),
+        "--response-bytes",
+        str(config.response_bytes),
+        "--slack-latency",
+        str(config.slack_latency),
+    ]
+    if config.seed is not None:
+        args += ["--seed", str(config.seed)]
+    return args
+
+
+async def _drive(
+    base_urls: Dict[str, str],
+    targets: Sequence[str],
+    rps: float,
+    duration: float,
+    warmup: float,
+    max_in_flight: int,
+    distinct_prompts: int,
+) -> Dict[str, Any]:
+    summaries = {}
+    limits = httpx.Limits(
+        max_connections=max_in_flight, max_keepalive_connections=max_in_flight
+    )
+    for name in targets:
+        target = TARGETS[name]
+        async with httpx.AsyncClient(
+            base_url=base_urls[target.service], limits=limits, timeout=120.0
+        ) as client:
+            if warmup > 0:
+                await run_load(
+                    client, target, rps, warmup, max_in_flight, distinct_prompts
+                )
+            result = await run_load(
+                client, target, rps, duration, max_in_flight, distinct_prompts
+            )
+        summaries[name] = result.summary()
+    return summaries
+
+
+def run(
+    targets: Sequence[str],
+    rps: float,
+    duration: float,
+    engine: FakeEngineConfig,
+    warmup: float = 2.0,
+    max_in_flight: int = 1000,
+    distinct_prompts: int = 0,
+    log_level: str = "warning",
+) -> Dict[str, Any]:
+    """
+    Start the services, load each target and collect results.
+
+    Args:
+        targets: Names from loadgen.TARGETS, run one after another
+        rps: Target requests per second
+        duration: Measured seconds per target
+        engine: Fake Agent Engine behavior
+        warmup: Unmeasured seconds per target before measuring
+        max_in_flight: Per-target in-flight cap (excess requests are dropped)
+        distinct_prompts: Distinct prompts to cycle through (0: all unique)
+        log_level: Log level for the services
+
+    Returns:
+        Results dict (see write_results)
+    """
+    unknown = [name for name in targets if name not in TARGETS]
+    if unknown:
+        raise ValueError(
+            f"Unknown targets: {', '.join(unknown)} (expected {', '.join(TARGETS)})"
+        )
+
+    started_at = datetime.now(timezone.utc).isoformat()
+    with ExitStack() as stack:
+        engine_url = stack.enter_context(
+            service("engine", engine_args(engine), "/fake/stats", log_level)
+        )
+        base_urls = {
+            "gateway": stack.enter_context(
+                service("gateway", ["--engine-url", engine_url], "/health", log_level)
+            )
+        }
+        if any(TARGETS[name].service == "webhook" for name in targets):
+            base_urls["webhook"] = stack.enter_context(
+                service(
+                    "webhook",
+                    ["--engine-url", engine_url, "--gateway-url", base_urls["gateway"]],
+                    "/health",
+                    log_level,
+                )
+            )
+
+        summaries = asyncio.run(
+            _drive(
+                base_urls,
+                targets,
+                rps,
+                duration,
+                warmup,
+                max_in_flight,
+                distinct_prompts,
+            )
+        )
+        engine_stats = httpx.get(f"{engine_url}/fake/stats").json()
+
+    return {
+        "version": RESULTS_VERSION,
+        "started_at": started_at,
+        "git_commit": git_commit(),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            "rps": rps,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "max_in_flight": max_in_flight,
+            "distinct_prompts": distinct_prompts,
+            "engine": engine.to_dict(),
+        },
+        "targets": summaries,
+        "fake_engine": engine_stats,
+    }
+
+
+def write_results(results: Dict[str, Any], path: str) -> None:
+    """Write results as indented JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    """Read a results file written by write_results."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+COMPARED = (
+    ("p50_ms", lambda s: s["latency_ms"]["p50"], True),
+    ("p95_ms", lambda s: s["latency_ms"]["p95"], True),
+    ("p99_ms", lambda s: s["latency_ms"]["p99"], True),
+    ("throughput_rps", lambda s: s["throughput_rps"], False),
+    ("error_rate", lambda s: s["error_rate"], True),
+)
+
+
+def compare_results(
+    baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> Dict[str, Any]:
+    """
+    Compare two results files target by target.
+
+    Args:
+        baseline: Earlier results
+        current: New results
+        threshold: Relative change beyond which a metric counts as a
+            regression (latency/error rate up, throughput down)
+
+    Returns:
+        {"targets": {name: {metric: {baseline, current, change}}},
+         "regressions": ["target.metric", ...]}
+    """
+    report: Dict[str, Any] = {"targets": {}, "regressions": []}
+    for name, before in baseline.get("targets", {}).items():
+        after = current.get("targets", {}).get(name)
+        if after is None:
+            continue
+        rows = {}
+        for metric, get, lower_is_better in COMPARED:
+            old, new = get(before), get(after)
+            change = (new - old) / old if old else (0.0 if new == old else float("inf"))
+            rows[metric] = {"baseline": old, "current": new, "change": round(change, 4)}
+            worse = change > threshold if lower_is_better else change < -threshold
+            if worse:
+                report["regressions"].append(f"{name}.{metric}")
+        report["targets"][name] = rows
+    return report
+
+
+def format_summary(results: Dict[str, Any]) -> str:
+    """Human-readable table of a results dict."""
+    lines = [
+        f"{'target':<14}{'ok':>8}{'failed':>8}{'rps':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+    ]
+    for name, s in results["targets"].items():
+        lat = s["latency_ms"]
+        lines.append(
+            f"{name:<14}{s['ok']:>8}{s['failed']:>8}{s['throughput_rps']:>9.1f}"
+            f"{lat['p50']:>10.1f}{lat['p95']:>10.1f}{lat['p99']:>10.1f}"
+        )
+        if s["errors"]:
+            lines.append(f"{'':<14}errors: {s['errors']}")
+    return "\n".join(lines)
+
+
+def format_comparison(report: Dict[str, Any]) -> str:
+    """Human-readable table of a compare_results report."""
+    lines = []
+    for name, rows in report["targets"].items():
+        lines.append(name)
+        for metric, row in rows.items():
+            lines.append(
+                f"  {metric:<15}{row['baseline']:>12}{row['current']:>12}{row['change'] * 100:>+9.1f}%"
+            )
+    lines.append(f"regressions: {', '.join(report['regressions']) or 'none'}")
+    return "\n".join(lines)
@@ -0,0 +1,233 @@
+"""
+Open-Loop Load Generator
+
+Requests are started on a fixed schedule (target RPS) whether or not
+earlier ones have finished, and latency is measured from each request's
+scheduled start. A slow server therefore shows up as queueing latency
+instead of quietly lowering the offered load (coordinated omission).
+
+Targets:
+- query: POST /query on the gateway
+- a2a_run: POST /a2a/run on the gateway (sessionless, bob)
+- slack_events: POST /slack/events on the webhook (signed app_mention)
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import math
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+SLACK_SIGNING_SECRET = "loadtest-signing-secret"
+
+
+def _query_request(i: int, distinct: int) -> Tuple[bytes, Dict[str, str]]:
+    body = {"query": f"load test prompt {i % distinct if distinct else i}"}
+    return json.dumps(body).encode(), {"Content-Type": "application/json"}
+
+
+def _a2a_run_request(i: int, distinct: int) -> Tuple[bytes, Dict[str, str]]:
+    body = {
+        "agent_role": "bob",
+        "prompt": f"load test prompt {i % distinct if distinct else i}",
+        "caller_spiffe_id": "spiffe://intent.solutions/loadtest",
+        "env": "dev",
+    }
+    return json.dumps(body).encode(), {"Content-Type": "application/json"}
+
+
+def _slack_event_request(i: int, distinct: int) -> Tuple[bytes, Dict[str, str]]:
+    body = json.dumps(
+        {
+            "type": "event_callback",
+            "event_id": f"EvLOAD{i}",
+            "event": {
+                "type": "app_mention",
+                "user": f"U{i % 50:05d}",
+                "channel": f"C{i % 10:05d}",
+                "ts": f"{time.time():.6f}",
+                "text": f"<@U07NRCYJX8A> load test prompt {i % distinct if distinct else i}",
+            },
+        }
+    ).encode()
+    timestamp = str(int(time.time()))
+    signature = (
+        "v0="
+        + hmac.new(
+            SLACK_SIGNING_SECRET.encode(),
+            f"v0:{timestamp}:".encode() + body,
+            hashlib.sha256,
+        ).hexdigest()
+    )
+    headers = {
+        "Content-Type": "application/json",
+        "X-Slack-Request-Timestamp": timestamp,
+        "X-Slack-Signature": signature,
+    }
+    return body, headers
+
+
+@dataclass(frozen=True)
+class Target:
+    """An endpoint to load."""
+
+    name: str
+    service: str
+    """"gateway" or "webhook" - which app the path lives on"""
+    path: str
+    build: Callable[[int, int], Tuple[bytes, Dict[str, str]]]
+    """build(index, distinct_prompts) -> (body, headers)"""
+
+
+TARGETS: Dict[str, Target] = {
+    "query": Target("query", "gateway", "/query", _query_request),
+    "a2a_run": Target("a2a_run", "gateway", "/a2a/run", _a2a_run_request),
+    "slack_events": Target(
+        "slack_events", "webhook", "/slack/events", _slack_event_request
+    ),
+}
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 if empty)."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LoadResult:
+    """Raw outcomes of one load run."""
+
+    target: str
+    rps: float
+    duration: float
+    latencies: List[float] = field(default_factory=list)
+    """Seconds from scheduled start to completion, successful requests"""
+    errors: Counter = field(default_factory=Counter)
+    sent: int = 0
+    dropped: int = 0
+    """Requests not started because max_in_flight was reached"""
+    elapsed: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the run.
+
+        Returns:
+            Dict with request counts, throughput (successful requests per
+            second), error counts by class and latency percentiles in ms
+        """
+        ordered = sorted(self.latencies)
+        ok = len(ordered)
+        failed = sum(self.errors.values())
+        ms = lambda seconds: round(seconds * 1000, 2)  # noqa: E731
+        return {
+            "target": self.target,
+            "target_rps": self.rps,
+            "duration_s": self.duration,
+            "requests": self.sent,
+            "ok": ok,
+            "failed": failed,
+            "dropped": self.dropped,
+            "error_rate": round(failed / self.sent, 4) if self.sent else 0.0,
+            "errors": dict(sorted(self.errors.items())),
+            "throughput_rps": round(ok / self.elapsed, 2) if self.elapsed else 0.0,
+            "latency_ms": {
+                "p50": ms(percentile(ordered, 50)),
+                "p95": ms(percentile(ordered, 95)),
+                "p99": ms(percentile(ordered, 99)),
+                "max": ms(ordered[-1]) if ordered else 0.0,
+                "mean": ms(sum(ordered) / ok) if ok else 0.0,
+            },
+        }
+
+
+def _error_class(
+    response: Optional[httpx.Response], error: Optional[BaseException]
+) -> Optional[str]:
+    if error is not None:
+        return type(error).__name__
+    if response.status_code >= 400:
+        return f"http_{response.status_code}"
+    # /a2a/run reports upstream failures in the body with a 200
+    if response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = response.json()
+        except ValueError:
+            return None
+        if isinstance(body, dict) and body.get("error"):
+            return "a2a_error"
+    return None
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    target: Target,
+    rps: float,
+    duration: float,
+    max_in_flight: int = 1000,
+    distinct_prompts: int = 0,
+) -> LoadResult:
+    """
+    Drive one target at a fixed arrival rate.
+
+    Args:
+        client: Client whose base_url is the target's service
+        target: Endpoint to load
+        rps: Requests started per second
+        duration: Seconds to keep starting requests
+        max_in_flight: Requests in flight beyond which new ones are dropped
+        distinct_prompts: Cycle through this many prompts (0: all unique),
+            to exercise the gateway's coalescing and response cache
+
+    Returns:
+        LoadResult once every started request has finished
+    """
+    loop = asyncio.get_running_loop()
+    result = LoadResult(target=target.name, rps=rps, duration=duration)
+    total = int(rps * duration)
+    in_flight = 0
+    tasks = []
+
+    async def one(i: int, scheduled: float) -> None:
+        nonlocal in_flight
+        body, headers = target.build(i, distinct_prompts)
+        response, error = None, None
+        try:
+            response = await client.post(target.path, content=body, headers=headers)
+        except Exception as e:
+            error = e
+        finally:
+            in_flight -= 1
+        failure = _error_class(response, error)
+        if failure is None:
+            result.latencies.append(loop.time() - scheduled)
+        else:
+            result.errors[failure] += 1
+
+    start = loop.time()
+    for i in range(total):
+        scheduled = start + i / rps
+        delay = scheduled - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        result.sent += 1
+        if in_flight >= max_in_flight:
+            result.dropped += 1
+            result.errors["dropped"] += 1
+            continue
+        in_flight += 1
+        tasks.append(asyncio.ensure_future(one(i, scheduled)))
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    result.elapsed = loop.time() - start
+    return result
@@ -0,0 +1,103 @@
+"""
+Service Bootstraps for Load Tests
+
+Each function runs one app under uvicorn on loopback, wired to the fake
+Agent Engine instead of GCP. They are the `python -m loadtest serve ...`
+entry points the harness starts as subprocesses, so the apps under test
+do not share a CPU-bound event loop with the load generator.
+
+Offline wiring:
+- gateway: a static access token instead of Application Default
+  Credentials, and a routing table whose Agent Engine URLs point at the fake
+- webhook: SLACK_API_URL and A2A_GATEWAY_URL point at the fake Slack API
+  and the local gateway
+"""
+
+import logging
+import os
+import sys
+from types import SimpleNamespace
+
+import uvicorn
+
+from .fake_engine import FakeEngineConfig, create_app
+from .loadgen import SLACK_SIGNING_SECRET
+
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Path the fake engine serves under; mirrors the real resource name
+ENGINE_RESOURCE = "v1/projects/loadtest/locations/local/reasoningEngines"
+
+
+def engine_query_url(engine_url: str, engine_id: str = "fake") -> str:
+    """:query URL on the fake engine."""
+    return f"{engine_url}/{ENGINE_RESOURCE}/{engine_id}:query"
+
+
+def _run(app, port: int, log_level: str) -> None:
+    logging.getLogger().setLevel(log_level.upper())
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level=log_level, access_log=False)
+
+
+def serve_engine(
+    port: int, config: FakeEngineConfig, log_level: str = "warning"
+) -> None:
+    """Serve the fake Agent Engine."""
+    _run(create_app(config), port, log_level)
+
+
+def serve_gateway(port: int, engine_url: str, log_level: str = "warning") -> None:
+    """Serve the A2A gateway against the fake Agent Engine."""
+    os.environ.setdefault("PROJECT_ID", "loadtest")
+    os.environ.setdefault("LOCATION", "local")
+    os.environ.setdefault("AGENT_ENGINE_ID", "fake")
+    os.environ["AGENT_ENGINE_URL"] = engine_query_url(engine_url)
+    sys.path.insert(0, os.path.join(SERVICE_DIR, "a2a_gateway"))
+
+    import main
+    import routing
+    import token_manager
+    from agents.config.agent_engine import AgentEngineConfig
+
+    token_manager._manager = token_manager.TokenManager(
+        credentials_loader=lambda scopes: SimpleNamespace(
+            token="loadtest", expiry=None
+        ),
+        refresher=lambda credentials: None,
+    )
+
+    routes = {}
+    for role in routing.KNOWN_AGENT_ROLES:
+        config = AgentEngineConfig(
+            reasoning_engine_id=f"fake-{role}",
+            project_id="loadtest",
+            location="local",
+            spiffe_id=f"spiffe://intent.solutions/agent/{role}/dev/local/loadtest",
+        )
+        url = engine_query_url(engine_url, config.reasoning_engine_id)
+        routes[("dev", role)] = routing.Route(
+            env="dev",
+            agent_role=role,
+            config=config,
+            url=url,
+            stream_url=url.replace(":query", ":streamQuery?alt=sse"),
+        )
+    routing._table = routing.RoutingTable(routes, default_env="dev")
+
+    _run(main.app, port, log_level)
+
+
+def serve_webhook(
+    port: int, engine_url: str, gateway_url: str, log_level: str = "warning"
+) -> None:
+    """Serve the Slack webhook, routed through the gateway, replying to the fake Slack API."""
+    os.environ["SLACK_BOB_ENABLED"] = "true"
+    os.environ["SLACK_BOT_TOKEN"] = "xoxb-loadtest"
+    os.environ["SLACK_SIGNING_SECRET"] = SLACK_SIGNING_SECRET
+    os.environ["SLACK_API_URL"] = f"{engine_url}/api"
+    os.environ["A2A_GATEWAY_URL"] = gateway_url
+    sys.path.insert(0, os.path.join(SERVICE_DIR, "slack_webhook"))
+
+    import main
+
+    _run(main.app, port, log_level)
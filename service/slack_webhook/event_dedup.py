@@ -0,0 +1,285 @@
+"""
+Slack Event Deduplication
+
+Slack redelivers an event (with X-Slack-Retry-Num) when it did not get a
+timely 200, and the same message can also arrive through more than one
+subscription (e.g. app_mention and message.channels). Instead of dropping
+every retry, each event is claimed once by its keys:
+
+- event:<event_id> - the delivery envelope's ID (same across retries)
+- msg:<client_msg_id> - the message's ID (same across subscriptions)
+
+The first request to claim any of the keys processes the event; later
+ones are acknowledged and skipped. A claim is released again when the
+event never reached a worker (queue full, shutting down), so Slack's
+retry of it goes through. Once a worker has the event it is never
+released: one processing attempt per event.
+
+Stores are pluggable, as in the gateway's response cache:
+- "memory": in-process, bounded by entry count
+- "sqlite": a local SQLite file that survives restarts and is shared by
+  every worker process on the host
+
+Environment Variables:
+- SLACK_DEDUP_BACKEND: "memory" or "sqlite" (default: memory)
+- SLACK_DEDUP_TTL: Seconds a claim is kept (default: 3600; Slack retries
+  within about 5 minutes)
+- SLACK_DEDUP_MAX_ENTRIES: Max claims kept by the memory store (default: 100000)
+- SLACK_DEDUP_PATH: SQLite file for the sqlite backend
+  (default: /tmp/bobs-brain-slack-dedup.sqlite3)
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+DEFAULT_TTL = 3600.0
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_SQLITE_PATH = "/tmp/bobs-brain-slack-dedup.sqlite3"
+
+
+def dedup_keys(
+    event_id: Optional[str] = None, client_msg_id: Optional[str] = None
+) -> List[str]:
+    """Keys identifying an event (empty if it carries no IDs)."""
+    keys = []
+    if event_id:
+        keys.append(f"event:{event_id}")
+    if client_msg_id:
+        keys.append(f"msg:{client_msg_id}")
+    return keys
+
+
+class DedupStore(ABC):
+    """
+    Set of keys with per-key TTL and atomic claim.
+
+    Stores with blocking I/O set `blocking = True`; EventDeduplicator then
+    calls them from a worker thread.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def claim(self, keys: Sequence[str], ttl: float) -> bool:
+        """Add all keys if none is live; return False if any already was."""
+
+    @abstractmethod
+    def release(self, keys: Sequence[str]) -> None:
+        """Remove keys so the event can be claimed again."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get live entry count and evictions."""
+
+
+class InProcessDedupStore(DedupStore):
+    """
+    In-process claims, oldest evicted first above max_entries.
+
+    Args:
+        max_entries: Max keys kept
+        clock: Time source (tests)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+        self.evictions = 0
+
+    def claim(self, keys: Sequence[str], ttl: float) -> bool:
+        now = self._clock()
+        if any(self._expiry.get(key, 0.0) > now for key in keys):
+            return False
+        for key in keys:
+            self._expiry.pop(key, None)
+            self._expiry[key] = now + ttl
+        # Entries are in claim order, so expired ones sit at the front
+        while self._expiry and (
+            len(self._expiry) > self.max_entries
+            or next(iter(self._expiry.values())) <= now
+        ):
+            _, expires_at = self._expiry.popitem(last=False)
+            if expires_at > now:
+                self.evictions += 1
+        return True
+
+    def release(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._expiry.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": BACKEND_MEMORY,
+            "entries": len(self._expiry),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+class SQLiteDedupStore(DedupStore):
+    """
+    Claims in a local SQLite file, kept across restarts and shared by
+    every process that opens it. Claims are atomic across processes
+    (BEGIN IMMEDIATE).
+
+    Args:
+        path: SQLite database file
+        clock: Time source (tests)
+    """
+
+    blocking = True
+
+    def __init__(
+        self, path: str = DEFAULT_SQLITE_PATH, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS claims (key TEXT PRIMARY KEY, expires_at REAL NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS claims_expiry ON claims (expires_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open an autocommit connection (claim() manages its transaction); always close."""
+        db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        try:
+            yield db
+        finally:
+            db.close()
+
+    def claim(self, keys: Sequence[str], ttl: float) -> bool:
+        now = self._clock()
+        placeholders = ",".join("?" * len(keys))
+        with self._lock, self._connect() as db:
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                db.execute("DELETE FROM claims WHERE expires_at <= ?", (now,))
+                live = db.execute(
+                    f"SELECT COUNT(*) FROM claims WHERE key IN ({placeholders})",
+                    tuple(keys),
+                ).fetchone()[0]
+                if live:
+                    db.execute("ROLLBACK")
+                    return False
+                db.executemany(
+                    "INSERT INTO claims VALUES (?, ?)",
+                    [(key, now + ttl) for key in keys],
+                )
+                db.execute("COMMIT")
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+        return True
+
+    def release(self, keys: Sequence[str]) -> None:
+        with self._lock, self._connect() as db:
+            db.executemany("DELETE FROM claims WHERE key = ?", [(key,) for key in keys])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as db:
+            entries = db.execute(
+                "SELECT COUNT(*) FROM claims WHERE expires_at > ?", (self._clock(),)
+            ).fetchone()[0]
+        return {"backend": BACKEND_SQLITE, "entries": entries, "path": self.path}
+
+
+class EventDeduplicator:
+    """
+    Claims Slack events so each is processed once.
+
+    Args:
+        store: Backing store
+        ttl: Seconds a claim is kept
+    """
+
+    def __init__(self, store: DedupStore, ttl: float = DEFAULT_TTL):
+        self.store = store
+        self.ttl = ttl
+        self.claimed = 0
+        self.duplicates = 0
+        self.released = 0
+        self.unkeyed = 0
+
+    @classmethod
+    def from_env(cls) -> "EventDeduplicator":
+        """Build the deduplicator from SLACK_DEDUP_* environment variables."""
+        backend = os.getenv("SLACK_DEDUP_BACKEND", BACKEND_MEMORY)
+        if backend == BACKEND_MEMORY:
+            store: DedupStore = InProcessDedupStore(
+                int(os.getenv("SLACK_DEDUP_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+            )
+        elif backend == BACKEND_SQLITE:
+            store = SQLiteDedupStore(os.getenv("SLACK_DEDUP_PATH", DEFAULT_SQLITE_PATH))
+        else:
+            raise ValueError(
+                f"Invalid SLACK_DEDUP_BACKEND: {backend!r} (expected {BACKEND_MEMORY} or {BACKEND_SQLITE})"
+            )
+        return cls(store, float(os.getenv("SLACK_DEDUP_TTL", str(DEFAULT_TTL))))
+
+    async def _call_store(self, method: Callable, *args: Any) -> Any:
+        if self.store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def claim(
+        self, event_id: Optional[str] = None, client_msg_id: Optional[str] = None
+    ) -> bool:
+        """
+        Claim an event for processing.
+
+        Returns:
+            True if this is the first claim (or the event has no IDs to
+            dedup on); False for a duplicate
+        """
+        keys = dedup_keys(event_id, client_msg_id)
+        if not keys:
+            self.unkeyed += 1
+            return True
+        if await self._call_store(self.store.claim, keys, self.ttl):
+            self.claimed += 1
+            return True
+        self.duplicates += 1
+        return False
+
+    async def release(
+        self, event_id: Optional[str] = None, client_msg_id: Optional[str] = None
+    ) -> None:
+        """Drop an event's claim so a redelivery is processed."""
+        keys = dedup_keys(event_id, client_msg_id)
+        if keys:
+            await self._call_store(self.store.release, keys)
+            self.released += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Get claim counters and store stats."""
+        return {
+            "ttl": self.ttl,
+            "claimed": self.claimed,
+            "duplicates": self.duplicates,
+            "released": self.released,
+            "unkeyed": self.unkeyed,
+            "store": self.store.stats(),
+        }
@@ -0,0 +1,292 @@
+"""
+Ack-Fast Slack Event Queue
+
+Slack expects a 200 within 3 seconds and retries otherwise, but an agent
+call can take up to a minute. /slack/events therefore only validates the
+event and enqueues it; N async workers in the same process make the agent
+call and post the reply.
+
+- Bounded: at most SLACK_QUEUE_MAX_DEPTH events wait. When full, the
+  overflow policy either rejects the new event ("reject") or drops the
+  oldest event of the user with the most queued events ("drop_oldest")
+- Per-user cap: one user may have at most SLACK_QUEUE_PER_USER events
+  waiting; beyond that the same overflow policy applies to their own events
+- Fair: workers take events round-robin across users, so one chatty user
+  cannot starve everyone else
+- Observable: queue depth, busy workers, wait time and enqueue outcomes
+  are exported on /metrics and /health
+
+Events are held in memory; whatever is still queued when the process
+stops after the drain timeout is lost unless a durable event store is
+configured (see event_store.py).
+
+Environment Variables:
+- SLACK_WORKERS: Worker tasks (default: 4)
+- SLACK_QUEUE_MAX_DEPTH: Max queued events (default: 100)
+- SLACK_QUEUE_PER_USER: Max queued events per user (default: 10)
+- SLACK_QUEUE_OVERFLOW: "reject" or "drop_oldest" (default: reject)
+- SLACK_QUEUE_DRAIN_TIMEOUT: Seconds to finish queued events on shutdown
+  (default: 8; Cloud Run allows 10 after SIGTERM)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import webhook_metrics
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("reject", "drop_oldest")
+
+
+@dataclass
+class SlackJob:
+    """A Slack message waiting for an agent reply."""
+
+    user: str
+    channel: str
+    text: str
+    thread_ts: Optional[str] = None
+    event_type: str = "message"
+    event_id: Optional[str] = None
+    client_msg_id: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.time)
+    job_id: Optional[str] = None  # Set once persisted (event_store.py)
+    redrives: int = 0  # Times re-queued from the event store after a restart
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict form (for logs and persistence)."""
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class EventQueueConfig:
+    """Worker pool and queue settings."""
+
+    workers: int = 4
+    max_depth: int = 100
+    per_user: int = 10
+    overflow: str = "reject"
+    drain_timeout: float = 8.0
+
+    @classmethod
+    def from_env(cls) -> "EventQueueConfig":
+        """Load settings from SLACK_WORKERS / SLACK_QUEUE_* environment variables."""
+        overflow = os.getenv("SLACK_QUEUE_OVERFLOW", "reject").strip().lower()
+        if overflow not in OVERFLOW_POLICIES:
+            logger.warning(f"Unknown SLACK_QUEUE_OVERFLOW {overflow!r}, using 'reject'")
+            overflow = "reject"
+        return cls(
+            workers=max(1, int(os.getenv("SLACK_WORKERS", "4"))),
+            max_depth=max(1, int(os.getenv("SLACK_QUEUE_MAX_DEPTH", "100"))),
+            per_user=max(1, int(os.getenv("SLACK_QUEUE_PER_USER", "10"))),
+            overflow=overflow,
+            drain_timeout=float(os.getenv("SLACK_QUEUE_DRAIN_TIMEOUT", "8")),
+        )
+
+
+Handler = Callable[[SlackJob], Awaitable[None]]
+DropHandler = Callable[[SlackJob, str], Any]
+
+
+class SlackEventQueue:
+    """
+    Bounded, per-user fair queue served by a pool of worker tasks.
+
+    Workers start on first submit() (or start()) on the running loop.
+
+    Args:
+        handler: Processes one job (agent call + reply); exceptions are
+            logged and counted, the worker keeps going
+        config: Settings (default: EventQueueConfig.from_env())
+        on_drop: Called with (job, reason) for rejected or dropped jobs,
+            reason being "queue_full", "user_limit" or "shutting_down"
+    """
+
+    def __init__(
+        self,
+        handler: Handler,
+        config: Optional[EventQueueConfig] = None,
+        on_drop: Optional[DropHandler] = None,
+    ):
+        self.config = config or EventQueueConfig.from_env()
+        self._handler = handler
+        self._on_drop = on_drop
+        # user -> queued jobs; key order is the round-robin order
+        self._queues: "OrderedDict[str, Deque[SlackJob]]" = OrderedDict()
+        self.depth = 0
+        self.busy = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._available: Optional[asyncio.Semaphore] = None
+        self._workers: List[asyncio.Task] = []
+        self._closed = False
+
+        self.enqueued = 0
+        self.rejected: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self.processed = 0
+        self.failed = 0
+
+    def start(self) -> None:
+        """Start the workers on the running loop (no-op if already running there)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        self._loop = loop
+        self._closed = False
+        self._available = asyncio.Semaphore(self.depth)
+        self._workers = [
+            loop.create_task(self._worker(i), name=f"slack-worker-{i}")
+            for i in range(self.config.workers)
+        ]
+        logger.info(
+            "Slack event workers started", extra={"workers": self.config.workers}
+        )
+
+    def submit(self, job: SlackJob) -> bool:
+        """
+        Queue a job without waiting.
+
+        Returns:
+            True if queued; False if the overflow policy rejected it
+        """
+        self.start()
+        if self._closed:
+            return self._refuse(job, "shutting_down")
+
+        user_jobs = self._queues.get(job.user)
+        if user_jobs is not None and len(user_jobs) >= self.config.per_user:
+            if self.config.overflow == "reject":
+                return self._refuse(job, "user_limit")
+            self._evict(job.user, "user_limit")
+        elif self.depth >= self.config.max_depth:
+            if self.config.overflow == "reject":
+                return self._refuse(job, "queue_full")
+            self._evict(
+                max(self._queues, key=lambda user: len(self._queues[user])),
+                "queue_full",
+            )
+
+        self._queues.setdefault(job.user, deque()).append(job)
+        self.depth += 1
+        webhook_metrics.queue_depth.set(self.depth)
+        self.enqueued += 1
+        webhook_metrics.queue_events.labels("enqueued").inc()
+        self._available.release()
+        return True
+
+    def _refuse(self, job: SlackJob, reason: str) -> bool:
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        webhook_metrics.queue_events.labels("rejected").inc()
+        logger.warning(
+            "Slack event rejected",
+            extra={"reason": reason, "user": job.user, "depth": self.depth},
+        )
+        self._notify_drop(job, reason)
+        return False
+
+    def _evict(self, user: str, reason: str) -> None:
+        user_jobs = self._queues[user]
+        job = user_jobs.popleft()
+        if not user_jobs:
+            del self._queues[user]
+        self.depth -= 1
+        webhook_metrics.queue_depth.set(self.depth)
+        self.dropped[reason] = self.dropped.get(reason, 0) + 1
+        webhook_metrics.queue_events.labels("dropped").inc()
+        logger.warning(
+            "Slack event dropped",
+            extra={"reason": reason, "user": user, "depth": self.depth},
+        )
+        self._notify_drop(job, reason)
+
+    def _notify_drop(self, job: SlackJob, reason: str) -> None:
+        if self._on_drop is None:
+            return
+        try:
+            self._on_drop(job, reason)
+        except Exception as e:
+            logger.error(f"Slack drop handler failed: {e}", exc_info=True)
+
+    def _pop(self) -> Optional[SlackJob]:
+        """Take the next job round-robin across users."""
+        if not self._queues:
+            return None
+        user, user_jobs = self._queues.popitem(last=False)
+        job = user_jobs.popleft()
+        if user_jobs:
+            self._queues[user] = user_jobs  # Back of the rotation
+        self.depth -= 1
+        webhook_metrics.queue_depth.set(self.depth)
+        return job
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            await self._available.acquire()
+            job = self._pop()
+            if job is None:
+                continue  # Its permit belonged to an evicted job
+            wait = max(0.0, time.time() - job.enqueued_at)
+            webhook_metrics.queue_wait.observe(wait)
+            self.busy += 1
+            webhook_metrics.queue_busy_workers.set(self.busy)
+            try:
+                await self._handler(job)
+                self.processed += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Slack event handling failed: {e}", exc_info=True)
+            finally:
+                self.busy -= 1
+                webhook_metrics.queue_busy_workers.set(self.busy)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting jobs, let workers finish queued ones, then cancel them.
+
+        Args:
+            timeout: Max seconds to drain (default: config.drain_timeout)
+        """
+        self._closed = True
+        timeout = self.config.drain_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while (self.depth or self.busy) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        if self.depth or self.busy:
+            logger.warning(
+                "Slack event queue not drained",
+                extra={"queued": self.depth, "busy": self.busy},
+            )
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def oldest_wait(self) -> float:
+        """Seconds the longest-waiting queued job has waited."""
+        oldest = min(
+            (jobs[0].enqueued_at for jobs in self._queues.values()), default=None
+        )
+        return round(max(0.0, time.time() - oldest), 3) if oldest is not None else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get queue depth, worker usage and outcome counters."""
+        return {
+            "depth": self.depth,
+            "max_depth": self.config.max_depth,
+            "users": len(self._queues),
+            "oldest_wait_s": self.oldest_wait(),
+            "workers": self.config.workers,
+            "busy": self.busy,
+            "overflow": self.config.overflow,
+            "enqueued": self.enqueued,
+            "rejected": dict(self.rejected),
+            "dropped": dict(self.dropped),
+            "processed": self.processed,
+            "failed": self.failed,
+        }
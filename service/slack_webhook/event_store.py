@@ -0,0 +1,253 @@
+"""
+Durable Slack Event Store
+
+The worker queue (event_queue.py) is in memory, so an instance recycle
+loses every event that was acked but not yet answered. With a durable
+backend each event is written to a store before /slack/events acks it,
+deleted once its reply is posted, and whatever is left on startup is
+queued again.
+
+- "memory" (default): nothing is stored; events live only in the queue
+- "sqlite": a SQLite file in WAL mode. It survives process restarts; to
+  survive an instance recycle, SLACK_QUEUE_PATH must be on a volume that
+  outlives the instance (e.g. a Cloud Run volume mount), not the
+  in-memory filesystem. One file per webhook process: on startup every
+  stored event is re-driven (at most MAX_REDRIVES times)
+
+Delivery is at least once: an event whose reply was posted just before
+a crash, but not yet deleted, is answered again after the restart.
+
+EventStore is the interface a managed queue could implement later:
+put() is publish, delete() is ack and pending() returns unacked messages.
+
+Environment Variables:
+- SLACK_QUEUE_BACKEND: "memory" or "sqlite" (default: memory)
+- SLACK_QUEUE_PATH: SQLite file for the sqlite backend
+  (default: /tmp/bobs-brain-slack-queue.sqlite3)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import fields as dataclass_fields
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from event_queue import SlackJob
+
+logger = logging.getLogger(__name__)
+
+BACKEND_MEMORY = "memory"
+BACKEND_SQLITE = "sqlite"
+DEFAULT_SQLITE_PATH = "/tmp/bobs-brain-slack-queue.sqlite3"
+# A stored event is re-driven at most this many times (poison events)
+MAX_REDRIVES = 3
+# Stored jobs may come from an older SlackJob; unknown fields are dropped
+JOB_FIELDS = frozenset(field.name for field in dataclass_fields(SlackJob))
+
+
+class EventStore(ABC):
+    """
+    Events that were acked to Slack but not yet answered.
+
+    Stores with blocking I/O set `blocking = True`; DurableEvents then
+    calls them from a worker thread.
+    """
+
+    blocking = False
+
+    @abstractmethod
+    def put(self, job_id: str, job: Dict[str, Any]) -> None:
+        """Persist an event (must be durable when this returns)."""
+
+    @abstractmethod
+    def delete(self, job_id: str) -> None:
+        """Forget an answered event."""
+
+    @abstractmethod
+    def pending(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get all stored events, oldest first."""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Get stored event count and backend details."""
+
+
+class SQLiteEventStore(EventStore):
+    """
+    Events in a local SQLite file (WAL, synchronous=NORMAL: a commit
+    survives a process crash, only a power loss can lose the last ones).
+
+    Each call opens its own connection, so the store is safe across threads.
+
+    Args:
+        path: SQLite database file
+        clock: Time source (tests)
+    """
+
+    blocking = True
+
+    def __init__(
+        self, path: str = DEFAULT_SQLITE_PATH, clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                " id TEXT PRIMARY KEY, stored_at REAL NOT NULL, job TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection; commit on success and always close."""
+        db = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            db.execute("PRAGMA synchronous=NORMAL")
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def put(self, job_id: str, job: Dict[str, Any]) -> None:
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?)",
+                (job_id, self._clock(), json.dumps(job)),
+            )
+
+    def delete(self, job_id: str) -> None:
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM events WHERE id = ?", (job_id,))
+
+    def pending(self) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock, self._connect() as db:
+            rows = db.execute(
+                "SELECT id, job FROM events ORDER BY stored_at, rowid"
+            ).fetchall()
+        return [(job_id, json.loads(job)) for job_id, job in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock, self._connect() as db:
+            stored = db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        return {"backend": BACKEND_SQLITE, "stored": stored, "path": self.path}
+
+
+class DurableEvents:
+    """
+    Persists Slack jobs in an optional EventStore (a no-op without one).
+
+    Args:
+        store: Backing store, or None for the in-memory default
+    """
+
+    def __init__(self, store: Optional[EventStore] = None):
+        self.store = store
+        self.persisted = 0
+        self.completed = 0
+        self.redriven = 0
+        self.abandoned = 0
+        self.errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether events are persisted."""
+        return self.store is not None
+
+    @classmethod
+    def from_env(cls) -> "DurableEvents":
+        """Build from SLACK_QUEUE_BACKEND / SLACK_QUEUE_PATH."""
+        backend = os.getenv("SLACK_QUEUE_BACKEND", BACKEND_MEMORY)
+        if backend == BACKEND_MEMORY:
+            return cls()
+        if backend == BACKEND_SQLITE:
+            return cls(
+                SQLiteEventStore(os.getenv("SLACK_QUEUE_PATH", DEFAULT_SQLITE_PATH))
+            )
+        raise ValueError(
+            f"Invalid SLACK_QUEUE_BACKEND: {backend!r} (expected {BACKEND_MEMORY} or {BACKEND_SQLITE})"
+        )
+
+    async def _call_store(self, method: Callable, *args: Any) -> Any:
+        if self.store.blocking:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def persist(self, job: SlackJob) -> bool:
+        """
+        Store a job before it is acked (assigns job.job_id).
+
+        Returns:
+            True if stored; False if disabled or the store failed (the job
+            is then only held in memory)
+        """
+        if self.store is None:
+            return False
+        job.job_id = job.job_id or uuid.uuid4().hex
+        try:
+            await self._call_store(self.store.put, job.job_id, job.to_dict())
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to persist Slack event: {e}", exc_info=True)
+            return False
+        self.persisted += 1
+        return True
+
+    async def complete(self, job: SlackJob) -> None:
+        """Delete an answered (or abandoned) job."""
+        if self.store is None or not job.job_id:
+            return
+        try:
+            await self._call_store(self.store.delete, job.job_id)
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Failed to delete stored Slack event: {e}", exc_info=True)
+            return
+        self.completed += 1
+
+    async def redrive(self) -> List[SlackJob]:
+        """Get the jobs left over from a previous run, oldest first."""
+        if self.store is None:
+            return []
+        jobs = []
+        for job_id, fields in await self._call_store(self.store.pending):
+            known = {
+                name: value for name, value in fields.items() if name in JOB_FIELDS
+            }
+            job = SlackJob(**{**known, "job_id": job_id})
+            if job.redrives >= MAX_REDRIVES:
+                # Crashed the webhook (or never got a reply out) too often
+                logger.warning(
+                    "Abandoning stored Slack event", extra={"event_id": job.event_id}
+                )
+                self.abandoned += 1
+                await self.complete(job)
+                continue
+            job.redrives += 1
+            await self._call_store(self.store.put, job_id, job.to_dict())
+            jobs.append(job)
+        self.redriven += len(jobs)
+        if jobs:
+            logger.info("Re-driving stored Slack events", extra={"count": len(jobs)})
+        return jobs
+
+    def stats(self) -> Dict[str, Any]:
+        """Get persistence counters and store stats."""
+        return {
+            "backend": (
+                self.store.stats() if self.store else {"backend": BACKEND_MEMORY}
+            ),
+            "persisted": self.persisted,
+            "completed": self.completed,
+            "redriven": self.redriven,
+            "abandoned": self.abandoned,
+            "errors": self.errors,
+        }
@@ -0,0 +1,199 @@
+"""
+Shared HTTP Clients for the Slack Webhook
+
+One pooled httpx.AsyncClient per upstream route, opened and closed by the
+FastAPI lifespan, so workers reuse warm (HTTP/2 when available)
+connections instead of paying a TCP+TLS handshake per Slack event:
+
+- "agent": agent calls (A2A gateway or direct Agent Engine)
+- "slack": Slack Web API calls
+
+Outside a running app (scripts, unit tests), pooled_client() falls back to
+a per-call client, so callers work the same either way. Pool usage per
+route is exported on /metrics (slack_webhook_http_pool_*) and /health.
+
+Environment Variables:
+- SLACK_HTTP2: Enable HTTP/2 if the h2 package is installed (default: true)
+- SLACK_HTTP_MAX_CONNECTIONS: Max connections per route (default: 50)
+- SLACK_HTTP_MAX_KEEPALIVE: Max idle keepalive connections per route
+  (default: 10)
+- SLACK_HTTP_KEEPALIVE_EXPIRY: Idle connection lifetime in seconds
+  (default: 30)
+- SLACK_HTTP_CONNECT_TIMEOUT: Connect timeout in seconds (default: 5)
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, Optional, Tuple
+
+import httpx
+
+import webhook_metrics
+from common import http_pool as common_pool  # On sys.path via webhook_metrics
+from common.http_pool import connection_stats, http2_available
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60.0
+
+
+@dataclass(frozen=True)
+class PoolConfig(common_pool.PoolConfig):
+    """Connection pool settings (applied to each route)."""
+
+    max_connections: int = 50
+    max_keepalive_connections: int = 10
+
+    env_names: ClassVar[Dict[str, str]] = {
+        "http2": "SLACK_HTTP2",
+        "max_connections": "SLACK_HTTP_MAX_CONNECTIONS",
+        "max_keepalive_connections": "SLACK_HTTP_MAX_KEEPALIVE",
+        "keepalive_expiry": "SLACK_HTTP_KEEPALIVE_EXPIRY",
+        "connect_timeout": "SLACK_HTTP_CONNECT_TIMEOUT",
+    }
+
+
+# Module-level shared clients by route (set by the app lifespan)
+_clients: Dict[str, httpx.AsyncClient] = {}
+_config: Optional[PoolConfig] = None
+
+
+def open_client(
+    route: str,
+    config: Optional[PoolConfig] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    **kwargs: Any,
+) -> httpx.AsyncClient:
+    """
+    Open the shared client for a route (call from the app lifespan).
+
+    Args:
+        route: Route name ("agent" or "slack")
+        config: Pool settings (default: PoolConfig.from_env())
+        timeout: Default total timeout for the route's requests
+        **kwargs: Extra httpx.AsyncClient arguments (base_url, headers, transport)
+
+    Returns:
+        The route's shared client (the existing one if already open)
+    """
+    global _config
+
+    if route in _clients:
+        return _clients[route]
+
+    config = config or _config or PoolConfig.from_env()
+    http2 = config.http2 and http2_available()
+    if config.http2 and not http2:
+        logger.warning("SLACK_HTTP2 requested but h2 is not installed; using HTTP/1.1")
+
+    _clients[route] = httpx.AsyncClient(
+        http2=http2,
+        limits=config.limits(),
+        timeout=httpx.Timeout(timeout, connect=min(config.connect_timeout, timeout)),
+        **kwargs,
+    )
+    _config = config
+
+    logger.info(
+        "Shared HTTP client started",
+        extra={
+            "route": route,
+            "http2": http2,
+            "max_connections": config.max_connections,
+        },
+    )
+    return _clients[route]
+
+
+async def close_clients() -> None:
+    """Close every shared client (call from the app lifespan)."""
+    global _config
+
+    clients = list(_clients.items())
+    _clients.clear()
+    _config = None
+    for route, client in clients:
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.error(f"Failed to close {route} HTTP client: {e}", exc_info=True)
+    if clients:
+        logger.info(
+            "Shared HTTP clients closed",
+            extra={"routes": [route for route, _ in clients]},
+        )
+
+
+def get_client(route: str) -> Optional[httpx.AsyncClient]:
+    """Get a route's shared client, or None outside the app lifespan."""
+    return _clients.get(route)
+
+
+@asynccontextmanager
+async def pooled_client(
+    route: str, timeout: float = DEFAULT_TIMEOUT
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Get a client for one call on a route.
+
+    Yields the route's shared pooled client when the app is running,
+    otherwise a short-lived client that is closed on exit.
+
+    Args:
+        route: Route name
+        timeout: Timeout for the short-lived fallback client
+    """
+    client = _clients.get(route)
+    if client is not None:
+        yield client
+        return
+
+    async with httpx.AsyncClient(timeout=timeout) as client:
+        yield client
+
+
+def pool_stats() -> Dict[str, Any]:
+    """
+    Get pool configuration and usage per route (for /health).
+
+    Returns:
+        Dict with the pool settings and, per open route, its connection usage
+    """
+    if _config is None:
+        return {"status": "not_started"}
+
+    return {
+        "status": "ok",
+        "http2": _config.http2 and http2_available(),
+        "max_connections": _config.max_connections,
+        "max_keepalive_connections": _config.max_keepalive_connections,
+        "keepalive_expiry": _config.keepalive_expiry,
+        "routes": {
+            route: connection_stats(client) for route, client in _clients.items()
+        },
+    }
+
+
+def _connection_samples() -> Iterator[Tuple[Dict[str, str], Optional[int]]]:
+    for route, client in list(_clients.items()):
+        stats = connection_stats(client)
+        for state in ("active", "idle"):
+            yield {"route": route, "state": state}, stats.get(f"{state}_connections")
+
+
+def _request_samples() -> Iterator[Tuple[Dict[str, str], Optional[int]]]:
+    for route, client in list(_clients.items()):
+        yield {"route": route}, connection_stats(client).get("requests")
+
+
+webhook_metrics.registry.register_callback(
+    "http_pool_connections",
+    "Pooled upstream connections by route and state",
+    _connection_samples,
+)
+webhook_metrics.registry.register_callback(
+    "http_pool_requests",
+    "Upstream requests using or waiting for a pooled connection, by route",
+    _request_samples,
+)
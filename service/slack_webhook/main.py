@@ -4,10 +4,11 @@ Slack Webhook - FastAPI Proxy to Agent Engine
 Enforces R3: Cloud Run as gateway only (proxy to Agent Engine via REST).
 
 This service:
-1. Receives Slack events (mentions, DMs)
-2. Proxies to Agent Engine via REST API
-3. Does NOT import Runner (R3 compliance)
-4. Returns responses to Slack
+1. Receives Slack events (mentions, DMs) and acknowledges them at once
+2. Queues them for a pool of background workers (see event_queue.py)
+3. Workers proxy to Agent Engine via REST API
+4. Does NOT import Runner (R3 compliance)
+5. Returns responses to Slack
 
 Environment Variables:
 - SLACK_BOT_TOKEN: Slack bot OAuth token (xoxb-...)
@@ -19,18 +20,51 @@ Environment Variables:
 - PORT: Service port (default 8080)
 - SLACK_SWE_PIPELINE_MODE: Routing mode (local|engine) - Phase AE2
 - A2A_GATEWAY_URL: A2A gateway URL (for engine mode) - Phase AE2
+- SLACK_API_URL: Slack Web API base URL (default https://slack.com/api;
+  the load-test harness points it at a fake)
+- SLACK_WORKERS / SLACK_QUEUE_*: Worker pool and queue (see event_queue.py)
+- SLACK_DEDUP_*: Event dedup store (see event_dedup.py)
+- SLACK_QUEUE_BACKEND / SLACK_QUEUE_PATH: Keep acked events across
+  restarts (see event_store.py)
+- SLACK_OUTBOUND_*: Per-channel reply rate limits (see slack_outbound.py)
+- SLACK_REPLY_MODE / SLACK_STREAM_*: Post replies once complete, or edit
+  a placeholder as the answer streams in (see progressive_reply.py)
+- SLACK_HTTP*: Pooled agent and Slack API clients (see http_clients.py)
+
+Metrics:
+- GET /metrics serves Prometheus text metrics (see webhook_metrics.py)
 """
 
+import asyncio
 import os
+import sys
 import logging
 import hashlib
 import hmac
 import time
-from typing import Dict, Any
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict
 from fastapi import FastAPI, HTTPException, Request, Header
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 import httpx
 
+# Webhook modules are imported by file name (as deployed alongside main.py)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import webhook_metrics
+from event_dedup import EventDeduplicator
+from event_queue import SlackEventQueue, SlackJob
+from event_store import DurableEvents
+from http_clients import close_clients, open_client, pool_stats, pooled_client
+from progressive_reply import (
+    GatewayStreamError,
+    ProgressiveReply,
+    ReplyConfig,
+    stream_gateway_text,
+)
+from slack_outbound import SlackOutbound
+from common.metrics import CONTENT_TYPE, MetricsMiddleware
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -45,6 +79,7 @@ PROJECT_ID = os.getenv("PROJECT_ID")
 LOCATION = os.getenv("LOCATION")
 AGENT_ENGINE_ID = os.getenv("AGENT_ENGINE_ID")
 PORT = int(os.getenv("PORT", "8080"))
+SLACK_API_URL = os.getenv("SLACK_API_URL", "https://slack.com/api")
 
 # A2A Gateway URL (SLACK-ENDTOEND-DEV: S2)
 # Preferred routing: Slack → a2a_gateway → Agent Engine
@@ -58,6 +93,7 @@ if LOCATION and PROJECT_ID and AGENT_ENGINE_ID:
         f"https://{LOCATION}-aiplatform.googleapis.com/v1/projects/{PROJECT_ID}/locations/{LOCATION}/reasoningEngines/{AGENT_ENGINE_ID}:query",
     )
 
+
 # Validate required environment variables
 def validate_config() -> tuple[bool, list[str]]:
     """
@@ -99,25 +135,56 @@ def validate_config() -> tuple[bool, list[str]]:
     )
     return True, []
 
+
 config_valid, missing_vars = validate_config()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open the pooled HTTP clients and start the Slack event workers; drain
+    them, flush replies and close the clients on shutdown.
+    """
+    global slack_client
+
+    open_client("agent")
+    if SLACK_BOB_ENABLED and SLACK_BOT_TOKEN:
+        slack_client = open_client(
+            "slack",
+            timeout=30.0,
+            base_url=SLACK_API_URL,
+            headers={
+                "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
+                "Content-Type": "application/json",
+            },
+        )
+    event_queue.start()
+    # Events acked by a previous process but never answered
+    for job in await durable.redrive():
+        await dedup.claim(job.event_id, job.client_msg_id)  # Skip Slack's retries of it
+        event_queue.submit(job)
+    try:
+        yield
+    finally:
+        await event_queue.stop()
+        await outbound.stop()
+        await close_clients()
+        slack_client = None
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Bob's Brain Slack Webhook",
     description="Slack event handler proxying to Vertex AI Agent Engine",
     version="0.7.0",  # SLACK-ENDTOEND-DEV
+    lifespan=lifespan,
 )
 
-# Slack API client (only if bot is enabled and configured)
+# Per-route request metrics (GET /metrics)
+app.add_middleware(MetricsMiddleware, metrics=webhook_metrics.http)
+
+# Slack API client (opened by the lifespan if the bot is enabled and configured)
 slack_client = None
-if SLACK_BOB_ENABLED and SLACK_BOT_TOKEN:
-    slack_client = httpx.AsyncClient(
-        base_url="https://slack.com/api",
-        headers={
-            "Authorization": f"Bearer {SLACK_BOT_TOKEN}",
-            "Content-Type": "application/json",
-        },
-    )
 
 
 def verify_slack_signature(body: bytes, timestamp: str, signature: str) -> bool:
@@ -158,7 +225,8 @@ async def slack_events(
     """
     Handle Slack events.
 
-    Receives events from Slack (mentions, DMs) and proxies to Agent Engine.
+    Receives events from Slack (mentions, DMs) and queues them for the
+    worker pool, returning well within Slack's 3-second ack deadline.
 
     R3 Compliance: Does NOT run agent locally - proxies via REST.
 
@@ -188,6 +256,7 @@ async def slack_events(
         # Slack URL verification challenge
         if data.get("type") == "url_verification":
             logger.info("Slack URL verification challenge received")
+            webhook_metrics.events.labels("url_verification", "handled").inc()
             return {"challenge": data.get("challenge")}
 
         # Handle event callback
@@ -198,11 +267,9 @@ async def slack_events(
             # Ignore bot messages (prevent loops)
             if event.get("bot_id"):
                 logger.info("Ignoring bot message")
-                return {"ok": True}
-
-            # Ignore retry attempts (Slack retries if no 200 within 3s)
-            if request.headers.get("x-slack-retry-num"):
-                logger.info("Ignoring Slack retry")
+                webhook_metrics.events.labels(
+                    event_type or "unknown", "ignored_bot"
+                ).inc()
                 return {"ok": True}
 
             # Extract message text
@@ -225,29 +292,73 @@ async def slack_events(
 
             if not text:
                 logger.info("Empty message after mention removal")
+                webhook_metrics.events.labels(event_type or "unknown", "empty").inc()
                 return {"ok": True}
 
-            # Query Agent Engine via REST (R3: no local Runner)
-            agent_response = await query_agent_engine(
-                query=text, session_id=f"{user_id}_{channel_id}"
-            )
+            # One processing attempt per event: Slack retries and the same
+            # message delivered under another subscription are skipped
+            event_id = data.get("event_id")
+            client_msg_id = event.get("client_msg_id")
+            if not await dedup.claim(event_id, client_msg_id):
+                logger.info(
+                    "Skipping duplicate Slack event",
+                    extra={
+                        "event_id": event_id,
+                        "retry_num": request.headers.get("x-slack-retry-num"),
+                    },
+                )
+                webhook_metrics.events.labels(
+                    event_type or "unknown", "duplicate"
+                ).inc()
+                return {"ok": True}
 
-            # Post response to Slack
-            await post_slack_message(
-                channel=channel_id, text=agent_response, thread_ts=thread_ts
+            # Ack now (once stored, with a durable backend); a worker makes
+            # the agent call and posts the reply
+            job = SlackJob(
+                user=user_id or "unknown",
+                channel=channel_id,
+                text=text,
+                thread_ts=thread_ts,
+                event_type=event_type or "unknown",
+                event_id=event_id,
+                client_msg_id=client_msg_id,
             )
-
+            await durable.persist(job)
+            outcome = "queued" if event_queue.submit(job) else "rejected"
+            webhook_metrics.events.labels(job.event_type, outcome).inc()
             return {"ok": True}
 
         logger.warning(f"Unhandled Slack event type: {data.get('type')}")
+        webhook_metrics.events.labels("unhandled", "ignored").inc()
         return {"ok": True}
 
     except Exception as e:
         logger.error(f"Slack event processing failed: {e}", exc_info=True)
+        webhook_metrics.events.labels("unknown", "error").inc()
         # Return 200 to Slack to prevent retries
         return {"ok": True}
 
 
+def build_a2a_payload(query: str, session_id: str) -> Dict[str, Any]:
+    """
+    Build an A2AAgentCall body for Bob.
+
+    Args:
+        query: User query text
+        session_id: Session identifier for memory
+
+    Returns:
+        dict: Request body for /a2a/run and /a2a/stream
+    """
+    return {
+        "agent_role": "bob",  # Target Bob orchestrator
+        "prompt": query,
+        "session_id": session_id,
+        "caller_spiffe_id": "spiffe://intent.solutions/slack/webhook",
+        "env": os.getenv("DEPLOYMENT_ENV", "dev"),
+    }
+
+
 async def query_agent_engine(query: str, session_id: str) -> str:
     """
     Query Agent Engine via REST API.
@@ -281,22 +392,22 @@ async def query_agent_engine(query: str, session_id: str) -> str:
             )
 
             # Build A2A call payload following A2AAgentCall schema
-            a2a_payload = {
-                "agent_role": "bob",  # Target Bob orchestrator
-                "prompt": query,
-                "session_id": session_id,
-                "caller_spiffe_id": "spiffe://intent.solutions/slack/webhook",
-                "env": os.getenv("DEPLOYMENT_ENV", "dev"),
-            }
-
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{A2A_GATEWAY_URL}/a2a/run",
-                    json=a2a_payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                response.raise_for_status()
-                result = response.json()
+            a2a_payload = build_a2a_payload(query, session_id)
+
+            with webhook_metrics.timed_call(
+                webhook_metrics.agent_latency,
+                webhook_metrics.agent_errors,
+                "a2a_gateway",
+            ):
+                async with pooled_client("agent", timeout=60.0) as client:
+                    response = await client.post(
+                        f"{A2A_GATEWAY_URL}/a2a/run",
+                        json=a2a_payload,
+                        headers={"Content-Type": "application/json"},
+                        timeout=60.0,
+                    )
+                    response.raise_for_status()
+                    result = response.json()
 
             # Extract response from A2AAgentResult
             response_text = result.get("response", "No response from A2A gateway")
@@ -336,15 +447,21 @@ async def query_agent_engine(query: str, session_id: str) -> str:
 
             payload = {"query": query, "session_id": session_id}
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    AGENT_ENGINE_URL,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
+            with webhook_metrics.timed_call(
+                webhook_metrics.agent_latency,
+                webhook_metrics.agent_errors,
+                "agent_engine",
+            ):
+                async with pooled_client("agent", timeout=30.0) as client:
+                    response = await client.post(
+                        AGENT_ENGINE_URL,
+                        json=payload,
+                        headers={"Content-Type": "application/json"},
+                        timeout=30.0,
+                    )
 
-                response.raise_for_status()
-                result = response.json()
+                    response.raise_for_status()
+                    result = response.json()
 
             # Extract response text (adjust based on Agent Engine response format)
             response_text = result.get("response", "I couldn't generate a response.")
@@ -373,31 +490,238 @@ async def query_agent_engine(query: str, session_id: str) -> str:
         return "Sorry, something went wrong."
 
 
-async def post_slack_message(channel: str, text: str, thread_ts: str = None) -> None:
+async def post_slack_message(
+    channel: str,
+    text: str,
+    thread_ts: str = None,
+    on_sent: Callable[[], Any] = None,
+    on_dropped: Callable[[], Any] = None,
+    on_failed: Callable[[], Any] = None,
+) -> None:
     """
-    Post message to Slack channel.
+    Queue a message for a Slack channel (returns without waiting).
+
+    Delivery is paced per channel and retried on rate limits by the
+    outbound dispatcher (see slack_outbound.py).
 
     Args:
         channel: Slack channel ID
         text: Message text
         thread_ts: Thread timestamp (for replies)
+        on_sent: Called once the message is in Slack
+        on_dropped: Called if the channel's outbound queue overflows and
+            the message is dropped
+        on_failed: Called if Slack rejects the message or sending fails for good
     """
-    try:
-        payload = {"channel": channel, "text": text}
+    outbound.post(
+        channel,
+        text,
+        thread_ts,
+        on_sent=on_sent,
+        on_dropped=on_dropped,
+        on_failed=on_failed,
+    )
+
+
+async def call_slack_api(method: str, payload: Dict[str, Any]) -> httpx.Response:
+    """
+    Call a Slack Web API method.
+
+    Args:
+        method: API method (chat.postMessage, chat.update)
+        payload: Request body
+
+    Returns:
+        httpx.Response: Slack's response; 429 is returned, not raised, so
+        callers can honor Retry-After
+
+    Raises:
+        httpx.HTTPError: Transport errors and other non-2xx responses
+    """
+    with webhook_metrics.timed_call(
+        webhook_metrics.slack_api_latency, webhook_metrics.slack_api_errors, method
+    ):
+        response = await slack_client.post(f"/{method}", json=payload)
+        if response.status_code != 429:
+            response.raise_for_status()
+
+    logger.info(
+        f"Slack {method} called",
+        extra={
+            "channel": payload.get("channel"),
+            "thread_ts": payload.get("thread_ts"),
+        },
+    )
+    return response
 
-        if thread_ts:
-            payload["thread_ts"] = thread_ts
 
-        response = await slack_client.post("/chat.postMessage", json=payload)
-        response.raise_for_status()
+async def send_chat_message(payload: Dict[str, Any]) -> httpx.Response:
+    """Call chat.postMessage (used by the outbound dispatcher)."""
+    return await call_slack_api("chat.postMessage", payload)
 
-        logger.info(
-            "Message posted to Slack",
-            extra={"channel": channel, "thread_ts": thread_ts},
+
+async def send_chat_update(payload: Dict[str, Any]) -> httpx.Response:
+    """Call chat.update (used by progressive replies)."""
+    return await call_slack_api("chat.update", payload)
+
+
+async def stream_agent_reply(job: SlackJob) -> None:
+    """
+    Progressive reply: post a placeholder, then edit it as the gateway
+    streams the answer.
+
+    Args:
+        job: Queued Slack message
+    """
+    reply = ProgressiveReply(
+        outbound,
+        send_chat_update,
+        update_budget,
+        reply_config,
+        channel=job.channel,
+        thread_ts=job.thread_ts,
+        received_at=job.enqueued_at,
+    )
+    await reply.start()
+
+    session_id = f"{job.user}_{job.channel}"
+    error = None
+    try:
+        with webhook_metrics.timed_call(
+            webhook_metrics.agent_latency,
+            webhook_metrics.agent_errors,
+            "a2a_gateway_stream",
+        ):
+            async with pooled_client("agent", timeout=60.0) as client:
+                chunks = stream_gateway_text(
+                    client,
+                    f"{A2A_GATEWAY_URL}/a2a/stream",
+                    build_a2a_payload(job.text, session_id),
+                )
+                async for text in chunks:
+                    await reply.append(text)
+
+    except GatewayStreamError as e:
+        logger.error(
+            "A2A gateway stream returned error",
+            extra={"error": str(e), "session_id": session_id},
+        )
+        error = "Sorry, I encountered an error processing your request."
+
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            f"HTTP error during agent stream: {e.response.status_code}", exc_info=True
         )
+        error = "Sorry, I encountered an error processing your request."
+
+    except httpx.RequestError as e:
+        logger.error(f"Failed to connect to backend: {e}", exc_info=True)
+        error = "Sorry, I'm having trouble connecting to my backend."
 
     except Exception as e:
-        logger.error(f"Failed to post Slack message: {e}", exc_info=True)
+        logger.error(f"Agent stream failed: {e}", exc_info=True)
+        error = "Sorry, something went wrong."
+
+    if error:
+        # Keep whatever was already shown; the apology goes after it
+        await reply.finish(f"{reply.text}\n\n{error}" if reply.text.strip() else error)
+    else:
+        await reply.finish(
+            reply.text if reply.text.strip() else "No response from A2A gateway"
+        )
+
+
+async def process_event(job: SlackJob) -> None:
+    """
+    Worker handler: query the agent and post its reply in the thread.
+
+    In progressive reply mode (with the A2A gateway) the reply is streamed
+    into a placeholder message instead.
+
+    Args:
+        job: Queued Slack message
+    """
+    if reply_config.mode == "progressive" and A2A_GATEWAY_URL:
+        await stream_agent_reply(job)
+        await durable.complete(job)
+        webhook_metrics.events.labels(job.event_type, "handled").inc()
+        return
+
+    # Query Agent Engine via REST (R3: no local Runner)
+    agent_response = await query_agent_engine(
+        query=job.text, session_id=f"{job.user}_{job.channel}"
+    )
+
+    # Post response to Slack; the stored event is deleted once it is sent,
+    # or once outbound gives up on it: re-driving would repeat the agent call
+    # and may post the reply twice (a failed send can still have reached Slack)
+    await post_slack_message(
+        channel=job.channel,
+        text=agent_response,
+        thread_ts=job.thread_ts,
+        on_sent=lambda: _run_in_background(durable.complete(job)),
+        on_dropped=lambda: _complete_unsent(job, "dropped"),
+        on_failed=lambda: _complete_unsent(job, "failed"),
+    )
+    # Measured when queued for Slack; pacing shows in slack_outbound_delay_seconds
+    webhook_metrics.first_text.labels("post").observe(
+        max(0.0, time.time() - job.enqueued_at)
+    )
+
+    webhook_metrics.events.labels(job.event_type, "handled").inc()
+
+
+BUSY_REPLY = "I'm handling a lot of requests right now. Please try again in a minute."
+
+
+async def _unclaim_and_reply(job: SlackJob, reason: str) -> None:
+    if reason == "shutting_down" and durable.enabled:
+        return  # Stays stored and claimed; re-driven on the next start
+    # Never processed: let a redelivery of this event through
+    await durable.complete(job)
+    await dedup.release(job.event_id, job.client_msg_id)
+    if reason != "shutting_down":  # Slack retries the event against another instance
+        await post_slack_message(job.channel, BUSY_REPLY, job.thread_ts)
+
+
+def _complete_unsent(job: SlackJob, outcome: str) -> None:
+    logger.warning(
+        f"Slack reply {outcome} by outbound queue, event completed",
+        extra={"event_id": job.event_id, "channel": job.channel, "job_id": job.job_id},
+    )
+    _run_in_background(durable.complete(job))
+
+
+def _run_in_background(coro: Awaitable[Any]) -> None:
+    task = asyncio.ensure_future(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def on_job_dropped(job: SlackJob, reason: str) -> None:
+    """Release the job's dedup claim and tell the user (without blocking the ack)."""
+    _run_in_background(_unclaim_and_reply(job, reason))
+
+
+_background_tasks: set = set()
+
+dedup = EventDeduplicator.from_env()
+durable = DurableEvents.from_env()
+event_queue = SlackEventQueue(handler=process_event, on_drop=on_job_dropped)
+outbound = SlackOutbound(send=send_chat_message)
+reply_config = ReplyConfig.from_env()
+update_budget = reply_config.update_budget()
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    """
+    Prometheus metrics endpoint.
+
+    Returns:
+        Response: Metrics in the Prometheus text exposition format
+    """
+    return Response(webhook_metrics.registry.render(), media_type=CONTENT_TYPE)
 
 
 @app.get("/health")
@@ -408,6 +732,11 @@ async def health() -> Dict[str, Any]:
     Returns:
         dict: Service health status and configuration
     """
+    # Store stats may hit SQLite: keep them off the event loop
+    dedup_stats, durable_stats = await asyncio.gather(
+        asyncio.to_thread(dedup.stats), asyncio.to_thread(durable.stats)
+    )
+
     # Determine routing method
     routing = "disabled"
     if SLACK_BOB_ENABLED:
@@ -427,7 +756,15 @@ async def health() -> Dict[str, Any]:
         "missing_vars": missing_vars if not config_valid else [],
         "routing": routing,
         "a2a_gateway_url": A2A_GATEWAY_URL if A2A_GATEWAY_URL else None,
-        "agent_engine_url": AGENT_ENGINE_URL if AGENT_ENGINE_URL and not A2A_GATEWAY_URL else None,
+        "agent_engine_url": (
+            AGENT_ENGINE_URL if AGENT_ENGINE_URL and not A2A_GATEWAY_URL else None
+        ),
+        "event_queue": event_queue.stats(),
+        "dedup": dedup_stats,
+        "durable": durable_stats,
+        "outbound": outbound.stats(),
+        "http_pool": pool_stats(),
+        "reply_mode": reply_config.mode if A2A_GATEWAY_URL else "post",
     }
 
 
@@ -443,7 +780,11 @@ async def root() -> Dict[str, str]:
         "name": "Bob's Brain Slack Webhook",
         "version": "0.6.0",
         "description": "Slack event handler proxying to Vertex AI Agent Engine",
-        "endpoints": {"events": "/slack/events", "health": "/health"},
+        "endpoints": {
+            "events": "/slack/events",
+            "health": "/health",
+            "metrics": "/metrics",
+        },
     }
 
 
@@ -0,0 +1,309 @@
+"""
+Progressive Slack Replies
+
+Agent answers take 10-30 seconds. In "progressive" reply mode a worker
+posts a placeholder in the thread as soon as it takes the event, streams
+the answer from the A2A gateway (/a2a/stream, server-sent events) and
+edits the placeholder with the text received so far (chat.update), ending
+with a final update carrying the complete answer.
+
+- Throttled: the first text replaces the placeholder at once; later
+  updates of a message come at most every SLACK_STREAM_UPDATE_INTERVAL
+  seconds, and all replies share a budget of
+  SLACK_STREAM_UPDATES_PER_MINUTE chat.update calls (Slack's limit is per
+  workspace). Intermediate updates that find the budget spent are skipped;
+  the next one carries all text so far
+- Final update: waits for the budget and honors Retry-After. If it cannot
+  be made (or the placeholder was never posted), the answer is posted as a
+  new message instead
+- Long answers: the placeholder shows the first SLACK_STREAM_MAX_CHARS
+  characters; the rest follows as messages in the thread
+- Time to first visible text (event receipt to the first agent text in
+  Slack) is exported for both reply modes, so they can be compared
+
+Environment Variables:
+- SLACK_REPLY_MODE: "post" (one message once the answer is complete) or
+  "progressive" (default: post). Progressive needs A2A_GATEWAY_URL;
+  without it replies are posted
+- SLACK_STREAM_PLACEHOLDER: Placeholder text (default: "_Thinking..._")
+- SLACK_STREAM_UPDATE_INTERVAL: Min seconds between updates of a message
+  (default: 1.5)
+- SLACK_STREAM_UPDATES_PER_MINUTE: chat.update budget shared by all
+  replies (default: 50)
+- SLACK_STREAM_MAX_CHARS: Max characters per message (default: 3900)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+import webhook_metrics
+from slack_outbound import SlackOutbound, TokenBucket, retry_after
+
+logger = logging.getLogger(__name__)
+
+REPLY_MODES = ("post", "progressive")
+FINAL_UPDATE_ATTEMPTS = 3
+
+
+@dataclass(frozen=True)
+class ReplyConfig:
+    """Reply mode and progressive update settings."""
+
+    mode: str = "post"
+    placeholder: str = "_Thinking..._"
+    update_interval: float = 1.5
+    updates_per_minute: float = 50.0
+    max_chars: int = 3900
+
+    @classmethod
+    def from_env(cls) -> "ReplyConfig":
+        """Load settings from SLACK_REPLY_MODE / SLACK_STREAM_* environment variables."""
+        mode = os.getenv("SLACK_REPLY_MODE", "post").strip().lower()
+        if mode not in REPLY_MODES:
+            logger.warning(f"Unknown SLACK_REPLY_MODE {mode!r}, using 'post'")
+            mode = "post"
+        return cls(
+            mode=mode,
+            placeholder=os.getenv("SLACK_STREAM_PLACEHOLDER", "_Thinking..._"),
+            update_interval=float(os.getenv("SLACK_STREAM_UPDATE_INTERVAL", "1.5")),
+            updates_per_minute=max(
+                1.0, float(os.getenv("SLACK_STREAM_UPDATES_PER_MINUTE", "50"))
+            ),
+            max_chars=max(100, int(os.getenv("SLACK_STREAM_MAX_CHARS", "3900"))),
+        )
+
+    def update_budget(self, clock: Callable[[], float] = time.monotonic) -> TokenBucket:
+        """Token bucket for chat.update calls, shared by all replies."""
+        return TokenBucket(
+            self.updates_per_minute / 60.0,
+            max(1, int(self.updates_per_minute // 10)),
+            clock,
+        )
+
+
+class GatewayStreamError(Exception):
+    """The gateway reported an error event in the stream."""
+
+    pass
+
+
+async def parse_sse(
+    lines: AsyncIterator[str],
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Parse server-sent events into (event, data) pairs.
+
+    Args:
+        lines: Response lines without line endings
+
+    Yields:
+        (event name, JSON-decoded data); events without data are skipped
+    """
+    event, data = "message", []
+    async for line in lines:
+        if not line:
+            if data:
+                yield event, json.loads("\n".join(data))
+            event, data = "message", []
+        elif line.startswith("event:"):
+            event = line[len("event:") :].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:") :].strip())
+    if data:
+        yield event, json.loads("\n".join(data))
+
+
+async def stream_gateway_text(
+    client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+) -> AsyncIterator[str]:
+    """
+    Stream an agent answer from the gateway's /a2a/stream endpoint.
+
+    Args:
+        client: HTTP client
+        url: Full /a2a/stream URL
+        payload: A2AAgentCall body
+
+    Yields:
+        Text chunks in order
+
+    Raises:
+        GatewayStreamError: The stream carried an error event
+        httpx.HTTPError: The request failed
+    """
+    async with client.stream("POST", url, json=payload) as response:
+        response.raise_for_status()
+        async for event, data in parse_sse(response.aiter_lines()):
+            if event == "chunk":
+                yield data.get("text", "")
+            elif event == "error":
+                raise GatewayStreamError(data.get("error") or "Gateway stream failed")
+
+
+def split_text(text: str, max_chars: int) -> List[str]:
+    """Split text into messages of at most max_chars."""
+    return [text[i : i + max_chars] for i in range(0, len(text), max_chars)] or [""]
+
+
+Update = Callable[[Dict[str, Any]], Awaitable[httpx.Response]]
+
+
+class ProgressiveReply:
+    """
+    One Slack reply that is edited as the agent's answer streams in.
+
+    Args:
+        outbound: Dispatcher for the placeholder and any posted messages
+        update: Calls chat.update with a payload and returns the response
+        budget: chat.update token bucket shared by all replies
+        config: Reply settings
+        channel: Slack channel ID
+        thread_ts: Thread to reply in
+        received_at: Wall-clock time the Slack event was received
+        clock: Monotonic time source (tests)
+    """
+
+    def __init__(
+        self,
+        outbound: SlackOutbound,
+        update: Update,
+        budget: TokenBucket,
+        config: ReplyConfig,
+        channel: str,
+        thread_ts: Optional[str],
+        received_at: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._outbound = outbound
+        self._update = update
+        self._budget = budget
+        self.config = config
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.received_at = received_at
+        self._clock = clock
+        self.ts: Optional[str] = None
+        self.text = ""
+        self.shown = ""
+        self.updates = 0
+        self._last_update = 0.0
+        self._first_text_recorded = False
+
+    async def start(self) -> bool:
+        """
+        Post the placeholder.
+
+        Returns:
+            True if it was posted; otherwise the answer is posted when complete
+        """
+        answer = await self._outbound.post_and_wait(
+            self.channel, self.config.placeholder, self.thread_ts
+        )
+        if answer and answer.get("ok") and answer.get("ts"):
+            self.ts = answer["ts"]
+            return True
+        logger.warning(
+            "Slack placeholder not posted; replying once the answer is complete"
+        )
+        return False
+
+    async def append(self, text: str) -> None:
+        """Add streamed text; update the message if the throttle allows."""
+        self.text += text
+        if self.ts is None:
+            return
+        # The first text replaces the placeholder at once; later updates are spaced out
+        if (
+            self.shown
+            and self._clock() - self._last_update < self.config.update_interval
+        ):
+            return
+        visible = self._visible(self.text)
+        if not visible.strip() or visible == self.shown:
+            return
+        if self._budget.take() > 0:
+            webhook_metrics.reply_updates.labels("skipped").inc()
+            return
+        await self._send_update(visible)
+
+    async def finish(self, text: Optional[str] = None) -> None:
+        """
+        Show the complete answer.
+
+        Args:
+            text: Final text instead of the streamed text (e.g. an error message)
+        """
+        final = self.text if text is None else text
+        parts = split_text(final, self.config.max_chars)
+        if self.ts is not None and await self._final_update(parts[0]):
+            parts = parts[1:]
+        for part in parts:
+            self._outbound.post(
+                self.channel, part, self.thread_ts, on_sent=self._record_first_text
+            )
+
+    def _visible(self, text: str) -> str:
+        if len(text) <= self.config.max_chars:
+            return text
+        return text[: self.config.max_chars - 1] + "…"
+
+    async def _final_update(self, text: str) -> bool:
+        if text == self.shown:
+            return True
+        for _ in range(FINAL_UPDATE_ATTEMPTS):
+            wait = self._budget.take()
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self._budget.take()
+            outcome = await self._send_update(text)
+            if outcome != "ratelimited":
+                return outcome == "sent"
+        return False
+
+    async def _send_update(self, text: str) -> str:
+        """chat.update the message; returns the outcome (sent, ratelimited, failed)."""
+        self._last_update = self._clock()
+        try:
+            response = await self._update(
+                {"channel": self.channel, "ts": self.ts, "text": text}
+            )
+        except Exception as e:
+            logger.error(f"Slack chat.update failed: {e}", exc_info=True)
+            webhook_metrics.reply_updates.labels("failed").inc()
+            return "failed"
+
+        delay = retry_after(response)
+        if delay is not None:
+            self._budget.pause(delay)
+            webhook_metrics.reply_updates.labels("ratelimited").inc()
+            return "ratelimited"
+        try:
+            answer = response.json()
+        except ValueError:
+            answer = {"ok": False, "error": "invalid_response"}
+        if not answer.get("ok"):
+            logger.warning(
+                "Slack chat.update rejected", extra={"error": answer.get("error")}
+            )
+            webhook_metrics.reply_updates.labels("failed").inc()
+            return "failed"
+
+        self.shown = text
+        self.updates += 1
+        webhook_metrics.reply_updates.labels("sent").inc()
+        self._record_first_text()
+        return "sent"
+
+    def _record_first_text(self) -> None:
+        if not self._first_text_recorded:
+            self._first_text_recorded = True
+            webhook_metrics.first_text.labels("progressive").observe(
+                max(0.0, time.time() - self.received_at)
+            )
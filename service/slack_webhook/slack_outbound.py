@@ -0,0 +1,482 @@
+"""
+Outbound Slack Dispatcher
+
+Slack allows roughly one chat.postMessage per second per channel and
+answers bursts with `ratelimited` (HTTP 429 + Retry-After). Replies are
+therefore not posted inline: post() queues the message and returns at
+once, and one drain task per channel sends it when the channel's token
+bucket allows.
+
+- Per-channel token buckets: SLACK_OUTBOUND_RATE messages/s with bursts
+  of SLACK_OUTBOUND_BURST
+- Retry-After: a rate-limited message goes back to the front of its
+  channel's queue and the channel pauses for as long as Slack asked
+- Coalescing: while messages pile up, a new threaded message for a
+  thread that already has one waiting is appended to it (up to
+  SLACK_OUTBOUND_MERGE_MAX_CHARS), so a backlog costs one post per thread;
+  top-level messages are never merged
+- Bounded: a channel holds at most SLACK_OUTBOUND_MAX_PENDING messages;
+  beyond that its oldest message is dropped (and its on_dropped
+  callbacks run, so callers can settle whatever the message stood for)
+- Failures: a message Slack rejects, that fails to send or that stays
+  rate limited after SLACK_OUTBOUND_MAX_ATTEMPTS is given up on and its
+  on_failed callbacks run
+
+post_and_wait() is the same path for callers that need Slack's answer
+(e.g. the ts of a placeholder they will chat.update later); such messages
+are never merged.
+
+Messages are held in memory only; whatever is still pending when the
+process stops after the drain timeout is lost.
+
+Environment Variables:
+- SLACK_OUTBOUND_RATE: Messages per second per channel (default: 1)
+- SLACK_OUTBOUND_BURST: Bucket size (default: 3)
+- SLACK_OUTBOUND_MAX_PENDING: Max pending messages per channel (default: 50)
+- SLACK_OUTBOUND_MERGE_MAX_CHARS: Max length of a merged message (default: 3900)
+- SLACK_OUTBOUND_MAX_ATTEMPTS: Attempts per message when rate limited (default: 3)
+- SLACK_OUTBOUND_DRAIN_TIMEOUT: Seconds to flush pending messages on shutdown
+  (default: 2)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+import httpx
+
+import webhook_metrics
+
+logger = logging.getLogger(__name__)
+
+MERGE_SEPARATOR = "\n\n"
+DEFAULT_RETRY_AFTER = 1.0
+MAX_IDLE_CHANNELS = 1000
+
+
+@dataclass(frozen=True)
+class OutboundConfig:
+    """Per-channel rate limit and queue settings."""
+
+    rate: float = 1.0
+    burst: int = 3
+    max_pending: int = 50
+    merge_max_chars: int = 3900
+    max_attempts: int = 3
+    drain_timeout: float = 2.0
+
+    @classmethod
+    def from_env(cls) -> "OutboundConfig":
+        """Load settings from SLACK_OUTBOUND_* environment variables."""
+        return cls(
+            rate=max(0.01, float(os.getenv("SLACK_OUTBOUND_RATE", "1"))),
+            burst=max(1, int(os.getenv("SLACK_OUTBOUND_BURST", "3"))),
+            max_pending=max(1, int(os.getenv("SLACK_OUTBOUND_MAX_PENDING", "50"))),
+            merge_max_chars=int(os.getenv("SLACK_OUTBOUND_MERGE_MAX_CHARS", "3900")),
+            max_attempts=max(1, int(os.getenv("SLACK_OUTBOUND_MAX_ATTEMPTS", "3"))),
+            drain_timeout=float(os.getenv("SLACK_OUTBOUND_DRAIN_TIMEOUT", "2")),
+        )
+
+
+class TokenBucket:
+    """
+    Token bucket that can also be paused (for Retry-After).
+
+    Args:
+        rate: Tokens added per second
+        burst: Bucket size
+        clock: Monotonic time source
+    """
+
+    def __init__(
+        self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self.tokens = float(burst)
+        self.updated = clock()
+        self.paused_until = 0.0
+
+    def take(self) -> float:
+        """
+        Take a token if one is available.
+
+        Returns:
+            0 if a token was taken, else seconds until one will be
+        """
+        now = self._clock()
+        if now < self.paused_until:
+            return self.paused_until - now
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds`, then exactly one."""
+        self.paused_until = max(self.paused_until, self._clock() + seconds)
+        self.tokens = 1.0
+        self.updated = self.paused_until
+
+    def is_full(self) -> bool:
+        """Whether the bucket has refilled (the channel is idle)."""
+        now = self._clock()
+        return (
+            now >= self.paused_until
+            and self.tokens + (now - self.updated) * self.rate >= self.burst
+        )
+
+
+@dataclass
+class OutboundMessage:
+    """A message (or several merged ones) waiting for its channel."""
+
+    channel: str
+    text: str
+    thread_ts: Optional[str] = None
+    parts: int = 1
+    attempts: int = 0
+    queued_at: float = field(default_factory=time.monotonic)
+    # Set for post_and_wait(): resolved with Slack's answer, or None
+    result: Optional["asyncio.Future[Optional[Dict[str, Any]]]"] = None
+    # Called once the message (or the one it was merged into) is sent
+    on_sent: List[Callable[[], Any]] = field(default_factory=list)
+    # Called if the message (or the one it was merged into) is dropped
+    on_dropped: List[Callable[[], Any]] = field(default_factory=list)
+    # Called if the message (or the one it was merged into) is given up on
+    on_failed: List[Callable[[], Any]] = field(default_factory=list)
+
+    def resolve(self, answer: Optional[Dict[str, Any]]) -> None:
+        """Hand Slack's answer (None on failure) to a post_and_wait() caller."""
+        if self.result is not None and not self.result.done():
+            self.result.set_result(answer)
+
+    def payload(self) -> Dict[str, Any]:
+        """chat.postMessage request body."""
+        payload = {"channel": self.channel, "text": self.text}
+        if self.thread_ts:
+            payload["thread_ts"] = self.thread_ts
+        return payload
+
+
+class _Channel:
+    def __init__(self, bucket: TokenBucket):
+        self.bucket = bucket
+        self.pending: Deque[OutboundMessage] = deque()
+        self.task: Optional[asyncio.Task] = None
+
+
+def retry_after(response: httpx.Response) -> Optional[float]:
+    """
+    Seconds Slack asked us to wait, or None if the response is not a rate limit.
+
+    Slack signals rate limits with HTTP 429 + Retry-After; some methods
+    answer 200 with {"ok": false, "error": "ratelimited"} instead.
+    """
+    limited = response.status_code == 429
+    if not limited and response.status_code == 200:
+        try:
+            limited = response.json().get("error") == "ratelimited"
+        except ValueError:
+            limited = False
+    if not limited:
+        return None
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER)))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER
+
+
+def _answer(response: httpx.Response) -> Optional[Dict[str, Any]]:
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
+
+def _run_callbacks(callbacks: List[Callable[[], Any]], name: str) -> None:
+    for callback in callbacks:
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"Outbound {name} callback failed: {e}", exc_info=True)
+
+
+Send = Callable[[Dict[str, Any]], Awaitable[httpx.Response]]
+
+
+class SlackOutbound:
+    """
+    Rate-limited, coalescing chat.postMessage dispatcher.
+
+    Drain tasks run on the loop post() is called from.
+
+    Args:
+        send: Posts one chat.postMessage payload and returns the response
+        config: Settings (default: OutboundConfig.from_env())
+        clock: Monotonic time source (tests)
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        config: Optional[OutboundConfig] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.config = config or OutboundConfig.from_env()
+        self._send = send
+        self._clock = clock
+        # channel -> state; key order is least recently used first
+        self._channels: "OrderedDict[str, _Channel]" = OrderedDict()
+        self.pending = 0
+
+        self.queued = 0
+        self.merged = 0
+        self.sent = 0
+        self.ratelimited = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def post(
+        self,
+        channel: str,
+        text: str,
+        thread_ts: Optional[str] = None,
+        on_sent: Optional[Callable[[], Any]] = None,
+        on_dropped: Optional[Callable[[], Any]] = None,
+        on_failed: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        """
+        Queue a message for the channel without waiting.
+
+        Args:
+            channel: Slack channel ID
+            text: Message text
+            thread_ts: Thread to reply in (only threaded messages are merged)
+            on_sent: Called (without arguments) once the message is in Slack
+            on_dropped: Called (without arguments) if the message is dropped
+                because its channel is full
+            on_failed: Called (without arguments) if sending fails for good
+                (rejected by Slack, send error, or still rate limited after
+                max_attempts); the post may have reached Slack on a send error
+        """
+        message = OutboundMessage(
+            channel,
+            text,
+            thread_ts,
+            queued_at=self._clock(),
+            on_sent=[on_sent] if on_sent else [],
+            on_dropped=[on_dropped] if on_dropped else [],
+            on_failed=[on_failed] if on_failed else [],
+        )
+        state = self._channel(channel)
+        if self._merge(state, message):
+            return
+        self._enqueue(state, message)
+
+    async def post_and_wait(
+        self, channel: str, text: str, thread_ts: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Queue a message (never merged) and wait until it is sent.
+
+        Returns:
+            Slack's chat.postMessage answer (with "ts"), or None if the
+            message failed or was dropped
+        """
+        message = OutboundMessage(
+            channel,
+            text,
+            thread_ts,
+            queued_at=self._clock(),
+            result=asyncio.get_running_loop().create_future(),
+        )
+        self._enqueue(self._channel(channel), message)
+        return await message.result
+
+    def _enqueue(self, state: _Channel, message: OutboundMessage) -> None:
+        if len(state.pending) >= self.config.max_pending:
+            oldest = state.pending.popleft()
+            oldest.resolve(None)
+            self._count("dropped", oldest.parts)
+            self._set_pending(self.pending - 1)
+            logger.warning(
+                "Outbound Slack message dropped",
+                extra={
+                    "channel": message.channel,
+                    "thread_ts": oldest.thread_ts,
+                    "parts": oldest.parts,
+                    "queued_for": round(self._clock() - oldest.queued_at, 3),
+                },
+            )
+            _run_callbacks(oldest.on_dropped, "on_dropped")
+        state.pending.append(message)
+        self._set_pending(self.pending + 1)
+        self._count("queued")
+
+        if state.task is None or state.task.done():
+            state.task = asyncio.get_running_loop().create_task(
+                self._drain(message.channel, state)
+            )
+
+    def _channel(self, channel: str) -> _Channel:
+        state = self._channels.get(channel)
+        if state is None:
+            state = self._channels[channel] = _Channel(
+                TokenBucket(self.config.rate, self.config.burst, self._clock)
+            )
+            self._prune()
+        else:
+            self._channels.move_to_end(channel)
+        return state
+
+    def _prune(self) -> None:
+        """Forget least recently used channels that are idle and refilled."""
+        excess = len(self._channels) - MAX_IDLE_CHANNELS
+        for name in list(self._channels):
+            if excess <= 0:
+                break
+            state = self._channels[name]
+            if (
+                not state.pending
+                and (state.task is None or state.task.done())
+                and state.bucket.is_full()
+            ):
+                del self._channels[name]
+                excess -= 1
+
+    def _merge(self, state: _Channel, new: OutboundMessage) -> bool:
+        """Append to the thread's newest waiting message, if there is room."""
+        if not new.thread_ts:
+            # Unrelated top-level messages must stay separate posts
+            return False
+        for message in reversed(state.pending):
+            if message.thread_ts == new.thread_ts and message.result is None:
+                if (
+                    len(message.text) + len(MERGE_SEPARATOR) + len(new.text)
+                    > self.config.merge_max_chars
+                ):
+                    return False
+                message.text = f"{message.text}{MERGE_SEPARATOR}{new.text}"
+                message.parts += 1
+                message.on_sent.extend(new.on_sent)
+                message.on_dropped.extend(new.on_dropped)
+                message.on_failed.extend(new.on_failed)
+                self._count("merged")
+                return True
+        return False
+
+    async def _drain(self, channel: str, state: _Channel) -> None:
+        while state.pending:
+            wait = state.bucket.take()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            message = state.pending.popleft()
+            self._set_pending(self.pending - 1)
+            message.attempts += 1
+            try:
+                response = await self._send(message.payload())
+            except Exception as e:
+                logger.error(f"Failed to post Slack message: {e}", exc_info=True)
+                self._fail(message)
+                continue
+
+            delay = retry_after(response)
+            if delay is None:
+                answer = _answer(response)
+                message.resolve(answer)
+                if not (answer or {}).get("ok"):
+                    logger.warning(
+                        "Slack rejected message",
+                        extra={
+                            "channel": channel,
+                            "error": (answer or {}).get("error"),
+                        },
+                    )
+                    self._fail(message)
+                    continue
+                _run_callbacks(message.on_sent, "on_sent")
+                self._count("sent", message.parts)
+                webhook_metrics.outbound_delay.observe(
+                    self._clock() - message.queued_at
+                )
+                continue
+
+            self._count("ratelimited")
+            state.bucket.pause(delay)
+            logger.warning(
+                "Slack rate limited channel",
+                extra={
+                    "channel": channel,
+                    "retry_after": delay,
+                    "attempt": message.attempts,
+                },
+            )
+            if message.attempts >= self.config.max_attempts:
+                self._fail(message)
+                continue
+            state.pending.appendleft(message)
+            self._set_pending(self.pending + 1)
+
+    def _fail(self, message: OutboundMessage) -> None:
+        message.resolve(None)
+        self._count("failed", message.parts)
+        _run_callbacks(message.on_failed, "on_failed")
+
+    def _count(self, outcome: str, amount: int = 1) -> None:
+        setattr(self, outcome, getattr(self, outcome) + amount)
+        webhook_metrics.outbound_messages.labels(outcome).inc(amount)
+
+    def _set_pending(self, pending: int) -> None:
+        self.pending = pending
+        webhook_metrics.outbound_pending.set(pending)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Let drain tasks flush pending messages, then cancel them.
+
+        Args:
+            timeout: Max seconds to flush (default: config.drain_timeout)
+        """
+        timeout = self.config.drain_timeout if timeout is None else timeout
+        tasks = [
+            state.task
+            for state in self._channels.values()
+            if state.task and not state.task.done()
+        ]
+        if tasks:
+            _, unfinished = await asyncio.wait(tasks, timeout=timeout)
+            if unfinished:
+                logger.warning(
+                    "Outbound Slack messages not flushed",
+                    extra={"pending": self.pending},
+                )
+            for task in unfinished:
+                task.cancel()
+            await asyncio.gather(*unfinished, return_exceptions=True)
+        for state in self._channels.values():
+            for message in state.pending:
+                message.resolve(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pending messages and outcome counters."""
+        return {
+            "pending": self.pending,
+            "channels": len(self._channels),
+            "rate": self.config.rate,
+            "burst": self.config.burst,
+            "queued": self.queued,
+            "merged": self.merged,
+            "sent": self.sent,
+            "ratelimited": self.ratelimited,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
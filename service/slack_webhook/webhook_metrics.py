@@ -0,0 +1,120 @@
+"""
+Prometheus Metrics for the Slack Webhook
+
+Metric definitions exported by GET /metrics. Built on the shared registry
+in service/common/metrics.py (same format as the A2A gateway).
+
+- slack_webhook_http_*: request count, latency and in-flight per route
+- slack_webhook_events_total: Slack events by type and outcome
+- slack_webhook_agent_*: agent call latency and error classes by backend
+  (a2a_gateway or agent_engine)
+- slack_webhook_slack_api_*: Slack Web API call latency and error classes
+- slack_webhook_event_queue_*: queue depth, busy workers, enqueue outcomes
+  and queue wait time
+- slack_webhook_slack_outbound_*: outbound message outcomes, pending
+  messages and delivery delay (see slack_outbound.py)
+- slack_webhook_reply_*: time to first visible reply text by reply mode,
+  and chat.update outcomes of progressive replies (see progressive_reply.py)
+- slack_webhook_http_pool_*: pooled connections and requests per upstream
+  route (registered by http_clients.py)
+"""
+
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# service/common is shared with a2a_gateway (copied next to main.py in the image)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.metrics import HTTPMetrics, MetricsRegistry, classify_error  # noqa: E402
+
+registry = MetricsRegistry(namespace="slack_webhook")
+http = HTTPMetrics(registry)
+
+events = registry.counter(
+    "events_total",
+    "Slack events by type and outcome (queued, rejected, handled, duplicate, ignored_bot, empty, error)",
+    ["event_type", "outcome"],
+)
+
+agent_latency = registry.histogram(
+    "agent_call_duration_seconds", "Agent call latency by backend", ["backend"]
+)
+agent_errors = registry.counter(
+    "agent_call_errors_total",
+    "Agent call failures by backend and error class",
+    ["backend", "error_class"],
+)
+
+slack_api_latency = registry.histogram(
+    "slack_api_duration_seconds", "Slack Web API call latency by method", ["method"]
+)
+slack_api_errors = registry.counter(
+    "slack_api_errors_total",
+    "Slack Web API failures by method and error class",
+    ["method", "error_class"],
+)
+
+queue_events = registry.counter(
+    "event_queue_total",
+    "Slack event queue outcomes (enqueued, rejected, dropped)",
+    ["outcome"],
+)
+queue_depth = registry.gauge("event_queue_depth", "Slack events waiting for a worker")
+queue_busy_workers = registry.gauge(
+    "event_queue_busy_workers", "Workers currently handling a Slack event"
+)
+queue_wait = registry.histogram(
+    "event_queue_wait_seconds",
+    "Time Slack events wait in the queue before a worker takes them",
+)
+
+outbound_messages = registry.counter(
+    "slack_outbound_total",
+    "Outbound Slack messages by outcome (queued, merged, sent, ratelimited, dropped, failed)",
+    ["outcome"],
+)
+outbound_pending = registry.gauge(
+    "slack_outbound_pending", "Slack messages waiting for their channel's rate limit"
+)
+outbound_delay = registry.histogram(
+    "slack_outbound_delay_seconds",
+    "Time from queueing to delivery of outbound Slack messages",
+)
+
+first_text = registry.histogram(
+    "reply_first_text_seconds",
+    "Time from Slack event receipt to the first agent text visible in Slack, by reply mode (post, progressive)",
+    ["mode"],
+)
+reply_updates = registry.counter(
+    "reply_updates_total",
+    "chat.update calls of progressive replies by outcome (sent, skipped, ratelimited, failed)",
+    ["outcome"],
+)
+
+
+@contextmanager
+def timed_call(latency, errors, label: str) -> Iterator[None]:
+    """
+    Time an outbound call and count its failure class.
+
+    Args:
+        latency: Histogram labelled by label
+        errors: Counter labelled by (label, error_class)
+        label: Backend or Slack API method
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as e:
+        status_code = getattr(getattr(e, "response", None), "status_code", None)
+        errors.labels(
+            label,
+            classify_error(e, status_code if isinstance(status_code, int) else None),
+        ).inc()
+        raise
+    finally:
+        latency.labels(label).observe(time.perf_counter() - started)
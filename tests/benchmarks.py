@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for Bob's Brain
+
+Run with `make benchmark` (or `python tests/benchmarks.py`). Benchmarks
+are offline and synthetic; they are not collected by pytest.
+
+Benchmarks:
+- path_matcher: Filter a synthetic 200k-path monorepo tree with the
+  registry analysis patterns, compiled PathMatcher vs per-pattern fnmatch
+- slack_event_store: Persist and delete Slack events in the webhook's
+  SQLite event store (concurrently, as /slack/events does) and check the
+  rate against a target peak event rate
+"""
+
+import argparse
+import asyncio
+import fnmatch
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+# Webhook modules are imported by file name
+sys.path.insert(0, str(Path(__file__).parent.parent / "service" / "slack_webhook"))
+
+from agents.tools.path_matcher import PathMatcher
+
+
+# Mirrors config/repos.yaml settings, padded to a dozen patterns
+FILE_PATTERNS = ["*.py", "*.yaml", "*.yml", "*.md", "*.json", "*.toml", "*.cfg", "Dockerfile"]
+EXCLUDE_PATTERNS = ["*.pyc", "__pycache__/*", ".git/*", "node_modules/*", "venv/*", ".venv/*"]
+
+EXTENSIONS = [".py", ".pyc", ".md", ".json", ".ts", ".js", ".yaml", ".png", ".go", ".txt"]
+TOP_DIRS = ["services", "libs", "node_modules", "venv", "docs", "tools", "infra", "web"]
+
+
+def synthetic_tree(count: int, seed: int = 42) -> list:
+    """Generate a deterministic monorepo-like list of file paths."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(count):
+        depth = rng.randint(1, 6)
+        parts = [rng.choice(TOP_DIRS)] + [f"pkg{rng.randint(0, 300)}" for _ in range(depth - 1)]
+        paths.append("/".join(parts) + f"/file{i}" + rng.choice(EXTENSIONS))
+    return paths
+
+
+def fnmatch_filter(paths: list) -> list:
+    """Baseline: the original per-pattern fnmatch loop."""
+    selected = []
+    for path in paths:
+        if not any(fnmatch.fnmatch(path, p) for p in FILE_PATTERNS):
+            continue
+        if any(fnmatch.fnmatch(path, p) for p in EXCLUDE_PATTERNS):
+            continue
+        selected.append(path)
+    return selected
+
+
+def matcher_filter(paths: list) -> list:
+    """Compiled PathMatcher, built once."""
+    matches = PathMatcher(FILE_PATTERNS, EXCLUDE_PATTERNS).matches
+    return [path for path in paths if matches(path)]
+
+
+def best_of(func, paths: list, repeat: int) -> tuple:
+    """Run func repeat times, returning (best seconds, result)."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(paths)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_path_matcher(count: int, repeat: int) -> None:
+    """Benchmark tree filtering on a synthetic tree of `count` paths."""
+    paths = synthetic_tree(count)
+
+    baseline_time, baseline = best_of(fnmatch_filter, paths, repeat)
+    compiled_time, compiled = best_of(matcher_filter, paths, repeat)
+
+    assert baseline == compiled, "PathMatcher results differ from fnmatch"
+
+    print(f"path_matcher: {count:,} paths, {len(FILE_PATTERNS) + len(EXCLUDE_PATTERNS)} patterns, "
+          f"{len(compiled):,} selected")
+    print(f"  fnmatch loop:  {baseline_time * 1000:8.1f} ms")
+    print(f"  PathMatcher:   {compiled_time * 1000:8.1f} ms  ({baseline_time / compiled_time:.1f}x faster)")
+
+
+async def store_events(durable, count: int, concurrency: int) -> tuple:
+    """Persist then delete `count` jobs, `concurrency` at a time; returns (persist s, delete s)."""
+    from event_queue import SlackJob
+
+    jobs = [
+        SlackJob(user=f"U{i % 50}", channel="C1", text="hello " * 20, thread_ts=f"{i}.0", event_id=f"Ev{i}")
+        for i in range(count)
+    ]
+    timings = []
+    for step in (durable.persist, durable.complete):
+        start = time.perf_counter()
+        for i in range(0, count, concurrency):
+            await asyncio.gather(*(step(job) for job in jobs[i:i + concurrency]))
+        timings.append(time.perf_counter() - start)
+    return tuple(timings)
+
+
+def bench_slack_event_store(count: int, concurrency: int, target_rate: float) -> None:
+    """Benchmark the durable Slack event store against a target events/second."""
+    from event_store import DurableEvents, SQLiteEventStore
+
+    with tempfile.TemporaryDirectory() as tmp:
+        durable = DurableEvents(SQLiteEventStore(str(Path(tmp) / "queue.sqlite3")))
+        persist_time, delete_time = asyncio.run(store_events(durable, count, concurrency))
+        assert durable.store.pending() == [], "Events left in the store"
+
+    rate = count / (persist_time + delete_time)
+    print(f"slack_event_store: {count:,} events, {concurrency} concurrent, SQLite WAL")
+    print(f"  persist:       {count / persist_time:8.0f} events/s  ({persist_time / count * 1000:.2f} ms each)")
+    print(f"  delete:        {count / delete_time:8.0f} events/s")
+    print(f"  persist+delete:{rate:8.0f} events/s  (target {target_rate:.0f}/s, {rate / target_rate:.1f}x headroom)")
+    assert rate >= target_rate, f"Event store below target rate: {rate:.0f}/s < {target_rate:.0f}/s"
+
+
+BENCHMARKS = {
+    "path_matcher": lambda args: bench_path_matcher(args.paths, args.repeat),
+    "slack_event_store": lambda args: bench_slack_event_store(args.events, args.concurrency, args.target_rate),
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run Bob's Brain benchmarks")
+    parser.add_argument("names", nargs="*", help=f"Benchmarks to run (default: all of {', '.join(BENCHMARKS)})")
+    parser.add_argument("--paths", type=int, default=200_000, help="Synthetic tree size (default: 200000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is reported)")
+    parser.add_argument("--events", type=int, default=2_000, help="Slack events to store (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent Slack requests (default: 16)")
+    # Slack delivers at most 30,000 events/hour per workspace (~8/s); leave burst headroom
+    parser.add_argument("--target-rate", type=float, default=100.0,
+                        help="Peak Slack events/second the store must sustain (default: 100)")
+    args = parser.parse_args()
+
+    for name in args.names or list(BENCHMARKS):
+        if name not in BENCHMARKS:
+            parser.error(f"Unknown benchmark: {name}")
+        BENCHMARKS[name](args)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,8 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
+import requests
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -23,8 +25,67 @@ from agents.tools.github_client import (
     GitHubRateLimitError,
     RepoFile,
     RepoTree,
-    get_client
+    RetryPolicy,
+    get_client,
+    git_blob_sha,
+    ARCHIVE_AUTO_MIN_FILES
 )
+from agents.tools.blob_store import BlobStore
+
+
+def make_tarball(files, prefix="test-repo-abc123"):
+    """Build an in-memory GitHub-style tarball from a {path: bytes} dict."""
+    import io
+    import tarfile
+
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        directory = tarfile.TarInfo(prefix)
+        directory.type = tarfile.DIRTYPE
+        archive.addfile(directory)
+        for path, data in files.items():
+            info = tarfile.TarInfo(f"{prefix}/{path}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    buffer.seek(0)
+    return buffer
+
+
+# Tree of a "very large" repo whose recursive listings GitHub truncates:
+# root and src/ are truncated, docs/ and src/pkg/ list completely
+TRUNCATED_TREES = {
+    ("main", True): {"truncated": True, "tree": [{"path": "a.py", "type": "blob", "size": 1, "sha": "a"}]},
+    ("main", False): {"tree": [
+        {"path": "a.py", "type": "blob", "size": 1, "sha": "a"},
+        {"path": "docs", "type": "tree", "sha": "t-docs"},
+        {"path": "node_modules", "type": "tree", "sha": "t-nm"},
+        {"path": "src", "type": "tree", "sha": "t-src"},
+    ]},
+    ("t-docs", True): {"tree": [{"path": "guide.md", "type": "blob", "size": 10, "sha": "g"}]},
+    ("t-src", True): {"truncated": True, "tree": []},
+    ("t-src", False): {"tree": [
+        {"path": "main.py", "type": "blob", "size": 100, "sha": "m"},
+        {"path": "pkg", "type": "tree", "sha": "t-pkg"},
+    ]},
+    ("t-pkg", True): {"tree": [
+        {"path": "sub", "type": "tree", "sha": "t-sub"},
+        {"path": "x.py", "type": "blob", "size": 1000, "sha": "x"},
+        {"path": "sub/y.py", "type": "blob", "size": 5, "sha": "y"},
+    ]},
+}
+
+
+def fake_tree_request(requested):
+    """Build a _request side effect serving TRUNCATED_TREES."""
+    def request(method, endpoint, **kwargs):
+        tree = endpoint.split("/git/trees/")[1]
+        recursive = tree.endswith("?recursive=1")
+        key = (tree.replace("?recursive=1", ""), recursive)
+        requested.append(key)
+        response = Mock(status_code=200)
+        response.json.return_value = TRUNCATED_TREES[key]
+        return response
+    return request
 
 
 class TestGitHubClient(unittest.TestCase):
@@ -183,6 +244,265 @@ class TestGitHubClient(unittest.TestCase):
         self.assertEqual(len(tree.files), 2)
         self.assertEqual(tree.total_size, 300)
 
+    @patch('requests.Session.request')
+    def test_get_repo_tree_archive_strategy(self, mock_request):
+        """Test archive strategy streams the tarball and applies filters."""
+        archive_response = Mock()
+        archive_response.status_code = 200
+        archive_response.raw = make_tarball({
+            "README.md": b"# Readme",
+            "src/main.py": b"print('hi')",
+            "src/cache.pyc": b"\x00\x01",
+            "big.py": b"x" * 5000,
+        })
+        mock_request.return_value = archive_response
+
+        tree = self.client.get_repo_tree(
+            owner="test",
+            repo="repo",
+            ref="main",
+            file_patterns=["*.py", "*.md"],
+            exclude_patterns=["*.pyc"],
+            max_file_size=1000,
+            fetch_content=True,
+            strategy="archive"
+        )
+
+        # One request, to the tarball endpoint
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertIn("/tarball/main", mock_request.call_args[0][1])
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+
+        self.assertIsInstance(tree, RepoTree)
+        files = {f.path: f for f in tree.files}
+        self.assertEqual(set(files), {"README.md", "src/main.py"})
+        self.assertEqual(files["src/main.py"].content, "print('hi')")
+        self.assertEqual(files["src/main.py"].sha, git_blob_sha(b"print('hi')"))
+        self.assertEqual(tree.total_size, len(b"# Readme") + len(b"print('hi')"))
+
+    @patch('requests.Session.request')
+    def test_get_repo_tree_archive_total_size_limit(self, mock_request):
+        """Test archive strategy stops streaming at the total size budget."""
+        archive_response = Mock()
+        archive_response.status_code = 200
+        archive_response.raw = make_tarball({
+            "a.py": b"a" * 100,
+            "b.py": b"b" * 100,
+            "c.py": b"c" * 100,
+        })
+        mock_request.return_value = archive_response
+
+        tree = self.client.get_repo_tree(
+            owner="test",
+            repo="repo",
+            max_total_size=250,
+            strategy="archive"
+        )
+
+        self.assertEqual([f.path for f in tree.files], ["a.py", "b.py"])
+        self.assertEqual(tree.total_size, 200)
+        self.assertIsNone(tree.files[0].content)
+
+    @patch('requests.Session.request')
+    def test_get_repo_tree_auto_uses_archive_for_many_files(self, mock_request):
+        """Test auto strategy downloads one tarball instead of N contents calls."""
+        count = ARCHIVE_AUTO_MIN_FILES + 1
+        contents = {f"f{i}.py": f"v = {i}".encode() for i in range(count)}
+
+        list_response = Mock()
+        list_response.status_code = 200
+        list_response.json.return_value = {
+            "tree": [
+                {"path": path, "type": "blob", "size": len(data), "sha": git_blob_sha(data)}
+                for path, data in contents.items()
+            ]
+        }
+        archive_response = Mock()
+        archive_response.status_code = 200
+        archive_response.raw = make_tarball(contents)
+        mock_request.side_effect = [list_response, archive_response]
+
+        tree = self.client.get_repo_tree(
+            owner="test",
+            repo="repo",
+            fetch_content=True,
+            strategy="auto"
+        )
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(len(tree.files), count)
+        self.assertEqual(tree.files[3].content, "v = 3")
+
+    @patch('requests.Session.request')
+    def test_get_repo_tree_auto_falls_back_to_per_file(self, mock_request):
+        """Test auto strategy fetches files individually when the archive is unreadable."""
+        import base64
+        import io
+
+        count = ARCHIVE_AUTO_MIN_FILES + 1
+        contents = {f"f{i}.py": f"v = {i}".encode() for i in range(count)}
+
+        def request(method, url, **kwargs):
+            response = Mock(status_code=200)
+            if "/git/trees/" in url:
+                response.json.return_value = {"tree": [
+                    {"path": path, "type": "blob", "size": len(data), "sha": git_blob_sha(data)}
+                    for path, data in contents.items()
+                ]}
+            elif "/tarball/" in url:
+                response.raw = io.BytesIO(b"not a tarball")
+            else:
+                path = url.split("/contents/")[1]
+                response.json.return_value = {"content": base64.b64encode(contents[path]).decode()}
+            return response
+
+        mock_request.side_effect = request
+
+        tree = self.client.get_repo_tree(owner="test", repo="repo", fetch_content=True, strategy="auto")
+
+        self.assertEqual(mock_request.call_count, 2 + count)
+        self.assertEqual([file.content for file in tree.files], [data.decode() for data in contents.values()])
+
+    @patch('requests.Session.request')
+    def test_get_repo_tree_auto_uses_per_file_for_few_files(self, mock_request):
+        """Test auto strategy keeps per-file fetches for small trees."""
+        import base64
+
+        list_response = Mock()
+        list_response.status_code = 200
+        list_response.json.return_value = {
+            "tree": [{"path": "only.py", "type": "blob", "size": 5, "sha": "a"}]
+        }
+        content_response = Mock()
+        content_response.status_code = 200
+        content_response.json.return_value = {
+            "content": base64.b64encode(b"x = 1").decode()
+        }
+        mock_request.side_effect = [list_response, content_response]
+
+        tree = self.client.get_repo_tree(owner="test", repo="repo", fetch_content=True, strategy="auto")
+
+        self.assertIn("/contents/only.py", mock_request.call_args[0][1])
+        self.assertEqual(tree.files[0].content, "x = 1")
+
+    @patch('requests.Session.request')
+    def test_get_file_content_uses_blob_store(self, mock_request):
+        """Test fetched content is stored and later served without a request."""
+        import base64
+        import tempfile
+
+        data = b"Hello, World!"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "content": base64.b64encode(data).decode(),
+            "encoding": "base64",
+            "sha": git_blob_sha(data)
+        }
+        mock_request.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as store_dir:
+            client = GitHubClient(token="fake_token", blob_store=BlobStore(store_dir))
+
+            first = client.get_file_content("test", "repo", "README.md")
+            second = client.get_file_content("test", "repo", "README.md", sha=git_blob_sha(data))
+            by_sha = client.get_blob_content("test", "repo", git_blob_sha(data))
+
+        self.assertEqual(first, "Hello, World!")
+        self.assertEqual(second, "Hello, World!")
+        self.assertEqual(by_sha, "Hello, World!")
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch('requests.Session.request')
+    def test_get_blob_content_fetches_git_blob(self, mock_request):
+        """Test blobs missing from the store are fetched via git/blobs/{sha}."""
+        import base64
+
+        data = b"x = 1\n"
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "content": base64.b64encode(data).decode(),
+            "encoding": "base64"
+        }
+        mock_request.return_value = mock_response
+
+        content = self.client.get_blob_content("test", "repo", git_blob_sha(data))
+
+        self.assertEqual(content, "x = 1\n")
+        self.assertIn(f"/git/blobs/{git_blob_sha(data)}", mock_request.call_args[0][1])
+
+    @patch('requests.Session.request')
+    def test_get_repo_tree_served_from_blob_store(self, mock_request):
+        """Test unchanged files need no content requests on repeat audits."""
+        import tempfile
+
+        contents = {f"f{i}.py": f"v = {i}".encode() for i in range(3)}
+        list_response = Mock()
+        list_response.status_code = 200
+        list_response.json.return_value = {
+            "tree": [
+                {"path": path, "type": "blob", "size": len(data), "sha": git_blob_sha(data)}
+                for path, data in contents.items()
+            ]
+        }
+        mock_request.return_value = list_response
+
+        with tempfile.TemporaryDirectory() as store_dir:
+            store = BlobStore(store_dir)
+            for data in contents.values():
+                store.put(git_blob_sha(data), data)
+
+            client = GitHubClient(token="fake_token", blob_store=store)
+            tree = client.get_repo_tree("test", "repo", fetch_content=True)
+
+        # Only the tree listing went over the network
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual([f.content for f in tree.files], ["v = 0", "v = 1", "v = 2"])
+
+    def test_iter_repo_files_walks_truncated_tree(self):
+        """Test truncated listings fall back to a breadth-first subtree walk."""
+        requested = []
+        with patch.object(self.client, "_request", side_effect=fake_tree_request(requested)):
+            files = list(self.client.iter_repo_files(
+                "test", "repo", exclude_patterns=["node_modules/*"]
+            ))
+
+        self.assertEqual(
+            sorted(f.path for f in files),
+            ["a.py", "docs/guide.md", "src/main.py", "src/pkg/sub/y.py", "src/pkg/x.py"]
+        )
+        # Excluded directories are never fetched
+        self.assertNotIn(("t-nm", True), requested)
+        # Completely listed subtrees are not walked further
+        self.assertNotIn(("t-sub", True), requested)
+
+    def test_iter_repo_files_applies_budget_while_streaming(self):
+        """Test max_total_size stops the walk without listing everything."""
+        requested = []
+        with patch.object(self.client, "_request", side_effect=fake_tree_request(requested)):
+            files = list(self.client.iter_repo_files(
+                "test", "repo", exclude_patterns=["node_modules/*"], max_total_size=150
+            ))
+
+        self.assertLessEqual(sum(f.size for f in files), 150)
+        self.assertIn("src/main.py", [f.path for f in files])
+        self.assertNotIn("src/pkg/x.py", [f.path for f in files])
+
+    def test_list_repo_files_covers_truncated_tree(self):
+        """Test list_repo_files no longer returns a partial truncated tree."""
+        with patch.object(self.client, "_request", side_effect=fake_tree_request([])):
+            files = self.client.list_repo_files(
+                "test", "repo", file_patterns=["*.py"], exclude_patterns=["node_modules/*"]
+            )
+
+        self.assertIn("src/pkg/sub/y.py", [f.path for f in files])
+
+    def test_get_repo_tree_unknown_strategy(self):
+        """Test unknown strategies are rejected."""
+        with self.assertRaises(ValueError):
+            self.client.get_repo_tree("test", "repo", strategy="bogus")
+
     @patch('requests.Session.request')
     def test_auth_error(self, mock_request):
         """Test authentication error handling."""
@@ -229,6 +549,80 @@ class TestGitHubClient(unittest.TestCase):
         self.assertEqual(result['user'], "testuser")
         self.assertEqual(result['rate_limit_remaining'], 5000)
 
+    @patch('requests.Session.request')
+    def test_get_issues_page_conditional(self, mock_request):
+        """Test issue listing sends If-None-Match and handles 304."""
+        listing = Mock(status_code=200, links={"next": {"url": "..."}}, headers={"ETag": '"abc"'})
+        listing.json.return_value = [
+            {"number": 1, "body": "issue"},
+            {"number": 2, "body": "pr", "pull_request": {}}
+        ]
+        not_modified = Mock(status_code=304, links={}, headers={}, text="")
+        mock_request.side_effect = [listing, not_modified]
+
+        issues, etag, has_next = self.client.get_issues_page("test", "repo")
+        self.assertEqual([i["number"] for i in issues], [1])
+        self.assertEqual(etag, '"abc"')
+        self.assertTrue(has_next)
+
+        issues, etag, _ = self.client.get_issues_page("test", "repo", etag='"abc"')
+        self.assertIsNone(issues)
+        self.assertEqual(etag, '"abc"')
+        self.assertEqual(mock_request.call_args.kwargs["headers"], {"If-None-Match": '"abc"'})
+
+    @patch('requests.Session.request')
+    def test_update_issue(self, mock_request):
+        """Test issue update uses PATCH on the issue number."""
+        mock_response = Mock(status_code=200)
+        mock_response.json.return_value = {
+            "number": 7, "html_url": "https://github.com/test/repo/issues/7",
+            "title": "t", "state": "open"
+        }
+        mock_request.return_value = mock_response
+
+        issue = self.client.update_issue("test", "repo", 7, {"title": "t", "body": "b"})
+
+        self.assertEqual(issue.number, 7)
+        method, url = mock_request.call_args.args
+        self.assertEqual(method, "PATCH")
+        self.assertTrue(url.endswith("/repos/test/repo/issues/7"))
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_update_issue_not_retried_after_read_timeout(self, mock_request, mock_sleep):
+        """Test a PATCH that may have been applied is not sent again."""
+        mock_request.side_effect = requests.exceptions.ReadTimeout("slow")
+
+        with self.assertRaises(GitHubClientError):
+            self.client.update_issue("test", "repo", 7, {"title": "t"})
+
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch('time.sleep')
+    @patch('requests.Session.request')
+    def test_retry_policy_by_method(self, mock_request, mock_sleep):
+        """Test GETs retry on 5xx while PATCH retries only on connect errors and 429 with Retry-After."""
+        policy = RetryPolicy(max_retries=2)
+        self.assertTrue(policy.should_retry(503, 0, "GET"))
+        self.assertFalse(policy.should_retry(503, 0, "PATCH"))
+        self.assertFalse(policy.should_retry(429, 0, "POST"))
+        self.assertTrue(policy.should_retry(429, 0, "POST", retry_after="1"))
+        self.assertTrue(policy.should_retry_error(0, "POST", connect_phase=True))
+        self.assertFalse(policy.should_retry_error(0, "POST", connect_phase=False))
+        self.assertFalse(policy.should_retry_error(2, "GET", connect_phase=True))
+
+        ok = Mock(status_code=200)
+        ok.json.return_value = {
+            "number": 7, "html_url": "https://github.com/test/repo/issues/7",
+            "title": "t", "state": "open"
+        }
+        mock_request.side_effect = [requests.exceptions.ConnectTimeout("refused"), ok]
+
+        issue = self.client.update_issue("test", "repo", 7, {"title": "t"})
+
+        self.assertEqual(issue.number, 7)
+        self.assertEqual(mock_request.call_count, 2)
+
     def test_check_auth_no_token(self):
         """Test auth check without token."""
         client = GitHubClient(token=None)
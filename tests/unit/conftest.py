@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the unit tests.
+
+The Slack webhook's modules import each other by file name, so its
+directory is put on sys.path here for every test module that imports
+them.
+"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+WEBHOOK_DIR = os.path.join(REPO_ROOT, "service", "slack_webhook")
+sys.path.insert(0, WEBHOOK_DIR)
+
+
+@pytest.fixture
+def load_slack_webhook():
+    """
+    Loader for slack_webhook/main.py.
+
+    Each call imports a fresh module under its own name (the gateway owns
+    "main"), so set environment variables before calling it.
+    """
+
+    def load():
+        spec = importlib.util.spec_from_file_location(
+            "slack_webhook_main", os.path.join(WEBHOOK_DIR, "main.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    return load
@@ -0,0 +1,155 @@
+"""
+Unit tests for the A2A gateway's batch endpoint (/a2a/batch).
+
+Agent Engine is replaced by a fake call_agent_engine that sleeps per
+prompt and records how many calls overlap.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from agent_engine_client import AgentEngineResponse  # noqa: E402
+
+
+class FakeEngine:
+    """call_agent_engine stand-in: prompt "sleep:<s>" waits, "fail" errors, "boom" raises."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.correlation_ids = []
+
+    async def __call__(self, agent_role, prompt, session_id=None, correlation_id=None, context=None, env=None):
+        self.correlation_ids.append(correlation_id)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if prompt.startswith("sleep:"):
+                await asyncio.sleep(float(prompt.split(":", 1)[1]))
+            if prompt == "boom":
+                raise RuntimeError("engine exploded")
+            if prompt == "fail":
+                return AgentEngineResponse(response="", error="HTTP error 500", metadata={"status_code": 500})
+            return AgentEngineResponse(
+                response=f"{agent_role}:{prompt}",
+                metadata={"agent_role": agent_role, "correlation_id": correlation_id},
+            )
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def engine():
+    fake = FakeEngine()
+    with patch.object(agent_engine_client, "call_agent_engine", fake), \
+            patch.object(main.coalescer, "enabled", False):
+        yield fake
+
+
+async def post_batch(payload):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        return await client.post("/a2a/batch", json=payload)
+
+
+@pytest.mark.asyncio
+async def test_batch_returns_results_in_request_order(engine):
+    calls = [
+        {"agent_role": "iam-adk", "prompt": "sleep:0.05"},
+        {"agent_role": "iam-qa", "prompt": "sleep:0.01"},
+        {"agent_role": "bob", "prompt": "sleep:0"},
+    ]
+    response = await post_batch({"calls": calls, "correlation_id": "batch-1"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["response"] for r in body["results"]] == ["iam-adk:sleep:0.05", "iam-qa:sleep:0.01", "bob:sleep:0"]
+    assert body["correlation_id"] == "batch-1"
+    assert body["metadata"]["succeeded"] == 3
+    assert sorted(engine.correlation_ids) == ["batch-1-0", "batch-1-1", "batch-1-2"]
+    assert engine.peak == 3  # Ran concurrently
+
+
+@pytest.mark.asyncio
+async def test_item_errors_do_not_fail_the_batch(engine):
+    calls = [
+        {"agent_role": "bob", "prompt": "fail"},
+        {"agent_role": "bob", "prompt": "ok"},
+        {"agent_role": "bob", "prompt": "boom"},
+    ]
+    response = await post_batch({"calls": calls})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert results[0]["error"] == "HTTP error 500"
+    assert results[1]["error"] is None
+    assert "engine exploded" in results[2]["error"]
+    assert response.json()["metadata"]["failed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_per_batch_concurrency_cap(engine):
+    calls = [{"agent_role": "bob", "prompt": "sleep:0.02"} for _ in range(6)]
+
+    response = await post_batch({"calls": calls, "max_concurrency": 2})
+
+    assert response.status_code == 200
+    assert response.json()["metadata"]["max_concurrency"] == 2
+    assert engine.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_requested_concurrency_cannot_exceed_gateway_cap(engine, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_CONCURRENCY", 3)
+    calls = [{"agent_role": "bob", "prompt": "sleep:0.02"} for _ in range(6)]
+
+    response = await post_batch({"calls": calls, "max_concurrency": 100})
+
+    assert response.json()["metadata"]["max_concurrency"] == 3
+    assert engine.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_ndjson_streams_in_completion_order(engine):
+    calls = [
+        {"agent_role": "bob", "prompt": "sleep:0.05"},
+        {"agent_role": "bob", "prompt": "sleep:0"},
+    ]
+    response = await post_batch({"calls": calls, "stream": True})
+
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["index"] for line in lines[:-1]] == [1, 0]
+    assert all(line["status_code"] == 200 for line in lines[:-1])
+    assert lines[-1]["summary"]["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_size_limits(engine, monkeypatch):
+    monkeypatch.setattr(main, "BATCH_MAX_CALLS", 2)
+
+    empty = await post_batch({"calls": []})
+    too_many = await post_batch({"calls": [{"agent_role": "bob", "prompt": "x"}] * 3})
+
+    assert empty.status_code == 400
+    assert too_many.status_code == 400
+    assert "limit is 2" in too_many.json()["detail"]
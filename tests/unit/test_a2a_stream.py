@@ -0,0 +1,173 @@
+"""
+Unit tests for the A2A gateway's SSE streaming endpoint (/a2a/stream).
+
+A local fake streaming Agent Engine is served through httpx.MockTransport
+on the gateway's shared upstream client - no network access required.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from agents.config.agent_engine import AgentEngineConfig  # noqa: E402
+from http_pool import close_shared_client, start_shared_client  # noqa: E402
+from routing import RoutingTable  # noqa: E402
+
+
+class FakeStreamingEngine:
+    """Agent Engine :streamQuery stand-in that emits SSE lines on demand."""
+
+    def __init__(self, texts, status_code=200):
+        self.texts = texts
+        self.status_code = status_code
+        self.produced = 0
+        self.requests = []
+
+    async def _body(self):
+        for text in self.texts:
+            self.produced += 1
+            event = {"content": {"parts": [{"text": text}]}, "session_id": "s-1"}
+            yield f"data: {json.dumps(event)}\n\n".encode()
+
+    def __call__(self, request):
+        self.requests.append(request)
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, text="engine unavailable")
+        return httpx.Response(200, content=self._body(), headers={"Content-Type": "text/event-stream"})
+
+
+@pytest.fixture
+def agent_config():
+    config = AgentEngineConfig(
+        reasoning_engine_id="engine-123",
+        project_id="test-project",
+        location="us-central1",
+        spiffe_id="spiffe://intent.solutions/agent/bobs-brain/dev/us-central1/0.9.0",
+    )
+    table = RoutingTable.from_configs({("dev", "bob"): config})
+    with patch.object(agent_engine_client, "get_routing_table", return_value=table), \
+            patch.object(agent_engine_client, "get_access_token", AsyncMock(return_value="test-token")):
+        yield config
+
+
+@pytest_asyncio.fixture
+async def engine(agent_config):
+    fake = FakeStreamingEngine(["Hello", ", ", "world"])
+    await start_shared_client(transport=httpx.MockTransport(fake))
+    yield fake
+    await close_shared_client()
+
+
+def parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+async def post_stream(payload):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        return await client.post("/a2a/stream", json=payload)
+
+
+@pytest.mark.asyncio
+async def test_stream_proxies_chunks_and_ends_with_summary(engine):
+    response = await post_stream({"agent_role": "bob", "prompt": "hi", "correlation_id": "corr-1"})
+
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["x-correlation-id"] == "corr-1"
+
+    events = parse_sse(response.text)
+    assert [name for name, _ in events] == ["start", "chunk", "chunk", "chunk", "summary"]
+    assert "".join(data["text"] for name, data in events if name == "chunk") == "Hello, world"
+
+    summary = events[-1][1]
+    assert summary["correlation_id"] == "corr-1"
+    assert summary["chunks"] == 3
+    assert summary["response_length"] == len("Hello, world")
+    assert summary["session_id"] == "s-1"
+    assert summary["error"] is None
+    assert summary["ttfb_ms"] >= 0
+    assert summary["first_chunk_ms"] >= 0
+
+    upstream = engine.requests[0]
+    assert upstream.url.path.endswith("reasoningEngines/engine-123:streamQuery")
+    assert upstream.headers["X-Correlation-ID"] == "corr-1"
+    assert upstream.headers["Authorization"] == "Bearer test-token"
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_upstream_errors_as_events(engine):
+    engine.status_code = 503
+
+    events = parse_sse((await post_stream({"agent_role": "bob", "prompt": "hi"})).text)
+
+    assert [name for name, _ in events] == ["start", "error", "summary"]
+    assert events[1][1]["status_code"] == 503
+    assert "503" in events[-1][1]["error"]
+    assert events[-1][1]["correlation_id"]  # Generated when not provided
+
+
+@pytest.mark.asyncio
+async def test_stream_reads_upstream_only_as_fast_as_consumer(engine):
+    engine.texts = [f"chunk-{i}" for i in range(10)]
+
+    stream = agent_engine_client.stream_agent_engine("bob", "hi")
+    first = await stream.__anext__()
+    assert first.text == "chunk-0"
+    assert engine.produced <= 2  # Not drained ahead of the consumer
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_unconfigured_agent_emits_error():
+    with patch.object(agent_engine_client, "get_routing_table", return_value=RoutingTable.from_configs({})):
+        events = parse_sse((await post_stream({"agent_role": "nobody", "prompt": "hi"})).text)
+
+    assert [name for name, _ in events] == ["start", "error", "summary"]
+    assert "not configured" in events[-1][1]["error"]
+
+
+def test_parse_stream_line_formats():
+    parse = agent_engine_client._parse_stream_line
+    assert parse('data: {"content": {"parts": [{"text": "a"}, {"text": "b"}]}}').text == "ab"
+    assert parse('{"output": "ndjson"}').text == "ndjson"
+    assert parse('data: {"content": {"parts": [{"function_call": {}}]}}') is None
+    assert parse("event: message") is None
+    assert parse("") is None
+
+
+@pytest.mark.asyncio
+async def test_run_result_metadata_includes_ttfb(agent_config):
+    def engine(request):
+        return httpx.Response(200, json={"response": "done", "metadata": {}})
+
+    await start_shared_client(transport=httpx.MockTransport(engine))
+    try:
+        result = await agent_engine_client.call_agent_engine("bob", "hi")
+    finally:
+        await close_shared_client()
+
+    assert result.response == "done"
+    assert result.metadata["ttfb_ms"] >= 0
+    assert result.metadata["total_ms"] >= result.metadata["ttfb_ms"]
@@ -0,0 +1,238 @@
+"""
+Unit tests for gateway admission control (limits, queue, AIMD).
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from admission import AdmissionConfig, AdmissionController, AdmissionRejected  # noqa: E402
+from agent_engine_client import AgentEngineResponse  # noqa: E402
+from http_pool import close_shared_client, start_shared_client  # noqa: E402
+
+
+def controller(**overrides):
+    settings = dict(initial_limit=2, min_limit=1, max_limit=4, per_caller_limit=2,
+                    max_queue=2, queue_timeout=0.2, adaptive=False)
+    settings.update(overrides)
+    return AdmissionController(AdmissionConfig(**settings))
+
+
+async def hold(ctrl, caller, release):
+    async with ctrl.admit(caller):
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_global_limit_queues_then_admits_in_order():
+    ctrl = controller()
+    release = asyncio.Event()
+    holders = [asyncio.ensure_future(hold(ctrl, None, release)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert ctrl.in_flight == 2
+
+    order = []
+
+    async def queued(name):
+        async with ctrl.admit(None):
+            order.append(name)
+
+    waiting = [asyncio.ensure_future(queued(n)) for n in ("first", "second")]
+    await asyncio.sleep(0)
+    assert ctrl.stats()["queue_depth"] == 2
+
+    release.set()
+    await asyncio.gather(*holders, *waiting)
+    assert order == ["first", "second"]
+    assert ctrl.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_fast_with_retry_after():
+    ctrl = controller(max_queue=1)
+    release = asyncio.Event()
+    tasks = [asyncio.ensure_future(hold(ctrl, None, release)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        async with ctrl.admit(None):
+            pass
+    assert rejected.value.reason == "queue_full"
+    assert rejected.value.retry_after >= 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio
+async def test_queue_deadline_rejects():
+    ctrl = controller(initial_limit=1, queue_timeout=0.01)
+    release = asyncio.Event()
+    holder = asyncio.ensure_future(hold(ctrl, None, release))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected, match="queue_timeout"):
+        async with ctrl.admit(None):
+            pass
+    assert ctrl.stats()["queue_depth"] == 0
+
+    release.set()
+    await holder
+    assert ctrl.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_per_caller_limit_lets_other_callers_through():
+    ctrl = controller(initial_limit=3, per_caller_limit=1)
+    release = asyncio.Event()
+    noisy = [asyncio.ensure_future(hold(ctrl, "spiffe://noisy", release)) for _ in range(2)]
+    await asyncio.sleep(0)
+    assert ctrl.in_flight == 1  # Second noisy call is queued
+
+    async with ctrl.admit("spiffe://quiet"):
+        assert ctrl.in_flight == 2
+
+    release.set()
+    await asyncio.gather(*noisy)
+    assert ctrl.stats()["callers_in_flight"] == 0
+
+
+def test_aimd_decreases_on_errors_and_grows_when_saturated():
+    ctrl = controller(adaptive=True, initial_limit=4, max_limit=8, target_latency=5.0)
+
+    for _ in range(4):
+        ctrl.record(0.5, 503)
+    assert ctrl.limit == 2
+    assert ctrl.stats()["limit_decreases"] == 1
+
+    ctrl._window_peak = ctrl.limit  # Limit was the bottleneck
+    for _ in range(2):
+        ctrl.record(0.5, 200)
+    assert ctrl.limit == 3
+
+
+def test_aimd_decreases_on_high_latency_and_respects_floor():
+    ctrl = controller(adaptive=True, initial_limit=2, min_limit=2, target_latency=1.0)
+    for _ in range(2):
+        ctrl.record(9.0, 200)
+    assert ctrl.limit == 2
+
+
+def test_aimd_does_not_grow_unused_limit():
+    ctrl = controller(adaptive=True, initial_limit=2)
+    for _ in range(2):
+        ctrl.record(0.1, 200)
+    assert ctrl.limit == 2
+
+
+@pytest.mark.asyncio
+async def test_a2a_run_returns_429_with_retry_after_when_overloaded():
+    release = asyncio.Event()
+
+    async def slow_call_agent_engine(**kwargs):
+        await release.wait()
+        return AgentEngineResponse(response="done", metadata={})
+
+    ctrl = controller(initial_limit=1, max_queue=0)
+    transport = httpx.ASGITransport(app=main.app)
+    with patch.object(main, "admission", ctrl), \
+            patch.object(agent_engine_client, "call_agent_engine", slow_call_agent_engine):
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            body = {"agent_role": "bob", "prompt": "hi"}
+            first = asyncio.ensure_future(client.post("/a2a/run", json=body))
+            while ctrl.in_flight == 0:
+                await asyncio.sleep(0.001)
+
+            rejected = await client.post("/a2a/run", json={**body, "correlation_id": "c2"})
+            release.set()
+            accepted = await first
+
+    assert accepted.status_code == 200
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert rejected.json()["correlation_id"] == "c2"
+    assert rejected.json()["metadata"]["reason"] == "queue_full"
+    assert ctrl.stats()["rejected"]["queue_full"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_is_admission_controlled():
+    release = asyncio.Event()
+
+    async def engine(request):
+        await release.wait()
+        return httpx.Response(200, json={"response": "done"})
+
+    ctrl = controller(initial_limit=1, max_queue=0)
+    await start_shared_client(transport=httpx.MockTransport(engine))
+    transport = httpx.ASGITransport(app=main.app)
+    try:
+        with patch.object(main, "admission", ctrl):
+            async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+                first = asyncio.ensure_future(client.post("/query", json={"query": "hi"}))
+                while ctrl.in_flight == 0:
+                    await asyncio.sleep(0.001)
+
+                rejected = await client.post("/query", json={"query": "again"})
+                release.set()
+                accepted = await first
+    finally:
+        await close_shared_client()
+
+    assert accepted.json() == {"response": "done"}
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert ctrl.in_flight == 0
+    assert ctrl.latency_ewma is not None  # Outcome recorded for AIMD
+
+
+@pytest.mark.asyncio
+async def test_a2a_stream_holds_a_slot_until_the_stream_ends():
+    release = asyncio.Event()
+
+    class StreamChunk:
+        text = "done"
+        session_id = None
+
+    async def stream_agent_engine(**kwargs):
+        await release.wait()
+        yield StreamChunk()
+
+    ctrl = controller(initial_limit=1, max_queue=0)
+    transport = httpx.ASGITransport(app=main.app)
+    with patch.object(main, "admission", ctrl), \
+            patch.object(agent_engine_client, "stream_agent_engine", stream_agent_engine):
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            body = {"agent_role": "bob", "prompt": "hi"}
+            first = asyncio.ensure_future(client.post("/a2a/stream", json=body))
+            while ctrl.in_flight == 0:
+                await asyncio.sleep(0.001)
+
+            rejected = await client.post("/a2a/stream", json={**body, "correlation_id": "c2"})
+            release.set()
+            accepted = await first
+
+    assert accepted.status_code == 200
+    assert "event: summary" in accepted.text
+    assert rejected.status_code == 429
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert rejected.json()["correlation_id"] == "c2"
+    assert ctrl.in_flight == 0
+    assert ctrl.latency_ewma is not None
@@ -0,0 +1,120 @@
+"""
+Unit tests for the A2A gateway's precomputed AgentCards (agent_cards.py).
+
+Covers ETag/Cache-Control/304 handling for the gateway card and the
+specialist card endpoints, and loading cards from agents/*/.well-known.
+"""
+
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import main  # noqa: E402
+from agent_cards import PrecomputedJSON, SpecialistCards  # noqa: E402
+
+
+def write_card(root, directory, card):
+    path = root / directory / ".well-known" / "agent-card.json"
+    path.parent.mkdir(parents=True)
+    path.write_text(json.dumps(card))
+
+
+async def get(path, headers=None):
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        return await client.get(path, headers=headers)
+
+
+def test_etag_is_stable_and_content_addressed():
+    first = PrecomputedJSON.from_obj({"name": "bob", "version": "1.0"})
+    again = PrecomputedJSON.from_obj({"name": "bob", "version": "1.0"})
+    changed = PrecomputedJSON.from_obj({"name": "bob", "version": "1.1"})
+
+    assert first.etag == again.etag
+    assert first.etag != changed.etag
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+    assert json.loads(first.body) == {"name": "bob", "version": "1.0"}
+
+
+@pytest.mark.asyncio
+async def test_gateway_card_served_with_etag_and_304(monkeypatch):
+    monkeypatch.setenv("GATEWAY_CARD_MAX_AGE", "60")
+
+    response = await get("/.well-known/agent.json")
+
+    assert response.status_code == 200
+    assert response.json() == main.get_agent_card_dict()
+    assert response.headers["cache-control"] == "public, max-age=60"
+    etag = response.headers["etag"]
+
+    for if_none_match in (etag, f'"other", W/{etag}', "*"):
+        cached = await get("/.well-known/agent.json", headers={"If-None-Match": if_none_match})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+    stale = await get("/.well-known/agent.json", headers={"If-None-Match": '"stale"'})
+    assert stale.status_code == 200
+
+
+def test_loader_keys_by_name_and_prefers_newer_versions(tmp_path):
+    write_card(tmp_path, "iam_adk", {"name": "iam-adk", "version": "0.10.0"})
+    write_card(tmp_path, "lead_old", {"name": "lead", "version": "0.10.0"})
+    write_card(tmp_path, "lead_new", {"name": "lead", "version": "0.11.0"})
+    write_card(tmp_path, "unnamed", {"version": "1.0.0"})
+    broken = tmp_path / "broken" / ".well-known" / "agent-card.json"
+    broken.parent.mkdir(parents=True)
+    broken.write_text("{not json")
+
+    cards = SpecialistCards.from_directory(str(tmp_path))
+
+    assert cards.names() == ["iam-adk", "lead", "unnamed"]
+    assert json.loads(cards.get("lead").body)["version"] == "0.11.0"
+    assert cards.get("iam_adk") is cards.get("iam-adk")
+    assert cards.get("missing") is None
+    index = json.loads(cards.index.body)["agents"]
+    assert index[0]["card_url"] == "/agents/iam-adk/.well-known/agent-card.json"
+    assert index[0]["etag"] == cards.get("iam-adk").etag
+
+
+@pytest.mark.asyncio
+async def test_specialist_card_endpoints(tmp_path, monkeypatch):
+    write_card(tmp_path, "iam_qa", {"name": "iam-qa", "version": "0.11.0", "description": "QA"})
+    monkeypatch.setattr(main, "SPECIALIST_CARDS", SpecialistCards.from_directory(str(tmp_path)))
+
+    card = await get("/agents/iam-qa/.well-known/agent-card.json")
+    assert card.status_code == 200
+    assert card.json()["description"] == "QA"
+
+    cached = await get("/agents/iam_qa/.well-known/agent-card.json", headers={"If-None-Match": card.headers["etag"]})
+    assert cached.status_code == 304
+
+    missing = await get("/agents/nope/.well-known/agent-card.json")
+    assert missing.status_code == 404
+
+    index = await get("/agents/cards")
+    assert [agent["name"] for agent in index.json()["agents"]] == ["iam-qa"]
+    assert "etag" in index.headers
+
+
+def test_repo_specialist_cards_load():
+    cards = SpecialistCards.from_directory()
+
+    assert "iam-adk" in cards.names()
+    # The legacy dash-named directory duplicates the lead's card at an older version
+    lead = [name for name in cards.names() if "devops-lead" in name]
+    assert len(lead) == 1
@@ -22,6 +22,13 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 sys.path.insert(0, project_root)
 
 
+def make_routing_table(configs):
+    """Routing table snapshot holding only the given (env, agent_role) configs."""
+    from service.a2a_gateway.routing import RoutingTable
+
+    return RoutingTable.from_configs(configs, default_env="dev")
+
+
 # Test fixtures
 @pytest.fixture
 def mock_agent_config():
@@ -104,15 +111,15 @@ def test_get_gcp_token_failure(mock_default):
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_success(mock_client_class, mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+async def test_call_agent_engine_success(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test successful Agent Engine call."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
     # Mock config and token
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.return_value = "test-token"
 
     # Mock HTTP response
@@ -144,17 +151,18 @@ async def test_call_agent_engine_success(mock_client_class, mock_get_token, mock
     assert result.metadata["agent_role"] == "bob"
     assert result.metadata["correlation_id"] == "corr-456"
 
-    mock_build_config.assert_called_once_with("bob", "dev")
+    engine_url = mock_client.__aenter__.return_value.post.call_args.args[0]
+    assert engine_url.endswith("/reasoningEngines/test-engine-123:query")
     mock_get_token.assert_called_once()
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-async def test_call_agent_engine_agent_not_configured(mock_build_config, mock_env_vars):
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+async def test_call_agent_engine_agent_not_configured(mock_routing_table, mock_env_vars):
     """Test when agent is not configured."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
-    mock_build_config.return_value = None
+    mock_routing_table.return_value = make_routing_table({})
 
     result = await call_agent_engine(
         agent_role="unknown-agent",
@@ -168,13 +176,13 @@ async def test_call_agent_engine_agent_not_configured(mock_build_config, mock_en
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
-async def test_call_agent_engine_auth_failure(mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
+async def test_call_agent_engine_auth_failure(mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test authentication failure."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.side_effect = RuntimeError("Auth failed")
 
     result = await call_agent_engine(
@@ -188,15 +196,15 @@ async def test_call_agent_engine_auth_failure(mock_get_token, mock_build_config,
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_http_error(mock_client_class, mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+async def test_call_agent_engine_http_error(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test HTTP error from Agent Engine."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
     import httpx
 
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.return_value = "test-token"
 
     # Mock HTTP error
@@ -222,15 +230,15 @@ async def test_call_agent_engine_http_error(mock_client_class, mock_get_token, m
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_timeout(mock_client_class, mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+async def test_call_agent_engine_timeout(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test timeout error."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
     import httpx
 
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.return_value = "test-token"
 
     # Mock timeout
@@ -258,14 +266,14 @@ async def test_call_agent_engine_timeout(mock_client_class, mock_get_token, mock
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_headers(mock_client_class, mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+async def test_call_agent_engine_headers(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test request headers include correlation ID and SPIFFE ID."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.return_value = "test-token"
 
     # Mock successful response
@@ -294,14 +302,14 @@ async def test_call_agent_engine_headers(mock_client_class, mock_get_token, mock
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_payload(mock_client_class, mock_get_token, mock_build_config, mock_agent_config, mock_env_vars):
+async def test_call_agent_engine_payload(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test request payload includes query, session_id, and context."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
-    mock_build_config.return_value = mock_agent_config
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
     mock_get_token.return_value = "test-token"
 
     # Mock successful response
@@ -338,20 +346,21 @@ async def test_call_agent_engine_payload(mock_client_class, mock_get_token, mock
 
 
 @pytest.mark.asyncio
-@patch("service.a2a_gateway.agent_engine_client.build_agent_config")
-@patch("service.a2a_gateway.agent_engine_client.get_gcp_token")
+@patch("service.a2a_gateway.agent_engine_client.get_routing_table")
+@patch("service.a2a_gateway.agent_engine_client.get_access_token")
 @patch("service.a2a_gateway.agent_engine_client.httpx.AsyncClient")
-async def test_call_agent_engine_env_override(mock_client_class, mock_get_token, mock_build_config, mock_env_vars):
+async def test_call_agent_engine_env_override(mock_client_class, mock_get_token, mock_routing_table, mock_agent_config, mock_env_vars):
     """Test environment can be explicitly overridden."""
     from service.a2a_gateway.agent_engine_client import call_agent_engine
 
-    mock_build_config.return_value = None  # Will fail if called with wrong env
+    mock_routing_table.return_value = make_routing_table({("dev", "bob"): mock_agent_config})
 
-    await call_agent_engine(
+    result = await call_agent_engine(
         agent_role="bob",
         prompt="Test",
         env="staging",
     )
 
-    # Should have been called with staging env
-    mock_build_config.assert_called_once_with("bob", "staging")
+    # Bob is only routed in dev, so the staging override must miss
+    assert "not configured for staging" in result.error
+    mock_client_class.assert_not_called()
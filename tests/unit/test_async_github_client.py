@@ -0,0 +1,324 @@
+"""
+Unit tests for AsyncGitHubClient.
+
+Uses httpx.MockTransport - no network access required.
+"""
+
+import asyncio
+import base64
+import io
+import tarfile
+
+import httpx
+import pytest
+
+from agents.tools.async_github_client import AsyncGitHubClient, gather_limited
+from agents.tools.blob_store import BlobStore, git_blob_sha
+from agents.tools.github_client import (
+    ARCHIVE_AUTO_MIN_FILES,
+    GitHubAuthError,
+    GitHubClientError,
+    GitHubRateLimitError,
+    RetryPolicy,
+)
+
+NO_WAIT = RetryPolicy(max_retries=2, backoff_base=0, max_backoff=0)
+
+
+def tarball(files, prefix="repo-abc123"):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        for path, data in files.items():
+            info = tarfile.TarInfo(f"{prefix}/{path}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def tree_json(files):
+    return {
+        "tree": [
+            {"type": "blob", "path": path, "sha": git_blob_sha(data), "size": len(data)}
+            for path, data in files.items()
+        ]
+    }
+
+
+def make_client(handler, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    kwargs.setdefault("retry_policy", NO_WAIT)
+    return AsyncGitHubClient(token="fake_token", http_client=http_client, **kwargs)
+
+
+class GitHubFake:
+    """Minimal GitHub API backed by a dict of files."""
+
+    def __init__(self, files):
+        self.files = files
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request):
+        path = request.url.path
+        self.calls.append(path)
+        if path.endswith("/git/trees/main"):
+            return httpx.Response(200, json=tree_json(self.files))
+        if path.endswith("/tarball/main"):
+            return httpx.Response(200, content=tarball(self.files))
+        if "/contents/" in path:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            file_path = path.split("/contents/", 1)[1]
+            data = self.files[file_path]
+            return httpx.Response(200, json={
+                "content": base64.b64encode(data).decode(),
+                "sha": git_blob_sha(data),
+            })
+        return httpx.Response(404, json={"message": "Not Found"})
+
+
+@pytest.mark.asyncio
+async def test_list_repo_files_applies_filters():
+    fake = GitHubFake({"a.py": b"a", "b.md": b"b", "venv/c.py": b"c"})
+    async with make_client(fake) as client:
+        files = await client.list_repo_files(
+            "o", "r", file_patterns=["*.py"], exclude_patterns=["venv/*"]
+        )
+    assert [f.path for f in files] == ["a.py"]
+
+
+@pytest.mark.asyncio
+async def test_get_repo_tree_fetches_concurrently_with_bound():
+    files = {f"f{i}.py": f"print({i})".encode() for i in range(10)}
+    fake = GitHubFake(files)
+    async with make_client(fake, max_concurrency=3) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True, strategy="per_file")
+
+    assert {f.path: f.content for f in tree.files} == {p: d.decode() for p, d in files.items()}
+    assert 1 < fake.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_archive_strategy_reads_tarball():
+    files = {"a.py": b"x = 1", "docs/b.md": b"# B"}
+    fake = GitHubFake(files)
+    async with make_client(fake) as client:
+        tree = await client.get_repo_tree(
+            "o", "r", file_patterns=["*.py"], fetch_content=True, strategy="archive"
+        )
+
+    assert [(f.path, f.content) for f in tree.files] == [("a.py", "x = 1")]
+    assert fake.calls == ["/repos/o/r/tarball/main"]
+
+
+@pytest.mark.asyncio
+async def test_archive_follows_codeload_redirect_on_supplied_client():
+    files = {"a.py": b"x = 1"}
+    fake = GitHubFake(files)
+
+    async def handler(request):
+        if request.url.host == "api.github.com" and request.url.path.endswith("/tarball/main"):
+            fake.calls.append(request.url.path)
+            return httpx.Response(302, headers={"Location": "https://codeload.github.com/o/r/legacy.tar.gz/main"})
+        if request.url.host == "codeload.github.com":
+            assert "authorization" not in request.headers
+            return httpx.Response(200, content=tarball(files))
+        return await fake(request)
+
+    async with make_client(handler) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True, strategy="archive")
+
+    assert [(f.path, f.content) for f in tree.files] == [("a.py", "x = 1")]
+
+
+@pytest.mark.asyncio
+async def test_auto_strategy_switches_to_archive_for_large_trees():
+    files = {f"f{i}.py": f"v = {i}".encode() for i in range(ARCHIVE_AUTO_MIN_FILES + 1)}
+    fake = GitHubFake(files)
+    async with make_client(fake) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True, strategy="auto")
+
+    assert all(f.content is not None for f in tree.files)
+    assert not any("/contents/" in call for call in fake.calls)
+
+
+@pytest.mark.asyncio
+async def test_default_strategy_fetches_per_file_for_large_trees():
+    files = {f"f{i}.py": f"v = {i}".encode() for i in range(ARCHIVE_AUTO_MIN_FILES + 1)}
+    fake = GitHubFake(files)
+    async with make_client(fake) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True)
+
+    assert all(f.content is not None for f in tree.files)
+    assert not any(call.endswith("/tarball/main") for call in fake.calls)
+
+
+@pytest.mark.asyncio
+async def test_blob_store_shared_with_sync_layer(tmp_path):
+    files = {"a.py": b"cached"}
+    store = BlobStore(tmp_path)
+    store.put(git_blob_sha(b"cached"), b"cached")
+    fake = GitHubFake(files)
+    async with make_client(fake, blob_store=store) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True, strategy="per_file")
+
+    assert tree.files[0].content == "cached"
+    assert not any("/contents/" in call for call in fake.calls)
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_status_then_succeeds():
+    attempts = []
+
+    def handler(request):
+        attempts.append(request)
+        if len(attempts) < 3:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"tree": []})
+
+    async with make_client(handler) as client:
+        assert await client.list_repo_files("o", "r") == []
+    assert len(attempts) == 3
+
+
+@pytest.mark.asyncio
+async def test_connect_errors_are_wrapped_after_retries():
+    def handler(request):
+        raise httpx.ConnectError("boom", request=request)
+
+    async with make_client(handler) as client:
+        with pytest.raises(GitHubClientError):
+            await client.list_repo_files("o", "r")
+
+
+@pytest.mark.parametrize("failure", [
+    lambda request: (_ for _ in ()).throw(httpx.ReadTimeout("slow", request=request)),
+    lambda request: httpx.Response(503),
+    lambda request: httpx.Response(429),  # No Retry-After
+])
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_are_not_resent_after_they_may_have_applied(failure):
+    attempts = []
+
+    def handler(request):
+        attempts.append(request.method)
+        return failure(request)
+
+    async with make_client(handler) as client:
+        with pytest.raises(GitHubClientError):
+            await client.create_issue("o", "r", {"title": "t"})
+    assert attempts == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_non_idempotent_requests_retry_connect_errors_and_throttling():
+    attempts = []
+    created = httpx.Response(201, json={
+        "number": 7, "html_url": "https://github.com/o/r/issues/7", "title": "t", "state": "open",
+    })
+
+    def handler(request):
+        attempts.append(request.method)
+        if len(attempts) == 1:
+            raise httpx.ConnectError("refused", request=request)
+        if len(attempts) == 2:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return created
+
+    async with make_client(handler) as client:
+        issue = await client.create_issue("o", "r", {"title": "t"})
+    assert issue.number == 7
+    assert attempts == ["POST", "POST", "POST"]
+
+
+@pytest.mark.asyncio
+async def test_auto_strategy_falls_back_to_per_file_fetches_when_archive_fails():
+    files = {f"f{i}.py": f"v = {i}".encode() for i in range(ARCHIVE_AUTO_MIN_FILES + 1)}
+    fake = GitHubFake(files)
+
+    async def handler(request):
+        if request.url.path.endswith("/tarball/main"):
+            return httpx.Response(502)
+        return await fake(request)
+
+    async with make_client(handler) as client:
+        tree = await client.get_repo_tree("o", "r", fetch_content=True, strategy="auto")
+
+    assert all(f.content == files[f.path].decode() for f in tree.files)
+    assert sum("/contents/" in call for call in fake.calls) == len(files)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_and_auth_errors_map_like_sync_client():
+    def rate_limited(request):
+        return httpx.Response(403, text="API rate limit exceeded", headers={"X-RateLimit-Reset": "0"})
+
+    async with make_client(rate_limited) as client:
+        with pytest.raises(GitHubRateLimitError):
+            await client.list_repo_files("o", "r")
+
+    async with make_client(lambda request: httpx.Response(401, text="Bad credentials")) as client:
+        with pytest.raises(GitHubAuthError):
+            await client.list_repo_files("o", "r")
+
+
+@pytest.mark.asyncio
+async def test_create_issue_requires_token():
+    client = AsyncGitHubClient(token=None, http_client=httpx.AsyncClient())
+    client.token = None
+    with pytest.raises(GitHubAuthError):
+        await client.create_issue("o", "r", {"title": "t"})
+    await client._client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_create_issue_posts_payload():
+    def handler(request):
+        assert request.method == "POST"
+        return httpx.Response(201, json={
+            "number": 7,
+            "html_url": "https://github.com/o/r/issues/7",
+            "title": "t",
+            "state": "open",
+        })
+
+    async with make_client(handler) as client:
+        issue = await client.create_issue("o", "r", {"title": "t"})
+    assert issue.number == 7
+
+
+@pytest.mark.asyncio
+async def test_gather_limited_preserves_order():
+    async def value(i):
+        await asyncio.sleep(0.001 * (5 - i))
+        return i
+
+    assert await gather_limited((value(i) for i in range(5)), 2) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_iter_repo_files_walks_truncated_tree():
+    trees = {
+        ("main", True): {"truncated": True, "tree": []},
+        ("main", False): {"tree": [
+            {"path": "a.py", "type": "blob", "size": 1, "sha": "a"},
+            {"path": "src", "type": "tree", "sha": "t-src"},
+            {"path": "venv", "type": "tree", "sha": "t-venv"},
+        ]},
+        ("t-src", True): {"tree": [{"path": "pkg/b.py", "type": "blob", "size": 2, "sha": "b"}]},
+    }
+    requested = []
+
+    def handler(request):
+        key = (request.url.path.rsplit("/", 1)[1], request.url.params.get("recursive") == "1")
+        requested.append(key)
+        return httpx.Response(200, json=trees[key])
+
+    async with make_client(handler) as client:
+        paths = [f.path async for f in client.iter_repo_files("o", "r", exclude_patterns=["venv/*"])]
+
+    assert paths == ["a.py", "src/pkg/b.py"]
+    assert ("t-venv", True) not in requested
@@ -0,0 +1,123 @@
+"""
+Test Content-Addressed Blob Store
+
+Tests the local blob cache used by the GitHub client: sharded layout,
+compression codecs, integrity checks, and LRU eviction by total bytes.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.tools.blob_store import BlobStore, git_blob_sha, get_default_blob_store
+
+
+def make_blob(text: str):
+    """Return (sha, bytes) for a text blob."""
+    data = text.encode()
+    return git_blob_sha(data), data
+
+
+class TestGitBlobSha:
+    """Test git_blob_sha() matches git's object hashing"""
+
+    def test_matches_git_hash_object(self):
+        """Test empty and simple blobs hash like `git hash-object`"""
+        assert git_blob_sha(b"") == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+        assert git_blob_sha(b"hello\n") == "ce013625030ba8dba906f756967f9e9ca394464a"
+
+
+class TestBlobStore:
+    """Test BlobStore get/put and eviction"""
+
+    @pytest.mark.parametrize("compression", ["none", "gzip"])
+    def test_round_trip_sharded(self, tmp_path, compression):
+        """Test stored blobs round-trip and land in a two-char shard"""
+        store = BlobStore(tmp_path, compression=compression)
+        sha, data = make_blob("print('hello')\n" * 50)
+
+        assert store.put(sha, data) is True
+        assert sha in store
+        assert store.get(sha) == data
+        assert (tmp_path / sha[:2]).is_dir()
+
+    def test_rejects_mismatched_sha(self, tmp_path):
+        """Test content that does not hash to the key is not stored"""
+        store = BlobStore(tmp_path)
+        sha, _ = make_blob("original")
+
+        assert store.put(sha, b"tampered") is False
+        assert store.get(sha) is None
+
+    def test_miss_counts(self, tmp_path):
+        """Test hits and misses are tracked"""
+        store = BlobStore(tmp_path)
+        sha, data = make_blob("x")
+        store.get(sha)
+        store.put(sha, data)
+        store.get(sha)
+
+        stats = store.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_zstd_blob_without_zstandard_is_a_miss(self, tmp_path, monkeypatch):
+        """Test a .zst blob written by another process is skipped, not an error"""
+        sha, _ = make_blob("compressed elsewhere")
+        shard = tmp_path / sha[:2]
+        shard.mkdir()
+        (shard / (sha[2:] + ".zst")).write_bytes(b"\x28\xb5\x2f\xfd not really zstd")
+        monkeypatch.setattr("agents.tools.blob_store.zstandard", None)
+
+        store = BlobStore(tmp_path, compression="gzip")
+        assert store.get(sha) is None
+        assert (store.stats()["hits"], store.stats()["misses"]) == (0, 1)
+        assert (shard / (sha[2:] + ".zst")).exists()
+
+    def test_index_survives_restart(self, tmp_path):
+        """Test a new store instance sees blobs written by an earlier one"""
+        sha, data = make_blob("persisted")
+        BlobStore(tmp_path, compression="gzip").put(sha, data)
+
+        reopened = BlobStore(tmp_path, compression="none")
+        assert reopened.get(sha) == data
+        assert reopened.total_bytes > 0
+
+    def test_lru_eviction_by_total_bytes(self, tmp_path):
+        """Test least recently used blobs are evicted past max_bytes"""
+        store = BlobStore(tmp_path, max_bytes=250, compression="none")
+        blobs = [make_blob(ch * 100) for ch in "abc"]
+
+        store.put(*blobs[0])
+        store.put(*blobs[1])
+        store.get(blobs[0][0])  # a is now more recent than b
+        store.put(*blobs[2])
+
+        assert blobs[0][0] in store
+        assert blobs[1][0] not in store
+        assert blobs[2][0] in store
+        assert store.total_bytes <= 250
+        assert not (tmp_path / blobs[1][0][:2] / blobs[1][0][2:]).exists()
+
+    def test_unknown_compression(self, tmp_path):
+        """Test unknown codecs are rejected"""
+        with pytest.raises(ValueError):
+            BlobStore(tmp_path, compression="brotli")
+
+
+class TestGetDefaultBlobStore:
+    """Test get_default_blob_store() environment configuration"""
+
+    def test_disabled_without_env(self, monkeypatch):
+        """Test no store is created when GITHUB_BLOB_STORE_DIR is unset"""
+        monkeypatch.delenv("GITHUB_BLOB_STORE_DIR", raising=False)
+        assert get_default_blob_store() is None
+
+    def test_shared_instance(self, monkeypatch, tmp_path):
+        """Test the same store is returned for the same directory"""
+        monkeypatch.setenv("GITHUB_BLOB_STORE_DIR", str(tmp_path))
+        assert get_default_blob_store() is get_default_blob_store()
@@ -0,0 +1,128 @@
+"""
+Unit tests for single-flight coalescing of identical gateway calls.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from agent_engine_client import AgentEngineResponse  # noqa: E402
+from coalescing import SingleFlight, canonical_request_key  # noqa: E402
+
+
+def test_canonical_key_ignores_dict_order():
+    a = canonical_request_key(agent_role="bob", prompt="hi", context={"x": 1, "y": [1, 2]})
+    b = canonical_request_key(prompt="hi", context={"y": [1, 2], "x": 1}, agent_role="bob")
+    assert a == b
+    assert a != canonical_request_key(agent_role="bob", prompt="hi!", context={"x": 1, "y": [1, 2]})
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_share_one_call():
+    flight = SingleFlight(enabled=True)
+    calls = []
+
+    async def upstream():
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return "answer"
+
+    results = await asyncio.gather(*(flight.run("k", upstream) for _ in range(5)))
+
+    assert [value for value, _ in results] == ["answer"] * 5
+    assert [shared for _, shared in results].count(False) == 1
+    assert len(calls) == 1
+    assert flight.stats() == {"enabled": True, "in_flight": 0, "upstream_calls": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_completed_calls_are_not_reused():
+    flight = SingleFlight(enabled=True)
+    calls = []
+
+    async def upstream():
+        calls.append(1)
+        return len(calls)
+
+    assert (await flight.run("k", upstream))[0] == 1
+    assert (await flight.run("k", upstream))[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_propagate_to_every_caller():
+    flight = SingleFlight(enabled=True)
+
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*(flight.run("k", upstream) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_cancel_followers():
+    flight = SingleFlight(enabled=True)
+
+    async def upstream():
+        await asyncio.sleep(0.02)
+        return "answer"
+
+    leader = asyncio.ensure_future(flight.run("k", upstream))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.run("k", upstream))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == ("answer", True)
+
+
+@pytest.mark.asyncio
+async def test_a2a_run_coalesces_sessionless_calls_only():
+    calls = []
+
+    async def fake_call_agent_engine(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.02)
+        return AgentEngineResponse(
+            response="done",
+            metadata={"correlation_id": kwargs["correlation_id"]},
+        )
+
+    transport = httpx.ASGITransport(app=main.app)
+    with patch.object(main, "coalescer", SingleFlight(enabled=True)), \
+            patch.object(agent_engine_client, "call_agent_engine", fake_call_agent_engine):
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            body = {"agent_role": "bob", "prompt": "status?", "context": {"a": 1}}
+            responses = await asyncio.gather(*(
+                client.post("/a2a/run", json={**body, "correlation_id": f"c{i}"}) for i in range(3)
+            ))
+            await asyncio.gather(*(
+                client.post("/a2a/run", json={**body, "session_id": "s1"}) for _ in range(2)
+            ))
+            health = (await client.get("/health")).json()
+
+    results = [r.json() for r in responses]
+    assert len(calls) == 1 + 2  # Sessionless burst coalesced; session calls not
+    assert [r["correlation_id"] for r in results] == ["c0", "c1", "c2"]
+    assert sorted(r["metadata"]["correlation_id"] for r in results) == ["c0", "c1", "c2"]
+    assert sum("coalesced_with" in r["metadata"] for r in results) == 2
+    assert health["coalescing"]["coalesced"] == 2
@@ -0,0 +1,183 @@
+"""
+Unit tests for the local bare-mirror git backend.
+
+Runs entirely against fixture repositories created in tmp_path.
+"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from agents.config.repos import RegistrySettings
+from agents.tools.blob_store import BlobStore, git_blob_sha
+from agents.tools.git_mirror import (
+    CatFileBatch,
+    GitMirrorClient,
+    GitMirrorError,
+    get_repo_client,
+)
+from agents.tools.github_client import GitHubClient, RepoTree
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def git(cwd, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd, check=True, capture_output=True
+    )
+
+
+def commit_files(work, files, message="update"):
+    for path, data in files.items():
+        target = work / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+    git(work, "add", "-A")
+    git(work, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def upstream(tmp_path):
+    """Fixture repo at {tmp}/remotes/acme/widgets with a main branch."""
+    work = tmp_path / "remotes" / "acme" / "widgets"
+    work.mkdir(parents=True)
+    git(work, "init", "-q", "-b", "main")
+    commit_files(work, {
+        "app.py": b"print('hi')\n",
+        "docs/guide.md": b"# Guide\n",
+        "venv/lib.py": b"vendored\n",
+        "logo.png": b"\x89PNG",
+    }, "initial")
+    return work
+
+
+@pytest.fixture
+def client(tmp_path, upstream):
+    template = str(tmp_path / "remotes" / "{owner}" / "{repo}")
+    with GitMirrorClient(tmp_path / "mirrors", url_template=template, refresh_interval=0) as mirror:
+        yield mirror
+
+
+def test_list_repo_files_matches_api_shape(client):
+    files = client.list_repo_files(
+        "acme", "widgets", file_patterns=["*.py", "*.md"], exclude_patterns=["venv/*"]
+    )
+    assert sorted(f.path for f in files) == ["app.py", "docs/guide.md"]
+    app = next(f for f in files if f.path == "app.py")
+    assert app.type == "file"
+    assert app.size == len(b"print('hi')\n")
+    assert app.sha == git_blob_sha(b"print('hi')\n")
+
+
+def test_get_repo_tree_with_content(client):
+    tree = client.get_repo_tree("acme", "widgets", file_patterns=["*.py"], fetch_content=True)
+    assert isinstance(tree, RepoTree)
+    assert {f.path: f.content for f in tree.files} == {
+        "app.py": "print('hi')\n",
+        "venv/lib.py": "vendored\n",
+    }
+
+
+def test_total_size_budget(client):
+    tree = client.get_repo_tree("acme", "widgets", max_total_size=15)
+    assert tree.total_size <= 15
+    assert len(tree.files) < 4
+
+
+def test_get_file_content_by_path_and_sha(client):
+    assert client.get_file_content("acme", "widgets", "docs/guide.md") == "# Guide\n"
+    sha = git_blob_sha(b"# Guide\n")
+    assert client.get_blob_content("acme", "widgets", sha) == "# Guide\n"
+    with pytest.raises(GitMirrorError):
+        client.get_file_content("acme", "widgets", "missing.py")
+
+
+def test_incremental_fetch_picks_up_new_commits(client, upstream):
+    assert client.get_file_content("acme", "widgets", "app.py") == "print('hi')\n"
+    commit_files(upstream, {"app.py": b"print('bye')\n", "new.py": b"x = 1\n"})
+
+    assert client.get_file_content("acme", "widgets", "app.py") == "print('bye')\n"
+    assert "new.py" in {f.path for f in client.list_repo_files("acme", "widgets")}
+
+
+def test_refresh_interval_skips_fetch(tmp_path, upstream):
+    template = str(tmp_path / "remotes" / "{owner}" / "{repo}")
+    with GitMirrorClient(tmp_path / "mirrors", url_template=template, refresh_interval=3600) as mirror:
+        mirror.list_repo_files("acme", "widgets")
+        commit_files(upstream, {"new.py": b"x = 1\n"})
+        assert "new.py" not in {f.path for f in mirror.list_repo_files("acme", "widgets")}
+
+        mirror.ensure_mirror("acme", "widgets", force=True)
+        assert "new.py" in {f.path for f in mirror.list_repo_files("acme", "widgets")}
+
+
+def test_missing_remote_raises(tmp_path):
+    with GitMirrorClient(tmp_path / "mirrors", url_template=str(tmp_path / "{owner}" / "{repo}")) as mirror:
+        with pytest.raises(GitMirrorError):
+            mirror.list_repo_files("nobody", "nothing")
+
+
+def test_cat_file_batch_reuses_one_process(client):
+    client.ensure_mirror("acme", "widgets")
+    reader = client._reader("acme", "widgets")
+    reader.read("main:app.py")
+    process = reader._process
+    assert reader.read("main:docs/guide.md")[1] == "blob"
+    assert reader._process is process
+    assert reader.read("main:nope") is None
+
+
+def test_cat_file_batch_missing_path_with_spaces(client):
+    client.ensure_mirror("acme", "widgets")
+    reader = client._reader("acme", "widgets")
+    assert reader.read("main:no such.py") is None
+    process = reader._process
+    assert reader.read("main:still no such file.py") is None
+    assert reader.read("main:app.py")[2] == b"print('hi')\n"
+    assert reader._process is process
+
+
+def test_token_is_passed_through_the_environment(tmp_path, monkeypatch):
+    runs = []
+
+    def fake_run(command, **kwargs):
+        runs.append((command, kwargs["env"]))
+        return subprocess.CompletedProcess(command, 0, stdout=b"", stderr=b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    mirror = GitMirrorClient(tmp_path / "mirrors", token="ghp_secret")
+    mirror._git("fetch", "origin", remote=True)
+
+    ((command, env),) = runs
+    assert not any("ghp_secret" in arg or "extraHeader" in arg for arg in command)
+    assert env["GIT_CONFIG_COUNT"] == "2"
+    assert env["GIT_CONFIG_KEY_1"] == "http.extraHeader"
+    assert env["GIT_CONFIG_VALUE_1"].startswith("Authorization: Basic ")
+
+
+def test_cat_file_batch_restarts_after_close(client):
+    path = client.ensure_mirror("acme", "widgets")
+    reader = CatFileBatch(path)
+    assert reader.read("main:app.py")[2] == b"print('hi')\n"
+    reader.close()
+    assert reader.read("main:app.py")[2] == b"print('hi')\n"
+    reader.close()
+
+
+def test_populates_blob_store(tmp_path, upstream):
+    store = BlobStore(tmp_path / "blobs")
+    template = str(tmp_path / "remotes" / "{owner}" / "{repo}")
+    with GitMirrorClient(tmp_path / "mirrors", url_template=template, blob_store=store) as mirror:
+        mirror.get_repo_tree("acme", "widgets", file_patterns=["app.py"], fetch_content=True)
+    assert git_blob_sha(b"print('hi')\n") in store
+
+
+def test_get_repo_client_selects_backend(tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_MIRROR_DIR", str(tmp_path / "mirrors"))
+    assert isinstance(get_repo_client(RegistrySettings()), GitHubClient)
+    assert isinstance(get_repo_client(RegistrySettings(repo_backend="git_mirror")), GitMirrorClient)
+    with pytest.raises(ValueError):
+        get_repo_client(RegistrySettings(repo_backend="svn"))
@@ -0,0 +1,118 @@
+"""
+Unit tests for the A2A gateway's shared upstream HTTP pool.
+
+Uses httpx.MockTransport - no network access required.
+"""
+
+import os
+import sys
+
+import httpx
+import pytest
+import pytest_asyncio
+
+# Gateway modules import each other by file name; import the pool the same
+# way so tests see the module state agent_engine_client uses
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+import http_pool  # noqa: E402
+from http_pool import (  # noqa: E402
+    PoolConfig,
+    close_shared_client,
+    get_shared_client,
+    pool_stats,
+    route_timeout,
+    start_shared_client,
+    upstream_client,
+)
+
+
+def ok_transport():
+    return httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+
+
+@pytest_asyncio.fixture
+async def reset_pool():
+    yield
+    await close_shared_client()
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("GATEWAY_HTTP2", "false")
+    monkeypatch.setenv("GATEWAY_POOL_MAX_CONNECTIONS", "12")
+    monkeypatch.setenv("GATEWAY_POOL_MAX_KEEPALIVE", "4")
+    monkeypatch.setenv("GATEWAY_POOL_KEEPALIVE_EXPIRY", "15")
+
+    config = PoolConfig.from_env()
+    assert config == PoolConfig(
+        http2=False, max_connections=12, max_keepalive_connections=4, keepalive_expiry=15.0
+    )
+
+
+def test_route_timeout_uses_env_override(monkeypatch):
+    monkeypatch.setenv("GATEWAY_TIMEOUT_A2A_RUN", "90")
+    monkeypatch.setenv("GATEWAY_CONNECT_TIMEOUT", "2")
+
+    timeout = route_timeout("a2a_run", 45.0)
+    assert timeout.read == 90.0
+    assert timeout.connect == 2.0
+    assert route_timeout("query").read == 30.0
+    assert route_timeout("query", 10.0).read == 10.0
+
+
+@pytest.mark.asyncio
+async def test_start_is_idempotent_and_close_resets(reset_pool):
+    client = await start_shared_client(PoolConfig(http2=False), transport=ok_transport())
+    assert await start_shared_client() is client
+    assert get_shared_client() is client
+
+    await close_shared_client()
+    assert get_shared_client() is None
+    assert client.is_closed
+    await close_shared_client()  # Safe to call twice
+
+
+@pytest.mark.asyncio
+async def test_upstream_client_reuses_shared_client(reset_pool):
+    shared = await start_shared_client(PoolConfig(http2=False), transport=ok_transport())
+
+    async with upstream_client(5.0) as first:
+        response = await first.post("https://engine.test/query", json={})
+    async with upstream_client(5.0) as second:
+        pass
+
+    assert first is second is shared
+    assert response.json() == {"ok": True}
+    assert not shared.is_closed
+
+
+@pytest.mark.asyncio
+async def test_upstream_client_falls_back_outside_lifespan(reset_pool):
+    async with upstream_client(5.0) as client:
+        assert client is not get_shared_client()
+        assert client.timeout.read == 5.0
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_reports_config_and_connections(reset_pool):
+    assert pool_stats() == {"status": "not_started"}
+
+    await start_shared_client(PoolConfig(http2=False, max_connections=10))
+    stats = pool_stats()
+    assert stats["status"] == "ok"
+    assert stats["http2"] is False
+    assert stats["max_connections"] == 10
+    assert stats["connections"] == 0
+    assert stats["utilization"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_without_h2(reset_pool, monkeypatch):
+    monkeypatch.setattr(http_pool, "http2_available", lambda: False)
+    await start_shared_client(PoolConfig(http2=True))
+    assert pool_stats()["http2"] is False
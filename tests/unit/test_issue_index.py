@@ -0,0 +1,224 @@
+"""
+Unit tests for finding fingerprints, the open issue index, and
+deduplicated batch issue creation.
+"""
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+AGENTS_DIR = Path(__file__).parent.parent.parent / "agents"
+sys.path.insert(0, str(AGENTS_DIR))
+sys.path.insert(0, str(AGENTS_DIR / "iam_issue"))
+
+# The repo-root tools/ directory can be imported first as a namespace
+# package by other tests; make `tools` resolve to agents/tools
+if "tools" in sys.modules and getattr(sys.modules["tools"], "__file__", None) is None:
+    del sys.modules["tools"]
+
+import github_issue_adapter as adapter  # noqa: E402
+from config.github_features import GitHubMode  # noqa: E402
+from shared_contracts import IssueSpec, IssueType, Severity  # noqa: E402
+from tools.github_client import CreatedIssue  # noqa: E402
+from tools.issue_index import (  # noqa: E402
+    IndexedIssue,
+    OpenIssueIndex,
+    finding_fingerprint,
+    normalize_title,
+    parse_fingerprint,
+    stamp_fingerprint,
+)
+
+
+def make_issue(title="Missing docstring in 3 functions", description="Add docstrings", **kwargs):
+    return IssueSpec(
+        id=kwargs.pop("id", "ISS-1"),
+        type=IssueType.MISSING_DOC,
+        severity=Severity.LOW,
+        title=title,
+        description=description,
+        file_path=kwargs.pop("file_path", "agents/bob/agent.py"),
+        **kwargs
+    )
+
+
+def issue_item(number, body):
+    return {"number": number, "html_url": f"https://github.com/o/r/issues/{number}", "body": body}
+
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+def test_normalize_title_ignores_case_punctuation_and_numbers():
+    assert normalize_title("Missing docstring (3 functions)") == normalize_title("missing  docstring: 4 functions")
+
+
+def test_fingerprint_depends_on_repo_rule_and_file():
+    base = finding_fingerprint("o/r", "R1", "a.py", "Title")
+    assert base == finding_fingerprint("O/R", "R1", "a.py", "title")
+    assert base != finding_fingerprint("o/other", "R1", "a.py", "Title")
+    assert base != finding_fingerprint("o/r", "R2", "a.py", "Title")
+    assert base != finding_fingerprint("o/r", "R1", "b.py", "Title")
+
+
+def test_stamp_and_parse_round_trip():
+    fp, ch = "a" * 64, "b" * 64
+    body = stamp_fingerprint("## Body", fp, ch)
+    assert parse_fingerprint(body) == (fp, ch)
+    assert parse_fingerprint("no marker") is None
+    assert parse_fingerprint(None) is None
+
+
+def test_issue_body_fingerprint_is_stable_across_runs():
+    first = adapter.format_issue_body(make_issue(id="ISS-1"), "o/r")
+    second = adapter.format_issue_body(make_issue(id="ISS-2"), "o/r")
+    assert first != second  # Issue ID and timestamp differ
+    assert parse_fingerprint(first) == parse_fingerprint(second)
+    assert parse_fingerprint(adapter.format_issue_body(make_issue())) is None
+
+
+# ============================================================================
+# INDEX
+# ============================================================================
+
+def test_index_lists_pages_and_reuses_etags(tmp_path):
+    fp1, fp2 = "1" * 64, "2" * 64
+    client = MagicMock()
+    client.get_issues_page.side_effect = [
+        ([issue_item(1, stamp_fingerprint("x", fp1, "c" * 64)), issue_item(5, "human issue")], '"e1"', True),
+        ([issue_item(2, stamp_fingerprint("y", fp2, "d" * 64))], '"e2"', False),
+    ]
+
+    index = OpenIssueIndex.load(client, "o", "r", cache_dir=tmp_path)
+    assert len(index) == 2
+    assert index.get(fp1).number == 1
+    assert index.pages_fetched == 2
+
+    # Next run: both pages unchanged (304), served from the cache
+    client.get_issues_page.side_effect = [(None, '"e1"', False), (None, '"e2"', False)]
+    index = OpenIssueIndex.load(client, "o", "r", cache_dir=tmp_path)
+    assert index.get(fp2).number == 2
+    assert index.pages_not_modified == 2
+    etags = [call.kwargs["etag"] for call in client.get_issues_page.call_args_list[2:]]
+    assert etags == ['"e1"', '"e2"']
+
+
+def test_index_refreshes_changed_page(tmp_path):
+    fp1 = "1" * 64
+    client = MagicMock()
+    client.get_issues_page.return_value = ([issue_item(1, stamp_fingerprint("x", fp1, "c" * 64))], '"e1"', False)
+    OpenIssueIndex.load(client, "o", "r", cache_dir=tmp_path)
+
+    # Issue closed: page changed, new listing is empty
+    client.get_issues_page.return_value = ([], '"e2"', False)
+    index = OpenIssueIndex.load(client, "o", "r", cache_dir=tmp_path)
+    assert fp1 not in index
+
+
+def test_index_ignores_corrupt_cache(tmp_path):
+    OpenIssueIndex.cache_path("o", "r", tmp_path).write_text("{not json")
+    client = MagicMock()
+    client.get_issues_page.return_value = ([], '"e"', False)
+    assert len(OpenIssueIndex.load(client, "o", "r", cache_dir=tmp_path)) == 0
+    assert client.get_issues_page.call_args.kwargs["etag"] is None
+
+
+# ============================================================================
+# DEDUPLICATED BATCH CREATION
+# ============================================================================
+
+@pytest.fixture
+def dry_run():
+    with patch.object(adapter, "get_github_mode", return_value=GitHubMode.DRY_RUN):
+        yield
+
+
+@pytest.fixture
+def github():
+    """REAL mode against a mocked GitHubClient."""
+    client = MagicMock(token="fake_token")
+    client.create_issue.side_effect = lambda owner, repo, payload: CreatedIssue(
+        number=100, html_url="https://github.com/o/r/issues/100", title=payload["title"], state="open"
+    )
+    with patch.object(adapter, "get_github_mode", return_value=GitHubMode.REAL), \
+            patch.object(adapter, "GitHubClient", return_value=client):
+        yield client
+
+
+def index_with(issue, content_hash=None):
+    index = OpenIssueIndex("o", "r")
+    index.add(adapter.issue_fingerprint(issue, "o/r"), IndexedIssue(
+        number=42,
+        html_url="https://github.com/o/r/issues/42",
+        content_hash=content_hash or adapter.issue_content_hash(issue)
+    ))
+    return index
+
+
+def test_batch_skips_already_filed_findings(github):
+    issue = make_issue()
+    with patch.object(adapter, "load_open_issue_index", return_value=index_with(issue)) as load:
+        results = adapter.batch_create_github_issues([issue, make_issue(title="New finding")], "repo", "o", "r")
+
+    assert [r.action for r in results] == ["skipped", "created"]
+    assert [r.issue_number for r in results] == [42, 100]
+    assert load.call_args.kwargs["client"] is github
+    github.create_issue.assert_called_once()
+
+
+def test_batch_updates_changed_findings(github):
+    issue = make_issue()
+    stale = index_with(issue, content_hash="0" * 64)
+    with patch.object(adapter, "load_open_issue_index", return_value=stale):
+        [result] = adapter.batch_create_github_issues([issue], "repo", "o", "r")
+    with patch.object(adapter, "load_open_issue_index", return_value=index_with(issue, content_hash="0" * 64)):
+        [skipped] = adapter.batch_create_github_issues([issue], "repo", "o", "r", update_existing=False)
+
+    assert result.action == "updated"
+    assert result.issue_number == 42
+    owner, repo, number, update = github.update_issue.call_args.args
+    assert (owner, repo, number, set(update)) == ("o", "r", 42, {"title", "body"})
+    assert skipped.action == "skipped"
+    github.create_issue.assert_not_called()
+
+
+def test_batch_skips_duplicates_within_batch(dry_run):
+    results = adapter.batch_create_github_issues(
+        [make_issue(id="A"), make_issue(id="B", title="missing docstring in 7 functions")],
+        "repo", "o", "r"
+    )
+    assert [r.action for r in results] == ["created", "skipped"]
+
+
+def test_batch_dry_run_does_not_list_issues(dry_run):
+    with patch.object(adapter, "load_open_issue_index") as load, \
+            patch.object(adapter, "GitHubClient") as client:
+        [result] = adapter.batch_create_github_issues([make_issue()], "repo", "o", "r")
+    load.assert_not_called()
+    client.assert_not_called()
+    assert (result.mode, result.action) == ("dry_run", "created")
+
+
+def test_batch_proceeds_without_index_when_listing_fails(github):
+    with patch.object(adapter.OpenIssueIndex, "load", side_effect=adapter.GitHubClientError("boom")):
+        [result] = adapter.batch_create_github_issues([make_issue()], "repo", "o", "r")
+    assert (result.action, result.issue_number) == ("created", 100)
+
+
+def test_create_failure_is_reported(github):
+    github.create_issue.side_effect = adapter.GitHubClientError("Server error")
+    with patch.object(adapter, "load_open_issue_index", return_value=None):
+        [result] = adapter.batch_create_github_issues([make_issue()], "repo", "o", "r")
+    assert not result.success
+    assert result.error == "Server error"
+
+
+def test_batch_disabled_mode_does_not_list_issues():
+    with patch.object(adapter, "get_github_mode", return_value=GitHubMode.DISABLED), \
+            patch.object(adapter, "load_open_issue_index") as load:
+        [result] = adapter.batch_create_github_issues([make_issue()], "repo", "o", "r")
+    load.assert_not_called()
+    assert result.mode == "disabled"
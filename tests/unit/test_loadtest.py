@@ -0,0 +1,118 @@
+"""
+Unit tests for the offline load-test harness (service/loadtest).
+
+The fake Agent Engine is exercised through httpx.ASGITransport; no
+subprocesses or sockets are started.
+"""
+
+import json
+import random
+
+import httpx
+import pytest
+
+from service.loadtest.fake_engine import FakeEngineConfig, LatencyModel, create_app
+from service.loadtest.harness import compare_results
+from service.loadtest.loadgen import TARGETS, LoadResult, Target, percentile, run_load
+from service.loadtest.servers import engine_query_url
+
+QUERY_PATH = engine_query_url("").lstrip("/")
+
+
+async def no_sleep(seconds):
+    return None
+
+
+def engine_client(**config):
+    app = create_app(FakeEngineConfig(seed=7, **config), sleep=no_sleep)
+    transport = httpx.ASGITransport(app=app)
+    return app, httpx.AsyncClient(transport=transport, base_url="http://engine")
+
+
+def test_latency_model_parsing_and_sampling():
+    rng = random.Random(1)
+    assert LatencyModel.parse("fixed:0.1").sample(rng) == 0.1
+    assert 0.05 <= LatencyModel.parse("uniform:0.05,0.3").sample(rng) <= 0.3
+
+    lognormal = LatencyModel.parse("lognormal:0.2,1.5")
+    samples = sorted(lognormal.sample(rng) for _ in range(5000))
+    assert percentile(samples, 50) == pytest.approx(0.2, rel=0.1)
+    assert percentile(samples, 99) == pytest.approx(1.5, rel=0.25)
+    assert str(lognormal) == "lognormal:0.2,1.5"
+
+    for bad in ("gamma:1", "uniform:0.1", "lognormal:2,1"):
+        with pytest.raises(ValueError):
+            LatencyModel.parse(bad)
+
+
+@pytest.mark.asyncio
+async def test_fake_engine_query_stream_and_slack():
+    app, client = engine_client(stream_chunks=3, response_bytes=30)
+    async with client:
+        query = await client.post(f"/{QUERY_PATH}", json={"query": "hi", "session_id": "s1"})
+        stream = await client.post(f"/{QUERY_PATH.replace(':query', ':streamQuery')}?alt=sse", json={"query": "hi"})
+        posted = await client.post("/api/chat.postMessage", json={"channel": "C1", "text": "Sorry, failed"})
+        stats = (await client.get("/fake/stats")).json()
+
+    assert query.json()["output"].startswith("echo: hi")
+    assert query.json()["session_id"] == "s1"
+    events = [json.loads(line[len("data: "):]) for line in stream.text.splitlines() if line.startswith("data: ")]
+    assert [e["content"]["parts"][0]["text"][:3] for e in events] == ["[0]", "[1]", "[2]"]
+    assert posted.json()["ok"] is True
+    assert stats["queries"] == 1 and stats["streams"] == 1
+    assert stats["slack_posts"] == 1 and stats["slack_error_replies"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fake_engine_injects_errors():
+    app, client = engine_client(error_rate=1.0, error_statuses=(503,))
+    async with client:
+        response = await client.post(f"/{QUERY_PATH}", json={"query": "hi"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert app.state.stats.errors == {"503": 1}
+
+
+@pytest.mark.asyncio
+async def test_run_load_counts_requests_and_errors():
+    target = Target("engine", "engine", f"/{QUERY_PATH}", TARGETS["query"].build)
+
+    _, client = engine_client()
+    async with client:
+        ok = await run_load(client, target, rps=200, duration=0.1)
+    _, client = engine_client(error_rate=1.0, error_statuses=(500,))
+    async with client:
+        failing = await run_load(client, target, rps=200, duration=0.1)
+
+    summary = ok.summary()
+    assert summary["requests"] == 20
+    assert summary["ok"] == 20
+    assert summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"]
+    assert failing.summary()["errors"] == {"http_500": 20}
+    assert failing.summary()["error_rate"] == 1.0
+
+
+def test_summary_percentiles():
+    result = LoadResult(target="t", rps=10, duration=1, latencies=[i / 1000 for i in range(1, 101)], sent=100)
+    result.elapsed = 2.0
+
+    summary = result.summary()
+
+    assert summary["latency_ms"] == {"p50": 50.0, "p95": 95.0, "p99": 99.0, "max": 100.0, "mean": 50.5}
+    assert summary["throughput_rps"] == 50.0
+
+
+def test_compare_flags_regressions():
+    def results(p99, rps):
+        return {"targets": {"a2a_run": {
+            "latency_ms": {"p50": 50.0, "p95": 90.0, "p99": p99},
+            "throughput_rps": rps,
+            "error_rate": 0.0,
+        }}}
+
+    report = compare_results(results(100.0, 20.0), results(150.0, 15.0), threshold=0.1)
+
+    assert report["targets"]["a2a_run"]["p99_ms"]["change"] == 0.5
+    assert report["regressions"] == ["a2a_run.p99_ms", "a2a_run.throughput_rps"]
+    assert compare_results(results(100.0, 20.0), results(105.0, 20.0))["regressions"] == []
@@ -0,0 +1,172 @@
+"""
+Unit tests for the Prometheus metrics shared by the gateway services.
+
+Covers the text exposition format, the per-observation cost, and the
+/metrics endpoints of the A2A gateway and the Slack webhook (through
+httpx.ASGITransport - no collector required).
+"""
+
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SERVICE_DIR = os.path.join(REPO_ROOT, "service")
+GATEWAY_DIR = os.path.join(SERVICE_DIR, "a2a_gateway")
+sys.path.insert(0, SERVICE_DIR)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from agent_engine_client import AgentEngineResponse  # noqa: E402
+from common.metrics import CONTENT_TYPE, MetricsRegistry, classify_error, parse_metrics  # noqa: E402
+
+
+def test_render_counter_gauge_histogram():
+    registry = MetricsRegistry(namespace="test")
+    requests = registry.counter("requests_total", "Requests", ["route"])
+    in_flight = registry.gauge("in_flight", "In flight")
+    latency = registry.histogram("latency_seconds", "Latency", ["route"], buckets=(0.1, 1.0))
+
+    requests.labels("/a2a/run").inc()
+    requests.labels("/a2a/run").inc(2)
+    in_flight.set(3)
+    latency.labels("/a2a/run").observe(0.05)
+    latency.labels("/a2a/run").observe(0.5)
+    latency.labels("/a2a/run").observe(5.0)
+
+    text = registry.render()
+    assert "# TYPE test_requests_total counter" in text
+    assert "# TYPE test_latency_seconds histogram" in text
+
+    samples = parse_metrics(text)
+    assert samples['test_requests_total{route="/a2a/run"}'] == 3
+    assert samples["test_in_flight"] == 3
+    # Buckets are cumulative and end with +Inf
+    assert samples['test_latency_seconds_bucket{route="/a2a/run",le="0.1"}'] == 1
+    assert samples['test_latency_seconds_bucket{route="/a2a/run",le="1"}'] == 2
+    assert samples['test_latency_seconds_bucket{route="/a2a/run",le="+Inf"}'] == 3
+    assert samples['test_latency_seconds_count{route="/a2a/run"}'] == 3
+    assert samples['test_latency_seconds_sum{route="/a2a/run"}'] == pytest.approx(5.55)
+
+
+def test_label_values_are_escaped_and_validated():
+    registry = MetricsRegistry()
+    counter = registry.counter("errors_total", "Errors", ["reason"])
+    counter.labels('bad "quote"\nline').inc()
+
+    assert 'errors_total{reason="bad \\"quote\\"\\nline"} 1' in registry.render()
+    with pytest.raises(ValueError):
+        counter.labels("a", "b")
+    with pytest.raises(ValueError):
+        registry.counter("errors_total", "Duplicate")
+
+
+def test_failing_callback_does_not_break_scrape():
+    registry = MetricsRegistry()
+    registry.counter("ok_total", "Fine").inc()
+
+    def broken():
+        raise RuntimeError("pool gone")
+
+    registry.register_callback("broken", "Broken", broken)
+    registry.register_callback("depth", "Depth", lambda: [({"queue": "a"}, 2), ({"queue": "b"}, None)])
+
+    text = registry.render()
+    samples = parse_metrics(text)
+    assert samples["ok_total"] == 1
+    assert samples['depth{queue="a"}'] == 2
+    assert 'depth{queue="b"}' not in samples
+    assert "broken unavailable: pool gone" in text
+
+
+def test_classify_error():
+    request = httpx.Request("POST", "https://example.test")
+    assert classify_error(status_code=429) == "http_429"
+    assert classify_error(status_code=404) == "http_4xx"
+    assert classify_error(status_code=503) == "http_5xx"
+    assert classify_error(httpx.ReadTimeout("slow", request=request)) == "timeout"
+    assert classify_error(httpx.ConnectError("refused", request=request)) == "connect"
+    assert classify_error(ValueError("bad json")) == "other"
+
+
+def test_observation_cost_is_microseconds():
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ["route", "method"])
+    requests = registry.counter("requests_total", "Requests", ["route", "method", "status"])
+
+    iterations = 20000
+    started = time.perf_counter()
+    for i in range(iterations):
+        latency.labels("/a2a/run", "POST").observe(i * 1e-4)
+        requests.labels("/a2a/run", "POST", "200").inc()
+    per_request = (time.perf_counter() - started) / iterations
+
+    # A few microseconds in practice; generous bound for slow CI machines
+    assert per_request < 50e-6
+
+
+@pytest.mark.asyncio
+async def test_gateway_metrics_endpoint():
+    result = AgentEngineResponse(
+        response="pong",
+        session_id="s-1",
+        metadata={"agent_role": "bob", "correlation_id": "c-1"},
+    )
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        with patch.object(agent_engine_client, "call_agent_engine", AsyncMock(return_value=result)):
+            before = parse_metrics((await client.get("/metrics")).text)
+            run = await client.post("/a2a/run", json={"agent_role": "bob", "prompt": "ping"})
+            assert run.status_code == 200
+            await client.get("/health")
+            await client.get("/no-such-route")
+
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    samples = parse_metrics(response.text)
+
+    def delta(key):
+        return samples.get(key, 0) - before.get(key, 0)
+
+    assert delta('gateway_http_requests_total{route="/a2a/run",method="POST",status="200"}') == 1
+    assert delta('gateway_http_requests_total{route="/health",method="GET",status="200"}') == 1
+    assert delta('gateway_http_requests_total{route="unmatched",method="GET",status="404"}') == 1
+    assert delta('gateway_http_request_duration_seconds_count{route="/a2a/run",method="POST"}') == 1
+    assert delta('gateway_a2a_calls_total{route="/a2a/run",agent_role="bob",outcome="ok"}') == 1
+    assert samples['gateway_a2a_calls_in_flight{route="/a2a/run",agent_role="bob"}'] == 0
+    # /metrics itself is not counted
+    assert not any('route="/metrics"' in key for key in samples)
+    # Scrape-time gauges from admission control and the token cache
+    assert samples['gateway_admission{value="limit"}'] == main.admission.limit
+    assert 'gateway_token_refreshes_total{result="success"}' in samples
+
+
+@pytest.mark.asyncio
+async def test_slack_webhook_metrics_endpoint(monkeypatch, load_slack_webhook):
+    monkeypatch.delenv("SLACK_BOB_ENABLED", raising=False)
+    webhook = load_slack_webhook()
+
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        challenge = await client.post(
+            "/slack/events", json={"type": "url_verification", "challenge": "abc"}
+        )
+        assert challenge.json() == {"challenge": "abc"}
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    samples = parse_metrics(response.text)
+    assert samples['slack_webhook_http_requests_total{route="/slack/events",method="POST",status="200"}'] >= 1
+    assert samples['slack_webhook_events_total{event_type="url_verification",outcome="handled"}'] >= 1
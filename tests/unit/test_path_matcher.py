@@ -0,0 +1,80 @@
+"""
+Test Precompiled Path Matcher
+
+Tests that PathMatcher selects exactly the paths fnmatch would, across
+its fast paths and regex fallback, and that matchers are reused.
+"""
+
+import fnmatch
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from agents.tools.path_matcher import PathMatcher, get_path_matcher
+
+
+PATHS = [
+    "README.md",
+    "agents/bob/agent.py",
+    "agents/bob/__pycache__/agent.cpython-312.pyc",
+    "__pycache__/root.pyc",
+    "node_modules/pkg/index.js",
+    "web/node_modules/pkg/index.js",
+    "config/repos.yaml",
+    "docs/guide.MD",
+    "setup.cfg",
+    ".venv/lib/site.py",
+    "data/file[1].json",
+    "Makefile",
+]
+
+PATTERN_CASES = [
+    (["*.py", "*.md"], ["*.pyc", "__pycache__/*", "node_modules/*"]),
+    (["*.yaml", "*.yml", "Makefile"], []),
+    ([], ["*__pycache__*", ".venv/*"]),
+    (["agents/*/agent.py", "data/file?1?.json"], None),
+    (["*"], ["docs/*"]),
+    (["*.[jy]*"], ["web/*"]),
+]
+
+
+def fnmatch_selects(path, include, exclude):
+    """Reference implementation: the original per-pattern fnmatch loop."""
+    if include and not any(fnmatch.fnmatch(path, p) for p in include):
+        return False
+    if exclude and any(fnmatch.fnmatch(path, p) for p in exclude):
+        return False
+    return True
+
+
+class TestPathMatcher:
+    """Test PathMatcher.matches() against fnmatch semantics"""
+
+    @pytest.mark.parametrize("include,exclude", PATTERN_CASES)
+    def test_equivalent_to_fnmatch(self, include, exclude):
+        """Test every fast path agrees with fnmatch"""
+        matcher = PathMatcher(include, exclude)
+        for path in PATHS:
+            assert matcher.matches(path) == fnmatch_selects(path, include, exclude), path
+
+    def test_no_patterns_selects_everything(self):
+        """Test an empty matcher selects all paths"""
+        matcher = PathMatcher()
+        assert all(matcher(path) for path in PATHS)
+
+    def test_excludes_dir_only_when_fully_excluded(self):
+        """Test directory pruning is conservative"""
+        matcher = PathMatcher(["*.py"], ["node_modules/*", "*__pycache__*", "*.pyc"])
+        assert matcher.excludes_dir("node_modules")
+        assert matcher.excludes_dir("agents/__pycache__")
+        assert not matcher.excludes_dir("web/node_modules")
+        assert not matcher.excludes_dir("agents")
+
+    def test_get_path_matcher_is_cached(self):
+        """Test matchers for the same patterns are reused"""
+        assert get_path_matcher(["*.py"], ["venv/*"]) is get_path_matcher(("*.py",), ("venv/*",))
+        assert get_path_matcher(["*.py"]) is not get_path_matcher(["*.md"])
@@ -0,0 +1,207 @@
+"""
+Unit tests for Agent Engine retries and hedging (resilience.py).
+
+Attempts are fake send() coroutines returning httpx.Response objects, so
+no upstream is involved; sleeps are kept to tens of milliseconds.
+"""
+
+import asyncio
+import os
+import sys
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+from resilience import ResiliencePolicy, UpstreamResilience, retry_reason  # noqa: E402
+
+REQUEST = httpx.Request("POST", "https://engine.test/v1/reasoningEngines/1:query")
+
+
+def response(status_code, headers=None):
+    return httpx.Response(status_code, headers=headers, request=REQUEST)
+
+
+def make_resilience(**policy):
+    policy.setdefault("retry_base_delay", 0.01)
+    policy.setdefault("retry_max_delay", 0.02)
+    return UpstreamResilience(ResiliencePolicy(**policy), rng=lambda: 0.5)
+
+
+class ScriptedSend:
+    """send() that plays back (delay, outcome) steps, one per attempt."""
+
+    def __init__(self, steps):
+        self.steps = list(steps)
+        self.started = 0
+        self.cancelled = 0
+        self.timeouts = []
+
+    async def __call__(self, remaining):
+        index = self.started
+        self.started += 1
+        self.timeouts.append(remaining)
+        delay, outcome = self.steps[min(index, len(self.steps) - 1)]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome, index
+
+
+def test_retry_reason_classification():
+    assert retry_reason(error=httpx.ConnectError("refused", request=REQUEST)) == "connect"
+    assert retry_reason(error=httpx.ConnectTimeout("slow", request=REQUEST)) == "connect"
+    assert retry_reason(error=httpx.ReadTimeout("slow", request=REQUEST)) is None
+    assert retry_reason(response(429)) == "http_429"
+    assert retry_reason(response(503)) == "http_503"
+    assert retry_reason(response(500)) is None
+    assert retry_reason(response(200)) is None
+
+
+@pytest.mark.asyncio
+async def test_retries_connect_errors_and_503_until_success():
+    resilience = make_resilience(max_attempts=3)
+    send = ScriptedSend([
+        (0, httpx.ConnectError("refused", request=REQUEST)),
+        (0, response(503)),
+        (0, response(200)),
+    ])
+
+    result, attempt = await resilience.execute("bob", send, timeout=5)
+
+    assert result.status_code == 200
+    assert attempt == 2
+    assert resilience.stats()["retries"] == {"connect": 1, "http_503": 1}
+    assert resilience.stats()["retry_rate"] == 2.0
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded_and_surface_last_outcome():
+    resilience = make_resilience(max_attempts=2)
+    send = ScriptedSend([(0, response(429))])
+
+    result, _ = await resilience.execute("bob", send, timeout=5)
+
+    assert result.status_code == 429
+    assert send.started == 2
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_raised_immediately():
+    resilience = make_resilience(max_attempts=3)
+    send = ScriptedSend([(0, httpx.ReadTimeout("slow", request=REQUEST))])
+
+    with pytest.raises(httpx.ReadTimeout):
+        await resilience.execute("bob", send, timeout=5)
+    assert send.started == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_longer_than_deadline_is_not_waited_out():
+    resilience = make_resilience(max_attempts=3)
+    send = ScriptedSend([(0, response(429, {"Retry-After": "30"}))])
+
+    result, _ = await resilience.execute("bob", send, timeout=1)
+
+    assert result.status_code == 429
+    assert send.started == 1
+
+
+class FakeClock:
+    """Clock and sleep that only advance when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.now += seconds
+
+
+@pytest.mark.asyncio
+async def test_attempts_share_the_deadline():
+    clock = FakeClock()
+    resilience = UpstreamResilience(
+        ResiliencePolicy(max_attempts=5, retry_base_delay=0.01, retry_max_delay=0.02),
+        rng=lambda: 0.5, clock=clock, sleep=clock.sleep,
+    )
+
+    async def send(remaining):
+        timeouts.append(remaining)
+        clock.now += 0.3  # Each attempt takes 0.3s and gets a 503
+        return response(503), len(timeouts)
+
+    timeouts = []
+    result, attempt = await resilience.execute("bob", send, timeout=1.0)
+
+    # Backoffs of 0.005s then 0.01s; each attempt only gets what is left
+    assert timeouts == pytest.approx([1.0, 0.695, 0.385, 0.075])
+    # Retries ran out of deadline before max_attempts: the last 503 is returned
+    assert (result.status_code, attempt) == (503, 4)
+    assert clock.now == pytest.approx(1.225)
+
+
+def test_hedge_delay_tracks_the_latency_quantile():
+    resilience = make_resilience(hedge_min_samples=10, hedge_min_delay=0.0, hedge_quantile=0.9)
+    for i in range(9):
+        resilience.record_latency("bob", 0.1 * (i + 1))
+    assert resilience.hedge_delay("bob") is None  # Not enough samples yet
+
+    resilience.record_latency("bob", 1.0)
+    assert resilience.hedge_delay("bob") == pytest.approx(0.9)
+    assert resilience.hedge_delay("iam-adk") is None
+
+
+@pytest.mark.asyncio
+async def test_hedge_wins_and_cancels_the_slow_attempt():
+    resilience = make_resilience(
+        hedge_roles=frozenset({"bob"}), hedge_min_samples=1, hedge_min_delay=0.0, hedge_budget=1.0
+    )
+    resilience.record_latency("bob", 0.02)
+    send = ScriptedSend([(1.0, response(200)), (0, response(200))])
+
+    result, attempt = await resilience.execute("bob", send, timeout=5, hedge=True)
+    await asyncio.sleep(0)
+
+    assert attempt == 1  # The hedge answered first
+    assert send.cancelled == 1
+    stats = resilience.stats()
+    assert stats["hedged"] == 1
+    assert stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_no_hedge_for_unlisted_roles_or_when_not_requested():
+    resilience = make_resilience(hedge_roles=frozenset({"iam-adk"}), hedge_min_samples=1, hedge_min_delay=0.0)
+    resilience.record_latency("bob", 0.001)
+    resilience.record_latency("iam-adk", 0.001)
+
+    await resilience.execute("bob", ScriptedSend([(0.02, response(200))]), timeout=5, hedge=True)
+    await resilience.execute("iam-adk", ScriptedSend([(0.02, response(200))]), timeout=5, hedge=False)
+
+    assert resilience.stats()["hedged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_budget_limits_hedges():
+    resilience = make_resilience(
+        hedge_roles=frozenset({"*"}), hedge_min_samples=1, hedge_min_delay=0.0, hedge_budget=0.0
+    )
+    resilience.record_latency("bob", 0.001)
+
+    for _ in range(3):
+        await resilience.execute("bob", ScriptedSend([(0.01, response(200))]), timeout=5, hedge=True)
+
+    assert resilience.stats()["hedged"] == 1  # Only the up-front allowance
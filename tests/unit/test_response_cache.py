@@ -0,0 +1,177 @@
+"""
+Unit tests for the A2A gateway's sessionless response cache.
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import agent_engine_client  # noqa: E402
+import main  # noqa: E402
+from agent_engine_client import AgentEngineResponse  # noqa: E402
+from response_cache import (  # noqa: E402
+    InProcessStore,
+    ResponseCache,
+    SQLiteStore,
+    parse_role_ttls,
+    response_cache_key,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_store(request, tmp_path):
+    def factory(max_bytes=1024, clock=None):
+        clock = clock or FakeClock()
+        if request.param == "memory":
+            return InProcessStore(max_bytes=max_bytes, clock=clock)
+        return SQLiteStore(str(tmp_path / "cache.sqlite3"), max_bytes=max_bytes, clock=clock)
+    return factory
+
+
+def test_key_normalizes_prompt_and_context_order():
+    key = response_cache_key("bob", "What is  ADK?", {"a": 1, "b": 2})
+    assert key == response_cache_key("bob", "what is adk?  ", {"b": 2, "a": 1})
+    assert key != response_cache_key("foreman", "What is ADK?", {"a": 1, "b": 2})
+    assert key != response_cache_key("bob", "What is ADK?", {"a": 2, "b": 2})
+
+
+def test_parse_role_ttls():
+    assert parse_role_ttls("bob=300, iam-adk=900") == {"bob": 300.0, "iam-adk": 900.0}
+    assert parse_role_ttls("") == {}
+    with pytest.raises(ValueError):
+        parse_role_ttls("bob")
+
+
+def test_store_expires_entries(make_store):
+    clock = FakeClock()
+    store = make_store(clock=clock)
+    store.set("k", b"value", ttl=60)
+
+    assert store.get("k") == (b"value", 1000.0)
+    clock.now += 61
+    assert store.get("k") is None
+
+
+def test_store_evicts_least_recently_used_by_bytes(make_store):
+    clock = FakeClock()
+    store = make_store(max_bytes=10, clock=clock)
+    store.set("a", b"aaaa", ttl=60)
+    clock.now += 1
+    store.set("b", b"bbbb", ttl=60)
+    clock.now += 1
+    store.get("a")  # a is now more recent than b
+    clock.now += 1
+    store.set("c", b"cccc", ttl=60)
+
+    assert store.get("b") is None
+    assert store.get("a") is not None
+    assert store.get("c") is not None
+    assert store.stats()["bytes"] == 8
+    assert store.stats()["evictions"] == 1
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "shared.sqlite3")
+    SQLiteStore(path).set("k", b"shared", ttl=60)
+    assert SQLiteStore(path).get("k")[0] == b"shared"
+
+
+@pytest.mark.asyncio
+async def test_cache_lookup_respects_roles_and_sessions():
+    clock = FakeClock()
+    cache = ResponseCache(InProcessStore(clock=clock), {"bob": 300, "iam-issue": 0}, clock=clock)
+
+    status, key, _ = await cache.lookup("bob", "q", None, None, None)
+    assert status == "MISS"
+    await cache.put(key, "bob", {"response": "a"})
+    clock.now += 5
+
+    status, _, hit = await cache.lookup("bob", "Q", None, None, None)
+    assert status == "HIT"
+    assert hit.result == {"response": "a"}
+    assert hit.age == 5
+
+    assert (await cache.lookup("bob", "q", None, None, "session-1"))[0] == "BYPASS"
+    assert (await cache.lookup("iam-issue", "q", None, None, None))[0] == "BYPASS"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["bypassed"] == 2
+
+
+@pytest.mark.asyncio
+async def test_a2a_run_serves_repeats_from_cache(tmp_path):
+    calls = []
+
+    async def fake_call_agent_engine(**kwargs):
+        calls.append(kwargs)
+        return AgentEngineResponse(
+            response=f"answer for {kwargs['prompt']}",
+            metadata={"correlation_id": kwargs["correlation_id"], "spiffe_id": "spiffe://bob"},
+        )
+
+    cache = ResponseCache(SQLiteStore(str(tmp_path / "cache.sqlite3")), {"bob": 300})
+    transport = httpx.ASGITransport(app=main.app)
+    with patch.object(main, "response_cache", cache), \
+            patch.object(agent_engine_client, "call_agent_engine", fake_call_agent_engine):
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            first = await client.post("/a2a/run", json={"agent_role": "bob", "prompt": "What is ADK?"})
+            second = await client.post(
+                "/a2a/run", json={"agent_role": "bob", "prompt": "what is adk?", "correlation_id": "c2"}
+            )
+            session = await client.post(
+                "/a2a/run", json={"agent_role": "bob", "prompt": "What is ADK?", "session_id": "s1"}
+            )
+
+    assert len(calls) == 2
+    assert first.headers["x-cache"] == "MISS"
+    assert second.headers["x-cache"] == "HIT"
+    assert "age" in second.headers
+    assert session.headers["x-cache"] == "BYPASS"
+
+    hit = second.json()
+    assert hit["response"] == "answer for What is ADK?"
+    assert hit["correlation_id"] == "c2"
+    assert hit["metadata"]["correlation_id"] == "c2"
+    assert hit["metadata"]["cache"] == "hit"
+    assert hit["target_spiffe_id"] == "spiffe://bob"
+
+
+@pytest.mark.asyncio
+async def test_a2a_run_does_not_cache_errors():
+    calls = []
+
+    async def failing_call_agent_engine(**kwargs):
+        calls.append(kwargs)
+        return AgentEngineResponse(response="", error="Agent Engine HTTP error: 503")
+
+    cache = ResponseCache(InProcessStore(), {"bob": 300})
+    transport = httpx.ASGITransport(app=main.app)
+    with patch.object(main, "response_cache", cache), \
+            patch.object(agent_engine_client, "call_agent_engine", failing_call_agent_engine):
+        async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+            for _ in range(2):
+                response = await client.post("/a2a/run", json={"agent_role": "bob", "prompt": "q"})
+                assert response.headers["x-cache"] == "MISS"
+
+    assert len(calls) == 2
@@ -0,0 +1,140 @@
+"""
+Unit tests for the A2A gateway's agent routing table (routing.py).
+
+Covers the startup snapshot, per-call lookups, reload (function and
+admin endpoint) and isolation from environment changes between reloads.
+"""
+
+import os
+import sys
+
+import httpx
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+# main.py requires these at import time
+os.environ.setdefault("PROJECT_ID", "test-project")
+os.environ.setdefault("LOCATION", "us-central1")
+os.environ.setdefault("AGENT_ENGINE_ID", "test-engine")
+
+import main  # noqa: E402
+import routing  # noqa: E402
+from agents.config.agent_engine import build_agent_config  # noqa: E402
+from routing import RoutingTable  # noqa: E402
+
+
+@pytest.fixture
+def engine_env(monkeypatch):
+    monkeypatch.setenv("DEPLOYMENT_ENV", "dev")
+    monkeypatch.setenv("PROJECT_ID", "test-project")
+    monkeypatch.setenv("LOCATION", "us-central1")
+    monkeypatch.delenv("GCP_PROJECT_ID", raising=False)
+    monkeypatch.delenv("VERTEX_LOCATION", raising=False)
+    monkeypatch.setenv("AGENT_ENGINE_BOB_DEV", "bob-dev-1")
+    monkeypatch.setenv("AGENT_ENGINE_IAM_ADK_PROD", "adk-prod-1")
+    monkeypatch.setattr(routing, "_table", None)
+    yield monkeypatch
+    routing._table = None
+
+
+def test_build_snapshots_configured_roles(engine_env):
+    table = RoutingTable.build()
+
+    route = table.lookup("bob")
+    assert route.env == "dev"
+    assert route.config == build_agent_config("bob", "dev")
+    assert route.spiffe_id == "spiffe://intent.solutions/agent/bobs-brain/dev/us-central1/0.9.0"
+    assert route.url == (
+        "https://us-central1-aiplatform.googleapis.com/v1/projects/test-project/"
+        "locations/us-central1/reasoningEngines/bob-dev-1:query"
+    )
+    assert route.stream_url.endswith("reasoningEngines/bob-dev-1:streamQuery?alt=sse")
+
+    assert table.lookup("iam-adk") is None  # Only configured in prod
+    assert table.lookup("iam-adk", "prod").config.reasoning_engine_id == "adk-prod-1"
+    roles = table.stats()["roles"]
+    assert roles["dev"] == ["bob"]
+    assert "iam-adk" in roles["prod"]
+    assert "staging" not in roles
+
+
+def test_extra_roles_from_env(engine_env):
+    engine_env.setenv("GATEWAY_ROUTING_ROLES", "iam-docs, iam-adk")
+    engine_env.setenv("AGENT_ENGINE_IAM_DOCS_DEV", "docs-dev-1")
+
+    table = RoutingTable.build()
+
+    assert table.lookup("iam-docs").config.reasoning_engine_id == "docs-dev-1"
+    # Known roles listed again are not routed twice
+    assert table.stats()["roles"]["prod"].count("iam-adk") == 1
+
+
+def test_unlisted_role_with_engine_env_still_routes(engine_env):
+    engine_env.setenv("AGENT_ENGINE_IAM_DOC_DEV", "doc-dev-1")
+    table = RoutingTable.build()
+
+    route = table.lookup("iam-doc")
+    assert route.config.reasoning_engine_id == "doc-dev-1"
+    assert table.lookup("iam-doc") is route  # Cached in the table
+    assert "iam-doc" in table.stats()["roles"]["dev"]
+    assert table.lookup("iam-cleanup") is None  # No engine configured
+
+    # Explicit tables do not fall back to the environment
+    assert RoutingTable.from_configs({}).lookup("iam-doc") is None
+
+
+def test_builder_errors_skip_only_that_route(engine_env):
+    def builder(role, env):
+        if role == "broken":
+            raise ValueError("Required environment variable not set: PROJECT_ID")
+        return build_agent_config(role, env)
+
+    table = RoutingTable.build(roles=["broken", "bob"], envs=["dev"], builder=builder)
+
+    assert table.lookup("broken") is None
+    assert table.lookup("bob") is not None
+
+
+def test_table_is_immutable_until_reloaded(engine_env):
+    table = routing.get_routing_table()
+    assert routing.get_routing_table() is table
+
+    # Environment changes do not leak into the snapshot...
+    engine_env.setenv("AGENT_ENGINE_BOB_DEV", "bob-dev-2")
+    assert routing.get_routing_table().lookup("bob").config.reasoning_engine_id == "bob-dev-1"
+    with pytest.raises(TypeError):
+        table._routes[("dev", "foreman")] = None
+
+    # ...until an explicit reload swaps in a new table
+    reloaded = routing.reload_routing_table()
+    assert reloaded.version == table.version + 1
+    assert routing.get_routing_table().lookup("bob").config.reasoning_engine_id == "bob-dev-2"
+    assert table.lookup("bob").config.reasoning_engine_id == "bob-dev-1"
+
+
+@pytest.mark.asyncio
+async def test_admin_reload_endpoint(engine_env):
+    routing.get_routing_table()
+    engine_env.setenv("AGENT_ENGINE_FOREMAN_DEV", "foreman-dev-1")
+
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        engine_env.delenv("GATEWAY_ADMIN_TOKEN", raising=False)
+        disabled = await client.post("/admin/routing/reload")
+
+        engine_env.setenv("GATEWAY_ADMIN_TOKEN", "s3cret")
+        wrong = await client.post("/admin/routing/reload", headers={"Authorization": "Bearer nope"})
+        ok = await client.post("/admin/routing/reload", headers={"Authorization": "Bearer s3cret"})
+
+    assert disabled.status_code == 403
+    assert wrong.status_code == 403
+    assert ok.status_code == 200
+    body = ok.json()
+    assert body["version"] == body["previous_version"] + 1
+    assert "foreman" in body["roles"]["dev"]
+    assert routing.get_routing_table().lookup("foreman") is not None
@@ -0,0 +1,173 @@
+"""
+Unit tests for Slack event deduplication (event_dedup.py).
+
+Covers both stores (TTL, release, bounds, SQLite persistence) and the
+webhook's handling of Slack retries and duplicate deliveries.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from event_dedup import EventDeduplicator, InProcessDedupStore, SQLiteDedupStore
+from event_queue import EventQueueConfig, SlackEventQueue
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store_factory(request, tmp_path):
+    clock = Clock()
+
+    def make():
+        if request.param == "memory":
+            return InProcessDedupStore(clock=clock)
+        return SQLiteDedupStore(str(tmp_path / "dedup.sqlite3"), clock=clock)
+
+    return make, clock
+
+
+def test_claim_is_exclusive_until_ttl_or_release(store_factory):
+    make, clock = store_factory
+    store = make()
+
+    assert store.claim(["event:E1", "msg:M1"], ttl=60)
+    assert not store.claim(["event:E1"], ttl=60)  # Slack retry
+    assert not store.claim(["event:E2", "msg:M1"], ttl=60)  # Same message, other subscription
+    assert store.claim(["event:E3"], ttl=60)
+
+    store.release(["event:E3"])
+    assert store.claim(["event:E3"], ttl=60)
+
+    clock.now += 61
+    assert store.claim(["event:E1", "msg:M1"], ttl=60)
+
+
+def test_sqlite_claims_survive_restarts_and_are_shared(tmp_path):
+    path = str(tmp_path / "dedup.sqlite3")
+    SQLiteDedupStore(path).claim(["event:E1"], ttl=60)
+
+    # A new process (or a second worker) opening the same file sees the claim
+    assert not SQLiteDedupStore(path).claim(["event:E1"], ttl=60)
+    assert SQLiteDedupStore(path).stats()["entries"] == 1
+
+
+def test_memory_store_is_bounded():
+    store = InProcessDedupStore(max_entries=2)
+    for i in range(3):
+        assert store.claim([f"event:E{i}"], ttl=60)
+
+    assert store.stats()["entries"] == 2
+    assert store.stats()["evictions"] == 1
+    assert store.claim(["event:E0"], ttl=60)  # Oldest was evicted
+
+
+@pytest.mark.asyncio
+async def test_deduplicator_counts_and_passes_unkeyed_events():
+    dedup = EventDeduplicator(InProcessDedupStore(), ttl=60)
+
+    assert await dedup.claim("E1", "M1")
+    assert not await dedup.claim("E1")
+    assert await dedup.claim(None, None)
+    assert await dedup.claim(None, None)
+    await dedup.release("E1", "M1")
+    assert await dedup.claim("E1")
+
+    stats = dedup.stats()
+    assert (stats["claimed"], stats["duplicates"], stats["released"], stats["unkeyed"]) == (2, 1, 1, 2)
+
+
+def mention(event_id, client_msg_id="M1", text="hello"):
+    return {
+        "type": "event_callback",
+        "event_id": event_id,
+        "event": {
+            "type": "app_mention",
+            "user": "U1",
+            "channel": "C1",
+            "ts": "1.5",
+            "client_msg_id": client_msg_id,
+            "text": f"<@U07NRCYJX8A> {text}",
+        },
+    }
+
+
+@pytest.fixture
+def webhook(monkeypatch, load_slack_webhook):
+    monkeypatch.delenv("SLACK_BOB_ENABLED", raising=False)
+    monkeypatch.delenv("SLACK_DEDUP_BACKEND", raising=False)
+    module = load_slack_webhook()
+    module.calls = []
+    module.posted = []
+
+    async def fake_agent(query, session_id):
+        module.calls.append(query)
+        return f"answer to {query}"
+
+    async def fake_post(channel, text, thread_ts=None, **callbacks):
+        module.posted.append(text)
+
+    monkeypatch.setattr(module, "query_agent_engine", fake_agent)
+    monkeypatch.setattr(module, "post_slack_message", fake_post)
+    return module
+
+
+async def post_events(webhook, *deliveries):
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        for payload, headers in deliveries:
+            response = await client.post("/slack/events", json=payload, headers=headers)
+            assert response.json() == {"ok": True}
+    await webhook.event_queue.stop(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_retries_and_duplicate_deliveries_are_processed_once(webhook):
+    await post_events(
+        webhook,
+        (mention("Ev1"), {}),
+        (mention("Ev1"), {"X-Slack-Retry-Num": "1"}),
+        (mention("Ev2", client_msg_id="M1"), {}),  # Same message via another subscription
+    )
+
+    assert webhook.calls == ["hello"]
+    assert webhook.dedup.stats()["duplicates"] == 2
+
+
+class FullQueue:
+    """Queue stand-in that rejects everything, as a full reject-policy queue does."""
+
+    def __init__(self, on_drop):
+        self.on_drop = on_drop
+
+    def submit(self, job):
+        self.on_drop(job, "queue_full")
+        return False
+
+    async def stop(self, timeout=None):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_retry_of_an_event_never_processed_goes_through(webhook, monkeypatch):
+    # First delivery hits a full queue and is rejected
+    monkeypatch.setattr(webhook, "event_queue", FullQueue(webhook.on_job_dropped))
+    await post_events(webhook, (mention("Ev1"), {}))
+    await asyncio.sleep(0.01)  # Release runs in the background
+    assert webhook.calls == []
+    assert webhook.posted == [webhook.BUSY_REPLY]
+
+    # Slack's retry is processed by a queue with room
+    monkeypatch.setattr(
+        webhook, "event_queue", SlackEventQueue(webhook.process_event, EventQueueConfig(workers=1))
+    )
+    await post_events(webhook, (mention("Ev1"), {"X-Slack-Retry-Num": "1"}))
+
+    assert webhook.calls == ["hello"]
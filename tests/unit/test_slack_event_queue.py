@@ -0,0 +1,181 @@
+"""
+Unit tests for the Slack webhook's ack-fast event queue (event_queue.py).
+
+Covers fairness, overflow policies, worker concurrency and draining, and
+that /slack/events returns before the agent call finishes.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from event_queue import EventQueueConfig, SlackEventQueue, SlackJob
+
+
+class Recorder:
+    """Handler that records jobs and can be held on a gate."""
+
+    def __init__(self, gate=None):
+        self.handled = []
+        self.active = 0
+        self.peak = 0
+        self.gate = gate
+
+    async def __call__(self, job):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            if self.gate is not None:
+                await self.gate.wait()
+            if job.text == "boom":
+                raise RuntimeError("agent exploded")
+            self.handled.append((job.user, job.text))
+        finally:
+            self.active -= 1
+
+
+def job(user, text="hi"):
+    return SlackJob(user=user, channel="C1", text=text, thread_ts="1.0")
+
+
+async def drain(queue):
+    await queue.stop(timeout=2)
+
+
+@pytest.mark.asyncio
+async def test_workers_take_users_round_robin():
+    recorder = Recorder()
+    queue = SlackEventQueue(recorder, EventQueueConfig(workers=1, max_depth=10, per_user=10))
+
+    for text in ("a1", "a2", "a3"):
+        queue.submit(job("alice", text))
+    queue.submit(job("bob", "b1"))
+    queue.submit(job("carol", "c1"))
+    await drain(queue)
+
+    # alice queued first, but goes to the back of the rotation after each job
+    assert [text for _, text in recorder.handled] == ["a1", "b1", "c1", "a2", "a3"]
+    assert queue.stats()["processed"] == 5
+
+
+@pytest.mark.asyncio
+async def test_reject_policy_enforces_depth_and_per_user_limits():
+    gate = asyncio.Event()
+    dropped = []
+    queue = SlackEventQueue(
+        Recorder(gate),
+        EventQueueConfig(workers=1, max_depth=3, per_user=2, overflow="reject"),
+        on_drop=lambda j, reason: dropped.append((j.user, reason)),
+    )
+    queue.submit(job("alice", "running"))
+    await asyncio.sleep(0)  # Worker takes it and blocks on the gate
+
+    assert queue.submit(job("alice"))
+    assert queue.submit(job("alice"))
+    assert not queue.submit(job("alice"))  # Per-user cap
+    assert queue.submit(job("bob"))
+    assert not queue.submit(job("carol"))  # Queue full
+
+    assert dropped == [("alice", "user_limit"), ("carol", "queue_full")]
+    assert queue.stats()["rejected"] == {"user_limit": 1, "queue_full": 1}
+    assert queue.stats()["depth"] == 3
+    gate.set()
+    await drain(queue)
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_evicts_from_the_heaviest_user():
+    gate = asyncio.Event()
+    recorder = Recorder(gate)
+    dropped = []
+    queue = SlackEventQueue(
+        recorder,
+        EventQueueConfig(workers=1, max_depth=3, per_user=5, overflow="drop_oldest"),
+        on_drop=lambda j, reason: dropped.append((j.text, reason)),
+    )
+    queue.submit(job("alice", "running"))
+    await asyncio.sleep(0)
+
+    for text in ("a1", "a2"):
+        queue.submit(job("alice", text))
+    queue.submit(job("bob", "b1"))
+    assert queue.submit(job("carol", "c1"))
+
+    assert dropped == [("a1", "queue_full")]
+    gate.set()
+    await drain(queue)
+    assert sorted(text for _, text in recorder.handled) == ["a2", "b1", "c1", "running"]
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_concurrency_and_handler_errors():
+    gate = asyncio.Event()
+    recorder = Recorder(gate)
+    queue = SlackEventQueue(recorder, EventQueueConfig(workers=3, max_depth=20, per_user=20))
+
+    for i in range(6):
+        queue.submit(job(f"user{i}", "boom" if i == 0 else "hi"))
+    await asyncio.sleep(0.01)
+    assert recorder.peak == 3
+    assert queue.stats()["busy"] == 3
+
+    gate.set()
+    await drain(queue)
+    stats = queue.stats()
+    assert stats["processed"] == 5
+    assert stats["failed"] == 1
+    assert stats["depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stop_refuses_new_jobs_while_draining():
+    gate = asyncio.Event()
+    queue = SlackEventQueue(Recorder(gate), EventQueueConfig(workers=1))
+    queue.submit(job("alice"))
+    await asyncio.sleep(0)
+
+    stopping = asyncio.ensure_future(queue.stop(timeout=1))
+    await asyncio.sleep(0)
+    assert not queue.submit(job("bob"))
+    gate.set()
+    await stopping
+
+    assert queue.stats()["rejected"] == {"shutting_down": 1}
+    assert queue.stats()["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slack_events_acks_before_the_agent_call(monkeypatch, load_slack_webhook):
+    monkeypatch.delenv("SLACK_BOB_ENABLED", raising=False)
+    webhook = load_slack_webhook()
+    gate = asyncio.Event()
+    posted = []
+
+    async def slow_agent(query, session_id):
+        await gate.wait()
+        return f"answer to {query}"
+
+    async def fake_post(channel, text, thread_ts=None, **callbacks):
+        posted.append((channel, text, thread_ts))
+
+    monkeypatch.setattr(webhook, "query_agent_engine", slow_agent)
+    monkeypatch.setattr(webhook, "post_slack_message", fake_post)
+
+    event = {
+        "type": "event_callback",
+        "event_id": "Ev1",
+        "event": {"type": "app_mention", "user": "U1", "channel": "C1", "ts": "1.5", "text": "<@U07NRCYJX8A> hello"},
+    }
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        response = await asyncio.wait_for(client.post("/slack/events", json=event), timeout=1)
+        health = (await client.get("/health")).json()
+
+    assert response.json() == {"ok": True}
+    assert posted == []  # Agent call still running
+    assert health["event_queue"]["enqueued"] == 1
+
+    gate.set()
+    await webhook.event_queue.stop(timeout=1)
+    assert posted == [("C1", "answer to hello", "1.5")]
@@ -0,0 +1,200 @@
+"""
+Unit tests for the durable Slack event store (event_store.py).
+
+Covers the SQLite store, re-drive bookkeeping and the webhook's
+persist-before-ack / delete-after-reply / re-drive-on-startup cycle.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from event_queue import SlackJob
+from event_store import MAX_REDRIVES, DurableEvents, SQLiteEventStore
+from slack_outbound import OutboundConfig, SlackOutbound
+
+REQUEST = httpx.Request("POST", "https://slack.test/api/chat.postMessage")
+
+
+def test_sqlite_store_keeps_events_across_instances(tmp_path):
+    path = str(tmp_path / "queue.sqlite3")
+    store = SQLiteEventStore(path)
+    store.put("j1", {"text": "first"})
+    store.put("j2", {"text": "second"})
+    store.put("j3", {"text": "third"})
+    store.delete("j2")
+
+    reopened = SQLiteEventStore(path)
+    assert reopened.pending() == [("j1", {"text": "first"}), ("j3", {"text": "third"})]
+    assert reopened.stats()["stored"] == 2
+
+
+@pytest.mark.asyncio
+async def test_redrive_counts_attempts_and_abandons_poison_events(tmp_path):
+    durable = DurableEvents(SQLiteEventStore(str(tmp_path / "queue.sqlite3")))
+    job = SlackJob(user="U1", channel="C1", text="hello", event_id="E1")
+    assert await durable.persist(job)
+
+    for attempt in range(1, MAX_REDRIVES + 1):
+        (redriven,) = await durable.redrive()
+        assert (redriven.job_id, redriven.text, redriven.redrives) == (job.job_id, "hello", attempt)
+
+    assert await durable.redrive() == []
+    assert durable.store.pending() == []
+    assert durable.stats()["abandoned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_stores_nothing():
+    durable = DurableEvents()
+    job = SlackJob(user="U1", channel="C1", text="hello")
+
+    assert not await durable.persist(job)
+    await durable.complete(job)
+    assert await durable.redrive() == []
+    assert durable.stats()["backend"] == {"backend": "memory"}
+
+
+def mention(event_id, text="hello", ts="1.5"):
+    return {
+        "type": "event_callback",
+        "event_id": event_id,
+        "event": {"type": "app_mention", "user": "U1", "channel": "C1", "ts": ts, "text": text},
+    }
+
+
+@pytest.fixture
+def durable_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("SLACK_BOB_ENABLED", raising=False)
+    monkeypatch.delenv("SLACK_DEDUP_BACKEND", raising=False)
+    monkeypatch.setenv("SLACK_QUEUE_BACKEND", "sqlite")
+    monkeypatch.setenv("SLACK_QUEUE_PATH", str(tmp_path / "queue.sqlite3"))
+
+
+@pytest.fixture
+def start_webhook(monkeypatch, load_slack_webhook):
+    """Load the webhook with a fake agent and a fake Slack API."""
+
+    def start(agent):
+        module = load_slack_webhook()
+        module.posted = []
+
+        async def send(payload):
+            module.posted.append(payload["text"])
+            return httpx.Response(200, json={"ok": True, "ts": "2.0"}, request=REQUEST)
+
+        monkeypatch.setattr(module, "query_agent_engine", agent)
+        monkeypatch.setattr(module, "outbound", SlackOutbound(send, OutboundConfig(rate=100.0, burst=10)))
+        return module
+
+    return start
+
+
+@pytest.mark.asyncio
+async def test_event_is_stored_until_its_reply_is_sent(durable_env, start_webhook):
+    release = asyncio.Event()
+
+    async def agent(query, session_id):
+        await release.wait()
+        return f"answer to {query}"
+
+    webhook = start_webhook(agent)
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        response = await client.post("/slack/events", json=mention("Ev1"))
+    assert response.json() == {"ok": True}
+    assert len(webhook.durable.store.pending()) == 1  # Stored before the ack
+
+    release.set()
+    await webhook.event_queue.stop(timeout=1)
+    await webhook.outbound.stop(timeout=1)
+    await asyncio.sleep(0.05)  # Deletion runs in the background
+
+    assert webhook.posted == ["answer to hello"]
+    assert webhook.durable.store.pending() == []
+
+
+@pytest.mark.asyncio
+async def test_events_left_by_a_stopped_webhook_are_redriven_on_startup(durable_env, start_webhook):
+    async def stuck_agent(query, session_id):
+        await asyncio.Event().wait()
+
+    first = start_webhook(stuck_agent)
+    transport = httpx.ASGITransport(app=first.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        await client.post("/slack/events", json=mention("Ev1", text="one"))
+        await client.post("/slack/events", json=mention("Ev2", text="two", ts="1.6"))
+    await first.event_queue.stop(timeout=0)  # Instance recycled mid-answer
+    assert first.posted == []
+
+    async def agent(query, session_id):
+        return f"answer to {query}"
+
+    second = start_webhook(agent)
+    async with second.lifespan(second.app):
+        for _ in range(100):
+            if len(second.posted) == 2:  # Two threads, so not merged
+                break
+            await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+
+    assert sorted(second.posted) == ["answer to one", "answer to two"]
+    assert second.durable.store.pending() == []
+    assert second.durable.stats()["redriven"] == 2
+
+
+@pytest.mark.asyncio
+async def test_event_is_completed_when_outbound_drops_its_reply(durable_env, monkeypatch, start_webhook):
+    async def agent(query, session_id):
+        return f"answer to {query}"
+
+    webhook = start_webhook(agent)
+    gate = asyncio.Event()
+
+    async def blocked_send(payload):
+        await gate.wait()
+        return httpx.Response(200, json={"ok": True}, request=REQUEST)
+
+    monkeypatch.setattr(webhook, "outbound", SlackOutbound(blocked_send, OutboundConfig(rate=100.0, max_pending=1)))
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        for i, ts in enumerate(("1.5", "1.6", "1.7")):
+            await client.post("/slack/events", json=mention(f"Ev{i}", text=str(i), ts=ts))
+            await asyncio.sleep(0.02)  # One in flight, one pending, then an overflow
+
+        await webhook.event_queue.stop(timeout=1)
+        await asyncio.sleep(0.05)
+        assert webhook.outbound.stats()["dropped"] == 1
+        assert len(webhook.durable.store.pending()) == 2  # The dropped reply's event is done
+
+        health = (await client.get("/health")).json()
+    assert health["durable"]["completed"] == 1
+
+    gate.set()
+    await webhook.outbound.stop(timeout=1)
+    await asyncio.sleep(0.05)
+    assert webhook.durable.store.pending() == []
+
+
+@pytest.mark.asyncio
+async def test_event_is_completed_when_slack_rejects_its_reply(durable_env, monkeypatch, start_webhook):
+    async def agent(query, session_id):
+        return f"answer to {query}"
+
+    webhook = start_webhook(agent)
+
+    async def rejecting_send(payload):
+        return httpx.Response(200, json={"ok": False, "error": "not_in_channel"}, request=REQUEST)
+
+    monkeypatch.setattr(webhook, "outbound", SlackOutbound(rejecting_send, OutboundConfig(rate=100.0)))
+    transport = httpx.ASGITransport(app=webhook.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://webhook") as client:
+        await client.post("/slack/events", json=mention("Ev1"))
+    await webhook.event_queue.stop(timeout=1)
+    await webhook.outbound.stop(timeout=1)
+    await asyncio.sleep(0.05)
+
+    assert webhook.outbound.stats()["failed"] == 1
+    assert webhook.durable.store.pending() == []  # Not re-driven on the next start
+    assert webhook.durable.stats()["completed"] == 1
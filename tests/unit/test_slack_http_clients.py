@@ -0,0 +1,106 @@
+"""
+Unit tests for the Slack webhook's pooled HTTP clients (http_clients.py).
+
+Uses httpx.MockTransport - no network access required.
+"""
+
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import webhook_metrics
+from common.metrics import parse_metrics
+from http_clients import (
+    PoolConfig,
+    close_clients,
+    get_client,
+    open_client,
+    pool_stats,
+    pooled_client,
+)
+
+
+@pytest_asyncio.fixture
+async def reset_clients():
+    yield
+    await close_clients()
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.setenv("SLACK_HTTP2", "false")
+    monkeypatch.setenv("SLACK_HTTP_MAX_CONNECTIONS", "12")
+    monkeypatch.setenv("SLACK_HTTP_MAX_KEEPALIVE", "4")
+    monkeypatch.setenv("SLACK_HTTP_KEEPALIVE_EXPIRY", "15")
+
+    assert PoolConfig.from_env() == PoolConfig(
+        http2=False, max_connections=12, max_keepalive_connections=4, keepalive_expiry=15.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_reuses_the_route_client(reset_clients):
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"ok": True}))
+    shared = open_client("agent", PoolConfig(http2=False), transport=transport)
+    assert open_client("agent") is shared
+
+    async with pooled_client("agent") as first:
+        response = await first.post("https://gateway.test/a2a/run", json={})
+    async with pooled_client("agent") as second:
+        pass
+    assert first is second is shared
+    assert response.json() == {"ok": True}
+
+    async with pooled_client("slack", timeout=5.0) as fallback:  # Route not open
+        assert fallback.timeout.read == 5.0
+    assert fallback.is_closed
+
+    await close_clients()
+    assert shared.is_closed
+    assert get_client("agent") is None
+    await close_clients()  # Safe to call twice
+
+
+@pytest.mark.asyncio
+async def test_pool_stats_and_metrics_are_per_route(reset_clients):
+    assert pool_stats() == {"status": "not_started"}
+
+    open_client("agent", PoolConfig(http2=False, max_connections=10))
+    open_client("slack")
+    stats = pool_stats()
+    assert (stats["status"], stats["http2"], stats["max_connections"]) == ("ok", False, 10)
+    assert stats["routes"]["agent"]["connections"] == 0
+    assert set(stats["routes"]) == {"agent", "slack"}
+
+    samples = parse_metrics(webhook_metrics.registry.render())
+    assert samples['slack_webhook_http_pool_connections{route="slack",state="idle"}'] == 0
+    assert samples['slack_webhook_http_pool_requests{route="agent"}'] == 0
+
+
+@pytest.mark.asyncio
+async def test_webhook_lifespan_shares_and_closes_its_clients(monkeypatch, reset_clients, load_slack_webhook):
+    monkeypatch.setenv("SLACK_BOB_ENABLED", "true")
+    monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+    monkeypatch.setenv("A2A_GATEWAY_URL", "http://gateway")
+    monkeypatch.setenv("SLACK_HTTP2", "false")
+    webhook = load_slack_webhook()
+    assert webhook.slack_client is None
+
+    requests = []
+
+    def gateway(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, json={"response": f"answer {len(requests)}"})
+
+    agent_client = open_client("agent", transport=httpx.MockTransport(gateway))
+    async with webhook.lifespan(webhook.app):
+        slack_client = webhook.slack_client
+        assert slack_client is get_client("slack")
+        assert slack_client.headers["Authorization"] == "Bearer xoxb-test"
+
+        assert await webhook.query_agent_engine("hi", "U1_C1") == "answer 1"
+        assert await webhook.query_agent_engine("again", "U1_C1") == "answer 2"
+        assert requests == ["/a2a/run", "/a2a/run"]
+
+    assert agent_client.is_closed and slack_client.is_closed
+    assert webhook.slack_client is None
@@ -0,0 +1,217 @@
+"""
+Unit tests for the Slack webhook's outbound dispatcher (slack_outbound.py).
+
+Covers per-channel pacing, Retry-After handling, coalescing of piled-up
+thread replies and the bounded per-channel queue. Sends are fake
+coroutines returning httpx.Response objects.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from slack_outbound import OutboundConfig, SlackOutbound, TokenBucket, retry_after
+
+REQUEST = httpx.Request("POST", "https://slack.test/api/chat.postMessage")
+
+
+def response(status_code=200, body=None, headers=None):
+    return httpx.Response(status_code, json=body or {"ok": True}, headers=headers, request=REQUEST)
+
+
+class FakeSlack:
+    """send() that records payloads and plays back scripted responses."""
+
+    def __init__(self, responses=(), gate=None):
+        self.responses = list(responses)
+        self.gate = gate
+        self.sent = []
+
+    async def __call__(self, payload):
+        if self.gate is not None:
+            await self.gate.wait()
+        self.sent.append((payload["channel"], payload["text"], payload.get("thread_ts")))
+        return self.responses.pop(0) if self.responses else response()
+
+
+def test_token_bucket_paces_and_pauses():
+    now = [0.0]
+    bucket = TokenBucket(rate=1.0, burst=2, clock=lambda: now[0])
+
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() == pytest.approx(1.0)
+
+    now[0] = 1.0
+    assert bucket.take() == 0
+
+    bucket.pause(5)
+    assert bucket.take() == pytest.approx(5.0)
+    now[0] = 6.0
+    assert bucket.take() == 0  # One token right after the pause
+    assert bucket.take() == pytest.approx(1.0)
+
+
+def test_retry_after_detects_both_rate_limit_forms():
+    assert retry_after(response(429, headers={"Retry-After": "7"})) == 7.0
+    assert retry_after(response(200, {"ok": False, "error": "ratelimited"})) == 1.0
+    assert retry_after(response(200, {"ok": False, "error": "channel_not_found"})) is None
+    assert retry_after(response(200)) is None
+
+
+@pytest.mark.asyncio
+async def test_channels_are_paced_independently():
+    slack = FakeSlack()
+    outbound = SlackOutbound(slack, OutboundConfig(rate=20.0, burst=1, merge_max_chars=0))
+
+    for i in range(3):
+        outbound.post("C1", f"c1-{i}", thread_ts=str(i))
+    outbound.post("C2", "c2-0")
+    await asyncio.sleep(0)
+
+    # Each channel's first message goes out immediately; C1's others wait
+    assert sorted(text for _, text, _ in slack.sent) == ["c1-0", "c2-0"]
+    assert outbound.pending == 2
+
+    await outbound.stop(timeout=1)
+    assert [text for channel, text, _ in slack.sent if channel == "C1"] == ["c1-0", "c1-1", "c1-2"]
+    assert outbound.stats()["sent"] == 4
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_message_is_retried_after_retry_after():
+    slack = FakeSlack([response(429, headers={"Retry-After": "0.05"})])
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, burst=5))
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    outbound.post("C1", "first", "1.0")
+    outbound.post("C1", "second", "2.0")
+    await outbound.stop(timeout=1)
+
+    assert [text for _, text, _ in slack.sent] == ["first", "first", "second"]
+    assert loop.time() - started >= 0.05
+    stats = outbound.stats()
+    assert (stats["ratelimited"], stats["sent"], stats["failed"]) == (1, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts():
+    limited = response(200, {"ok": False, "error": "ratelimited"}, headers={"Retry-After": "0"})
+    slack = FakeSlack([limited, limited])
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, max_attempts=2))
+
+    outbound.post("C1", "hello")
+    await outbound.stop(timeout=1)
+
+    assert len(slack.sent) == 2
+    assert outbound.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_piled_up_replies_to_a_thread_are_merged():
+    gate = asyncio.Event()
+    slack = FakeSlack(gate=gate)
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, burst=1, merge_max_chars=20))
+
+    outbound.post("C1", "in flight", "1.0")
+    await asyncio.sleep(0)  # Taken by the drain task, held on the gate
+    outbound.post("C1", "a", "1.0")
+    outbound.post("C1", "x", "2.0")
+    outbound.post("C1", "b", "1.0")
+    outbound.post("C1", "too long to merge!", "1.0")
+
+    assert outbound.pending == 3
+    gate.set()
+    await outbound.stop(timeout=1)
+
+    assert slack.sent == [
+        ("C1", "in flight", "1.0"),
+        ("C1", "a\n\nb", "1.0"),
+        ("C1", "x", "2.0"),
+        ("C1", "too long to merge!", "1.0"),
+    ]
+    stats = outbound.stats()
+    assert (stats["queued"], stats["merged"], stats["sent"]) == (4, 1, 5)
+
+
+@pytest.mark.asyncio
+async def test_full_channel_drops_its_oldest_message():
+    gate = asyncio.Event()
+    slack = FakeSlack(gate=gate)
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, max_pending=2, merge_max_chars=0))
+
+    outbound.post("C1", "in flight", "0")
+    await asyncio.sleep(0)
+    for i in range(1, 4):
+        outbound.post("C1", f"m{i}", str(i))
+
+    gate.set()
+    await outbound.stop(timeout=1)
+
+    assert [text for _, text, _ in slack.sent] == ["in flight", "m2", "m3"]
+    assert outbound.stats()["dropped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_top_level_messages_are_never_merged():
+    gate = asyncio.Event()
+    slack = FakeSlack(gate=gate)
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, burst=1))
+
+    outbound.post("C1", "in flight")
+    await asyncio.sleep(0)
+    outbound.post("C1", "first")
+    outbound.post("C1", "second")
+
+    gate.set()
+    await outbound.stop(timeout=1)
+
+    assert [text for _, text, _ in slack.sent] == ["in flight", "first", "second"]
+    assert outbound.stats()["merged"] == 0
+
+
+@pytest.mark.asyncio
+async def test_dropped_messages_run_their_on_dropped_callbacks():
+    gate = asyncio.Event()
+    slack = FakeSlack(gate=gate)
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, max_pending=1))
+    sent, dropped = [], []
+
+    def post(text, thread_ts):
+        outbound.post(
+            "C1", text, thread_ts,
+            on_sent=lambda: sent.append(text), on_dropped=lambda: dropped.append(text),
+        )
+
+    post("in flight", "0")
+    await asyncio.sleep(0)
+    post("a", "1")
+    post("b", "1")  # Merged into "a", so dropped along with it
+    post("c", "2")
+
+    gate.set()
+    await outbound.stop(timeout=1)
+
+    assert dropped == ["a", "b"]
+    assert sent == ["in flight", "c"]
+    assert outbound.stats()["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_messages_run_their_on_failed_callbacks():
+    slack = FakeSlack([
+        response(200, {"ok": False, "error": "not_in_channel"}),
+        response(429, headers={"Retry-After": "0"}),
+        response(429, headers={"Retry-After": "0"}),
+    ])
+    outbound = SlackOutbound(slack, OutboundConfig(rate=100.0, max_attempts=2))
+    failed = []
+
+    outbound.post("C1", "rejected", "1", on_failed=lambda: failed.append("rejected"))
+    outbound.post("C1", "throttled", "2", on_failed=lambda: failed.append("throttled"))
+    await outbound.stop(timeout=1)
+
+    assert failed == ["rejected", "throttled"]
+    assert outbound.stats()["failed"] == 2
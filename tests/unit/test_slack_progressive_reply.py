@@ -0,0 +1,223 @@
+"""
+Unit tests for progressive Slack replies (progressive_reply.py).
+
+Slack is either a recording fake or the load-test fake Slack API; the
+agent stream is a fake SSE backend in the gateway's /a2a/stream format.
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+import webhook_metrics
+from common.metrics import parse_metrics
+from service.loadtest.fake_engine import FakeEngineConfig, LatencyModel, create_app
+from progressive_reply import (
+    GatewayStreamError,
+    ProgressiveReply,
+    ReplyConfig,
+    parse_sse,
+    stream_gateway_text,
+)
+from slack_outbound import OutboundConfig, SlackOutbound, TokenBucket
+
+REQUEST = httpx.Request("POST", "https://slack.test/api/chat.update")
+
+
+def sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def fake_gateway(chunks, error=None):
+    """Fake streaming backend speaking the gateway's /a2a/stream events."""
+    app = FastAPI()
+
+    @app.post("/a2a/stream")
+    async def a2a_stream():
+        async def events():
+            yield sse("start", {"correlation_id": "c1", "agent_role": "bob"})
+            for seq, text in enumerate(chunks, start=1):
+                yield sse("chunk", {"seq": seq, "text": text})
+            if error:
+                yield sse("error", {"error": error})
+            yield sse("summary", {"chunks": len(chunks)})
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    return app
+
+
+class FakeSlack:
+    """Records chat.postMessage and chat.update calls."""
+
+    def __init__(self, updates=(), posts=()):
+        self.posts = []
+        self.updates = []
+        self.update_responses = list(updates)
+        self.post_responses = list(posts)
+
+    async def post(self, payload):
+        self.posts.append(payload["text"])
+        if self.post_responses:
+            return self.post_responses.pop(0)
+        return httpx.Response(200, json={"ok": True, "ts": f"{len(self.posts)}.0"}, request=REQUEST)
+
+    async def update(self, payload):
+        self.updates.append(payload["text"])
+        if self.update_responses:
+            return self.update_responses.pop(0)
+        return httpx.Response(200, json={"ok": True}, request=REQUEST)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_reply(slack, clock=None, budget=None, **config):
+    clock = clock or Clock()
+    config.setdefault("update_interval", 1.0)
+    outbound = SlackOutbound(slack.post, OutboundConfig(rate=100.0, burst=10))
+    return ProgressiveReply(
+        outbound, slack.update, budget or TokenBucket(100.0, 10), ReplyConfig(mode="progressive", **config),
+        channel="C1", thread_ts="1.0", received_at=0.0, clock=clock,
+    ), outbound, clock
+
+
+@pytest.mark.asyncio
+async def test_parse_sse_and_gateway_stream():
+    async def lines():
+        for line in ["event: chunk", 'data: {"text": "a"}', "", ": comment", 'data: {"x": 1}', ""]:
+            yield line
+
+    assert [item async for item in parse_sse(lines())] == [("chunk", {"text": "a"}), ("message", {"x": 1})]
+
+    transport = httpx.ASGITransport(app=fake_gateway(["Hello", " world"], error="boom"))
+    async with httpx.AsyncClient(transport=transport, base_url="http://gateway") as client:
+        received = []
+        with pytest.raises(GatewayStreamError, match="boom"):
+            async for text in stream_gateway_text(client, "http://gateway/a2a/stream", {"prompt": "hi"}):
+                received.append(text)
+    assert received == ["Hello", " world"]
+
+
+@pytest.mark.asyncio
+async def test_updates_are_throttled_and_end_with_the_full_answer():
+    slack = FakeSlack()
+    reply, outbound, clock = make_reply(slack)
+
+    assert await reply.start()
+    await reply.append("Hel")  # First text replaces the placeholder at once
+    clock.now += 0.5
+    await reply.append("lo")  # Within the update interval
+    clock.now += 1.0
+    await reply.append(" wor")
+    await reply.append("ld")
+    await reply.finish()
+    await outbound.stop(timeout=1)
+
+    assert slack.posts == ["_Thinking..._"]
+    assert slack.updates == ["Hel", "Hello wor", "Hello world"]
+
+
+@pytest.mark.asyncio
+async def test_spent_budget_skips_intermediate_updates_but_not_the_final_one():
+    slack = FakeSlack()
+    budget = TokenBucket(rate=50.0, burst=1)
+    reply, outbound, _ = make_reply(slack, budget=budget, update_interval=0)
+
+    await reply.start()
+    await reply.append("a")
+    await reply.append("b")  # Budget spent: skipped
+    await reply.finish()  # Waits for the next token
+    await outbound.stop(timeout=1)
+
+    assert slack.updates == ["a", "ab"]
+
+
+@pytest.mark.asyncio
+async def test_final_update_honors_retry_after():
+    limited = httpx.Response(429, json={"ok": False, "error": "ratelimited"}, headers={"Retry-After": "0.02"},
+                             request=REQUEST)
+    slack = FakeSlack(updates=[limited])
+    reply, outbound, _ = make_reply(slack)
+
+    await reply.start()
+    reply.text = "done"
+    await reply.finish()
+    await outbound.stop(timeout=1)
+
+    assert slack.updates == ["done", "done"]
+    assert slack.posts == ["_Thinking..._"]
+
+
+@pytest.mark.asyncio
+async def test_long_answers_continue_in_new_messages():
+    slack = FakeSlack()
+    reply, outbound, _ = make_reply(slack, max_chars=10)
+
+    await reply.start()
+    await reply.append("0123456789abcdefghij")
+    await reply.finish()
+    await outbound.stop(timeout=1)
+
+    assert slack.updates == ["012345678…", "0123456789"]
+    assert slack.posts == ["_Thinking..._", "abcdefghij"]
+
+
+@pytest.mark.asyncio
+async def test_without_a_placeholder_the_answer_is_posted():
+    rejected = httpx.Response(200, json={"ok": False, "error": "not_in_channel"}, request=REQUEST)
+    slack = FakeSlack(posts=[rejected])
+    reply, outbound, _ = make_reply(slack)
+
+    assert not await reply.start()
+    await reply.append("answer")
+    await reply.finish()
+    await outbound.stop(timeout=1)
+
+    assert slack.updates == []
+    assert slack.posts == ["_Thinking..._", "answer"]
+
+
+@pytest.mark.asyncio
+async def test_webhook_streams_into_the_fake_slack_api(monkeypatch, load_slack_webhook):
+    monkeypatch.delenv("SLACK_BOB_ENABLED", raising=False)
+    monkeypatch.setenv("SLACK_REPLY_MODE", "progressive")
+    monkeypatch.setenv("SLACK_STREAM_UPDATE_INTERVAL", "0")
+    monkeypatch.setenv("A2A_GATEWAY_URL", "http://gateway")
+    webhook = load_slack_webhook()
+
+    slack_api = create_app(FakeEngineConfig(slack_latency=LatencyModel.parse("fixed:0")))
+    webhook.slack_client = httpx.AsyncClient(transport=httpx.ASGITransport(app=slack_api), base_url="http://fake/api")
+
+    async def fake_stream(client, url, payload):
+        assert url == "http://gateway/a2a/stream"
+        assert payload["prompt"] == "hello"
+        for text in ("Hi", " there", "!"):
+            await asyncio.sleep(0.01)
+            yield text
+
+    monkeypatch.setattr(webhook, "stream_gateway_text", fake_stream)
+    before = parse_metrics(webhook_metrics.registry.render()).get(
+        'slack_webhook_reply_first_text_seconds_count{mode="progressive"}', 0
+    )
+
+    await webhook.process_event(webhook.SlackJob(user="U1", channel="C1", text="hello", thread_ts="1.5"))
+    await webhook.outbound.stop(timeout=1)
+    await webhook.slack_client.aclose()
+
+    stats = slack_api.state.stats
+    assert stats.slack_posts == 1  # Only the placeholder
+    assert stats.slack_updates == 3  # One per chunk; the final text was already shown
+    after = parse_metrics(webhook_metrics.registry.render())[
+        'slack_webhook_reply_first_text_seconds_count{mode="progressive"}'
+    ]
+    assert after == before + 1
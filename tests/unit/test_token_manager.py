@@ -0,0 +1,145 @@
+"""
+Unit tests for the A2A gateway's cached GCP token manager.
+
+Uses a fake credentials object - no google-auth calls or network access.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+GATEWAY_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "service", "a2a_gateway"
+)
+sys.path.insert(0, GATEWAY_DIR)
+
+from token_manager import TokenManager, _utcnow  # noqa: E402
+
+
+class FakeCredentials:
+    """google-auth style credentials with a counted, slow refresh."""
+
+    def __init__(self, token=None, expires_in=3600.0, refresh_delay=0.0, fail=False):
+        self.token = token
+        self.expiry = _utcnow() + timedelta(seconds=expires_in) if token else None
+        self.expires_in = expires_in
+        self.refresh_delay = refresh_delay
+        self.fail = fail
+        self.refreshes = 0
+        self.refresh_threads = []
+
+    def refresh(self):
+        self.refresh_threads.append(threading.current_thread())
+        time.sleep(self.refresh_delay)
+        if self.fail:
+            raise OSError("metadata server unavailable")
+        self.refreshes += 1
+        self.token = f"token-{self.refreshes}"
+        self.expiry = _utcnow() + timedelta(seconds=self.expires_in)
+
+
+def make_manager(credentials, **kwargs):
+    loads = []
+
+    def loader(scopes):
+        loads.append(scopes)
+        return credentials
+
+    manager = TokenManager(
+        credentials_loader=loader,
+        refresher=lambda creds: creds.refresh(),
+        **kwargs
+    )
+    return manager, loads
+
+
+@pytest.mark.asyncio
+async def test_loads_credentials_once_and_caches_token():
+    creds = FakeCredentials()
+    manager, loads = make_manager(creds)
+
+    tokens = [await manager.get_token() for _ in range(5)]
+
+    assert tokens == ["token-1"] * 5
+    assert len(loads) == 1
+    assert creds.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_refresh():
+    creds = FakeCredentials(refresh_delay=0.05)
+    manager, _ = make_manager(creds)
+
+    tokens = await asyncio.gather(*(manager.get_token() for _ in range(20)))
+
+    assert set(tokens) == {"token-1"}
+    assert creds.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_refresh_runs_off_the_event_loop():
+    creds = FakeCredentials()
+    manager, _ = make_manager(creds)
+
+    await manager.get_token()
+    assert creds.refresh_threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_token_near_expiry_is_served_while_refreshing_in_background():
+    creds = FakeCredentials(token="old", expires_in=120, refresh_delay=0.05)
+    manager, _ = make_manager(creds, refresh_margin=300)
+
+    # Still valid: returned immediately, refresh started in the background
+    assert await manager.get_token() == "old"
+    assert await manager.get_token() == "old"
+    assert manager.stats()["refreshing"] is True
+
+    await manager._refresh_task
+    assert await manager.get_token() == "token-1"
+    assert creds.refreshes == 1
+
+
+@pytest.mark.asyncio
+async def test_expired_token_waits_for_refresh():
+    creds = FakeCredentials(token="old", expires_in=5)
+    manager, _ = make_manager(creds)
+
+    assert await manager.get_token() == "token-1"
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_raises_runtime_error():
+    creds = FakeCredentials(fail=True)
+    manager, _ = make_manager(creds)
+
+    with pytest.raises(RuntimeError, match="Authentication failed"):
+        await manager.get_token()
+    assert manager.stats()["refresh_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_failure_keeps_current_token():
+    creds = FakeCredentials(token="old", expires_in=120, fail=True)
+    manager, _ = make_manager(creds, refresh_margin=300)
+
+    assert await manager.get_token() == "old"
+    await asyncio.gather(manager._refresh_task, return_exceptions=True)
+    assert await manager.get_token() == "old"
+    assert manager.stats()["last_error"] == "metadata server unavailable"
+
+
+@pytest.mark.asyncio
+async def test_credentials_load_failure_raises_runtime_error():
+    def loader(scopes):
+        raise ValueError("no ADC")
+
+    manager = TokenManager(credentials_loader=loader)
+    with pytest.raises(RuntimeError, match="no ADC"):
+        await manager.get_token()